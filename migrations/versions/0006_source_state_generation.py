@@ -0,0 +1,150 @@
+"""Track per-world source-state generations for cache invalidation.
+
+Revision ID: 0006_source_state_generation
+Revises: 0005_source_created_at_null
+Create Date: 2026-10-16
+
+Every statement that writes ``source_artifacts`` or ``source_revisions`` bumps
+the generation of each world whose rows it touched, in the same transaction, so
+readers observe the new generation exactly when the source rows become
+visible. A revision belongs to the world of its artifact; a revision stored
+before its artifact bumps nothing, and the artifact insert bumps its world
+later. Writes in one world never contend on, or invalidate, another world's
+row. ``TRUNCATE`` bumps every world. The counter is an invalidation stamp only;
+it never gates admission.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0006_source_state_generation"
+down_revision: str | None = "0005_source_created_at_null"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = "dungeonmind"
+
+# Transition tables need one trigger per event.
+_EVENTS = (
+    ("insert", "INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("update", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("delete", "DELETE", "REFERENCING OLD TABLE AS old_rows"),
+)
+
+# World of each changed row, per table and trigger operation. Revisions carry
+# no world of their own; they are attributed through their artifact.
+_REVISION_WORLDS = (
+    "SELECT a.world_id FROM ({}) AS r "
+    f"JOIN {SCHEMA}.source_artifacts AS a USING (source_artifact_id)"
+)
+_CHANGED_WORLDS = {
+    "source_artifacts": {
+        "INSERT": "SELECT world_id FROM new_rows",
+        "UPDATE": "SELECT world_id FROM new_rows UNION SELECT world_id FROM old_rows",
+        "DELETE": "SELECT world_id FROM old_rows",
+    },
+    "source_revisions": {
+        "INSERT": _REVISION_WORLDS.format("SELECT source_artifact_id FROM new_rows"),
+        "UPDATE": _REVISION_WORLDS.format(
+            "SELECT source_artifact_id FROM new_rows "
+            "UNION SELECT source_artifact_id FROM old_rows"
+        ),
+        "DELETE": _REVISION_WORLDS.format("SELECT source_artifact_id FROM old_rows"),
+    },
+}
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE TABLE {SCHEMA}.source_state_generation (
+            world_id text PRIMARY KEY,
+            generation bigint NOT NULL
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.bump_source_state_generations(changed text[])
+        RETURNS void
+        LANGUAGE sql
+        AS $$
+            INSERT INTO {SCHEMA}.source_state_generation AS g (world_id, generation)
+            SELECT DISTINCT world_id, 1
+            FROM unnest(changed) AS world_id
+            WHERE world_id IS NOT NULL
+            ORDER BY world_id
+            ON CONFLICT (world_id) DO UPDATE SET generation = g.generation + 1
+        $$
+        """
+    )
+    for table, changed in _CHANGED_WORLDS.items():
+        op.execute(
+            f"""
+            CREATE FUNCTION {SCHEMA}.{table}_state_generation()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    PERFORM {SCHEMA}.bump_source_state_generations(
+                        ARRAY({changed["INSERT"]})
+                    );
+                ELSIF TG_OP = 'UPDATE' THEN
+                    PERFORM {SCHEMA}.bump_source_state_generations(
+                        ARRAY({changed["UPDATE"]})
+                    );
+                ELSE
+                    PERFORM {SCHEMA}.bump_source_state_generations(
+                        ARRAY({changed["DELETE"]})
+                    );
+                END IF;
+                RETURN NULL;
+            END;
+            $$
+            """
+        )
+        for suffix, event, referencing in _EVENTS:
+            op.execute(
+                f"""
+                CREATE TRIGGER {table}_state_generation_{suffix}
+                AFTER {event} ON {SCHEMA}.{table}
+                {referencing}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION {SCHEMA}.{table}_state_generation()
+                """
+            )
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.truncate_source_state_generation()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE {SCHEMA}.source_state_generation SET generation = generation + 1;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    for table in _CHANGED_WORLDS:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_state_generation_truncate
+            AFTER TRUNCATE ON {SCHEMA}.{table}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {SCHEMA}.truncate_source_state_generation()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(tuple(_CHANGED_WORLDS)):
+        for suffix in ("truncate", *(suffix for suffix, _, _ in reversed(_EVENTS))):
+            op.execute(f"DROP TRIGGER {table}_state_generation_{suffix} ON {SCHEMA}.{table}")
+        op.execute(f"DROP FUNCTION {SCHEMA}.{table}_state_generation()")
+    op.execute(f"DROP FUNCTION {SCHEMA}.truncate_source_state_generation()")
+    op.execute(f"DROP FUNCTION {SCHEMA}.bump_source_state_generations(text[])")
+    op.execute(f"DROP TABLE {SCHEMA}.source_state_generation")
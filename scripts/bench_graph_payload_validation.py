@@ -0,0 +1,301 @@
+"""Microbenchmark: per-item ``model_validate`` versus batched list validation.
+
+Builds a synthetic 50k-node payload for every graph schema (v1-v5) and times
+validating its record lists one ``model_validate`` call per item against the
+batched validators the readers use (module-level ``TypeAdapter(list[...])``
+for v1-v3, the strict top-level payload model for v4/v5). Also reports the
+full eager reader parse for context. Numbers are best-of-N wall times with
+the cyclic collector paused.
+
+Run: uv run python scripts/bench_graph_payload_validation.py [--nodes 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dungeonmind.application import graph_snapshot
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    GRAPH_SCHEMA_V2,
+    GRAPH_SCHEMA_V3,
+    GRAPH_SCHEMA_V4,
+    GRAPH_SCHEMA_V5,
+    GraphEvidenceRecord,
+    GraphEvidenceRecordV2,
+    GraphNodeRecord,
+    GraphNodeV2Record,
+    GraphRelationshipRecord,
+    VersionedUnionGraphSnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_v4 import (
+    GraphObjectV4Record,
+    GraphRelationshipV4Record,
+    UnionGraphV4Payload,
+)
+from dungeonmind.application.graph_snapshot_v5 import UnionGraphV5Payload
+from dungeonmind.application.semantic_profiles import descriptor_sha256
+from dungeonmind.contracts.semantic_profile import SemanticProfileDescriptor
+from dungeonmind.infrastructure.semantic_profiles import StaticSemanticProfileRegistry
+
+WORLD_ID = "world:bench"
+DESCRIPTOR = SemanticProfileDescriptor(
+    profile_id="bench.kernel",
+    profile_revision="bench-profile-v1",
+    term_namespaces=["bench"],
+)
+PROFILE_REF = {
+    "schema_version": "dm_semantic_profile_ref_v1",
+    "profile_id": DESCRIPTOR.profile_id,
+    "profile_revision": DESCRIPTOR.profile_revision,
+    "descriptor_sha256": descriptor_sha256(DESCRIPTOR),
+}
+
+
+def _evidence_v1(index: int) -> dict[str, Any]:
+    return {
+        "evidence_ref_id": f"ev:{index}",
+        "source_artifact_id": "src:bench",
+        "source_revision_id": "srcrev:bench-v1",
+        "source_domain": "worldbuilding",
+        "evidence_role": "support",
+    }
+
+
+def _evidence_v2(index: int) -> dict[str, Any]:
+    return {
+        "schema_version": "dm_evidence_ref_v2",
+        "evidence_ref_id": f"ev:{index}",
+        "source_artifact_id": "src:bench",
+        "source_revision_id": "srcrev:bench-v1",
+        "source_domain_key": "buddy.worldbuilding",
+        "source_domain": "worldbuilding",
+        "evidence_role": "support",
+        "can_open_source": True,
+        "can_highlight_span": False,
+        "session_id": None,
+        "source_span_ref_id": None,
+        "locator": f"bench://notes#{index}",
+        "uri": None,
+        "source_locator": None,
+        "line_ref": None,
+    }
+
+
+def _meta(assertion_id: str, evidence_ref_id: str) -> dict[str, Any]:
+    return {
+        "schema_version": "dm_knowledge_assertion_metadata_v1",
+        "assertion_id": assertion_id,
+        "campaign_scope": "camp:bench",
+        "visibility": "player",
+        "epistemic_kind": "asserted",
+        "canon_state": "canonical",
+        "evidence_ref_ids": [evidence_ref_id],
+        "session_refs": [],
+        "temporal_scope": {"schema_version": "dm_temporal_scope_ref_v1", "kind": "unknown"},
+    }
+
+
+def _v1_shaped(nodes: int, *, v2: bool, kind: str, predicate: str) -> dict[str, Any]:
+    evidence_rows = max(1, nodes // 10)
+    records: list[dict[str, Any]] = []
+    for index in range(nodes):
+        evidence_ref_id = f"ev:{index % evidence_rows}"
+        if v2:
+            records.append(
+                {
+                    "object_id": f"obj:{index}",
+                    "kind": kind,
+                    "label": f"Node {index}",
+                    "evidence_ref_ids": [evidence_ref_id],
+                    "alias_assertions": [
+                        {
+                            "assertion_id": f"asrt:{index}:alias",
+                            "alias": f"Alias {index}",
+                            "evidence_ref_ids": [evidence_ref_id],
+                        }
+                    ],
+                    "summary_assertion": {
+                        "assertion_id": f"asrt:{index}:summary",
+                        "summary": f"Summary of node {index}.",
+                        "evidence_ref_ids": [evidence_ref_id],
+                    },
+                }
+            )
+        else:
+            records.append(
+                {
+                    "object_id": f"obj:{index}",
+                    "kind": kind,
+                    "label": f"Node {index}",
+                    "aliases": [f"Alias {index}"],
+                    "summary": f"Summary of node {index}.",
+                    "evidence_ref_ids": [evidence_ref_id],
+                }
+            )
+    return {
+        "world_id": WORLD_ID,
+        "nodes": records,
+        "relationships": [
+            {
+                "relationship_id": f"rel:{index}",
+                "subject_object_id": f"obj:{index}",
+                "predicate": predicate,
+                "object_object_id": f"obj:{(index + 1) % nodes}",
+                "evidence_ref_ids": [f"ev:{index % evidence_rows}"],
+            }
+            for index in range(nodes)
+        ],
+        "evidence_refs": [_evidence_v1(index) for index in range(evidence_rows)],
+    }
+
+
+def _v4_shaped(nodes: int, *, v5: bool) -> dict[str, Any]:
+    evidence_rows = max(1, nodes // 10)
+    evidence = _evidence_v2 if v5 else _evidence_v1
+    return {
+        "world_id": WORLD_ID,
+        "semantic_profile": PROFILE_REF,
+        "objects": [
+            {
+                "object_id": f"obj:{index}",
+                "kind": "bench:person",
+                "label": f"Node {index}",
+                "assertion_metadata": _meta(f"asrt:{index}", f"ev:{index % evidence_rows}"),
+                "aliases": [
+                    {
+                        "value": f"Alias {index}",
+                        "assertion_metadata": _meta(
+                            f"asrt:{index}:alias", f"ev:{index % evidence_rows}"
+                        ),
+                    }
+                ],
+                "summary": {
+                    "value": f"Summary of node {index}.",
+                    "assertion_metadata": _meta(
+                        f"asrt:{index}:summary", f"ev:{index % evidence_rows}"
+                    ),
+                },
+                "properties": [],
+            }
+            for index in range(nodes)
+        ],
+        "relationships": [
+            {
+                "relationship_id": f"rel:{index}",
+                "source_object_id": f"obj:{index}",
+                "target_object_id": f"obj:{(index + 1) % nodes}",
+                "predicate": "bench:knows",
+                "assertion_metadata": _meta(f"asrt:rel:{index}", f"ev:{index % evidence_rows}"),
+            }
+            for index in range(nodes)
+        ],
+        "evidence_refs": [evidence(index) for index in range(evidence_rows)],
+    }
+
+
+def _best_of(repeats: int, run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        # Collector pauses scale with the live heap (five 50k payloads), not
+        # with the validator under test; keep them out of the measurement.
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def _per_item_v1_shaped(payload: dict[str, Any], node_model: type[Any]) -> None:
+    [node_model.model_validate(node) for node in payload["nodes"]]
+    [GraphRelationshipRecord.model_validate(rel) for rel in payload["relationships"]]
+    [GraphEvidenceRecord.model_validate(row) for row in payload["evidence_refs"]]
+
+
+def _batched_v1_shaped(payload: dict[str, Any], node_adapter: Any) -> None:
+    node_adapter.validate_python(payload["nodes"])
+    graph_snapshot._RELATIONSHIP_RECORDS.validate_python(payload["relationships"])
+    graph_snapshot._EVIDENCE_RECORDS.validate_python(payload["evidence_refs"])
+
+
+def _per_item_v4_shaped(payload: dict[str, Any], evidence_model: type[Any]) -> None:
+    [GraphObjectV4Record.model_validate(record) for record in payload["objects"]]
+    [GraphRelationshipV4Record.model_validate(rel) for rel in payload["relationships"]]
+    [evidence_model.model_validate(row) for row in payload["evidence_refs"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    v1 = _v1_shaped(args.nodes, v2=False, kind="npc", predicate="knows")
+    v2 = _v1_shaped(args.nodes, v2=True, kind="npc", predicate="knows")
+    v3 = dict(
+        _v1_shaped(args.nodes, v2=True, kind="bench:person", predicate="bench:knows"),
+        semantic_profile=PROFILE_REF,
+    )
+    v4 = _v4_shaped(args.nodes, v5=False)
+    v5 = _v4_shaped(args.nodes, v5=True)
+    reader = VersionedUnionGraphSnapshotReader(StaticSemanticProfileRegistry([DESCRIPTOR]))
+
+    cases: list[tuple[str, dict[str, Any], Callable[[], object], Callable[[], object]]] = [
+        (
+            GRAPH_SCHEMA_V1,
+            v1,
+            lambda: _per_item_v1_shaped(v1, GraphNodeRecord),
+            lambda: _batched_v1_shaped(v1, graph_snapshot._NODE_RECORDS),
+        ),
+        (
+            GRAPH_SCHEMA_V2,
+            v2,
+            lambda: _per_item_v1_shaped(v2, GraphNodeV2Record),
+            lambda: _batched_v1_shaped(v2, graph_snapshot._NODE_V2_RECORDS),
+        ),
+        (
+            GRAPH_SCHEMA_V3,
+            v3,
+            lambda: _per_item_v1_shaped(v3, GraphNodeV2Record),
+            lambda: _batched_v1_shaped(v3, graph_snapshot._NODE_V2_RECORDS),
+        ),
+        (
+            GRAPH_SCHEMA_V4,
+            v4,
+            lambda: _per_item_v4_shaped(v4, GraphEvidenceRecord),
+            lambda: UnionGraphV4Payload.model_validate(v4),
+        ),
+        (
+            GRAPH_SCHEMA_V5,
+            v5,
+            lambda: _per_item_v4_shaped(v5, GraphEvidenceRecordV2),
+            lambda: UnionGraphV5Payload.model_validate(v5),
+        ),
+    ]
+    print(f"{args.nodes} nodes, best of {args.repeats}")
+    print(f"{'schema':<20}{'per-item s':>12}{'batched s':>12}{'speedup':>10}{'parse s':>10}")
+    for graph_schema, payload, per_item, batched in cases:
+        per_item_s = _best_of(args.repeats, per_item)
+        batched_s = _best_of(args.repeats, batched)
+        parse_s = _best_of(
+            1,
+            lambda schema=graph_schema, data=payload: reader.parse(
+                graph_schema=schema, graph_payload=data
+            ),
+        )
+        print(
+            f"{graph_schema:<20}{per_item_s:>12.3f}{batched_s:>12.3f}"
+            f"{per_item_s / batched_s:>9.2f}x{parse_s:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,7 @@ from .review_publication import (
     FinalizedReviewPublication,
     publish_finalized_review,
 )
+from .tokenization import Tokenizer
 
 __all__ = [
     "ContributionRepository",
@@ -60,6 +61,7 @@ __all__ = [
     "SemanticDocumentRepository",
     "SemanticSearchPort",
     "SourceRepository",
+    "Tokenizer",
     "UnionGraphV1SnapshotReader",
     "WorldGraphRepository",
     "evaluate_fictional_time_query",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 from ..contracts.evidence import EvidenceRef
@@ -9,9 +11,75 @@ from ..contracts.projection import Admissibility, ProjectionFocus
 from ..contracts.retrieval import Coverage, SourceAnchor
 from ..domain.canonical import canonical_json
 from .graph_snapshot import GraphObjectView, GraphRelationshipView
+from .tokenization import Tokenizer
 
 DEFAULT_CONTEXT_CHAR_LIMIT = 12_000
 
+_UNRANKED = float("inf")
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """Budget the assembled context in ``tokenizer`` tokens instead of bytes."""
+
+    tokenizer: Tokenizer
+    max_tokens: int
+
+    def __post_init__(self) -> None:
+        if self.max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+
+
+@dataclass(frozen=True)
+class ContextPriority:
+    """Per-object truncation priority: nearer the seeds first, then better semantic rank.
+
+    Objects missing from either mapping rank after every object present in it.
+    """
+
+    seed_distance: Mapping[str, int] = field(default_factory=dict)
+    semantic_rank: Mapping[str, int] = field(default_factory=dict)
+
+    def object_score(self, object_ids: Iterable[str]) -> tuple[float, float]:
+        """Score of the best-placed object among ``object_ids``; lower is kept longer."""
+        return min(
+            (
+                (
+                    self.seed_distance.get(object_id, _UNRANKED),
+                    self.semantic_rank.get(object_id, _UNRANKED),
+                )
+                for object_id in object_ids
+            ),
+            default=(_UNRANKED, _UNRANKED),
+        )
+
+
+def context_priority(
+    *,
+    seed_ids: Iterable[str],
+    relationships: Iterable[GraphRelationshipView],
+    candidate_object_ids: Iterable[str],
+) -> ContextPriority:
+    """Hop distance from the seeds over ``relationships`` and fused candidate rank."""
+    neighbours: dict[str, list[str]] = {}
+    for rel in relationships:
+        neighbours.setdefault(rel.subject_object_id, []).append(rel.object_object_id)
+        neighbours.setdefault(rel.object_object_id, []).append(rel.subject_object_id)
+    distance = {seed_id: 0 for seed_id in seed_ids}
+    frontier = list(distance)
+    while frontier:
+        next_frontier: list[str] = []
+        for object_id in frontier:
+            for neighbour in neighbours.get(object_id, ()):
+                if neighbour not in distance:
+                    distance[neighbour] = distance[object_id] + 1
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    rank: dict[str, int] = {}
+    for object_id in candidate_object_ids:
+        rank.setdefault(object_id, len(rank))
+    return ContextPriority(seed_distance=distance, semantic_rank=rank)
+
 
 def assemble_agent_context(
     *,
@@ -26,56 +94,198 @@ def assemble_agent_context(
     source_anchors: list[SourceAnchor],
     coverage: Coverage,
     char_limit: int = DEFAULT_CONTEXT_CHAR_LIMIT,
+    token_budget: TokenBudget | None = None,
+    priority: ContextPriority | None = None,
 ) -> str:
-    """Build canonical JSON context, truncating lower-ranked candidates first."""
-
-    ranked_objects = list(objects)
-    ranked_relationships = list(relationships)
-    ranked_evidence = list(evidence)
-    ranked_anchors = list(source_anchors)
-
-    def _document(
-        objs: list[GraphObjectView],
-        rels: list[GraphRelationshipView],
-        evs: list[EvidenceRef],
-        anchors: list[SourceAnchor],
-    ) -> dict[str, Any]:
-        return {
-            "revision_id": revision_id,
-            "world_id": world_id,
-            "campaign_id": campaign_id,
-            "admissibility": admissibility.value,
-            "focus": focus.model_dump(mode="json"),
-            "objects": [obj.model_dump(mode="json") for obj in objs],
-            "relationships": [rel.model_dump(mode="json") for rel in rels],
-            "evidence": [item.model_dump(mode="json") for item in evs],
-            "source_anchors": [item.model_dump(mode="json") for item in anchors],
-            "coverage": coverage.model_dump(mode="json"),
-        }
-
-    document = _document(
-        ranked_objects,
-        ranked_relationships,
-        ranked_evidence,
-        ranked_anchors,
+    """Build canonical JSON context, truncating lower-ranked candidates first.
+
+    Relationships are dropped first, then objects (always keeping one), then
+    source anchors, then evidence, until the UTF-8 rendering fits
+    ``char_limit`` or, with ``token_budget``, its token count fits
+    ``max_tokens``. Without ``priority`` each section drops from its end;
+    with it, the items farthest from the seeds and worst in semantic rank go
+    first. Kept items stay in input order.
+
+    Each item is serialized and measured once, and the document is rendered
+    exactly as ``canonical_json`` would render it. Token counts of the parts
+    are summed; the rendered document is then re-counted, and items keep
+    dropping one at a time for tokenizers whose counts are not additive.
+    """
+    scores = _section_scores(priority, objects, relationships, evidence, source_anchors)
+    cost: Callable[[str], int]
+    if token_budget is None:
+        limit = char_limit
+
+        def cost(text: str) -> int:
+            return len(text.encode("utf-8"))
+    else:
+        limit = token_budget.max_tokens
+        cost = token_budget.tokenizer.count_tokens
+    item_lists: dict[str, list[Any]] = {
+        "objects": objects,
+        "relationships": relationships,
+        "evidence": evidence,
+        "source_anchors": source_anchors,
+    }
+    sections = {
+        key: _Section(
+            [item.model_dump(mode="json") for item in items], cost, scores.get(key)
+        )
+        for key, items in item_lists.items()
+    }
+    scalars: dict[str, Any] = {
+        "revision_id": revision_id,
+        "world_id": world_id,
+        "campaign_id": campaign_id,
+        "admissibility": admissibility.value,
+        "focus": focus.model_dump(mode="json"),
+        "coverage": coverage.model_dump(mode="json"),
+    }
+    fields = {key: canonical_json(value) for key, value in scalars.items()}
+    keys = sorted((*fields, *sections))
+    # Braces, member separators, keys with their colons, and scalar values.
+    fixed_cost = (
+        cost("{}")
+        + (len(keys) - 1) * cost(",")
+        + sum(cost(f"{canonical_json(key)}:") for key in keys)
+        + sum(cost(value) for value in fields.values())
     )
-    rendered = canonical_json(document)
-    while len(rendered.encode("utf-8")) > char_limit:
-        if ranked_relationships:
-            ranked_relationships.pop()
-        elif ranked_objects and len(ranked_objects) > 1:
-            ranked_objects.pop()
-        elif ranked_anchors:
-            ranked_anchors.pop()
-        elif ranked_evidence:
-            ranked_evidence.pop()
-        else:
+
+    def _overflow() -> int:
+        return fixed_cost + sum(section.cost for section in sections.values()) - limit
+
+    for key, keep_at_least in _TRUNCATION_ORDER:
+        overflow = _overflow()
+        if overflow <= 0:
             break
-        document = _document(
-            ranked_objects,
-            ranked_relationships,
-            ranked_evidence,
-            ranked_anchors,
-        )
-        rendered = canonical_json(document)
+        sections[key].drop_until(overflow, keep_at_least=keep_at_least)
+
+    def _render() -> str:
+        members = []
+        for key in keys:
+            value = fields[key] if key in fields else sections[key].render()
+            members.append(f"{canonical_json(key)}:{value}")
+        return "{" + ",".join(members) + "}"
+
+    rendered = _render()
+    if token_budget is None:
+        return rendered
+    while cost(rendered) > limit and _drop_one(sections):
+        rendered = _render()
     return rendered
+
+
+# (section, items it always keeps), lowest priority first.
+_TRUNCATION_ORDER = (
+    ("relationships", 0),
+    ("objects", 1),
+    ("source_anchors", 0),
+    ("evidence", 0),
+)
+
+_Score = tuple[float, float, int]
+
+
+def _drop_one(sections: Mapping[str, _Section]) -> bool:
+    for key, keep_at_least in _TRUNCATION_ORDER:
+        if sections[key].drop_until(1, keep_at_least=keep_at_least):
+            return True
+    return False
+
+
+def _section_scores(
+    priority: ContextPriority | None,
+    objects: list[GraphObjectView],
+    relationships: list[GraphRelationshipView],
+    evidence: list[EvidenceRef],
+    source_anchors: list[SourceAnchor],
+) -> dict[str, list[_Score]]:
+    """Per-item scores (lower is kept longer); input position breaks ties."""
+    if priority is None:
+        return {}
+    object_scores = [priority.object_score([obj.object_id]) for obj in objects]
+    relationship_scores = [
+        priority.object_score([rel.subject_object_id, rel.object_object_id])
+        for rel in relationships
+    ]
+    # Evidence is as close to the seeds as the nearest object or relationship citing it.
+    cited: dict[str, tuple[float, float]] = {}
+    for owner, score in (
+        *zip(objects, object_scores, strict=True),
+        *zip(relationships, relationship_scores, strict=True),
+    ):
+        for evidence_ref_id in owner.evidence_ref_ids:
+            cited[evidence_ref_id] = min(cited.get(evidence_ref_id, score), score)
+    evidence_scores = [
+        cited.get(item.evidence_ref_id, (_UNRANKED, _UNRANKED)) for item in evidence
+    ]
+    anchor_scores = [
+        priority.object_score(anchor.supporting_object_ids) for anchor in source_anchors
+    ]
+    return {
+        key: [(*score, index) for index, score in enumerate(section_scores)]
+        for key, section_scores in (
+            ("objects", object_scores),
+            ("relationships", relationship_scores),
+            ("evidence", evidence_scores),
+            ("source_anchors", anchor_scores),
+        )
+    }
+
+
+class _Section:
+    """A JSON array whose items are rendered and measured once.
+
+    Items drop worst score first (last position first without scores); the
+    kept ones render in input order.
+    """
+
+    def __init__(
+        self,
+        items: list[Any],
+        cost: Callable[[str], int],
+        scores: list[_Score] | None,
+    ) -> None:
+        self._rendered = [canonical_json(item) for item in items]
+        self._costs = [cost(item) for item in self._rendered]
+        self._bracket_cost = cost("[]")
+        self._separator_cost = cost(",")
+        self._kept = [True] * len(self._rendered)
+        self._kept_count = len(self._rendered)
+        self._kept_cost = sum(self._costs)
+        if scores is None:
+            self._drop_order = list(range(len(self._rendered) - 1, -1, -1))
+        else:
+            self._drop_order = sorted(
+                range(len(self._rendered)), key=scores.__getitem__, reverse=True
+            )
+        self._next_drop = 0
+
+    @property
+    def cost(self) -> int:
+        """Cost of the rendered array: brackets, kept items and their commas."""
+        return (
+            self._bracket_cost
+            + self._kept_cost
+            + max(self._kept_count - 1, 0) * self._separator_cost
+        )
+
+    def drop_until(self, overflow: int, *, keep_at_least: int) -> bool:
+        """Drop items until ``overflow`` is freed or the floor is hit; True if any dropped."""
+        before = self.cost
+        dropped = False
+        while self._kept_count > keep_at_least and before - self.cost < overflow:
+            index = self._drop_order[self._next_drop]
+            self._next_drop += 1
+            self._kept[index] = False
+            self._kept_count -= 1
+            self._kept_cost -= self._costs[index]
+            dropped = True
+        return dropped
+
+    def render(self) -> str:
+        return (
+            "["
+            + ",".join(item for item, kept in zip(self._rendered, self._kept, strict=True) if kept)
+            + "]"
+        )
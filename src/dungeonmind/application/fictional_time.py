@@ -16,11 +16,13 @@ from ..contracts.fictional_time import (
     FictionalTimeResultStatus,
     FictionalTimeUnresolvedReason,
 )
-from ..contracts.graph import StoredGraphRevision
+from ..contracts.graph import StoredGraphRevision, WorldGraphRevision
 from ..domain.canonical import canonical_sha256
 from ..domain.errors import FictionalTimeIntegrityError
 from ..domain.revision_ids import compute_revision_id
 from .graph_snapshot import GraphSnapshotReader, ParsedGraphSnapshot
+from .graph_snapshot_cache import ParsedSnapshotCache
+from .verified_digests import VerifiedDigestRegistry
 
 
 def _integrity(reason: str, **details: Any) -> FictionalTimeIntegrityError:
@@ -28,11 +30,33 @@ def _integrity(reason: str, **details: Any) -> FictionalTimeIntegrityError:
     return FictionalTimeIntegrityError(reason=reason, details=safe or None)
 
 
-def _reload_revision(stored: StoredGraphRevision) -> StoredGraphRevision:
+def _reload_revision(
+    stored: StoredGraphRevision,
+    verified_digests: VerifiedDigestRegistry | None = None,
+) -> StoredGraphRevision:
+    """Reload ``stored`` and check its payload against the recorded digest.
+
+    With ``verified_digests`` only the envelope is reloaded: the registry
+    checks the payload in place and it is shared read-only, not copied.
+    """
+    if verified_digests is None:
+        try:
+            reloaded = StoredGraphRevision.model_validate(stored.model_dump(mode="json"))
+        except Exception:
+            raise _integrity("revision_reload_validation") from None
+        rev = reloaded.revision
+        if canonical_sha256(reloaded.graph_payload) != rev.graph_payload_sha256:
+            raise _integrity("graph_payload_digest_mismatch")
+        return reloaded
     try:
-        return StoredGraphRevision.model_validate(stored.model_dump(mode="json"))
+        rev = WorldGraphRevision.model_validate(stored.revision.model_dump(mode="json"))
     except Exception:
         raise _integrity("revision_reload_validation") from None
+    if not isinstance(stored.graph_payload, dict):
+        raise _integrity("revision_reload_validation")
+    if not verified_digests.payload_digest_matches(rev, stored.graph_payload):
+        raise _integrity("graph_payload_digest_mismatch")
+    return StoredGraphRevision.model_construct(revision=rev, graph_payload=stored.graph_payload)
 
 
 def _reload_bundle(bundle: FictionalTimeClaimBundle) -> FictionalTimeClaimBundle:
@@ -56,9 +80,7 @@ def _verify_binding(
     bundle: FictionalTimeClaimBundle,
 ) -> None:
     rev = revision.revision
-    digest = canonical_sha256(revision.graph_payload)
-    if digest != rev.graph_payload_sha256:
-        raise _integrity("graph_payload_digest_mismatch")
+    digest = rev.graph_payload_sha256
     expected_revision_id = compute_revision_id(
         world_id=rev.world_id,
         parent_revision_id=rev.parent_revision_id,
@@ -82,13 +104,18 @@ def _verify_binding(
 def _parse_snapshot(
     revision: StoredGraphRevision,
     reader: GraphSnapshotReader,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> ParsedGraphSnapshot:
-    payload = copy.deepcopy(revision.graph_payload)
     try:
-        snapshot = reader.parse(
-            graph_schema=revision.revision.graph_schema,
-            graph_payload=payload,
-        )
+        if snapshot_cache is not None:
+            # The digest and revision binding are verified before this point,
+            # which is what the cache key trusts.
+            snapshot = snapshot_cache.get_or_parse(revision, reader=reader)
+        else:
+            snapshot = reader.parse(
+                graph_schema=revision.revision.graph_schema,
+                graph_payload=copy.deepcopy(revision.graph_payload),
+            )
     except Exception:
         raise _integrity("graph_snapshot_validation") from None
     rev = revision.revision
@@ -314,12 +341,21 @@ def evaluate_fictional_time_query(
     claim_bundle: FictionalTimeClaimBundle,
     query: FictionalTimeQuery,
     graph_reader: GraphSnapshotReader,
+    verified_digests: VerifiedDigestRegistry | None = None,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> FictionalTimeQueryResult:
-    revision = _reload_revision(stored_revision)
+    """Evaluate ``query`` against one exact, digest-verified stored revision.
+
+    ``verified_digests`` skips re-hashing and re-copying payloads that already
+    verified; ``snapshot_cache`` reuses the parse of a revision across queries.
+    """
+    revision = _reload_revision(stored_revision, verified_digests)
     bundle = _reload_bundle(claim_bundle)
     query = _reload_query(query)
     _verify_binding(revision, bundle)
-    snapshot = _parse_snapshot(revision, graph_reader)
+    snapshot = _parse_snapshot(revision, graph_reader, snapshot_cache)
+    if verified_digests is not None:
+        verified_digests.record_parsed(revision.revision, revision.graph_payload)
     _verify_anchors(bundle, snapshot)
     _verify_evidence(bundle, snapshot)
     if query.query_kind is FictionalTimeQueryKind.STRICT_BEFORE:
@@ -7,7 +7,9 @@ from ..contracts.fictional_time_transport import FictionalTimeShadowQueryRequest
 from ..domain.errors import FictionalTimeIntegrityError, RevisionNotFoundError
 from .fictional_time import evaluate_fictional_time_query
 from .graph_snapshot import GraphSnapshotReader
+from .graph_snapshot_cache import ParsedSnapshotCache
 from .repositories import WorldGraphRepository
+from .verified_digests import VerifiedDigestRegistry
 
 
 def _reload_request(
@@ -26,6 +28,8 @@ def query_fictional_time_shadow_at_revision(
     *,
     world_graph_repository: WorldGraphRepository,
     graph_reader: GraphSnapshotReader,
+    verified_digests: VerifiedDigestRegistry | None = None,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> FictionalTimeQueryResult:
     """Load one exact stored revision and evaluate the caller-supplied shadow query."""
 
@@ -47,4 +51,6 @@ def query_fictional_time_shadow_at_revision(
         claim_bundle=verified.claim_bundle,
         query=verified.query,
         graph_reader=graph_reader,
+        verified_digests=verified_digests,
+        snapshot_cache=snapshot_cache,
     )
@@ -31,9 +31,12 @@ request actually targets the affected object.
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Collection, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Literal
+from functools import cached_property
+from itertools import repeat
 
 from ..contracts.evidence import (
     EvidenceRef,
@@ -42,6 +45,7 @@ from ..contracts.evidence import (
     SourceArtifactRecord,
     SourceArtifactV2,
     SourceDomain,
+    SourceRevision,
     SourceStatus,
 )
 from ..contracts.knowledge_assertion import KnowledgeAssertionMetadataV1
@@ -60,8 +64,9 @@ from .graph_snapshot import (
     GraphObjectView,
     GraphRelationshipView,
     ParsedGraphSnapshot,
+    PhraseMatcher,
     build_label_and_alias_indexes,
-    contains_exact_phrase,
+    carry_derived_indexes,
 )
 from .repositories import SourceRepository
 
@@ -102,6 +107,10 @@ class ValidatedProvenance:
     artifact: SourceArtifactRecord
 
 
+# Outcome of :func:`resolve_evidence_provenance` for one evidence ref.
+ProvenanceVerdict = ValidatedProvenance | ProvenanceRejection | EvidenceScopeVerdict | None
+
+
 @dataclass(frozen=True)
 class ObjectScopeExclusion:
     """Why a graph object/relationship was hidden by coarse scoping.
@@ -130,6 +139,14 @@ class ScopedGraphProjection:
     # only: used to stop semantic candidate seeding from revealing a hidden
     # alias→object association. Never copied into public coverage/diagnostics.
     omitted_alias_index: dict[str, list[str]] = field(default_factory=dict)
+    # Evidence ref ID → provenance verdict for this read's scope, for every ref
+    # scoping checked. Reused by evidence admission for the same turn.
+    evidence_verdicts: Mapping[str, ProvenanceVerdict] = field(default_factory=dict)
+
+    @cached_property
+    def omitted_alias_matcher(self) -> PhraseMatcher:
+        """Compiled on first use; projections are immutable once built."""
+        return PhraseMatcher(self.omitted_alias_index)
 
     @property
     def rejections(self) -> list[ProvenanceRejection]:
@@ -162,11 +179,19 @@ def objects_blocked_by_omitted_aliases(
     """
     if not omitted_alias_index:
         return set()
-    normalized = _norm_alias(message)
+    return _blocked_by_omitted_aliases(
+        _norm_alias(message), omitted_alias_index, PhraseMatcher(omitted_alias_index)
+    )
+
+
+def _blocked_by_omitted_aliases(
+    normalized_message: str,
+    omitted_alias_index: dict[str, list[str]],
+    matcher: PhraseMatcher,
+) -> set[str]:
     blocked: set[str] = set()
-    for alias, object_ids in omitted_alias_index.items():
-        if alias and contains_exact_phrase(normalized, alias):
-            blocked.update(object_ids)
+    for alias in matcher.find(normalized_message):
+        blocked.update(omitted_alias_index[alias])
     return blocked
 
 
@@ -181,10 +206,20 @@ def objects_blocked_by_ambiguous_aliases(
     """
     if not alias_index:
         return set()
-    normalized = _norm_alias(message)
+    return _blocked_by_ambiguous_aliases(
+        _norm_alias(message), alias_index, PhraseMatcher(alias_index)
+    )
+
+
+def _blocked_by_ambiguous_aliases(
+    normalized_message: str,
+    alias_index: dict[str, list[str]],
+    matcher: PhraseMatcher,
+) -> set[str]:
     blocked: set[str] = set()
-    for alias, object_ids in alias_index.items():
-        if alias and contains_exact_phrase(normalized, alias) and len(object_ids) > 1:
+    for alias in matcher.find(normalized_message):
+        object_ids = alias_index[alias]
+        if len(object_ids) > 1:
             blocked.update(object_ids)
     return blocked
 
@@ -205,6 +240,26 @@ def filter_candidate_object_ids(
     return [object_id for object_id in candidate_object_ids if object_id not in blocked]
 
 
+def filter_scoped_candidate_object_ids(
+    candidate_object_ids: list[str],
+    *,
+    message: str,
+    projection: ScopedGraphProjection,
+) -> list[str]:
+    """:func:`filter_candidate_object_ids` using the projection's compiled matchers."""
+    normalized = _norm_alias(message)
+    blocked = _blocked_by_omitted_aliases(
+        normalized, projection.omitted_alias_index, projection.omitted_alias_matcher
+    ) | _blocked_by_ambiguous_aliases(
+        normalized,
+        projection.snapshot.alias_index,
+        projection.snapshot.mention_matcher.aliases,
+    )
+    if not blocked:
+        return list(candidate_object_ids)
+    return [object_id for object_id in candidate_object_ids if object_id not in blocked]
+
+
 def source_artifact_in_scope(
     artifact: SourceArtifactRecord,
     *,
@@ -246,63 +301,149 @@ def source_artifact_in_scope(
     return True
 
 
-def _establish_artifact_scope(
-    artifact: SourceArtifactRecord,
+class PrefetchedSources:
+    """Read-through :class:`SourceRepository` view over one batched prefetch.
+
+    Artifacts and revisions named up front are loaded with one
+    ``get_artifacts`` / ``get_revisions`` call each; lookups of prefetched IDs
+    (present or absent) never reach the wrapped repository again. Other reads
+    and all writes pass through.
+    """
+
+    def __init__(
+        self,
+        sources: SourceRepository,
+        *,
+        source_artifact_ids: Collection[str] = (),
+        source_revision_ids: Collection[str] = (),
+    ) -> None:
+        self._sources = sources
+        self._artifact_ids = frozenset(source_artifact_ids)
+        self._revision_ids = frozenset(source_revision_ids)
+        self._artifacts = sources.get_artifacts(self._artifact_ids) if self._artifact_ids else {}
+        self._revisions = sources.get_revisions(self._revision_ids) if self._revision_ids else {}
+
+    @classmethod
+    def for_evidence(
+        cls,
+        sources: SourceRepository,
+        records: Iterable[GraphEvidenceRecord | GraphEvidenceRecordV2],
+    ) -> PrefetchedSources:
+        artifact_ids: set[str] = set()
+        revision_ids: set[str] = set()
+        for record in records:
+            artifact_ids.add(record.source_artifact_id)
+            if record.source_revision_id:
+                revision_ids.add(record.source_revision_id)
+        return cls(sources, source_artifact_ids=artifact_ids, source_revision_ids=revision_ids)
+
+    def put_artifact(self, artifact: SourceArtifactRecord) -> SourceArtifactRecord:
+        return self._sources.put_artifact(artifact)
+
+    def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None:
+        if source_artifact_id in self._artifact_ids:
+            return self._artifacts.get(source_artifact_id)
+        return self._sources.get_artifact(source_artifact_id)
+
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        found = {
+            source_artifact_id: self._artifacts[source_artifact_id]
+            for source_artifact_id in source_artifact_ids
+            if source_artifact_id in self._artifacts
+        }
+        remaining = [
+            source_artifact_id
+            for source_artifact_id in source_artifact_ids
+            if source_artifact_id not in self._artifact_ids
+        ]
+        if remaining:
+            found.update(self._sources.get_artifacts(remaining))
+        return found
+
+    def put_revision(self, revision: SourceRevision) -> SourceRevision:
+        return self._sources.put_revision(revision)
+
+    def get_revision(self, source_revision_id: str) -> SourceRevision | None:
+        if source_revision_id in self._revision_ids:
+            return self._revisions.get(source_revision_id)
+        return self._sources.get_revision(source_revision_id)
+
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        found = {
+            source_revision_id: self._revisions[source_revision_id]
+            for source_revision_id in source_revision_ids
+            if source_revision_id in self._revisions
+        }
+        remaining = [
+            source_revision_id
+            for source_revision_id in source_revision_ids
+            if source_revision_id not in self._revision_ids
+        ]
+        if remaining:
+            found.update(self._sources.get_revisions(remaining))
+        return found
+
+    def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]:
+        return self._sources.list_revisions(source_artifact_id)
+
+    def state_version(self, world_id: str) -> str:
+        return self._sources.state_version(world_id)
+
+
+def _artifact_for_scope(
+    record: GraphEvidenceRecord | GraphEvidenceRecordV2,
     *,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
-) -> EvidenceScopeVerdict | Literal[True] | None:
-    """Establish world/campaign/visibility before provenance diagnostics.
+    sources: SourceRepository,
+) -> SourceArtifactRecord | EvidenceScopeVerdict:
+    """The artifact whose scope decides ``record``, or ``SCOPE_UNKNOWN``.
 
-    Returns:
-      * ``True`` when the artifact is in scope for this read;
-      * ``None`` when the artifact is out of visibility/campaign/world scope
-        (silent filter);
-      * ``EvidenceScopeVerdict.SCOPE_UNKNOWN`` when v2 ``visibility is None``.
+    Independent of the read scope: unparseable v1 facets, a missing artifact
+    and a v2 artifact with ``visibility is None`` can never establish scope.
     """
+    if not isinstance(record, GraphEvidenceRecordV2):
+        try:
+            SourceDomain(record.source_domain)
+            EvidenceRole(record.evidence_role)
+        except ValueError:
+            return EvidenceScopeVerdict.SCOPE_UNKNOWN
+    artifact = sources.get_artifact(record.source_artifact_id)
+    if artifact is None:
+        return EvidenceScopeVerdict.SCOPE_UNKNOWN
     if isinstance(artifact, SourceArtifactV2) and artifact.visibility is None:
         return EvidenceScopeVerdict.SCOPE_UNKNOWN
-    if not source_artifact_in_scope(
-        artifact,
-        world_id=world_id,
-        campaign_id=campaign_id,
-        admissibility=admissibility,
-    ):
+    return artifact
+
+
+def _check_revision(
+    record: GraphEvidenceRecord | GraphEvidenceRecordV2,
+    *,
+    sources: SourceRepository,
+) -> ProvenanceRejection | None:
+    if not record.source_revision_id:
         return None
-    return True
+    revision = sources.get_revision(record.source_revision_id)
+    if revision is None:
+        return ProvenanceRejection(
+            "evidence_source_revision_missing",
+            record.source_revision_id,
+        )
+    if revision.source_artifact_id != record.source_artifact_id:
+        return ProvenanceRejection(
+            "evidence_source_revision_artifact_mismatch",
+            record.source_revision_id,
+        )
+    return None
 
 
-def _resolve_v1_evidence_provenance(
+def _v1_chain_rejection(
     record: GraphEvidenceRecord,
+    artifact: SourceArtifactRecord,
     *,
     evidence_ref_id: str,
     sources: SourceRepository,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
-) -> ValidatedProvenance | ProvenanceRejection | EvidenceScopeVerdict | None:
-    try:
-        source_domain = SourceDomain(record.source_domain)
-        evidence_role = EvidenceRole(record.evidence_role)
-    except ValueError:
-        return EvidenceScopeVerdict.SCOPE_UNKNOWN
-
-    artifact = sources.get_artifact(record.source_artifact_id)
-    if artifact is None:
-        return EvidenceScopeVerdict.SCOPE_UNKNOWN
-
-    # Scope before schema-mismatch diagnostics — detailed rejection codes are
-    # only safe after the artifact is proven visible for this read.
-    scoped = _establish_artifact_scope(
-        artifact,
-        world_id=world_id,
-        campaign_id=campaign_id,
-        admissibility=admissibility,
-    )
-    if scoped is not True:
-        return scoped
-
+) -> ProvenanceRejection | None:
     if isinstance(artifact, SourceArtifactV2):
         return ProvenanceRejection(
             "evidence_source_schema_mismatch",
@@ -314,63 +455,18 @@ def _resolve_v1_evidence_provenance(
             "evidence_source_inactive",
             record.source_artifact_id,
         )
-    if artifact.source_domain is not source_domain:
+    if artifact.source_domain is not SourceDomain(record.source_domain):
         return ProvenanceRejection("evidence_source_domain_mismatch", evidence_ref_id)
+    return _check_revision(record, sources=sources)
 
-    if record.source_revision_id:
-        revision = sources.get_revision(record.source_revision_id)
-        if revision is None:
-            return ProvenanceRejection(
-                "evidence_source_revision_missing",
-                record.source_revision_id,
-            )
-        if revision.source_artifact_id != record.source_artifact_id:
-            return ProvenanceRejection(
-                "evidence_source_revision_artifact_mismatch",
-                record.source_revision_id,
-            )
 
-    return ValidatedProvenance(
-        record=record,
-        evidence=EvidenceRef(
-            evidence_ref_id=record.evidence_ref_id,
-            source_artifact_id=record.source_artifact_id,
-            source_revision_id=record.source_revision_id,
-            source_domain=source_domain,
-            evidence_role=evidence_role,
-            can_open_source=record.can_open_source,
-            can_highlight_span=record.can_highlight_span,
-            locator=record.locator,
-            uri=record.uri,
-        ),
-        artifact=artifact,
-    )
-
-
-def _resolve_v2_evidence_provenance(
+def _v2_chain_rejection(
     record: GraphEvidenceRecordV2,
+    artifact: SourceArtifactRecord,
     *,
     evidence_ref_id: str,
     sources: SourceRepository,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
-) -> ValidatedProvenance | ProvenanceRejection | EvidenceScopeVerdict | None:
-    artifact = sources.get_artifact(record.source_artifact_id)
-    if artifact is None:
-        return EvidenceScopeVerdict.SCOPE_UNKNOWN
-
-    # Scope before schema-mismatch diagnostics — detailed rejection codes are
-    # only safe after the artifact is proven visible for this read.
-    scoped = _establish_artifact_scope(
-        artifact,
-        world_id=world_id,
-        campaign_id=campaign_id,
-        admissibility=admissibility,
-    )
-    if scoped is not True:
-        return scoped
-
+) -> ProvenanceRejection | None:
     if not isinstance(artifact, SourceArtifactV2):
         return ProvenanceRejection(
             "evidence_source_schema_mismatch",
@@ -387,23 +483,47 @@ def _resolve_v2_evidence_provenance(
         or artifact.source_domain != record.source_domain
     ):
         return ProvenanceRejection("evidence_source_domain_mismatch", evidence_ref_id)
+    return _check_revision(record, sources=sources)
 
-    if record.source_revision_id:
-        revision = sources.get_revision(record.source_revision_id)
-        if revision is None:
-            return ProvenanceRejection(
-                "evidence_source_revision_missing",
-                record.source_revision_id,
-            )
-        if revision.source_artifact_id != record.source_artifact_id:
-            return ProvenanceRejection(
-                "evidence_source_revision_artifact_mismatch",
-                record.source_revision_id,
-            )
 
+def _chain_rejection(
+    record: GraphEvidenceRecord | GraphEvidenceRecordV2,
+    artifact: SourceArtifactRecord,
+    *,
+    evidence_ref_id: str,
+    sources: SourceRepository,
+) -> ProvenanceRejection | None:
+    """Lifecycle, domain and revision checks for an artifact already in scope."""
+    if isinstance(record, GraphEvidenceRecordV2):
+        return _v2_chain_rejection(
+            record, artifact, evidence_ref_id=evidence_ref_id, sources=sources
+        )
+    return _v1_chain_rejection(record, artifact, evidence_ref_id=evidence_ref_id, sources=sources)
+
+
+def _validated(
+    record: GraphEvidenceRecord | GraphEvidenceRecordV2,
+    artifact: SourceArtifactRecord,
+) -> ValidatedProvenance:
+    if isinstance(record, GraphEvidenceRecordV2):
+        return ValidatedProvenance(
+            record=record,
+            evidence=record.model_copy(deep=True),
+            artifact=artifact,
+        )
     return ValidatedProvenance(
         record=record,
-        evidence=record.model_copy(deep=True),
+        evidence=EvidenceRef(
+            evidence_ref_id=record.evidence_ref_id,
+            source_artifact_id=record.source_artifact_id,
+            source_revision_id=record.source_revision_id,
+            source_domain=SourceDomain(record.source_domain),
+            evidence_role=EvidenceRole(record.evidence_role),
+            can_open_source=record.can_open_source,
+            can_highlight_span=record.can_highlight_span,
+            locator=record.locator,
+            uri=record.uri,
+        ),
         artifact=artifact,
     )
 
@@ -416,7 +536,7 @@ def resolve_evidence_provenance(
     world_id: str,
     campaign_id: str | None,
     admissibility: Admissibility,
-) -> ValidatedProvenance | ProvenanceRejection | EvidenceScopeVerdict | None:
+) -> ProvenanceVerdict:
     """Validate the complete evidence → artifact → revision provenance chain.
 
     Returns:
@@ -431,24 +551,224 @@ def resolve_evidence_provenance(
     record = snapshot.evidence.get(evidence_ref_id)
     if record is None:
         return EvidenceScopeVerdict.SCOPE_UNKNOWN
+    artifact = _artifact_for_scope(record, sources=sources)
+    if isinstance(artifact, EvidenceScopeVerdict):
+        return artifact
+    # Scope before schema-mismatch diagnostics — detailed rejection codes are
+    # only safe after the artifact is proven visible for this read.
+    if not source_artifact_in_scope(
+        artifact,
+        world_id=world_id,
+        campaign_id=campaign_id,
+        admissibility=admissibility,
+    ):
+        return None
+    rejection = _chain_rejection(
+        record, artifact, evidence_ref_id=evidence_ref_id, sources=sources
+    )
+    if rejection is not None:
+        return rejection
+    return _validated(record, artifact)
 
-    if isinstance(record, GraphEvidenceRecordV2):
-        return _resolve_v2_evidence_provenance(
-            record,
-            evidence_ref_id=evidence_ref_id,
-            sources=sources,
+
+def _flags_to_mask(flags: bytes | bytearray) -> int:
+    return int.from_bytes(flags, "little")
+
+
+class EvidenceScopeIndex:
+    """Scope-independent admission facts for one snapshot's evidence ledger.
+
+    Built once per parsed revision and source state (one batched source read)
+    and shared by every scope projected from it. Each ledger ref owns one byte
+    lane of a big integer, holding ``1`` when the ref has that property:
+
+    * the provenance chain holds (scope established, lifecycle, domain and
+      revision all valid), and
+    * per-world, per-campaign and player-visibility lanes of its artifact.
+
+    A scope's admitted set is then a few whole-ledger ``&`` / ``|`` operations
+    instead of per-ref branching. Refs that fail either path are resolved
+    exactly by :func:`resolve_evidence_provenance`, so fail-closed semantics
+    (including ``SCOPE_UNKNOWN``) are shared with the per-ref path.
+    """
+
+    def __init__(self, snapshot: ParsedGraphSnapshot, *, sources: SourceRepository) -> None:
+        self.snapshot = snapshot
+        self.sources = PrefetchedSources.for_evidence(sources, snapshot.evidence.values())
+        size = len(snapshot.evidence)
+        self._size = size
+        self._positions: dict[str, int] = {}
+        intact = bytearray(size)
+        player = bytearray(size)
+        self._worlds: dict[str, list[int]] = {}
+        self._campaigns: dict[str | None, list[int]] = {}
+        for position, (evidence_ref_id, record) in enumerate(snapshot.evidence.items()):
+            self._positions[evidence_ref_id] = position
+            artifact = _artifact_for_scope(record, sources=self.sources)
+            if isinstance(artifact, EvidenceScopeVerdict):
+                continue
+            if _chain_rejection(
+                record, artifact, evidence_ref_id=evidence_ref_id, sources=self.sources
+            ):
+                continue
+            intact[position] = 1
+            if artifact.visibility is Visibility.PLAYER:
+                player[position] = 1
+            self._worlds.setdefault(artifact.world_id, []).append(position)
+            self._campaigns.setdefault(artifact.campaign_id, []).append(position)
+        self._intact = _flags_to_mask(intact)
+        self._player = _flags_to_mask(player)
+        self._admitted: dict[tuple[str, str | None, Admissibility], bytes] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, evidence_ref_id: object) -> bool:
+        return evidence_ref_id in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def _lane_mask(self, positions: list[int] | None) -> int:
+        flags = bytearray(self._size)
+        for position in positions or ():
+            flags[position] = 1
+        return _flags_to_mask(flags)
+
+    def admitted_flags(
+        self,
+        *,
+        world_id: str,
+        campaign_id: str | None,
+        admissibility: Admissibility,
+    ) -> bytes:
+        """One byte per ledger position, plus a trailing ``0`` for unknown refs.
+
+        ``1`` exactly where :func:`resolve_evidence_provenance` would return
+        :class:`ValidatedProvenance` for this scope.
+        """
+        key = (world_id, campaign_id, admissibility)
+        with self._lock:
+            cached = self._admitted.get(key)
+        if cached is not None:
+            return cached
+        # Mirrors source_artifact_in_scope: same world; player reads see only
+        # player-visible artifacts; world-scoped reads exclude campaign-owned
+        # sources, campaign reads add their own campaign's.
+        mask = self._intact & self._lane_mask(self._worlds.get(world_id))
+        if admissibility is Admissibility.PLAYER:
+            mask &= self._player
+        campaigns = self._lane_mask(self._campaigns.get(None))
+        if campaign_id is not None:
+            campaigns |= self._lane_mask(self._campaigns.get(campaign_id))
+        mask &= campaigns
+        flags = mask.to_bytes(self._size, "little") + b"\0"
+        with self._lock:
+            self._admitted[key] = flags
+        return flags
+
+    def positions(self, evidence_ref_ids: Iterable[str]) -> Iterator[int]:
+        """Ledger positions; refs outside the ledger map to the trailing ``0``."""
+        return map(self._positions.get, evidence_ref_ids, repeat(self._size))
+
+
+class _EvidenceVerdictTable(Mapping[str, ProvenanceVerdict]):
+    """Provenance verdicts of one read scope, resolved per ref on first access.
+
+    Objects, assertions and relationships routinely cite the same evidence;
+    the chain only depends on the ref and the scope, so each verdict is
+    memoized. Iteration and length cover the whole ledger.
+    """
+
+    def __init__(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        sources: SourceRepository,
+        world_id: str,
+        campaign_id: str | None,
+        admissibility: Admissibility,
+    ) -> None:
+        self._snapshot = snapshot
+        self._sources = sources
+        self._world_id = world_id
+        self._campaign_id = campaign_id
+        self._admissibility = admissibility
+        self._verdicts: dict[str, ProvenanceVerdict] = {}
+
+    @property
+    def resolved_count(self) -> int:
+        return len(self._verdicts)
+
+    def all_admitted(self, evidence_ref_ids: list[str]) -> bool:
+        return all(
+            isinstance(self.resolve(evidence_ref_id), ValidatedProvenance)
+            for evidence_ref_id in evidence_ref_ids
+        )
+
+    def resolve(self, evidence_ref_id: str) -> ProvenanceVerdict:
+        if evidence_ref_id in self._verdicts:
+            return self._verdicts[evidence_ref_id]
+        verdict = resolve_evidence_provenance(
+            evidence_ref_id,
+            snapshot=self._snapshot,
+            sources=self._sources,
+            world_id=self._world_id,
+            campaign_id=self._campaign_id,
+            admissibility=self._admissibility,
+        )
+        self._verdicts[evidence_ref_id] = verdict
+        return verdict
+
+    def __getitem__(self, evidence_ref_id: str) -> ProvenanceVerdict:
+        if evidence_ref_id not in self:
+            raise KeyError(evidence_ref_id)
+        return self.resolve(evidence_ref_id)
+
+    def __contains__(self, evidence_ref_id: object) -> bool:
+        return evidence_ref_id in self._snapshot.evidence
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot.evidence)
+
+    def __len__(self) -> int:
+        return len(self._snapshot.evidence)
+
+
+class _IndexedEvidenceVerdictTable(_EvidenceVerdictTable):
+    """:class:`_EvidenceVerdictTable` over an :class:`EvidenceScopeIndex`.
+
+    ``all_admitted`` answers whole evidence lists from the scope's admitted
+    lanes; individual verdicts (needed for exclusion diagnostics and evidence
+    admission) are still resolved per ref, against the index's prefetched
+    sources.
+    """
+
+    def __init__(
+        self,
+        index: EvidenceScopeIndex,
+        *,
+        world_id: str,
+        campaign_id: str | None,
+        admissibility: Admissibility,
+    ) -> None:
+        super().__init__(
+            index.snapshot,
+            sources=index.sources,
             world_id=world_id,
             campaign_id=campaign_id,
             admissibility=admissibility,
         )
-    return _resolve_v1_evidence_provenance(
-        record,
-        evidence_ref_id=evidence_ref_id,
-        sources=sources,
-        world_id=world_id,
-        campaign_id=campaign_id,
-        admissibility=admissibility,
-    )
+        self._index = index
+        self._admitted = index.admitted_flags(
+            world_id=world_id, campaign_id=campaign_id, admissibility=admissibility
+        )
+
+    def all_admitted(self, evidence_ref_ids: list[str]) -> bool:
+        return 0 not in bytes(
+            map(self._admitted.__getitem__, self._index.positions(evidence_ref_ids))
+        )
 
 
 def public_coverage_gaps_for_exclusion(
@@ -470,29 +790,24 @@ def public_coverage_gaps_for_exclusion(
     return [], []
 
 
+# Returned alongside fully admitted evidence lists; callers never inspect it.
+_ADMITTED = ObjectScopeExclusion()
+
+
 def _classify_evidence_ids(
     evidence_ref_ids: list[str],
     *,
-    snapshot: ParsedGraphSnapshot,
-    sources: SourceRepository,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
+    verdicts: _EvidenceVerdictTable,
 ) -> tuple[bool, ObjectScopeExclusion]:
     """Return whether every evidence ID is in-scope+valid, plus exclusion info."""
     rejections: list[ProvenanceRejection] = []
     out_of_scope = False
     scope_unknown = False
+    if verdicts.all_admitted(evidence_ref_ids):
+        return True, _ADMITTED
     all_valid_in_scope = True
     for evidence_ref_id in evidence_ref_ids:
-        resolved = resolve_evidence_provenance(
-            evidence_ref_id,
-            snapshot=snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
-        )
+        resolved = verdicts.resolve(evidence_ref_id)
         if isinstance(resolved, ValidatedProvenance):
             continue
         all_valid_in_scope = False
@@ -521,10 +836,7 @@ def _classify_evidence_ids(
 def _project_v1_objects(
     snapshot: ParsedGraphSnapshot,
     *,
-    sources: SourceRepository,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
+    verdicts: _EvidenceVerdictTable,
 ) -> tuple[dict[str, GraphObjectView], dict[str, ObjectScopeExclusion]]:
     """Coarse-object policy for ``dm_union_graph_v1``."""
     object_exclusions: dict[str, ObjectScopeExclusion] = {}
@@ -532,11 +844,7 @@ def _project_v1_objects(
     for object_id, obj in snapshot.objects.items():
         all_valid, exclusion = _classify_evidence_ids(
             obj.evidence_ref_ids,
-            snapshot=snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
+            verdicts=verdicts,
         )
         if not all_valid or not obj.evidence_ref_ids:
             if not obj.evidence_ref_ids:
@@ -551,10 +859,7 @@ def _project_v1_objects(
 def _project_v2_objects(
     snapshot: ParsedGraphSnapshot,
     *,
-    sources: SourceRepository,
-    world_id: str,
-    campaign_id: str | None,
-    admissibility: Admissibility,
+    verdicts: _EvidenceVerdictTable,
 ) -> tuple[
     dict[str, GraphObjectView],
     dict[str, ObjectScopeExclusion],
@@ -579,11 +884,7 @@ def _project_v2_objects(
         core_ids = list(obj.core_evidence_ref_ids)
         all_valid, exclusion = _classify_evidence_ids(
             core_ids,
-            snapshot=snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
+            verdicts=verdicts,
         )
         if not all_valid or not core_ids:
             if not core_ids:
@@ -596,11 +897,7 @@ def _project_v2_objects(
         for assertion in obj.admitted_alias_assertions:
             alias_ok, alias_exclusion = _classify_evidence_ids(
                 assertion.evidence_ref_ids,
-                snapshot=snapshot,
-                sources=sources,
-                world_id=world_id,
-                campaign_id=campaign_id,
-                admissibility=admissibility,
+                verdicts=verdicts,
             )
             if alias_ok and assertion.evidence_ref_ids:
                 admitted_aliases.append(assertion)
@@ -618,11 +915,7 @@ def _project_v2_objects(
             summary = obj.admitted_summary_assertion
             summary_ok, summary_exclusion = _classify_evidence_ids(
                 summary.evidence_ref_ids,
-                snapshot=snapshot,
-                sources=sources,
-                world_id=world_id,
-                campaign_id=campaign_id,
-                admissibility=admissibility,
+                verdicts=verdicts,
             )
             if summary_ok and summary.evidence_ref_ids:
                 admitted_summary = summary
@@ -688,9 +981,7 @@ def assertion_metadata_in_scope(
 def _admit_v4_assertion(
     metadata: KnowledgeAssertionMetadataV1,
     *,
-    snapshot: ParsedGraphSnapshot,
-    sources: SourceRepository,
-    world_id: str,
+    verdicts: _EvidenceVerdictTable,
     campaign_id: str | None,
     admissibility: Admissibility,
 ) -> tuple[bool, ObjectScopeExclusion]:
@@ -707,19 +998,14 @@ def _admit_v4_assertion(
         return False, ObjectScopeExclusion(scope_unknown=True)
     return _classify_evidence_ids(
         metadata.evidence_ref_ids,
-        snapshot=snapshot,
-        sources=sources,
-        world_id=world_id,
-        campaign_id=campaign_id,
-        admissibility=admissibility,
+        verdicts=verdicts,
     )
 
 
 def _project_v4_objects(
     snapshot: ParsedGraphSnapshot,
     *,
-    sources: SourceRepository,
-    world_id: str,
+    verdicts: _EvidenceVerdictTable,
     campaign_id: str | None,
     admissibility: Admissibility,
 ) -> tuple[
@@ -742,9 +1028,7 @@ def _project_v4_objects(
             continue
         existence_ok, existence_exclusion = _admit_v4_assertion(
             existence,
-            snapshot=snapshot,
-            sources=sources,
-            world_id=world_id,
+            verdicts=verdicts,
             campaign_id=campaign_id,
             admissibility=admissibility,
         )
@@ -758,9 +1042,7 @@ def _project_v4_objects(
             assert alias.assertion_metadata is not None
             alias_ok, alias_exclusion = _admit_v4_assertion(
                 alias.assertion_metadata,
-                snapshot=snapshot,
-                sources=sources,
-                world_id=world_id,
+                verdicts=verdicts,
                 campaign_id=campaign_id,
                 admissibility=admissibility,
             )
@@ -776,9 +1058,7 @@ def _project_v4_objects(
             assert summary.assertion_metadata is not None
             summary_ok, summary_exclusion = _admit_v4_assertion(
                 summary.assertion_metadata,
-                snapshot=snapshot,
-                sources=sources,
-                world_id=world_id,
+                verdicts=verdicts,
                 campaign_id=campaign_id,
                 admissibility=admissibility,
             )
@@ -792,9 +1072,7 @@ def _project_v4_objects(
             assert prop.assertion_metadata is not None
             property_ok, property_exclusion = _admit_v4_assertion(
                 prop.assertion_metadata,
-                snapshot=snapshot,
-                sources=sources,
-                world_id=world_id,
+                verdicts=verdicts,
                 campaign_id=campaign_id,
                 admissibility=admissibility,
             )
@@ -840,6 +1118,19 @@ def _project_v4_objects(
     return objects, object_exclusions, assertion_exclusions, omitted_alias_index
 
 
+def _carry_relationship_index(
+    index: dict[str, list[str]],
+    retained: dict[str, GraphRelationshipView],
+) -> dict[str, list[str]]:
+    """Restrict a parent adjacency map to retained relationships (order kept)."""
+    carried: dict[str, list[str]] = {}
+    for key, relationship_ids in index.items():
+        kept = [rid for rid in relationship_ids if rid in retained]
+        if kept:
+            carried[key] = kept
+    return carried
+
+
 def project_scoped_snapshot(
     snapshot: ParsedGraphSnapshot,
     *,
@@ -847,6 +1138,7 @@ def project_scoped_snapshot(
     world_id: str,
     campaign_id: str | None,
     admissibility: Admissibility,
+    scope_index: EvidenceScopeIndex | None = None,
 ) -> ScopedGraphProjection:
     """Return a scoped snapshot and exclusion diagnostics.
 
@@ -855,10 +1147,35 @@ def project_scoped_snapshot(
     V4 filters every assertion by its own campaign scope and visibility before
     the same evidence-provenance checks.
 
+    Every object is visited, so a lazy snapshot (:class:`LazyObjectTable`) is
+    fully materialized here; lazy readers suit hosts that only look objects up.
+
     Graph-global exclusions are retained per object/relationship/assertion for
     callers that need targeted diagnostics. They must not be copied wholesale
     into public ``Coverage`` on every turn.
+
+    ``scope_index`` lets callers projecting several scopes of one snapshot
+    under one source state share its :class:`EvidenceScopeIndex`. Without one
+    (or with one built for another snapshot), each cited ref is resolved on
+    its own against one batched source read; building the whole-ledger index
+    only pays off when it is reused.
     """
+    verdicts: _EvidenceVerdictTable
+    if scope_index is not None and scope_index.snapshot is snapshot:
+        verdicts = _IndexedEvidenceVerdictTable(
+            scope_index,
+            world_id=world_id,
+            campaign_id=campaign_id,
+            admissibility=admissibility,
+        )
+    else:
+        verdicts = _EvidenceVerdictTable(
+            snapshot,
+            sources=PrefetchedSources.for_evidence(sources, snapshot.evidence.values()),
+            world_id=world_id,
+            campaign_id=campaign_id,
+            admissibility=admissibility,
+        )
     assertion_exclusions: dict[str, ObjectScopeExclusion] = {}
     omitted_alias_index: dict[str, list[str]] = {}
     if snapshot.graph_schema in (GRAPH_SCHEMA_V4, GRAPH_SCHEMA_V5):
@@ -869,8 +1186,7 @@ def project_scoped_snapshot(
             omitted_alias_index,
         ) = _project_v4_objects(
             snapshot,
-            sources=sources,
-            world_id=world_id,
+            verdicts=verdicts,
             campaign_id=campaign_id,
             admissibility=admissibility,
         )
@@ -880,21 +1196,9 @@ def project_scoped_snapshot(
             object_exclusions,
             assertion_exclusions,
             omitted_alias_index,
-        ) = _project_v2_objects(
-            snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
-        )
+        ) = _project_v2_objects(snapshot, verdicts=verdicts)
     else:
-        objects, object_exclusions = _project_v1_objects(
-            snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
-        )
+        objects, object_exclusions = _project_v1_objects(snapshot, verdicts=verdicts)
 
     relationship_exclusions: dict[str, ObjectScopeExclusion] = {}
     relationships: dict[str, GraphRelationshipView] = {}
@@ -913,11 +1217,7 @@ def project_scoped_snapshot(
             continue
         all_valid, exclusion = _classify_evidence_ids(
             rel.evidence_ref_ids,
-            snapshot=snapshot,
-            sources=sources,
-            world_id=world_id,
-            campaign_id=campaign_id,
-            admissibility=admissibility,
+            verdicts=verdicts,
         )
         if not all_valid or not rel.evidence_ref_ids:
             if not rel.evidence_ref_ids:
@@ -938,28 +1238,38 @@ def project_scoped_snapshot(
         for rel in relationships.values()
         for evidence_ref_id in rel.evidence_ref_ids
     }
+    # Look up retained records only: compact ledgers build a view per access.
     evidence = {
-        evidence_ref_id: record
-        for evidence_ref_id, record in snapshot.evidence.items()
+        evidence_ref_id: snapshot.evidence[evidence_ref_id]
+        for evidence_ref_id in snapshot.evidence
         if evidence_ref_id in retained_evidence_ids
     }
 
     label_index, alias_index = build_label_and_alias_indexes(objects)
 
+    scoped = ParsedGraphSnapshot(
+        world_id=snapshot.world_id,
+        graph_schema=snapshot.graph_schema,
+        objects=objects,
+        relationships=relationships,
+        evidence=evidence,
+        label_index=label_index,
+        alias_index=alias_index,
+        semantic_profile_ref=snapshot.semantic_profile_ref,
+        semantic_profile_descriptor=snapshot.semantic_profile_descriptor,
+        subject_index=_carry_relationship_index(snapshot.subject_index, relationships),
+        object_index=_carry_relationship_index(snapshot.object_index, relationships),
+        predicate_index=_carry_relationship_index(snapshot.predicate_index, relationships),
+    )
+    # Reuse the revision's compiled matcher and degree stats rather than
+    # rebuilding them over every projection.
+    carry_derived_indexes(scoped, snapshot, dropped_relationship_ids=relationship_exclusions)
+
     return ScopedGraphProjection(
-        snapshot=ParsedGraphSnapshot(
-            world_id=snapshot.world_id,
-            graph_schema=snapshot.graph_schema,
-            objects=objects,
-            relationships=relationships,
-            evidence=evidence,
-            label_index=label_index,
-            alias_index=alias_index,
-            semantic_profile_ref=snapshot.semantic_profile_ref,
-            semantic_profile_descriptor=snapshot.semantic_profile_descriptor,
-        ),
+        snapshot=scoped,
         object_exclusions=object_exclusions,
         relationship_exclusions=relationship_exclusions,
         assertion_exclusions=assertion_exclusions,
         omitted_alias_index=omitted_alias_index,
+        evidence_verdicts=verdicts,
     )
@@ -0,0 +1,250 @@
+"""Bounded cache of scoped graph projections.
+
+For one parsed revision, :func:`project_scoped_snapshot` depends only on
+``(world_id, campaign_id, admissibility)`` and the state of the source
+artifacts/revisions its evidence references. Entries are therefore keyed on
+the revision identity, the scope triple, and
+``SourceRepository.state_version(world_id)``.
+
+The source stamp is read *before* projecting: a write that lands mid-projection
+leaves the entry under the old stamp, which the next lookup no longer matches.
+Observing a new stamp for a world drops every entry of that world built against
+an older one; other worlds' entries are untouched. Cached projections are
+shared between callers and must be treated as read-only.
+
+Scopes of one revision also share its :class:`EvidenceScopeIndex`, kept in an
+:class:`EvidenceScopeIndexCache` keyed on the revision identity and the stamp.
+That cache stands on its own, so services that do not keep projections can
+still build each revision's index once per source state.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..contracts.graph import WorldGraphRevision
+from ..contracts.projection import Admissibility
+from .graph_scope import EvidenceScopeIndex, ScopedGraphProjection, project_scoped_snapshot
+from .graph_snapshot import ParsedGraphSnapshot
+from .repositories import SourceRepository
+
+ScopedProjectionKey = tuple[str, str, str, str | None, str]
+ScopeIndexKey = tuple[str, str, str, str]
+
+# Evidence scope indexes are ledger-sized; a few revisions cover the heads in
+# active use.
+DEFAULT_MAX_SCOPE_INDEXES = 4
+
+
+@dataclass(frozen=True)
+class EvidenceScopeIndexCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+
+
+class EvidenceScopeIndexCache:
+    """Thread-safe LRU of :class:`EvidenceScopeIndex` per revision and source stamp.
+
+    Keyed on ``(revision_id, graph_payload_sha256, world_id, state_version)``
+    where the stamp is ``world_id``'s, read by the caller *before* the index is
+    built. Storing an index drops the same revision's indexes under other
+    stamps; an index built from a different parse of the revision is replaced.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_SCOPE_INDEXES) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ScopeIndexKey, EvidenceScopeIndex] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_build(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        revision: WorldGraphRevision,
+        sources: SourceRepository,
+        world_id: str,
+        state_version: str,
+    ) -> EvidenceScopeIndex:
+        """Return the cached index of ``snapshot`` or build it through ``sources``.
+
+        ``snapshot`` must be the parse of ``revision``; callers own that binding.
+        """
+        key: ScopeIndexKey = (
+            revision.revision_id,
+            revision.graph_payload_sha256,
+            world_id,
+            state_version,
+        )
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.snapshot is snapshot:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        scope_index = EvidenceScopeIndex(snapshot, sources=sources)
+        with self._lock:
+            for stale in [
+                other for other in self._entries if other[:3] == key[:3] and other != key
+            ]:
+                del self._entries[stale]
+            self._entries[key] = scope_index
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return scope_index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> EvidenceScopeIndexCacheStats:
+        with self._lock:
+            return EvidenceScopeIndexCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+            )
+
+
+@dataclass(frozen=True)
+class ScopedProjectionCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    max_entries: int
+    indexes: int
+
+
+class ScopedProjectionCache:
+    """Thread-safe LRU of scoped projections bound to per-world source-state stamps.
+
+    ``scope_indexes`` may be shared with other consumers of the same
+    revisions; a private one holding ``max_indexes`` indexes is used otherwise.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_indexes: int = DEFAULT_MAX_SCOPE_INDEXES,
+        scope_indexes: EvidenceScopeIndexCache | None = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_indexes <= 0:
+            raise ValueError("max_indexes must be positive")
+        self._max_entries = max_entries
+        self._owns_scope_indexes = scope_indexes is None
+        self._scope_indexes = (
+            scope_indexes
+            if scope_indexes is not None
+            else EvidenceScopeIndexCache(max_entries=max_indexes)
+        )
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ScopedProjectionKey, ScopedGraphProjection] = (
+            OrderedDict()
+        )
+        self._state_versions: dict[str, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get_or_project(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        revision: WorldGraphRevision,
+        sources: SourceRepository,
+        world_id: str,
+        campaign_id: str | None,
+        admissibility: Admissibility,
+        state_version: str | None = None,
+    ) -> ScopedGraphProjection:
+        """Return the cached projection or scope ``snapshot`` through ``sources``.
+
+        ``snapshot`` must be the parse of ``revision``; callers own that binding.
+        Callers that already read ``world_id``'s source stamp for the turn pass
+        it as ``state_version``; otherwise it is read from ``sources``.
+        """
+        if state_version is None:
+            state_version = sources.state_version(world_id)
+        key: ScopedProjectionKey = (
+            revision.revision_id,
+            revision.graph_payload_sha256,
+            world_id,
+            campaign_id,
+            admissibility.value,
+        )
+        with self._lock:
+            self._observe(world_id, state_version)
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        scope_index = self._scope_indexes.get_or_build(
+            snapshot,
+            revision=revision,
+            sources=sources,
+            world_id=world_id,
+            state_version=state_version,
+        )
+        projection = project_scoped_snapshot(
+            snapshot,
+            sources=sources,
+            world_id=world_id,
+            campaign_id=campaign_id,
+            admissibility=admissibility,
+            scope_index=scope_index,
+        )
+        with self._lock:
+            if state_version != self._state_versions.get(world_id):
+                # Sources moved on while projecting; serve, never retain.
+                return projection
+            self._entries[key] = projection
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return projection
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._state_versions.clear()
+        if self._owns_scope_indexes:
+            self._scope_indexes.clear()
+
+    def stats(self) -> ScopedProjectionCacheStats:
+        with self._lock:
+            return ScopedProjectionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+                indexes=self._scope_indexes.stats().entries,
+            )
+
+    def _observe(self, world_id: str, state_version: str) -> None:
+        """Drop ``world_id``'s entries when its stamp is new. Caller holds the lock."""
+        if self._state_versions.get(world_id) == state_version:
+            return
+        stale = [key for key in self._entries if key[2] == world_id]
+        if stale:
+            self._invalidations += 1
+        for key in stale:
+            del self._entries[key]
+        self._state_versions[world_id] = state_version
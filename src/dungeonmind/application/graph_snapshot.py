@@ -12,10 +12,14 @@ plus a pinned ``SemanticProfileRef`` with namespace-admitted terms), and
 from __future__ import annotations
 
 import re
+import string
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any, Literal, Protocol, Self
 
-from pydantic import Field, ValidationError, model_validator
+from pydantic import Field, TypeAdapter, ValidationError, model_validator
 
 from ..contracts.base import DungeonMindModel
 from ..contracts.evidence import (
@@ -33,6 +37,7 @@ from ..contracts.semantic_profile import (
 )
 from ..domain.errors import PersistenceIntegrityError
 from .semantic_profiles import (
+    ProfilePin,
     SemanticProfileRegistry,
     resolve_and_verify_profile,
     validate_qualified_term,
@@ -161,6 +166,13 @@ GraphEvidenceRecordV2 = EvidenceRefV2
 
 GraphEvidenceLedgerRecord = GraphEvidenceRecord | GraphEvidenceRecordV2
 
+# Record lists validate in one pydantic-core call instead of a ``model_validate``
+# per item. Per-record validators still run; error locations gain a list index.
+_NODE_RECORDS = TypeAdapter(list[GraphNodeRecord])
+_NODE_V2_RECORDS = TypeAdapter(list[GraphNodeV2Record])
+_RELATIONSHIP_RECORDS = TypeAdapter(list[GraphRelationshipRecord])
+_EVIDENCE_RECORDS = TypeAdapter(list[GraphEvidenceRecord])
+
 
 class AdmittedAliasAssertion(DungeonMindModel):
     """Internal admitted alias assertion (excluded from public dumps).
@@ -245,13 +257,104 @@ class GraphRelationshipView(DungeonMindModel):
 class ParsedGraphSnapshot:
     world_id: str
     graph_schema: str
-    objects: dict[str, GraphObjectView]
-    relationships: dict[str, GraphRelationshipView]
-    evidence: dict[str, GraphEvidenceLedgerRecord]
+    # Plain dicts from the readers; read-only tables on the compact backend.
+    objects: Mapping[str, GraphObjectView]
+    relationships: Mapping[str, GraphRelationshipView]
+    evidence: Mapping[str, GraphEvidenceLedgerRecord]
     label_index: dict[str, list[str]] = field(default_factory=dict)
     alias_index: dict[str, list[str]] = field(default_factory=dict)
     semantic_profile_ref: SemanticProfileRef | None = None
     semantic_profile_descriptor: SemanticProfileDescriptor | None = None
+    # Adjacency: object ID (or predicate) → sorted relationship IDs.
+    subject_index: dict[str, list[str]] = field(default_factory=dict)
+    object_index: dict[str, list[str]] = field(default_factory=dict)
+    predicate_index: dict[str, list[str]] = field(default_factory=dict)
+
+    @cached_property
+    def mention_matcher(self) -> MentionMatcher:
+        """Compiled on first use; snapshots are immutable once built.
+
+        Scoped projections inherit a restricted view of their parent's matcher
+        via :func:`carry_derived_indexes` instead of compiling their own.
+        """
+        return MentionMatcher(
+            object_ids=PhraseMatcher(self.objects),
+            labels=PhraseMatcher(self.label_index),
+            aliases=PhraseMatcher(self.alias_index),
+        )
+
+    @cached_property
+    def degree_stats(self) -> GraphDegreeStats:
+        """Computed once per parsed revision from the adjacency indexes.
+
+        Scoped projections inherit their parent's stats, less the dropped
+        relationships, via :func:`carry_derived_indexes`.
+        """
+        return GraphDegreeStats.from_snapshot(self)
+
+
+@dataclass(frozen=True)
+class GraphDegreeStats:
+    """Relationship counts per object for one parsed revision.
+
+    ``degrees`` holds only objects with at least one relationship; a
+    relationship from an object to itself counts once.
+    """
+
+    degrees: dict[str, int]
+    max_degree: int = 0
+    mean_degree: float = 0.0
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ParsedGraphSnapshot) -> GraphDegreeStats:
+        subject_index, object_index = _adjacency(snapshot)
+        degrees: dict[str, int] = {}
+        for object_id in subject_index.keys() | object_index.keys():
+            outgoing = subject_index.get(object_id, ())
+            incoming = object_index.get(object_id, ())
+            # Self-loops appear in both lists; count each relationship once.
+            loops = len(set(outgoing).intersection(incoming)) if outgoing and incoming else 0
+            degrees[object_id] = len(outgoing) + len(incoming) - loops
+        return cls(
+            degrees=degrees,
+            max_degree=max(degrees.values(), default=0),
+            mean_degree=sum(degrees.values()) / len(snapshot.objects) if snapshot.objects else 0.0,
+        )
+
+    def degree(self, object_id: str) -> int:
+        return self.degrees.get(object_id, 0)
+
+    def restricted(
+        self,
+        object_ids: Iterable[str],
+        dropped: Iterable[GraphRelationshipView],
+    ) -> GraphDegreeStats:
+        """Stats over ``object_ids`` once the ``dropped`` relationships are removed.
+
+        Equal to :meth:`from_snapshot` on the restricted snapshot, in time
+        proportional to the retained objects and dropped relationships.
+        """
+        kept = set(object_ids)
+        degrees = {
+            object_id: degree
+            for object_id, degree in self.degrees.items()
+            if object_id in kept
+        }
+        for rel in dropped:
+            # A set, so a self-loop is removed once.
+            for endpoint in {rel.subject_object_id, rel.object_object_id}:
+                remaining = degrees.get(endpoint)
+                if remaining is None:
+                    continue
+                if remaining > 1:
+                    degrees[endpoint] = remaining - 1
+                else:
+                    del degrees[endpoint]
+        return GraphDegreeStats(
+            degrees=degrees,
+            max_degree=max(degrees.values(), default=0),
+            mean_degree=sum(degrees.values()) / len(kept) if kept else 0.0,
+        )
 
 
 class GraphSnapshotReader(Protocol):
@@ -310,6 +413,125 @@ def contains_exact_phrase(haystack: str, needle: str) -> bool:
     return re.search(pattern, haystack) is not None
 
 
+# Set form of ``_TOKEN_CONTINUATION`` for the compiled matcher below.
+_TOKEN_CONTINUATION_CHARS = frozenset(string.ascii_letters + string.digits + "_:-")
+
+
+class _PhraseTrieNode:
+    __slots__ = ("children", "phrase")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PhraseTrieNode] = {}
+        self.phrase: str | None = None
+
+
+class PhraseMatcher:
+    """Compiled multi-phrase form of :func:`contains_exact_phrase`.
+
+    ``find`` returns exactly the phrases for which ``contains_exact_phrase``
+    would be true, in one pass over the haystack: a character trie is walked
+    only from positions not preceded by a token-continuation character, and a
+    phrase counts only where the following character is not one either.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self._root = _PhraseTrieNode()
+        self._allowed: frozenset[str] | None = None
+        for phrase in phrases:
+            if not phrase:
+                continue
+            node = self._root
+            for char in phrase:
+                child = node.children.get(char)
+                if child is None:
+                    child = _PhraseTrieNode()
+                    node.children[char] = child
+                node = child
+            node.phrase = phrase
+
+    def find(self, haystack: str) -> set[str]:
+        found: set[str] = set()
+        root_children = self._root.children
+        if not root_children:
+            return found
+        continuation = _TOKEN_CONTINUATION_CHARS
+        length = len(haystack)
+        for start in range(length):
+            if start and haystack[start - 1] in continuation:
+                continue
+            node = root_children.get(haystack[start])
+            end = start + 1
+            while node is not None:
+                if node.phrase is not None and (
+                    end == length or haystack[end] not in continuation
+                ):
+                    found.add(node.phrase)
+                if end == length:
+                    break
+                node = node.children.get(haystack[end])
+                end += 1
+        if self._allowed is not None:
+            found &= self._allowed
+        return found
+
+    def restricted(self, phrases: Iterable[str]) -> PhraseMatcher:
+        """Share this trie but report only ``phrases``.
+
+        Every phrase must already be compiled into this matcher; a phrase
+        outside it is never found.
+        """
+        matcher = PhraseMatcher(())
+        matcher._root = self._root
+        matcher._allowed = frozenset(phrases)
+        return matcher
+
+
+@dataclass(frozen=True)
+class MentionMatcher:
+    """Per-snapshot compiled matchers for exact IDs, labels, and aliases."""
+
+    object_ids: PhraseMatcher
+    labels: PhraseMatcher
+    aliases: PhraseMatcher
+
+
+def _restrict_matcher(
+    matcher: PhraseMatcher,
+    compiled: Mapping[str, object],
+    phrases: Iterable[str],
+) -> PhraseMatcher:
+    wanted = list(phrases)
+    if all(phrase in compiled for phrase in wanted):
+        return matcher.restricted(wanted)
+    return PhraseMatcher(wanted)
+
+
+def carry_derived_indexes(
+    scoped: ParsedGraphSnapshot,
+    parent: ParsedGraphSnapshot,
+    *,
+    dropped_relationship_ids: Iterable[str],
+) -> None:
+    """Seed ``scoped``'s mention matcher and degree stats from ``parent``.
+
+    ``scoped`` must be a restriction of ``parent``: its objects and
+    relationships are taken from it, and ``dropped_relationship_ids`` lists
+    every parent relationship it left out. A scoped index phrase missing from
+    the parent's falls back to a fresh matcher for that index.
+    """
+    parent_matcher = parent.mention_matcher
+    derived = vars(scoped)  # ``cached_property`` storage; the dataclass is frozen.
+    derived["mention_matcher"] = MentionMatcher(
+        object_ids=_restrict_matcher(parent_matcher.object_ids, parent.objects, scoped.objects),
+        labels=_restrict_matcher(parent_matcher.labels, parent.label_index, scoped.label_index),
+        aliases=_restrict_matcher(parent_matcher.aliases, parent.alias_index, scoped.alias_index),
+    )
+    derived["degree_stats"] = parent.degree_stats.restricted(
+        scoped.objects,
+        (parent.relationships[relationship_id] for relationship_id in dropped_relationship_ids),
+    )
+
+
 def build_label_and_alias_indexes(
     objects: dict[str, GraphObjectView],
 ) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
@@ -327,6 +549,21 @@ def build_label_and_alias_indexes(
     return label_index, alias_index
 
 
+def build_relationship_indexes(
+    relationships: dict[str, GraphRelationshipView],
+) -> tuple[dict[str, list[str]], dict[str, list[str]], dict[str, list[str]]]:
+    """Build subject / object / predicate adjacency over relationship IDs."""
+    subject_index: dict[str, list[str]] = {}
+    object_index: dict[str, list[str]] = {}
+    predicate_index: dict[str, list[str]] = {}
+    for relationship_id in sorted(relationships):
+        rel = relationships[relationship_id]
+        subject_index.setdefault(rel.subject_object_id, []).append(relationship_id)
+        object_index.setdefault(rel.object_object_id, []).append(relationship_id)
+        predicate_index.setdefault(rel.predicate, []).append(relationship_id)
+    return subject_index, object_index, predicate_index
+
+
 def get_object_from_snapshot(
     snapshot: ParsedGraphSnapshot,
     object_id: str,
@@ -339,12 +576,19 @@ def list_relationships_from_snapshot(
     object_ids: list[str],
 ) -> list[GraphRelationshipView]:
     focus = set(object_ids)
-    matched = [
-        rel
-        for rel in snapshot.relationships.values()
-        if rel.subject_object_id in focus or rel.object_object_id in focus
-    ]
-    return sorted(matched, key=lambda rel: rel.relationship_id)
+    if snapshot.relationships and not (snapshot.subject_index or snapshot.object_index):
+        # Hand-assembled snapshot without adjacency: fall back to a full scan.
+        matched = [
+            rel
+            for rel in snapshot.relationships.values()
+            if rel.subject_object_id in focus or rel.object_object_id in focus
+        ]
+        return sorted(matched, key=lambda rel: rel.relationship_id)
+    matched_ids: set[str] = set()
+    for object_id in focus:
+        matched_ids.update(snapshot.subject_index.get(object_id, ()))
+        matched_ids.update(snapshot.object_index.get(object_id, ()))
+    return [snapshot.relationships[rid] for rid in sorted(matched_ids)]
 
 
 def resolve_mentions_from_snapshot(
@@ -387,30 +631,30 @@ def resolve_mentions_from_snapshot(
         else:
             _emit(object_id, IdentityOutcome.REJECTED, None)
 
-    for object_id in sorted(snapshot.objects):
-        if contains_exact_phrase(message, object_id):
-            _emit(object_id, IdentityOutcome.RESOLVED_EXISTING, object_id)
+    matcher = snapshot.mention_matcher
+    for object_id in sorted(matcher.object_ids.find(message)):
+        _emit(object_id, IdentityOutcome.RESOLVED_EXISTING, object_id)
 
-    for label, object_ids in sorted(snapshot.label_index.items()):
-        if label and contains_exact_phrase(normalized_message, label):
-            if len(object_ids) == 1:
-                obj = snapshot.objects[object_ids[0]]
-                _emit(obj.label, IdentityOutcome.RESOLVED_EXISTING, object_ids[0])
-            else:
-                _emit(
-                    snapshot.objects[object_ids[0]].label,
-                    IdentityOutcome.AMBIGUOUS,
-                    None,
-                )
+    for label in sorted(matcher.labels.find(normalized_message)):
+        object_ids = snapshot.label_index[label]
+        if len(object_ids) == 1:
+            obj = snapshot.objects[object_ids[0]]
+            _emit(obj.label, IdentityOutcome.RESOLVED_EXISTING, object_ids[0])
+        else:
+            _emit(
+                snapshot.objects[object_ids[0]].label,
+                IdentityOutcome.AMBIGUOUS,
+                None,
+            )
 
     ambiguous_object_ids: set[str] = set()
-    for alias, object_ids in sorted(snapshot.alias_index.items()):
-        if alias and contains_exact_phrase(normalized_message, alias):
-            if len(object_ids) == 1:
-                _emit(alias, IdentityOutcome.RESOLVED_EXISTING, object_ids[0])
-            else:
-                ambiguous_object_ids.update(object_ids)
-                _emit(alias, IdentityOutcome.AMBIGUOUS, None)
+    for alias in sorted(matcher.aliases.find(normalized_message)):
+        object_ids = snapshot.alias_index[alias]
+        if len(object_ids) == 1:
+            _emit(alias, IdentityOutcome.RESOLVED_EXISTING, object_ids[0])
+        else:
+            ambiguous_object_ids.update(object_ids)
+            _emit(alias, IdentityOutcome.AMBIGUOUS, None)
 
     # Semantic candidates must not override an exact ambiguous alias match by
     # emitting resolved_existing under a visible primary label.
@@ -427,24 +671,25 @@ def resolve_mentions_from_snapshot(
 def _parse_common_evidence_and_relationships(
     *,
     graph_payload: dict[str, Any],
-    objects: dict[str, GraphObjectView],
+    objects: Mapping[str, GraphObjectView],
+    base_evidence: Mapping[str, GraphEvidenceLedgerRecord] | None = None,
+    base_relationships: Mapping[str, GraphRelationshipView] | None = None,
 ) -> tuple[dict[str, GraphEvidenceLedgerRecord], dict[str, GraphRelationshipView]]:
+    """Parse payload evidence and relationships, appending to any already-parsed base."""
     try:
-        relationships = [
-            GraphRelationshipRecord.model_validate(rel)
-            for rel in graph_payload.get("relationships", [])
-        ]
-        evidence_rows = [
-            GraphEvidenceRecord.model_validate(row)
-            for row in graph_payload.get("evidence_refs", [])
-        ]
+        relationships = _RELATIONSHIP_RECORDS.validate_python(
+            graph_payload.get("relationships", [])
+        )
+        evidence_rows = _EVIDENCE_RECORDS.validate_python(
+            graph_payload.get("evidence_refs", [])
+        )
     except (ValidationError, TypeError, ValueError) as exc:
         raise PersistenceIntegrityError(
             "malformed graph relationship or evidence record",
             details={"error": str(exc)},
         ) from exc
 
-    evidence: dict[str, GraphEvidenceLedgerRecord] = {}
+    evidence: dict[str, GraphEvidenceLedgerRecord] = dict(base_evidence or {})
     for row in evidence_rows:
         prior = evidence.get(row.evidence_ref_id)
         if prior is not None and prior.model_dump() != row.model_dump():
@@ -454,7 +699,7 @@ def _parse_common_evidence_and_relationships(
             )
         evidence[row.evidence_ref_id] = row
 
-    relationships_by_id: dict[str, GraphRelationshipView] = {}
+    relationships_by_id: dict[str, GraphRelationshipView] = dict(base_relationships or {})
     for rel in relationships:
         if rel.relationship_id in relationships_by_id:
             raise PersistenceIntegrityError(
@@ -511,15 +756,86 @@ def _reject_semantic_profile_field(
         )
 
 
+def _validate_v2_node(node: Any) -> GraphNodeV2Record:
+    try:
+        return GraphNodeV2Record.model_validate(node)
+    except (ValidationError, TypeError, ValueError) as exc:
+        raise PersistenceIntegrityError(
+            "malformed graph node, relationship, or evidence record",
+            details={"error": str(exc)},
+        ) from exc
+
+
+def _claim_node_assertion_id(assertion_id: str, assertion_ids: set[str]) -> None:
+    if assertion_id in assertion_ids:
+        raise PersistenceIntegrityError(
+            f"duplicate assertion_id {assertion_id!r}",
+            details={"assertion_id": assertion_id},
+        )
+    assertion_ids.add(assertion_id)
+
+
+def _build_v2_shaped_object(
+    node: GraphNodeV2Record,
+    *,
+    assertion_ids: set[str],
+) -> GraphObjectView:
+    seen_aliases: set[str] = set()
+    alias_views: list[AdmittedAliasAssertion] = []
+    for assertion in node.alias_assertions:
+        _claim_node_assertion_id(assertion.assertion_id, assertion_ids)
+        normalized_alias = _norm(assertion.alias)
+        if normalized_alias in seen_aliases:
+            raise PersistenceIntegrityError(
+                f"duplicate normalized alias {assertion.alias!r} on "
+                f"object {node.object_id!r}",
+                details={"object_id": node.object_id, "alias": assertion.alias},
+            )
+        seen_aliases.add(normalized_alias)
+        alias_views.append(
+            AdmittedAliasAssertion(
+                assertion_id=assertion.assertion_id,
+                alias=assertion.alias,
+                evidence_ref_ids=list(assertion.evidence_ref_ids),
+            )
+        )
+
+    summary_view: AdmittedSummaryAssertion | None = None
+    if node.summary_assertion is not None:
+        assertion = node.summary_assertion
+        _claim_node_assertion_id(assertion.assertion_id, assertion_ids)
+        summary_view = AdmittedSummaryAssertion(
+            assertion_id=assertion.assertion_id,
+            summary=assertion.summary,
+            evidence_ref_ids=list(assertion.evidence_ref_ids),
+        )
+
+    retained_evidence = list(node.evidence_ref_ids)
+    for alias_view in alias_views:
+        retained_evidence.extend(alias_view.evidence_ref_ids)
+    if summary_view is not None:
+        retained_evidence.extend(summary_view.evidence_ref_ids)
+
+    return GraphObjectView(
+        object_id=node.object_id,
+        kind=node.kind,
+        label=node.label,
+        aliases=[item.alias for item in alias_views],
+        evidence_ref_ids=list(dict.fromkeys(retained_evidence)),
+        summary=summary_view.summary if summary_view is not None else None,
+        object_field_schema="v2",
+        core_evidence_ref_ids=list(node.evidence_ref_ids),
+        admitted_alias_assertions=alias_views,
+        admitted_summary_assertion=summary_view,
+    )
+
+
 def _parse_v2_shaped_objects(
     graph_payload: dict[str, Any],
 ) -> dict[str, GraphObjectView]:
     """Shared node parse for ``dm_union_graph_v2`` / ``dm_union_graph_v3``."""
     try:
-        nodes = [
-            GraphNodeV2Record.model_validate(node)
-            for node in graph_payload.get("nodes", [])
-        ]
+        nodes = _NODE_V2_RECORDS.validate_python(graph_payload.get("nodes", []))
     except (ValidationError, TypeError, ValueError) as exc:
         raise PersistenceIntegrityError(
             "malformed graph node, relationship, or evidence record",
@@ -534,65 +850,221 @@ def _parse_v2_shaped_objects(
                 f"duplicate object_id {node.object_id!r}",
                 details={"object_id": node.object_id},
             )
-        seen_aliases: set[str] = set()
-        alias_views: list[AdmittedAliasAssertion] = []
-        for assertion in node.alias_assertions:
-            if assertion.assertion_id in assertion_ids:
-                raise PersistenceIntegrityError(
-                    f"duplicate assertion_id {assertion.assertion_id!r}",
-                    details={"assertion_id": assertion.assertion_id},
-                )
-            assertion_ids.add(assertion.assertion_id)
-            normalized_alias = _norm(assertion.alias)
-            if normalized_alias in seen_aliases:
-                raise PersistenceIntegrityError(
-                    f"duplicate normalized alias {assertion.alias!r} on "
-                    f"object {node.object_id!r}",
-                    details={"object_id": node.object_id, "alias": assertion.alias},
-                )
-            seen_aliases.add(normalized_alias)
-            alias_views.append(
-                AdmittedAliasAssertion(
-                    assertion_id=assertion.assertion_id,
-                    alias=assertion.alias,
-                    evidence_ref_ids=list(assertion.evidence_ref_ids),
-                )
-            )
+        objects[node.object_id] = _build_v2_shaped_object(
+            node, assertion_ids=assertion_ids
+        )
+    return objects
 
-        summary_view: AdmittedSummaryAssertion | None = None
-        if node.summary_assertion is not None:
-            assertion = node.summary_assertion
-            if assertion.assertion_id in assertion_ids:
-                raise PersistenceIntegrityError(
-                    f"duplicate assertion_id {assertion.assertion_id!r}",
-                    details={"assertion_id": assertion.assertion_id},
-                )
-            assertion_ids.add(assertion.assertion_id)
-            summary_view = AdmittedSummaryAssertion(
-                assertion_id=assertion.assertion_id,
-                summary=assertion.summary,
-                evidence_ref_ids=list(assertion.evidence_ref_ids),
-            )
 
-        retained_evidence = list(node.evidence_ref_ids)
-        for alias_view in alias_views:
-            retained_evidence.extend(alias_view.evidence_ref_ids)
-        if summary_view is not None:
-            retained_evidence.extend(summary_view.evidence_ref_ids)
-
-        objects[node.object_id] = GraphObjectView(
-            object_id=node.object_id,
-            kind=node.kind,
-            label=node.label,
-            aliases=[item.alias for item in alias_views],
-            evidence_ref_ids=list(dict.fromkeys(retained_evidence)),
-            summary=summary_view.summary if summary_view is not None else None,
-            object_field_schema="v2",
-            core_evidence_ref_ids=list(node.evidence_ref_ids),
-            admitted_alias_assertions=alias_views,
-            admitted_summary_assertion=summary_view,
+class LazyObjectTable(Mapping[str, GraphObjectView]):
+    """Object mapping that validates and builds each view on first access.
+
+    Lazy readers check identifiers, assertion IDs and evidence references in a
+    structural pass; the per-object validation an eager parse performs runs in
+    ``__getitem__`` and raises the same ``PersistenceIntegrityError``. Built
+    views are kept, failures are not, so a broken object fails on every access.
+    Raw records are held by reference: payloads must not be mutated after parse.
+    """
+
+    __slots__ = ("_build", "_built", "_records")
+
+    def __init__(
+        self,
+        records: dict[str, Any],
+        build: Callable[[Any], GraphObjectView],
+    ) -> None:
+        self._records = records
+        self._build = build
+        self._built: dict[str, GraphObjectView] = {}
+
+    def __getitem__(self, object_id: str) -> GraphObjectView:
+        view = self._built.get(object_id)
+        if view is None:
+            view = self._build(self._records[object_id])
+            view = self._built.setdefault(object_id, view)
+        return view
+
+    def __contains__(self, object_id: object) -> bool:
+        return object_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def materialized_count(self) -> int:
+        return len(self._built)
+
+
+def is_lazy_snapshot(snapshot: ParsedGraphSnapshot) -> bool:
+    return isinstance(snapshot.objects, LazyObjectTable)
+
+
+# (label, alias texts, (assertion kind, assertion_id) pairs, evidence ID lists)
+# read straight off one raw object record; anything unreadable is left to build.
+_RawObjectFacts = tuple[Any, list[Any], list[tuple[str, Any]], list[Any]]
+
+
+@dataclass(frozen=True)
+class _LazyObjectScan:
+    objects: LazyObjectTable
+    label_index: dict[str, list[str]]
+    alias_index: dict[str, list[str]]
+    node_evidence: dict[str, list[str]]
+    claimed_assertion_ids: set[str]
+
+    def check_node_evidence(self, evidence: Mapping[str, Any]) -> None:
+        for object_id, evidence_ref_ids in self.node_evidence.items():
+            for evidence_ref_id in evidence_ref_ids:
+                if evidence_ref_id not in evidence:
+                    raise PersistenceIntegrityError(
+                        f"dangling node evidence_ref_id {evidence_ref_id!r}",
+                        details={"object_id": object_id},
+                    )
+
+
+def _raw_records(value: Any) -> list[dict[str, Any]]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def _raw_strings(value: Any) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, str)]
+
+
+def _v2_raw_facts(node: dict[str, Any]) -> _RawObjectFacts:
+    assertions = _raw_records(node.get("alias_assertions"))
+    aliases = [assertion.get("alias") for assertion in assertions]
+    summary = node.get("summary_assertion")
+    if isinstance(summary, dict):
+        assertions.append(summary)
+    return (
+        node.get("label"),
+        aliases,
+        [("", assertion.get("assertion_id")) for assertion in assertions],
+        [node.get("evidence_ref_ids")]
+        + [assertion.get("evidence_ref_ids") for assertion in assertions],
+    )
+
+
+def _scan_lazy_objects(
+    records: Any,
+    *,
+    facts: Callable[[dict[str, Any]], _RawObjectFacts],
+    claim: Callable[[str, str, set[str]], None],
+    build: Callable[[Any], GraphObjectView],
+    malformed_message: str,
+) -> _LazyObjectScan:
+    """Structural pass shared by the lazy readers.
+
+    Enforces object ID uniqueness, graph-global assertion ID uniqueness (via
+    ``claim``) and collects label/alias indexes and node evidence references
+    from the raw records. Everything else is ``build``'s job on first access.
+    """
+    if not isinstance(records, list):
+        raise PersistenceIntegrityError(
+            malformed_message,
+            details={"error": "object records must be a list"},
         )
-    return objects
+    raw: dict[str, dict[str, Any]] = {}
+    label_index: dict[str, list[str]] = {}
+    alias_index: dict[str, list[str]] = {}
+    node_evidence: dict[str, list[str]] = {}
+    claimed: set[str] = set()
+    for record in records:
+        object_id = record.get("object_id") if isinstance(record, dict) else None
+        if not isinstance(object_id, str):
+            raise PersistenceIntegrityError(
+                malformed_message,
+                details={"error": "object record requires a string object_id"},
+            )
+        if object_id in raw:
+            raise PersistenceIntegrityError(
+                f"duplicate object_id {object_id!r}",
+                details={"object_id": object_id},
+            )
+        raw[object_id] = record
+        label, aliases, assertions, evidence_lists = facts(record)
+        for kind, assertion_id in assertions:
+            if isinstance(assertion_id, str):
+                claim(assertion_id, kind, claimed)
+        if isinstance(label, str):
+            label_index.setdefault(_norm(label), []).append(object_id)
+        for alias in aliases:
+            if isinstance(alias, str):
+                alias_index.setdefault(_norm(alias), []).append(object_id)
+        node_evidence[object_id] = [
+            evidence_ref_id
+            for evidence_ref_ids in evidence_lists
+            for evidence_ref_id in _raw_strings(evidence_ref_ids)
+        ]
+    for key, ids in label_index.items():
+        label_index[key] = sorted(set(ids))
+    for key, ids in alias_index.items():
+        alias_index[key] = sorted(set(ids))
+    return _LazyObjectScan(
+        objects=LazyObjectTable(raw, build),
+        label_index=label_index,
+        alias_index=alias_index,
+        node_evidence=node_evidence,
+        claimed_assertion_ids=claimed,
+    )
+
+
+def _scan_lazy_v2_shaped_objects(
+    graph_payload: dict[str, Any],
+    *,
+    descriptor: SemanticProfileDescriptor | None,
+) -> _LazyObjectScan:
+    def build(node: Any) -> GraphObjectView:
+        view = _build_v2_shaped_object(_validate_v2_node(node), assertion_ids=set())
+        if descriptor is not None:
+            validate_qualified_term(view.kind, descriptor, field_name="kind")
+        return view
+
+    return _scan_lazy_objects(
+        graph_payload.get("nodes", []),
+        facts=_v2_raw_facts,
+        claim=lambda assertion_id, _kind, claimed: _claim_node_assertion_id(
+            assertion_id, claimed
+        ),
+        build=build,
+        malformed_message="malformed graph node, relationship, or evidence record",
+    )
+
+
+def _lazy_snapshot(
+    scan: _LazyObjectScan,
+    *,
+    world_id: str,
+    graph_schema: str,
+    evidence: dict[str, GraphEvidenceLedgerRecord],
+    relationships: dict[str, GraphRelationshipView],
+    semantic_profile_ref: SemanticProfileRef | None = None,
+    semantic_profile_descriptor: SemanticProfileDescriptor | None = None,
+) -> ParsedGraphSnapshot:
+    subject_index, object_index, predicate_index = build_relationship_indexes(
+        relationships
+    )
+    return ParsedGraphSnapshot(
+        world_id=world_id,
+        graph_schema=graph_schema,
+        objects=scan.objects,
+        relationships=relationships,
+        evidence=evidence,
+        label_index=scan.label_index,
+        alias_index=scan.alias_index,
+        subject_index=subject_index,
+        object_index=object_index,
+        predicate_index=predicate_index,
+        semantic_profile_ref=semantic_profile_ref,
+        semantic_profile_descriptor=semantic_profile_descriptor,
+    )
 
 
 class UnionGraphV1SnapshotReader:
@@ -614,10 +1086,7 @@ class UnionGraphV1SnapshotReader:
         _reject_semantic_profile_field(graph_payload, graph_schema=graph_schema)
 
         try:
-            nodes = [
-                GraphNodeRecord.model_validate(node)
-                for node in graph_payload.get("nodes", [])
-            ]
+            nodes = _NODE_RECORDS.validate_python(graph_payload.get("nodes", []))
         except (ValidationError, TypeError, ValueError) as exc:
             raise PersistenceIntegrityError(
                 "malformed graph node, relationship, or evidence record",
@@ -655,6 +1124,9 @@ class UnionGraphV1SnapshotReader:
                     )
 
         label_index, alias_index = build_label_and_alias_indexes(objects)
+        subject_index, object_index, predicate_index = build_relationship_indexes(
+            relationships_by_id
+        )
         return ParsedGraphSnapshot(
             world_id=world_id,
             graph_schema=graph_schema,
@@ -663,6 +1135,9 @@ class UnionGraphV1SnapshotReader:
             evidence=evidence,
             label_index=label_index,
             alias_index=alias_index,
+            subject_index=subject_index,
+            object_index=object_index,
+            predicate_index=predicate_index,
         )
 
     def get_object(
@@ -696,7 +1171,15 @@ class UnionGraphV1SnapshotReader:
 
 
 class UnionGraphV2SnapshotReader:
-    """Concrete reader for ``dm_union_graph_v2`` only."""
+    """Concrete reader for ``dm_union_graph_v2`` only.
+
+    With ``lazy_objects`` the parse runs only the structural checks and each
+    object view is validated and built on first access (see
+    :class:`LazyObjectTable`).
+    """
+
+    def __init__(self, *, lazy_objects: bool = False) -> None:
+        self.lazy_objects = lazy_objects
 
     def parse(
         self,
@@ -713,6 +1196,21 @@ class UnionGraphV2SnapshotReader:
         world_id = _require_payload_world(graph_payload)
         _reject_semantic_profile_field(graph_payload, graph_schema=graph_schema)
 
+        if self.lazy_objects:
+            scan = _scan_lazy_v2_shaped_objects(graph_payload, descriptor=None)
+            evidence, relationships_by_id = _parse_common_evidence_and_relationships(
+                graph_payload=graph_payload,
+                objects=scan.objects,
+            )
+            scan.check_node_evidence(evidence)
+            return _lazy_snapshot(
+                scan,
+                world_id=world_id,
+                graph_schema=graph_schema,
+                evidence=evidence,
+                relationships=relationships_by_id,
+            )
+
         objects = _parse_v2_shaped_objects(graph_payload)
         evidence, relationships_by_id = _parse_common_evidence_and_relationships(
             graph_payload=graph_payload,
@@ -727,6 +1225,9 @@ class UnionGraphV2SnapshotReader:
                     )
 
         label_index, alias_index = build_label_and_alias_indexes(objects)
+        subject_index, object_index, predicate_index = build_relationship_indexes(
+            relationships_by_id
+        )
         return ParsedGraphSnapshot(
             world_id=world_id,
             graph_schema=graph_schema,
@@ -735,6 +1236,9 @@ class UnionGraphV2SnapshotReader:
             evidence=evidence,
             label_index=label_index,
             alias_index=alias_index,
+            subject_index=subject_index,
+            object_index=object_index,
+            predicate_index=predicate_index,
             semantic_profile_ref=None,
             semantic_profile_descriptor=None,
         )
@@ -772,8 +1276,14 @@ class UnionGraphV2SnapshotReader:
 class UnionGraphV3SnapshotReader:
     """Concrete reader for ``dm_union_graph_v3`` (v2 nodes + semantic profile)."""
 
-    def __init__(self, profile_registry: SemanticProfileRegistry) -> None:
-        self._profile_registry = profile_registry
+    def __init__(
+        self,
+        profile_registry: SemanticProfileRegistry,
+        *,
+        lazy_objects: bool = False,
+    ) -> None:
+        self.profile_registry = profile_registry
+        self.lazy_objects = lazy_objects
 
     def parse(
         self,
@@ -803,7 +1313,26 @@ class UnionGraphV3SnapshotReader:
                 details={"error": str(exc)},
             ) from exc
 
-        descriptor = resolve_and_verify_profile(profile_ref, self._profile_registry)
+        descriptor = resolve_and_verify_profile(profile_ref, self.profile_registry)
+
+        if self.lazy_objects:
+            scan = _scan_lazy_v2_shaped_objects(graph_payload, descriptor=descriptor)
+            evidence, relationships_by_id = _parse_common_evidence_and_relationships(
+                graph_payload=graph_payload,
+                objects=scan.objects,
+            )
+            for rel in relationships_by_id.values():
+                validate_qualified_term(rel.predicate, descriptor, field_name="predicate")
+            scan.check_node_evidence(evidence)
+            return _lazy_snapshot(
+                scan,
+                world_id=world_id,
+                graph_schema=graph_schema,
+                evidence=evidence,
+                relationships=relationships_by_id,
+                semantic_profile_ref=profile_ref,
+                semantic_profile_descriptor=descriptor,
+            )
 
         objects = _parse_v2_shaped_objects(graph_payload)
         for obj in objects.values():
@@ -825,6 +1354,9 @@ class UnionGraphV3SnapshotReader:
                     )
 
         label_index, alias_index = build_label_and_alias_indexes(objects)
+        subject_index, object_index, predicate_index = build_relationship_indexes(
+            relationships_by_id
+        )
         return ParsedGraphSnapshot(
             world_id=world_id,
             graph_schema=graph_schema,
@@ -833,6 +1365,9 @@ class UnionGraphV3SnapshotReader:
             evidence=evidence,
             label_index=label_index,
             alias_index=alias_index,
+            subject_index=subject_index,
+            object_index=object_index,
+            predicate_index=predicate_index,
             semantic_profile_ref=profile_ref,
             semantic_profile_descriptor=descriptor,
         )
@@ -870,6 +1405,9 @@ class UnionGraphV3SnapshotReader:
 class _EmptySemanticProfileRegistry:
     """Default registry: admits nothing (v3 fails closed)."""
 
+    def descriptor_pins(self) -> tuple[ProfilePin, ...]:
+        return ()
+
     def get(
         self, profile_id: str, profile_revision: str
     ) -> SemanticProfileDescriptor | None:
@@ -882,6 +1420,8 @@ class VersionedUnionGraphSnapshotReader:
     def __init__(
         self,
         profile_registry: SemanticProfileRegistry | None = None,
+        *,
+        lazy_objects: bool = False,
     ) -> None:
         registry = profile_registry if profile_registry is not None else (
             _EmptySemanticProfileRegistry()
@@ -891,12 +1431,21 @@ class VersionedUnionGraphSnapshotReader:
         from .graph_snapshot_v4 import UnionGraphV4SnapshotReader
         from .graph_snapshot_v5 import UnionGraphV5SnapshotReader
 
-        self._profile_registry = registry
-        self._v1 = UnionGraphV1SnapshotReader()
-        self._v2 = UnionGraphV2SnapshotReader()
-        self._v3 = UnionGraphV3SnapshotReader(registry)
-        self._v4 = UnionGraphV4SnapshotReader(registry)
-        self._v5 = UnionGraphV5SnapshotReader(registry)
+        self.profile_registry = registry
+        # v1 nodes carry no assertions; its reader is always eager.
+        self.lazy_objects = lazy_objects
+        self._readers: dict[str, GraphSnapshotReader] = {
+            GRAPH_SCHEMA_V1: UnionGraphV1SnapshotReader(),
+            GRAPH_SCHEMA_V2: UnionGraphV2SnapshotReader(lazy_objects=lazy_objects),
+            GRAPH_SCHEMA_V3: UnionGraphV3SnapshotReader(registry, lazy_objects=lazy_objects),
+            GRAPH_SCHEMA_V4: UnionGraphV4SnapshotReader(registry, lazy_objects=lazy_objects),
+            GRAPH_SCHEMA_V5: UnionGraphV5SnapshotReader(registry, lazy_objects=lazy_objects),
+        }
+
+    @property
+    def schema_readers(self) -> Mapping[str, GraphSnapshotReader]:
+        """The reader each supported ``graph_schema`` is dispatched to."""
+        return MappingProxyType(self._readers)
 
     def parse(
         self,
@@ -904,26 +1453,9 @@ class VersionedUnionGraphSnapshotReader:
         graph_schema: str,
         graph_payload: dict[str, Any],
     ) -> ParsedGraphSnapshot:
-        if graph_schema == GRAPH_SCHEMA_V1:
-            return self._v1.parse(
-                graph_schema=graph_schema, graph_payload=graph_payload
-            )
-        if graph_schema == GRAPH_SCHEMA_V2:
-            return self._v2.parse(
-                graph_schema=graph_schema, graph_payload=graph_payload
-            )
-        if graph_schema == GRAPH_SCHEMA_V3:
-            return self._v3.parse(
-                graph_schema=graph_schema, graph_payload=graph_payload
-            )
-        if graph_schema == GRAPH_SCHEMA_V4:
-            return self._v4.parse(
-                graph_schema=graph_schema, graph_payload=graph_payload
-            )
-        if graph_schema == GRAPH_SCHEMA_V5:
-            return self._v5.parse(
-                graph_schema=graph_schema, graph_payload=graph_payload
-            )
+        reader = self._readers.get(graph_schema)
+        if reader is not None:
+            return reader.parse(graph_schema=graph_schema, graph_payload=graph_payload)
         raise PersistenceIntegrityError(
             f"unsupported graph schema {graph_schema!r}",
             details={"graph_schema": graph_schema},
@@ -959,14 +1491,335 @@ class VersionedUnionGraphSnapshotReader:
         )
 
 
+@dataclass(frozen=True)
+class GraphSnapshotDelta:
+    """Raw v2-shaped payload records a child revision adds to its parent.
+
+    ``upserted_nodes`` replace parent nodes in place or, for new object IDs,
+    append in the order given. Relationships and evidence rows only append.
+    """
+
+    upserted_nodes: tuple[dict[str, Any], ...] = ()
+    added_relationships: tuple[dict[str, Any], ...] = ()
+    added_evidence_refs: tuple[dict[str, Any], ...] = ()
+
+
+def _move_index_entries(
+    index: dict[str, list[str]],
+    *,
+    object_id: str,
+    old_keys: set[str],
+    new_keys: set[str],
+) -> None:
+    # Index lists may be shared with the parent snapshot: replace, never mutate.
+    for key in old_keys - new_keys:
+        remaining = [item for item in index.get(key, ()) if item != object_id]
+        if remaining:
+            index[key] = remaining
+        else:
+            index.pop(key, None)
+    for key in new_keys - old_keys:
+        index[key] = sorted({*index.get(key, ()), object_id})
+
+
+def _extend_adjacency(
+    index: Mapping[str, list[str]],
+    pairs: Iterable[tuple[str, str]],
+) -> dict[str, list[str]]:
+    extended = dict(index)
+    added: dict[str, list[str]] = {}
+    for key, relationship_id in pairs:
+        added.setdefault(key, []).append(relationship_id)
+    for key, relationship_ids in added.items():
+        extended[key] = sorted([*extended.get(key, ()), *relationship_ids])
+    return extended
+
+
+def derive_child_snapshot(
+    parent: ParsedGraphSnapshot,
+    delta: GraphSnapshotDelta,
+) -> ParsedGraphSnapshot:
+    """Apply ``delta`` to ``parent`` with the checks a full parse would make.
+
+    Supports the v2-shaped schemas (``dm_union_graph_v2`` / ``dm_union_graph_v3``).
+    The result equals a full parse of the child payload; unchanged views,
+    evidence rows and index lists are shared with ``parent``.
+    """
+    if parent.graph_schema not in (GRAPH_SCHEMA_V2, GRAPH_SCHEMA_V3):
+        raise PersistenceIntegrityError(
+            f"cannot derive {parent.graph_schema!r} snapshots incrementally",
+            details={"graph_schema": parent.graph_schema},
+        )
+    changed = _parse_v2_shaped_objects({"nodes": list(delta.upserted_nodes)})
+    descriptor = parent.semantic_profile_descriptor
+    if parent.graph_schema == GRAPH_SCHEMA_V3:
+        if descriptor is None:
+            raise PersistenceIntegrityError(
+                "dm_union_graph_v3 requires semantic_profile",
+                details={"graph_schema": parent.graph_schema},
+            )
+        for obj in changed.values():
+            validate_qualified_term(obj.kind, descriptor, field_name="kind")
+
+    retained_assertion_ids = {
+        assertion.assertion_id
+        for object_id, obj in parent.objects.items()
+        if object_id not in changed
+        for assertion in (
+            *obj.admitted_alias_assertions,
+            *filter(None, [obj.admitted_summary_assertion]),
+        )
+    }
+    for obj in changed.values():
+        for assertion in (
+            *obj.admitted_alias_assertions,
+            *filter(None, [obj.admitted_summary_assertion]),
+        ):
+            if assertion.assertion_id in retained_assertion_ids:
+                raise PersistenceIntegrityError(
+                    f"duplicate assertion_id {assertion.assertion_id!r}",
+                    details={"assertion_id": assertion.assertion_id},
+                )
+
+    objects = dict(parent.objects)
+    objects.update(changed)
+    evidence, relationships = _parse_common_evidence_and_relationships(
+        graph_payload={
+            "relationships": list(delta.added_relationships),
+            "evidence_refs": list(delta.added_evidence_refs),
+        },
+        objects=objects,
+        base_evidence=parent.evidence,
+        base_relationships=parent.relationships,
+    )
+    added_relationships = [
+        rel for rel_id, rel in relationships.items() if rel_id not in parent.relationships
+    ]
+    if descriptor is not None:
+        for rel in added_relationships:
+            validate_qualified_term(rel.predicate, descriptor, field_name="predicate")
+    for obj in changed.values():
+        for evidence_ref_id in obj.evidence_ref_ids:
+            if evidence_ref_id not in evidence:
+                raise PersistenceIntegrityError(
+                    f"dangling node evidence_ref_id {evidence_ref_id!r}",
+                    details={"object_id": obj.object_id},
+                )
+
+    label_index = dict(parent.label_index)
+    alias_index = dict(parent.alias_index)
+    for object_id, obj in changed.items():
+        previous = parent.objects.get(object_id)
+        _move_index_entries(
+            label_index,
+            object_id=object_id,
+            old_keys=set() if previous is None else {_norm(previous.label)},
+            new_keys={_norm(obj.label)},
+        )
+        _move_index_entries(
+            alias_index,
+            object_id=object_id,
+            old_keys=set() if previous is None else {_norm(a) for a in previous.aliases},
+            new_keys={_norm(alias) for alias in obj.aliases},
+        )
+    return ParsedGraphSnapshot(
+        world_id=parent.world_id,
+        graph_schema=parent.graph_schema,
+        objects=objects,
+        relationships=relationships,
+        evidence=evidence,
+        label_index=label_index,
+        alias_index=alias_index,
+        semantic_profile_ref=parent.semantic_profile_ref,
+        semantic_profile_descriptor=descriptor,
+        subject_index=_extend_adjacency(
+            parent.subject_index,
+            ((rel.subject_object_id, rel.relationship_id) for rel in added_relationships),
+        ),
+        object_index=_extend_adjacency(
+            parent.object_index,
+            ((rel.object_object_id, rel.relationship_id) for rel in added_relationships),
+        ),
+        predicate_index=_extend_adjacency(
+            parent.predicate_index,
+            ((rel.predicate, rel.relationship_id) for rel in added_relationships),
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class NeighborhoodExpansion:
+    """Bounds for :func:`expand_neighborhood`.
+
+    ``predicates`` is an allow-list (``None`` follows every predicate).
+    ``fanout_per_hop[i]`` caps how many new objects one frontier object may add
+    at hop ``i + 1``; the last cap repeats for deeper hops and an empty tuple
+    leaves fanout uncapped. ``max_nodes`` bounds the neighborhood, seeds
+    included; seeds themselves are never dropped.
+
+    Objects whose degree reaches ``hub_degree`` are hubs and add at most
+    ``hub_fanout`` new objects per hop. Whenever a cap applies, neighbours are
+    kept in relevance order: semantic candidate rank first, then the position
+    of the relationship's predicate in ``predicate_priority``, then
+    relationship ID.
+    """
+
+    max_hops: int = 1
+    predicates: frozenset[str] | None = None
+    fanout_per_hop: tuple[int, ...] = ()
+    max_nodes: int | None = None
+    hub_degree: int | None = None
+    hub_fanout: int = 16
+    predicate_priority: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.max_hops < 1:
+            raise ValueError("max_hops must be at least 1")
+        if any(cap < 1 for cap in self.fanout_per_hop):
+            raise ValueError("fanout_per_hop caps must be positive")
+        if self.max_nodes is not None and self.max_nodes < 1:
+            raise ValueError("max_nodes must be positive")
+        if self.hub_degree is not None and self.hub_degree < 1:
+            raise ValueError("hub_degree must be positive")
+        if self.hub_fanout < 1:
+            raise ValueError("hub_fanout must be positive")
+
+    def fanout_cap(self, hop: int) -> int | None:
+        if not self.fanout_per_hop:
+            return None
+        return self.fanout_per_hop[min(hop, len(self.fanout_per_hop) - 1)]
+
+    def is_hub(self, degree: int) -> bool:
+        return self.hub_degree is not None and degree >= self.hub_degree
+
+
+@dataclass(frozen=True)
+class Neighborhood:
+    object_ids: list[str]
+    # Every allowed relationship whose endpoints were both reached.
+    relationship_ids: list[str]
+    # Whether a fanout cap or the node budget left reachable objects out.
+    truncated: bool = False
+    # Hubs whose hub cap left reachable neighbours out.
+    capped_hub_ids: list[str] = field(default_factory=list)
+
+
+def _adjacency(
+    snapshot: ParsedGraphSnapshot,
+) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    subject_index, object_index = snapshot.subject_index, snapshot.object_index
+    if snapshot.relationships and not (subject_index or object_index):
+        # Hand-assembled snapshot without adjacency.
+        subject_index, object_index, _ = build_relationship_indexes(
+            dict(snapshot.relationships.items())
+        )
+    return subject_index, object_index
+
+
+def expand_neighborhood(
+    snapshot: ParsedGraphSnapshot,
+    seed_object_ids: list[str],
+    expansion: NeighborhoodExpansion,
+    *,
+    candidate_rank: Mapping[str, int] | None = None,
+) -> Neighborhood:
+    """Breadth-first expansion from the resolved seeds over adjacency indexes.
+
+    Deterministic: each hop visits its frontier in object-ID order and each
+    object's relationships in relevance order (``candidate_rank`` maps object
+    IDs to semantic candidate positions; see :class:`NeighborhoodExpansion`),
+    so caps and the budget always keep the same objects for the same snapshot
+    and candidates. Without ranks or predicate priorities that order is plain
+    relationship-ID order. The relationships returned are every allowed one
+    among the reached objects, so they do not depend on the order in which
+    the search found those objects.
+    """
+    subject_index, object_index = _adjacency(snapshot)
+    predicates = expansion.predicates
+    rank = candidate_rank or {}
+    unranked = len(rank)
+    priority = {predicate: index for index, predicate in enumerate(expansion.predicate_priority)}
+    unprioritized = len(priority)
+    degree_stats = snapshot.degree_stats if expansion.hub_degree is not None else None
+    frontier = sorted({oid for oid in seed_object_ids if oid in snapshot.objects})
+    reached = set(frontier)
+    budget = expansion.max_nodes
+    truncated = False
+    capped_hubs: set[str] = set()
+    for hop in range(expansion.max_hops):
+        hop_cap = expansion.fanout_cap(hop)
+        next_frontier: list[str] = []
+        for object_id in frontier:
+            cap = hop_cap
+            hub = degree_stats is not None and expansion.is_hub(degree_stats.degree(object_id))
+            if hub and (cap is None or expansion.hub_fanout < cap):
+                cap = expansion.hub_fanout
+            else:
+                hub = False
+            edges: list[tuple[int, int, str, str]] = []
+            for relationship_id in {
+                *subject_index.get(object_id, ()),
+                *object_index.get(object_id, ()),
+            }:
+                rel = snapshot.relationships[relationship_id]
+                if predicates is not None and rel.predicate not in predicates:
+                    continue
+                neighbor = (
+                    rel.object_object_id
+                    if rel.subject_object_id == object_id
+                    else rel.subject_object_id
+                )
+                edges.append(
+                    (
+                        rank.get(neighbor, unranked),
+                        priority.get(rel.predicate, unprioritized),
+                        relationship_id,
+                        neighbor,
+                    )
+                )
+            edges.sort()
+            added = 0
+            for _rank, _priority, _relationship_id, neighbor in edges:
+                if neighbor in reached:
+                    continue
+                if cap is not None and added >= cap:
+                    truncated = True
+                    if hub:
+                        capped_hubs.add(object_id)
+                    break
+                if budget is not None and len(reached) >= budget:
+                    truncated = True
+                    break
+                reached.add(neighbor)
+                next_frontier.append(neighbor)
+                added += 1
+        frontier = sorted(next_frontier)
+        if not frontier:
+            break
+    # Edges between final-hop objects, and edges passed over after a cap,
+    # were never followed; every relationship is listed under its subject.
+    related: list[str] = []
+    for object_id in reached:
+        for relationship_id in subject_index.get(object_id, ()):
+            rel = snapshot.relationships[relationship_id]
+            if rel.object_object_id in reached and (
+                predicates is None or rel.predicate in predicates
+            ):
+                related.append(relationship_id)
+    return Neighborhood(
+        object_ids=sorted(reached),
+        relationship_ids=sorted(related),
+        truncated=truncated,
+        capped_hub_ids=sorted(capped_hubs),
+    )
+
+
+ONE_HOP_EXPANSION = NeighborhoodExpansion()
+
+
 def collect_one_hop_object_ids(
     snapshot: ParsedGraphSnapshot,
     seed_object_ids: list[str],
 ) -> list[str]:
     """Resolved seeds plus objects at the far end of one-hop relationships."""
-    seeds = sorted({oid for oid in seed_object_ids if oid in snapshot.objects})
-    expanded = set(seeds)
-    for rel in list_relationships_from_snapshot(snapshot, seeds):
-        expanded.add(rel.subject_object_id)
-        expanded.add(rel.object_object_id)
-    return sorted(expanded)
+    return expand_neighborhood(snapshot, seed_object_ids, ONE_HOP_EXPANSION).object_ids
@@ -0,0 +1,485 @@
+"""Persisted, rebuildable artifacts of fully parsed graph snapshots.
+
+A parsed snapshot is a pure function of ``(graph_payload_sha256, reader code)``
+once its semantic profile pin is admitted, so a worker can write it once and
+later workers can load it instead of re-validating the stored payload; the
+snapshot cache re-checks the pin against the live registry on every load.
+An artifact is a derived cache, never a source of truth: it is read only
+under the exact key it was written for and is rebuilt from the stored payload
+whenever anything in that key differs.
+
+File layout (format version 1)::
+
+    MAGIC | u32 header length | header JSON | body
+
+The header binds the revision (world, revision ID, payload digest, schema),
+the reader digest, the reader-code digest and the body's SHA-256. The body is
+a ``marshal`` image of plain tuples, lists and dicts — no pickled classes, so
+loading never imports or calls anything — and views are rebuilt with
+``model_construct`` from values that already passed a full parse. Readers hand
+:func:`decode_snapshot_artifact` any buffer (an ``mmap`` works without a copy).
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import marshal
+import struct
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from ..contracts.evidence import EvidenceRefV2
+from ..contracts.graph import WorldGraphRevision
+from ..contracts.knowledge_assertion import KnowledgeAssertionMetadataV1
+from ..contracts.semantic_profile import SemanticProfileDescriptor, SemanticProfileRef
+from .graph_snapshot import (
+    AdmittedAliasAssertion,
+    AdmittedPropertyAssertion,
+    AdmittedSummaryAssertion,
+    GraphEvidenceLedgerRecord,
+    GraphEvidenceRecord,
+    GraphObjectView,
+    GraphRelationshipView,
+    ParsedGraphSnapshot,
+    VersionedUnionGraphSnapshotReader,
+)
+from .graph_snapshot_compact import compact_snapshot, is_compact_snapshot
+
+SNAPSHOT_ARTIFACT_FORMAT_VERSION = 1
+SNAPSHOT_ARTIFACT_SUFFIX = ".dmsnap"
+_MAGIC = b"DMSNAP\x00\x01"
+_HEADER_LENGTH = struct.Struct(">I")
+# Modules shared by every reader whose code decides what a parse (or its
+# artifact encoding) produces. The modules of the per-schema readers are added
+# from the dispatch table in :func:`_reader_code_modules`; editing any of them
+# invalidates every artifact written by an older build.
+_SHARED_CODE_MODULES = (
+    "dungeonmind.application.graph_snapshot",
+    "dungeonmind.application.graph_snapshot_artifacts",
+    "dungeonmind.application.graph_snapshot_compact",
+    "dungeonmind.application.semantic_profiles",
+    "dungeonmind.contracts.evidence",
+    "dungeonmind.contracts.knowledge_assertion",
+    "dungeonmind.contracts.semantic_profile",
+)
+_EVIDENCE_V1 = "v1"
+_EVIDENCE_V2 = "v2"
+_EVIDENCE_V1_FIELDS = GraphEvidenceRecord.model_fields.keys()
+
+
+def _reader_code_modules() -> tuple[str, ...]:
+    """Shared modules plus the module of every reader a schema is dispatched to."""
+    dispatched = VersionedUnionGraphSnapshotReader().schema_readers.values()
+    return tuple(
+        sorted({type(reader).__module__ for reader in dispatched}.union(_SHARED_CODE_MODULES))
+    )
+
+
+@cache
+def reader_code_digest() -> str:
+    """Digest of the artifact format version and the parse-defining module sources."""
+    digest = hashlib.sha256(str(SNAPSHOT_ARTIFACT_FORMAT_VERSION).encode("utf-8"))
+    for module_name in _reader_code_modules():
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        digest.update(module_name.encode("utf-8"))
+        if module_file is not None:
+            with suppress(OSError):
+                digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class SnapshotArtifactKey:
+    world_id: str
+    revision_id: str
+    graph_payload_sha256: str
+    graph_schema: str
+    reader_digest: str
+
+    @classmethod
+    def for_revision(
+        cls,
+        revision: WorldGraphRevision,
+        *,
+        reader_digest: str,
+    ) -> SnapshotArtifactKey:
+        return cls(
+            world_id=revision.world_id,
+            revision_id=revision.revision_id,
+            graph_payload_sha256=revision.graph_payload_sha256,
+            graph_schema=revision.graph_schema,
+            reader_digest=reader_digest,
+        )
+
+    @property
+    def artifact_name(self) -> str:
+        """Filesystem-safe name; identifiers never appear in paths verbatim."""
+        material = "\x1f".join(
+            (
+                self.world_id,
+                self.revision_id,
+                self.graph_payload_sha256,
+                self.graph_schema,
+                self.reader_digest,
+            )
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest() + SNAPSHOT_ARTIFACT_SUFFIX
+
+
+class SnapshotArtifactStore(Protocol):
+    """Derived parsed-snapshot artifacts. Best effort: never raises on I/O.
+
+    ``load`` returns ``None`` for a missing, unreadable or mismatched artifact
+    (and may discard it); ``save`` silently skips what it cannot write.
+    """
+
+    def load(self, key: SnapshotArtifactKey) -> ParsedGraphSnapshot | None: ...
+
+    def save(self, key: SnapshotArtifactKey, snapshot: ParsedGraphSnapshot) -> None: ...
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding allocates one container per record and none of them form
+    # cycles; letting the collector rescan them several times costs more
+    # than the decode itself on large worlds.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _json_or_none(model: BaseModel | None) -> str | None:
+    return None if model is None else model.model_dump_json()
+
+
+def _encode_object(obj: GraphObjectView) -> tuple[Any, ...]:
+    summary = obj.admitted_summary_assertion
+    return (
+        obj.object_id,
+        obj.kind,
+        obj.label,
+        list(obj.aliases),
+        list(obj.evidence_ref_ids),
+        obj.summary,
+        obj.object_field_schema,
+        list(obj.core_evidence_ref_ids),
+        [
+            (item.assertion_id, item.alias, list(item.evidence_ref_ids),
+             _json_or_none(item.assertion_metadata))
+            for item in obj.admitted_alias_assertions
+        ],
+        None
+        if summary is None
+        else (
+            summary.assertion_id,
+            summary.summary,
+            list(summary.evidence_ref_ids),
+            _json_or_none(summary.assertion_metadata),
+        ),
+        _json_or_none(obj.existence_assertion_metadata),
+        [
+            (item.assertion_id, item.property_term, item.value, list(item.evidence_ref_ids),
+             _json_or_none(item.assertion_metadata))
+            for item in obj.admitted_property_assertions
+        ],
+        tuple(sorted(obj.model_fields_set)),
+    )
+
+
+def _encode_relationship(rel: GraphRelationshipView) -> tuple[Any, ...]:
+    return (
+        rel.relationship_id,
+        rel.subject_object_id,
+        rel.predicate,
+        rel.object_object_id,
+        list(rel.evidence_ref_ids),
+        _json_or_none(rel.assertion_metadata),
+        tuple(sorted(rel.model_fields_set)),
+    )
+
+
+def _encode_evidence(row: GraphEvidenceLedgerRecord) -> tuple[Any, ...]:
+    if isinstance(row, GraphEvidenceRecord):
+        return (_EVIDENCE_V1, row.model_dump(), tuple(sorted(row.model_fields_set)))
+    return (_EVIDENCE_V2, row.model_dump_json(), ())
+
+
+def _metadata(raw: str | None) -> KnowledgeAssertionMetadataV1 | None:
+    return None if raw is None else KnowledgeAssertionMetadataV1.model_validate_json(raw)
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _restore(
+    model_cls: type[_ModelT],
+    values: dict[str, Any],
+    fields_set: Iterable[str] = (),
+) -> _ModelT:
+    # ``model_construct`` minus its per-field default scan: ``values`` always
+    # carries every field, and artifact loads build one model per record.
+    model = model_cls.__new__(model_cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(fields_set))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def _decode_object(record: Iterable[Any]) -> GraphObjectView:
+    (
+        object_id,
+        kind,
+        label,
+        aliases,
+        evidence_ref_ids,
+        summary,
+        field_schema,
+        core_evidence_ref_ids,
+        alias_assertions,
+        summary_assertion,
+        existence_metadata,
+        property_assertions,
+        fields_set,
+    ) = record
+    if summary_assertion is not None:
+        summary_id, summary_text, summary_evidence, summary_metadata = summary_assertion
+        summary_assertion = _restore(
+            AdmittedSummaryAssertion,
+            {
+                "assertion_id": summary_id,
+                "summary": summary_text,
+                "evidence_ref_ids": summary_evidence,
+                "assertion_metadata": _metadata(summary_metadata),
+            },
+        )
+    return _restore(
+        GraphObjectView,
+        {
+            "object_id": object_id,
+            "kind": kind,
+            "label": label,
+            "aliases": aliases,
+            "evidence_ref_ids": evidence_ref_ids,
+            "summary": summary,
+            "object_field_schema": field_schema,
+            "core_evidence_ref_ids": core_evidence_ref_ids,
+            "admitted_alias_assertions": [
+                _restore(
+                    AdmittedAliasAssertion,
+                    {
+                        "assertion_id": assertion_id,
+                        "alias": alias,
+                        "evidence_ref_ids": alias_evidence,
+                        "assertion_metadata": _metadata(metadata),
+                    },
+                )
+                for assertion_id, alias, alias_evidence, metadata in alias_assertions
+            ],
+            "admitted_summary_assertion": summary_assertion,
+            "existence_assertion_metadata": _metadata(existence_metadata),
+            "admitted_property_assertions": [
+                _restore(
+                    AdmittedPropertyAssertion,
+                    {
+                        "assertion_id": assertion_id,
+                        "property_term": property_term,
+                        "value": value,
+                        "evidence_ref_ids": property_evidence,
+                        "assertion_metadata": _metadata(metadata),
+                    },
+                )
+                for assertion_id, property_term, value, property_evidence, metadata
+                in property_assertions
+            ],
+        },
+        fields_set,
+    )
+
+
+def _decode_relationship(record: Iterable[Any]) -> GraphRelationshipView:
+    (
+        relationship_id,
+        subject_object_id,
+        predicate,
+        object_object_id,
+        evidence_ref_ids,
+        metadata,
+        fields_set,
+    ) = record
+    return _restore(
+        GraphRelationshipView,
+        {
+            "relationship_id": relationship_id,
+            "subject_object_id": subject_object_id,
+            "predicate": predicate,
+            "object_object_id": object_object_id,
+            "evidence_ref_ids": evidence_ref_ids,
+            "assertion_metadata": _metadata(metadata),
+        },
+        fields_set,
+    )
+
+
+def _decode_evidence(record: Iterable[Any]) -> GraphEvidenceLedgerRecord:
+    tag, values, fields_set = record
+    if tag == _EVIDENCE_V1:
+        if not isinstance(values, dict) or values.keys() != _EVIDENCE_V1_FIELDS:
+            raise ValueError("artifact evidence row does not match its schema")
+        return _restore(GraphEvidenceRecord, values, fields_set)
+    if tag == _EVIDENCE_V2:
+        return EvidenceRefV2.model_validate_json(values)
+    raise ValueError(f"unknown evidence tag {tag!r}")
+
+
+def _header(key: SnapshotArtifactKey, *, compact: bool, body: bytes) -> dict[str, Any]:
+    return {
+        "format_version": SNAPSHOT_ARTIFACT_FORMAT_VERSION,
+        "marshal_version": marshal.version,
+        "python": list(sys.version_info[:2]),
+        "reader_code_digest": reader_code_digest(),
+        "world_id": key.world_id,
+        "revision_id": key.revision_id,
+        "graph_payload_sha256": key.graph_payload_sha256,
+        "graph_schema": key.graph_schema,
+        "reader_digest": key.reader_digest,
+        "compact": compact,
+        "body_sha256": hashlib.sha256(body).hexdigest(),
+        "body_length": len(body),
+    }
+
+
+def encode_snapshot_artifact(
+    snapshot: ParsedGraphSnapshot,
+    *,
+    key: SnapshotArtifactKey,
+) -> bytes:
+    """Serialize ``snapshot`` as the artifact for ``key``.
+
+    Raises ``ValueError`` when the snapshot does not belong to ``key`` or holds
+    a value ``marshal`` cannot represent; callers then simply skip the write.
+    """
+    if snapshot.world_id != key.world_id or snapshot.graph_schema != key.graph_schema:
+        raise ValueError("snapshot does not match artifact key")
+    body = marshal.dumps(
+        (
+            snapshot.world_id,
+            snapshot.graph_schema,
+            _json_or_none(snapshot.semantic_profile_ref),
+            _json_or_none(snapshot.semantic_profile_descriptor),
+            [_encode_object(obj) for obj in snapshot.objects.values()],
+            [_encode_relationship(rel) for rel in snapshot.relationships.values()],
+            [_encode_evidence(row) for row in snapshot.evidence.values()],
+            dict(snapshot.label_index),
+            dict(snapshot.alias_index),
+            dict(snapshot.subject_index),
+            dict(snapshot.object_index),
+            dict(snapshot.predicate_index),
+        )
+    )
+    header = json.dumps(
+        _header(key, compact=is_compact_snapshot(snapshot), body=body),
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return b"".join((_MAGIC, _HEADER_LENGTH.pack(len(header)), header, body))
+
+
+def decode_snapshot_artifact(
+    data: Any,
+    *,
+    key: SnapshotArtifactKey,
+) -> ParsedGraphSnapshot | None:
+    """Load the snapshot in ``data`` (any buffer), or ``None`` if it must be rebuilt.
+
+    Anything short of an exact header match — format, interpreter, reader code,
+    revision key or body digest — and any malformed body yields ``None``.
+    """
+    with memoryview(data) as view:
+        prefix = len(_MAGIC) + _HEADER_LENGTH.size
+        if len(view) < prefix or view[: len(_MAGIC)] != _MAGIC:
+            return None
+        (header_length,) = _HEADER_LENGTH.unpack(view[len(_MAGIC) : prefix])
+        body_start = prefix + header_length
+        try:
+            header = json.loads(bytes(view[prefix:body_start]))
+        except (ValueError, UnicodeDecodeError):
+            return None
+        with view[body_start:] as body:
+            if not isinstance(header, dict) or header.get("body_length") != len(body):
+                return None
+            expected = _header(key, compact=bool(header.get("compact")), body=b"")
+            expected["body_sha256"] = header.get("body_sha256")
+            expected["body_length"] = len(body)
+            if header != expected or hashlib.sha256(body).hexdigest() != expected["body_sha256"]:
+                return None
+            try:
+                with _gc_paused():
+                    snapshot = _decode_body(marshal.loads(body))
+            except (ValueError, TypeError, EOFError, KeyError, IndexError):
+                # ``ValidationError`` is a ``ValueError``; all mean "rebuild".
+                return None
+    if snapshot.world_id != key.world_id or snapshot.graph_schema != key.graph_schema:
+        return None
+    return compact_snapshot(snapshot) if header["compact"] else snapshot
+
+
+def _decode_body(body: Any) -> ParsedGraphSnapshot:
+    (
+        world_id,
+        graph_schema,
+        profile_ref,
+        descriptor,
+        objects,
+        relationships,
+        evidence,
+        label_index,
+        alias_index,
+        subject_index,
+        object_index,
+        predicate_index,
+    ) = body
+    object_views = [_decode_object(record) for record in objects]
+    relationship_views = [_decode_relationship(record) for record in relationships]
+    evidence_rows = [_decode_evidence(record) for record in evidence]
+    indexes = (label_index, alias_index, subject_index, object_index, predicate_index)
+    if not all(isinstance(index, dict) for index in indexes):
+        raise TypeError("artifact index is not a mapping")
+    try:
+        return ParsedGraphSnapshot(
+            world_id=world_id,
+            graph_schema=graph_schema,
+            objects={view.object_id: view for view in object_views},
+            relationships={view.relationship_id: view for view in relationship_views},
+            evidence={row.evidence_ref_id: row for row in evidence_rows},
+            label_index=label_index,
+            alias_index=alias_index,
+            semantic_profile_ref=(
+                None
+                if profile_ref is None
+                else SemanticProfileRef.model_validate_json(profile_ref)
+            ),
+            semantic_profile_descriptor=(
+                None
+                if descriptor is None
+                else SemanticProfileDescriptor.model_validate_json(descriptor)
+            ),
+            subject_index=subject_index,
+            object_index=object_index,
+            predicate_index=predicate_index,
+        )
+    except ValidationError as exc:
+        raise ValueError("artifact metadata failed validation") from exc
@@ -0,0 +1,307 @@
+"""Bounded, revision-keyed cache of parsed graph snapshots.
+
+Stored revisions are immutable and content-addressed, so one full fail-closed
+parse of ``(world_id, revision_id, graph_payload_sha256)`` through a given
+reader is valid for the life of the process. Cached snapshots are shared
+between callers and must be treated as read-only; scoping builds new views.
+
+The cache is opt-in: services that are not handed one parse on every call.
+With a :class:`SnapshotArtifactStore`, a miss first tries the persisted
+artifact for the exact revision and reader, and a cold parse writes one, so a
+restarted worker skips payload validation for revisions any worker has seen.
+A loaded artifact's semantic profile pin is re-verified against the reader's
+live registry, failing exactly as a fresh parse would. Lazy readers bypass
+artifacts: encoding would materialize every object on the request path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import cast
+
+from ..contracts.graph import StoredGraphRevision, WorldGraphRevision
+from .graph_snapshot import GraphSnapshotReader, ParsedGraphSnapshot
+from .graph_snapshot_artifacts import SnapshotArtifactKey, SnapshotArtifactStore
+from .graph_snapshot_compact import (
+    CompactGraphSnapshotReader,
+    compact_snapshot,
+    is_compact_snapshot,
+)
+from .semantic_profiles import (
+    SemanticProfileRegistry,
+    profile_registry_digest,
+    resolve_and_verify_profile,
+)
+
+# Rough resident cost per parsed record (pydantic view + dict slot + strings).
+# Used only to keep the cache inside its configured budget, not for accounting.
+_APPROX_OBJECT_BYTES = 2_048
+_APPROX_RELATIONSHIP_BYTES = 768
+_APPROX_EVIDENCE_BYTES = 1_024
+_APPROX_INDEX_ENTRY_BYTES = 160
+_APPROX_SNAPSHOT_OVERHEAD_BYTES = 4_096
+# Slotted records with interned strings and array-backed evidence lists.
+_APPROX_COMPACT_OBJECT_BYTES = 512
+_APPROX_COMPACT_RELATIONSHIP_BYTES = 224
+_APPROX_COMPACT_EVIDENCE_BYTES = 224
+
+SnapshotCacheKey = tuple[str, str, str, str]
+
+
+def graph_reader_digest(reader: GraphSnapshotReader) -> str:
+    """Stable identity for the reader implementation that produced a snapshot.
+
+    Semantic profile pins are part of the graph payload and descriptors are
+    digest-verified against them, so the payload digest binds the profile's
+    content; whether the registry still admits it is checked again when an
+    artifact is loaded. The reader digest separates snapshots built by
+    different parsers, and folds in the digest of the reader's
+    ``profile_registry`` so readers validating against different pins never
+    share a parse.
+    Wrapping readers expose ``wrapped_reader`` and fold its digest into their own;
+    lazy readers (``lazy_objects``) hold differently shaped snapshots and get
+    their own digest.
+    """
+    reader_type = type(reader)
+    qualified = f"{reader_type.__module__}.{reader_type.__qualname__}"
+    if getattr(reader, "lazy_objects", False):
+        qualified = f"{qualified}[lazy]"
+    registry = getattr(reader, "profile_registry", None)
+    if registry is not None:
+        qualified = f"{qualified}{{profiles:{profile_registry_digest(registry)}}}"
+    wrapped = getattr(reader, "wrapped_reader", None)
+    if wrapped is not None:
+        qualified = f"{qualified}({graph_reader_digest(wrapped)})"
+    return hashlib.sha256(qualified.encode("utf-8")).hexdigest()[:16]
+
+
+def estimate_snapshot_bytes(snapshot: ParsedGraphSnapshot) -> int:
+    """Approximate resident size of ``snapshot`` for cache budgeting."""
+    index_entries = sum(len(ids) for ids in snapshot.label_index.values()) + sum(
+        len(ids) for ids in snapshot.alias_index.values()
+    )
+    if is_compact_snapshot(snapshot):
+        object_bytes = _APPROX_COMPACT_OBJECT_BYTES
+        relationship_bytes = _APPROX_COMPACT_RELATIONSHIP_BYTES
+        evidence_bytes = _APPROX_COMPACT_EVIDENCE_BYTES
+    else:
+        object_bytes = _APPROX_OBJECT_BYTES
+        relationship_bytes = _APPROX_RELATIONSHIP_BYTES
+        evidence_bytes = _APPROX_EVIDENCE_BYTES
+    return (
+        _APPROX_SNAPSHOT_OVERHEAD_BYTES
+        + len(snapshot.objects) * object_bytes
+        + len(snapshot.relationships) * relationship_bytes
+        + len(snapshot.evidence) * evidence_bytes
+        + index_entries * _APPROX_INDEX_ENTRY_BYTES
+    )
+
+
+def _reader_attribute(reader: GraphSnapshotReader, name: str) -> object:
+    """``name`` on ``reader`` or the first wrapped reader that defines it."""
+    current: object = reader
+    while current is not None:
+        value = getattr(current, name, None)
+        if value is not None:
+            return value
+        current = getattr(current, "wrapped_reader", None)
+    return None
+
+
+def _cache_key(revision: WorldGraphRevision, reader: GraphSnapshotReader) -> SnapshotCacheKey:
+    return (
+        revision.world_id,
+        revision.revision_id,
+        revision.graph_payload_sha256,
+        graph_reader_digest(reader),
+    )
+
+
+def _profile_still_admitted(snapshot: ParsedGraphSnapshot, reader: GraphSnapshotReader) -> bool:
+    """Re-run the parse-time profile check for an artifact's pin.
+
+    Raises what :func:`resolve_and_verify_profile` raises when the live registry
+    no longer admits the pin. ``False`` (rebuild from the payload) when the
+    reader exposes no registry to check against.
+    """
+    ref = snapshot.semantic_profile_ref
+    if ref is None:
+        return True
+    registry = _reader_attribute(reader, "profile_registry")
+    if registry is None:
+        return False
+    resolve_and_verify_profile(ref, cast(SemanticProfileRegistry, registry))
+    return True
+
+
+@dataclass(frozen=True)
+class ParsedSnapshotCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+    artifact_loads: int = 0
+    artifact_rebuilds: int = 0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    snapshot: ParsedGraphSnapshot
+    cost: int
+
+
+class ParsedSnapshotCache:
+    """Thread-safe LRU of parsed snapshots bounded by an approximate byte budget."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        artifacts: SnapshotArtifactStore | None = None,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._max_bytes = max_bytes
+        self._artifacts = artifacts
+        self._artifact_loads = 0
+        self._artifact_rebuilds = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[SnapshotCacheKey, _CacheEntry] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_parse(
+        self,
+        stored: StoredGraphRevision,
+        *,
+        reader: GraphSnapshotReader,
+    ) -> ParsedGraphSnapshot:
+        """Return the cached parse of ``stored`` or parse it through ``reader``.
+
+        Parse failures propagate and are never cached. Concurrent misses for the
+        same key may parse twice; the first result to land is kept.
+        """
+        revision = stored.revision
+        cached = self.get(revision, reader=reader)
+        if cached is not None:
+            return cached
+        if self._artifacts is None or _reader_attribute(reader, "lazy_objects"):
+            parsed = reader.parse(
+                graph_schema=revision.graph_schema,
+                graph_payload=stored.graph_payload,
+            )
+            return self.put(revision, parsed, reader=reader)
+        artifact_key = SnapshotArtifactKey.for_revision(
+            revision, reader_digest=graph_reader_digest(reader)
+        )
+        loaded = self._artifacts.load(artifact_key)
+        if loaded is not None and _profile_still_admitted(loaded, reader):
+            with self._lock:
+                self._artifact_loads += 1
+            return self.put(revision, loaded, reader=reader)
+        parsed = reader.parse(
+            graph_schema=revision.graph_schema,
+            graph_payload=stored.graph_payload,
+        )
+        self._artifacts.save(artifact_key, parsed)
+        with self._lock:
+            self._artifact_rebuilds += 1
+        return self.put(revision, parsed, reader=reader)
+
+    def get(
+        self,
+        revision: WorldGraphRevision,
+        *,
+        reader: GraphSnapshotReader,
+    ) -> ParsedGraphSnapshot | None:
+        """Return the cached parse of ``revision`` through ``reader``, counting hit/miss."""
+        key = _cache_key(revision, reader)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.snapshot
+            self._misses += 1
+        return None
+
+    def put(
+        self,
+        revision: WorldGraphRevision,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        reader: GraphSnapshotReader,
+    ) -> ParsedGraphSnapshot:
+        """Retain ``snapshot`` as the parse of ``revision``; returns the kept snapshot.
+
+        Callers own the binding: ``snapshot`` must be what ``reader`` produces for
+        the payload ``revision`` names. An entry that landed first wins.
+        """
+        key = _cache_key(revision, reader)
+        cost = estimate_snapshot_bytes(snapshot)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing.snapshot
+            if cost > self._max_bytes:
+                # Larger than the whole budget: serve it, never retain it.
+                return snapshot
+            self._entries[key] = _CacheEntry(snapshot=snapshot, cost=cost)
+            self._current_bytes += cost
+            while self._current_bytes > self._max_bytes:
+                _evicted_key, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.cost
+                self._evictions += 1
+        return snapshot
+
+    def save_artifact(
+        self,
+        revision: WorldGraphRevision,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        reader: GraphSnapshotReader,
+    ) -> bool:
+        """Persist ``snapshot`` as ``reader``'s artifact for ``revision`` without retaining it.
+
+        Lets a host that has already parsed a revision (the publication host
+        validating a new head) spare every turn host that shares the artifact
+        store the cold parse. ``snapshot`` must be a full, eager parse of the
+        payload ``revision`` names by ``reader`` or the reader it wraps; it is
+        compacted when ``reader`` is. Returns ``False`` without writing when
+        there is no artifact store or ``reader`` is lazy.
+        """
+        if self._artifacts is None or _reader_attribute(reader, "lazy_objects"):
+            return False
+        if isinstance(reader, CompactGraphSnapshotReader):
+            snapshot = compact_snapshot(snapshot)
+        self._artifacts.save(
+            SnapshotArtifactKey.for_revision(revision, reader_digest=graph_reader_digest(reader)),
+            snapshot,
+        )
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> ParsedSnapshotCacheStats:
+        with self._lock:
+            return ParsedSnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+                artifact_loads=self._artifact_loads,
+                artifact_rebuilds=self._artifact_rebuilds,
+            )
@@ -0,0 +1,454 @@
+"""Compact, interned backing store for parsed graph snapshots.
+
+A fully parsed snapshot keeps one pydantic ``GraphObjectView`` /
+``GraphRelationshipView`` / evidence ledger record per row, each with its own
+field dict, fields-set and list copies. :func:`compact_snapshot` re-homes the
+same data into slotted records: identifiers, kinds, labels, predicates and
+evidence string fields are interned, evidence ID lists become ``array("I")``
+offsets into one per-snapshot string table, and each ledger record keeps only
+a tuple of field values next to a shape shared by every record of its model.
+
+The result is still a :class:`ParsedGraphSnapshot`; ``objects``,
+``relationships`` and ``evidence`` are read-only mappings that build a fresh
+view on each item access, so only the records a turn actually touches are
+materialized. Views are built with ``model_construct`` from already-validated
+data and compare equal to the views the wrapped reader produced. Assertion
+metadata models are shared with the original parse, not copied.
+
+On a generated 20k-object graph the retained snapshot shrinks by roughly
+3x (see ``test_compaction_retains_a_fraction_of_the_full_parse``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ..contracts.knowledge_assertion import KnowledgeAssertionMetadataV1
+from ..contracts.retrieval import ResolvedReferent
+from .graph_snapshot import (
+    AdmittedAliasAssertion,
+    AdmittedPropertyAssertion,
+    AdmittedSummaryAssertion,
+    GraphEvidenceLedgerRecord,
+    GraphObjectView,
+    GraphRelationshipView,
+    GraphSnapshotReader,
+    ParsedGraphSnapshot,
+)
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    EvidenceCodes: TypeAlias = array[int] | tuple[int, ...]
+
+_NO_CODES: tuple[int, ...] = ()
+
+
+class _StringTable:
+    """Append-only table of interned strings addressed by integer offset."""
+
+    __slots__ = ("_offsets", "strings")
+
+    def __init__(self) -> None:
+        self._offsets: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def encode(self, values: Sequence[str]) -> EvidenceCodes:
+        if not values:
+            return _NO_CODES
+        codes = array("I")
+        for value in values:
+            offset = self._offsets.get(value)
+            if offset is None:
+                offset = len(self.strings)
+                self._offsets[value] = offset
+                self.strings.append(sys.intern(value))
+            codes.append(offset)
+        return codes
+
+    def freeze(self) -> tuple[str, ...]:
+        self._offsets = {}
+        return tuple(self.strings)
+
+
+def _decode(strings: tuple[str, ...], codes: EvidenceCodes) -> list[str]:
+    return [strings[code] for code in codes]
+
+
+def _intern_all(values: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+class _CompactAlias:
+    __slots__ = ("alias", "assertion_id", "evidence", "metadata")
+
+    def __init__(
+        self, assertion: AdmittedAliasAssertion, table: _StringTable
+    ) -> None:
+        self.assertion_id = sys.intern(assertion.assertion_id)
+        self.alias = sys.intern(assertion.alias)
+        self.evidence = table.encode(assertion.evidence_ref_ids)
+        self.metadata = assertion.assertion_metadata
+
+    def view(self, strings: tuple[str, ...]) -> AdmittedAliasAssertion:
+        return AdmittedAliasAssertion.model_construct(
+            assertion_id=self.assertion_id,
+            alias=self.alias,
+            evidence_ref_ids=_decode(strings, self.evidence),
+            assertion_metadata=self.metadata,
+        )
+
+
+class _CompactSummary:
+    __slots__ = ("assertion_id", "evidence", "metadata", "summary")
+
+    def __init__(
+        self, assertion: AdmittedSummaryAssertion, table: _StringTable
+    ) -> None:
+        self.assertion_id = sys.intern(assertion.assertion_id)
+        self.summary = assertion.summary
+        self.evidence = table.encode(assertion.evidence_ref_ids)
+        self.metadata = assertion.assertion_metadata
+
+    def view(self, strings: tuple[str, ...]) -> AdmittedSummaryAssertion:
+        return AdmittedSummaryAssertion.model_construct(
+            assertion_id=self.assertion_id,
+            summary=self.summary,
+            evidence_ref_ids=_decode(strings, self.evidence),
+            assertion_metadata=self.metadata,
+        )
+
+
+class _CompactProperty:
+    __slots__ = ("assertion_id", "evidence", "metadata", "property_term", "value")
+
+    def __init__(
+        self, assertion: AdmittedPropertyAssertion, table: _StringTable
+    ) -> None:
+        self.assertion_id = sys.intern(assertion.assertion_id)
+        self.property_term = sys.intern(assertion.property_term)
+        self.value = assertion.value
+        self.evidence = table.encode(assertion.evidence_ref_ids)
+        self.metadata = assertion.assertion_metadata
+
+    def view(self, strings: tuple[str, ...]) -> AdmittedPropertyAssertion:
+        return AdmittedPropertyAssertion.model_construct(
+            assertion_id=self.assertion_id,
+            property_term=self.property_term,
+            value=self.value,
+            evidence_ref_ids=_decode(strings, self.evidence),
+            assertion_metadata=self.metadata,
+        )
+
+
+class _CompactObject:
+    __slots__ = (
+        "alias_assertions",
+        "aliases",
+        "core_evidence",
+        "evidence",
+        "existence_metadata",
+        "field_schema",
+        "kind",
+        "label",
+        "object_id",
+        "property_assertions",
+        "summary",
+        "summary_assertion",
+    )
+
+    def __init__(self, obj: GraphObjectView, table: _StringTable) -> None:
+        self.object_id = sys.intern(obj.object_id)
+        self.kind = sys.intern(obj.kind)
+        self.label = sys.intern(obj.label)
+        self.aliases = _intern_all(obj.aliases)
+        self.evidence = table.encode(obj.evidence_ref_ids)
+        self.summary = obj.summary
+        self.field_schema = obj.object_field_schema
+        self.core_evidence = (
+            self.evidence
+            if obj.core_evidence_ref_ids == obj.evidence_ref_ids
+            else table.encode(obj.core_evidence_ref_ids)
+        )
+        self.alias_assertions = tuple(
+            _CompactAlias(item, table) for item in obj.admitted_alias_assertions
+        )
+        self.summary_assertion = (
+            None
+            if obj.admitted_summary_assertion is None
+            else _CompactSummary(obj.admitted_summary_assertion, table)
+        )
+        self.existence_metadata: KnowledgeAssertionMetadataV1 | None = (
+            obj.existence_assertion_metadata
+        )
+        self.property_assertions = tuple(
+            _CompactProperty(item, table) for item in obj.admitted_property_assertions
+        )
+
+    def view(self, strings: tuple[str, ...]) -> GraphObjectView:
+        return GraphObjectView.model_construct(
+            object_id=self.object_id,
+            kind=self.kind,
+            label=self.label,
+            aliases=list(self.aliases),
+            evidence_ref_ids=_decode(strings, self.evidence),
+            summary=self.summary,
+            object_field_schema=self.field_schema,
+            core_evidence_ref_ids=_decode(strings, self.core_evidence),
+            admitted_alias_assertions=[
+                item.view(strings) for item in self.alias_assertions
+            ],
+            admitted_summary_assertion=(
+                None
+                if self.summary_assertion is None
+                else self.summary_assertion.view(strings)
+            ),
+            existence_assertion_metadata=self.existence_metadata,
+            admitted_property_assertions=[
+                item.view(strings) for item in self.property_assertions
+            ],
+        )
+
+
+class _CompactRelationship:
+    __slots__ = (
+        "evidence",
+        "metadata",
+        "object_object_id",
+        "predicate",
+        "relationship_id",
+        "subject_object_id",
+    )
+
+    def __init__(self, rel: GraphRelationshipView, table: _StringTable) -> None:
+        self.relationship_id = sys.intern(rel.relationship_id)
+        self.subject_object_id = sys.intern(rel.subject_object_id)
+        self.predicate = sys.intern(rel.predicate)
+        self.object_object_id = sys.intern(rel.object_object_id)
+        self.evidence = table.encode(rel.evidence_ref_ids)
+        self.metadata = rel.assertion_metadata
+
+    def view(self, strings: tuple[str, ...]) -> GraphRelationshipView:
+        return GraphRelationshipView.model_construct(
+            relationship_id=self.relationship_id,
+            subject_object_id=self.subject_object_id,
+            predicate=self.predicate,
+            object_object_id=self.object_object_id,
+            evidence_ref_ids=_decode(strings, self.evidence),
+            assertion_metadata=self.metadata,
+        )
+
+
+class _EvidenceShape:
+    """Model and set fields shared by every ledger record of one layout."""
+
+    __slots__ = ("field_names", "fields_set", "model")
+
+    def __init__(
+        self, model: type[GraphEvidenceLedgerRecord], fields_set: frozenset[str]
+    ) -> None:
+        self.model = model
+        self.field_names = tuple(model.model_fields)
+        self.fields_set = fields_set
+
+
+def _intern_value(value: object) -> object:
+    # Exact ``str`` only: ``sys.intern`` rejects subclasses such as StrEnum members.
+    return sys.intern(value) if type(value) is str else value
+
+
+class _CompactEvidence:
+    __slots__ = ("shape", "values")
+
+    def __init__(
+        self,
+        record: GraphEvidenceLedgerRecord,
+        shapes: dict[tuple[type, frozenset[str]], _EvidenceShape],
+    ) -> None:
+        model = type(record)
+        fields_set = frozenset(record.model_fields_set)
+        shape = shapes.get((model, fields_set))
+        if shape is None:
+            shape = _EvidenceShape(model, fields_set)
+            shapes[(model, fields_set)] = shape
+        self.shape = shape
+        self.values = tuple(_intern_value(getattr(record, name)) for name in shape.field_names)
+
+    def view(self) -> GraphEvidenceLedgerRecord:
+        shape = self.shape
+        return shape.model.model_construct(
+            set(shape.fields_set), **dict(zip(shape.field_names, self.values, strict=True))
+        )
+
+
+class CompactObjectTable(Mapping[str, GraphObjectView]):
+    """Read-only object mapping that materializes a view per item access."""
+
+    __slots__ = ("_records", "_strings")
+
+    def __init__(
+        self,
+        records: dict[str, _CompactObject],
+        strings: tuple[str, ...],
+    ) -> None:
+        self._records = records
+        self._strings = strings
+
+    def __getitem__(self, object_id: str) -> GraphObjectView:
+        return self._records[object_id].view(self._strings)
+
+    def __contains__(self, object_id: object) -> bool:
+        return object_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class CompactRelationshipTable(Mapping[str, GraphRelationshipView]):
+    """Read-only relationship mapping that materializes a view per item access."""
+
+    __slots__ = ("_records", "_strings")
+
+    def __init__(
+        self,
+        records: dict[str, _CompactRelationship],
+        strings: tuple[str, ...],
+    ) -> None:
+        self._records = records
+        self._strings = strings
+
+    def __getitem__(self, relationship_id: str) -> GraphRelationshipView:
+        return self._records[relationship_id].view(self._strings)
+
+    def __contains__(self, relationship_id: object) -> bool:
+        return relationship_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class CompactEvidenceTable(Mapping[str, GraphEvidenceLedgerRecord]):
+    """Read-only evidence ledger that materializes a record per item access."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: dict[str, _CompactEvidence]) -> None:
+        self._records = records
+
+    def __getitem__(self, evidence_ref_id: str) -> GraphEvidenceLedgerRecord:
+        return self._records[evidence_ref_id].view()
+
+    def __contains__(self, evidence_ref_id: object) -> bool:
+        return evidence_ref_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def _intern_index(index: Mapping[str, list[str]]) -> dict[str, list[str]]:
+    return {
+        sys.intern(key): [sys.intern(value) for value in values]
+        for key, values in index.items()
+    }
+
+
+def is_compact_snapshot(snapshot: ParsedGraphSnapshot) -> bool:
+    return isinstance(snapshot.objects, CompactObjectTable)
+
+
+def compact_snapshot(snapshot: ParsedGraphSnapshot) -> ParsedGraphSnapshot:
+    """Return ``snapshot`` re-homed onto the compact backend (idempotent)."""
+    if is_compact_snapshot(snapshot):
+        return snapshot
+    table = _StringTable()
+    objects = {
+        sys.intern(object_id): _CompactObject(obj, table)
+        for object_id, obj in snapshot.objects.items()
+    }
+    relationships = {
+        sys.intern(relationship_id): _CompactRelationship(rel, table)
+        for relationship_id, rel in snapshot.relationships.items()
+    }
+    shapes: dict[tuple[type, frozenset[str]], _EvidenceShape] = {}
+    evidence = {
+        sys.intern(evidence_ref_id): _CompactEvidence(record, shapes)
+        for evidence_ref_id, record in snapshot.evidence.items()
+    }
+    strings = table.freeze()
+    return dataclasses.replace(
+        snapshot,
+        objects=CompactObjectTable(objects, strings),
+        relationships=CompactRelationshipTable(relationships, strings),
+        evidence=CompactEvidenceTable(evidence),
+        label_index=_intern_index(snapshot.label_index),
+        alias_index=_intern_index(snapshot.alias_index),
+        subject_index=_intern_index(snapshot.subject_index),
+        object_index=_intern_index(snapshot.object_index),
+        predicate_index=_intern_index(snapshot.predicate_index),
+    )
+
+
+class CompactGraphSnapshotReader:
+    """Wrap a reader so every parsed snapshot lands on the compact backend.
+
+    Parsing, validation and every failure mode are the wrapped reader's; only
+    the in-memory representation of a successful parse changes.
+    """
+
+    def __init__(self, wrapped_reader: GraphSnapshotReader) -> None:
+        self.wrapped_reader = wrapped_reader
+
+    def parse(
+        self,
+        *,
+        graph_schema: str,
+        graph_payload: dict[str, Any],
+    ) -> ParsedGraphSnapshot:
+        return compact_snapshot(
+            self.wrapped_reader.parse(
+                graph_schema=graph_schema,
+                graph_payload=graph_payload,
+            )
+        )
+
+    def get_object(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        object_id: str,
+    ) -> GraphObjectView | None:
+        return self.wrapped_reader.get_object(snapshot, object_id)
+
+    def list_relationships(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        object_ids: list[str],
+    ) -> list[GraphRelationshipView]:
+        return self.wrapped_reader.list_relationships(snapshot, object_ids)
+
+    def resolve_mentions(
+        self,
+        snapshot: ParsedGraphSnapshot,
+        *,
+        message: str,
+        selected_object_ids: list[str],
+        candidate_object_ids: list[str] | None = None,
+    ) -> list[ResolvedReferent]:
+        return self.wrapped_reader.resolve_mentions(
+            snapshot,
+            message=message,
+            selected_object_ids=selected_object_ids,
+            candidate_object_ids=candidate_object_ids,
+        )
@@ -28,14 +28,15 @@ model, so a v1-v3 payload cannot be read as v4 and vice versa.
 from __future__ import annotations
 
 import math
-from typing import Any, Self
+from collections.abc import Callable, Mapping
+from typing import Any, Protocol, Self, cast
 
 from pydantic import Field, ValidationError, model_validator
 
 from ..contracts.base import DungeonMindModel
 from ..contracts.knowledge_assertion import KnowledgeAssertionMetadataV1
 from ..contracts.retrieval import ResolvedReferent
-from ..contracts.semantic_profile import SemanticProfileRef
+from ..contracts.semantic_profile import SemanticProfileDescriptor, SemanticProfileRef
 from ..domain.errors import PersistenceIntegrityError
 from .graph_snapshot import (
     GRAPH_SCHEMA_V4,
@@ -47,7 +48,12 @@ from .graph_snapshot import (
     GraphObjectView,
     GraphRelationshipView,
     ParsedGraphSnapshot,
+    _lazy_snapshot,
+    _raw_records,
+    _RawObjectFacts,
+    _scan_lazy_objects,
     build_label_and_alias_indexes,
+    build_relationship_indexes,
     get_object_from_snapshot,
     list_relationships_from_snapshot,
     resolve_mentions_from_snapshot,
@@ -225,11 +231,305 @@ def _claim_assertion(
     return metadata
 
 
+def _raw_v4_claim(assertion_id: str, kind: str, claimed: set[str]) -> None:
+    if assertion_id in claimed:
+        raise PersistenceIntegrityError(
+            f"duplicate assertion_id {assertion_id!r}",
+            details={"assertion_id": assertion_id, "assertion_kind": kind},
+        )
+    claimed.add(assertion_id)
+
+
+def _v4_raw_facts(record: dict[str, Any]) -> _RawObjectFacts:
+    aliases = _raw_records(record.get("aliases"))
+    summary = record.get("summary")
+    field_records = [
+        *(("alias", item) for item in aliases),
+        *([("summary", summary)] if isinstance(summary, dict) else []),
+        *(("property", item) for item in _raw_records(record.get("properties"))),
+    ]
+    metadata = [
+        (kind, item.get("assertion_metadata"))
+        for kind, item in [("object_existence", record), *field_records]
+    ]
+    metadata = [(kind, item) for kind, item in metadata if isinstance(item, dict)]
+    return (
+        record.get("label"),
+        [item.get("value") for item in aliases],
+        [(kind, item.get("assertion_id")) for kind, item in metadata],
+        [item.get("evidence_ref_ids") for _, item in metadata],
+    )
+
+
+def _build_v4_object(
+    record: GraphObjectV4Record,
+    *,
+    descriptor: SemanticProfileDescriptor,
+    claimed: set[str],
+) -> GraphObjectView:
+    validate_qualified_term(record.kind, descriptor, field_name="kind")
+    existence = _claim_assertion(
+        record.assertion_metadata,
+        claimed=claimed,
+        kind="object_existence",
+    )
+
+    alias_views: list[AdmittedAliasAssertion] = []
+    for alias in record.aliases:
+        metadata = _claim_assertion(
+            alias.assertion_metadata,
+            claimed=claimed,
+            kind="alias",
+        )
+        alias_views.append(
+            AdmittedAliasAssertion(
+                assertion_id=metadata.assertion_id,
+                alias=alias.value,
+                evidence_ref_ids=list(metadata.evidence_ref_ids),
+                assertion_metadata=metadata,
+            )
+        )
+
+    summary_view: AdmittedSummaryAssertion | None = None
+    if record.summary is not None:
+        metadata = _claim_assertion(
+            record.summary.assertion_metadata,
+            claimed=claimed,
+            kind="summary",
+        )
+        summary_view = AdmittedSummaryAssertion(
+            assertion_id=metadata.assertion_id,
+            summary=record.summary.value,
+            evidence_ref_ids=list(metadata.evidence_ref_ids),
+            assertion_metadata=metadata,
+        )
+
+    property_views: list[AdmittedPropertyAssertion] = []
+    for prop in record.properties:
+        validate_qualified_term(
+            prop.property_term, descriptor, field_name="property_term"
+        )
+        metadata = _claim_assertion(
+            prop.assertion_metadata,
+            claimed=claimed,
+            kind="property",
+        )
+        property_views.append(
+            AdmittedPropertyAssertion(
+                assertion_id=metadata.assertion_id,
+                property_term=prop.property_term,
+                value=prop.value,
+                evidence_ref_ids=list(metadata.evidence_ref_ids),
+                assertion_metadata=metadata,
+            )
+        )
+
+    return GraphObjectView(
+        object_id=record.object_id,
+        kind=record.kind,
+        label=record.label,
+        aliases=list(dict.fromkeys(item.alias for item in alias_views)),
+        evidence_ref_ids=_retained_evidence(
+            existence, alias_views, summary_view, property_views
+        ),
+        summary=summary_view.summary if summary_view is not None else None,
+        object_field_schema="v4",
+        core_evidence_ref_ids=list(existence.evidence_ref_ids),
+        admitted_alias_assertions=alias_views,
+        admitted_summary_assertion=summary_view,
+        existence_assertion_metadata=existence,
+        admitted_property_assertions=property_views,
+    )
+
+
+def _parse_v4_relationships(
+    records: list[GraphRelationshipV4Record],
+    *,
+    objects: Mapping[str, GraphObjectView],
+    evidence: Mapping[str, GraphEvidenceLedgerRecord],
+    descriptor: SemanticProfileDescriptor,
+    claimed: set[str],
+) -> dict[str, GraphRelationshipView]:
+    relationships: dict[str, GraphRelationshipView] = {}
+    for rel in records:
+        if rel.relationship_id in relationships:
+            raise PersistenceIntegrityError(
+                f"duplicate relationship_id {rel.relationship_id!r}",
+                details={"relationship_id": rel.relationship_id},
+            )
+        if rel.source_object_id not in objects:
+            raise PersistenceIntegrityError(
+                f"dangling relationship subject {rel.source_object_id!r}",
+                details={"relationship_id": rel.relationship_id},
+            )
+        if rel.target_object_id not in objects:
+            raise PersistenceIntegrityError(
+                f"dangling relationship object {rel.target_object_id!r}",
+                details={"relationship_id": rel.relationship_id},
+            )
+        validate_qualified_term(rel.predicate, descriptor, field_name="predicate")
+        metadata = _claim_assertion(
+            rel.assertion_metadata,
+            claimed=claimed,
+            kind="relationship",
+        )
+        for evidence_ref_id in metadata.evidence_ref_ids:
+            if evidence_ref_id not in evidence:
+                raise PersistenceIntegrityError(
+                    f"dangling relationship evidence_ref_id {evidence_ref_id!r}",
+                    details={"relationship_id": rel.relationship_id},
+                )
+        relationships[rel.relationship_id] = GraphRelationshipView(
+            relationship_id=rel.relationship_id,
+            subject_object_id=rel.source_object_id,
+            predicate=rel.predicate,
+            object_object_id=rel.target_object_id,
+            evidence_ref_ids=list(metadata.evidence_ref_ids),
+            assertion_metadata=metadata,
+        )
+    return relationships
+
+
+class _AssertionGraphPayload(Protocol):
+    world_id: str
+    semantic_profile: SemanticProfileRef
+    objects: list[GraphObjectV4Record]
+    relationships: list[GraphRelationshipV4Record]
+
+
+def parse_assertion_graph(
+    graph_payload: dict[str, Any],
+    *,
+    graph_schema: str,
+    payload_model: type[DungeonMindModel],
+    index_evidence: Callable[[Any], dict[str, GraphEvidenceLedgerRecord]],
+    profile_registry: SemanticProfileRegistry,
+    lazy_objects: bool,
+) -> ParsedGraphSnapshot:
+    """Parse a v4-shaped payload (``dm_union_graph_v4`` / ``dm_union_graph_v5``).
+
+    Schema and top-level shape checks are the caller's; ``payload_model`` and
+    ``index_evidence`` carry the one schema-specific difference, the evidence
+    ledger. With ``lazy_objects`` the object records are only scanned
+    structurally and each view is validated and built on first access.
+    """
+    malformed = (
+        f"malformed {graph_schema} object, relationship, assertion, "
+        "or evidence record"
+    )
+    raw_objects = graph_payload.get("objects", [])
+    try:
+        payload = cast(
+            _AssertionGraphPayload,
+            payload_model.model_validate(
+                {**graph_payload, "objects": []} if lazy_objects else graph_payload
+            ),
+        )
+    except (ValidationError, TypeError, ValueError) as exc:
+        raise PersistenceIntegrityError(
+            malformed,
+            details={"error": str(exc)},
+        ) from exc
+
+    descriptor = resolve_and_verify_profile(payload.semantic_profile, profile_registry)
+    evidence = index_evidence(payload)
+
+    if lazy_objects:
+
+        def build(raw: Any) -> GraphObjectView:
+            try:
+                record = GraphObjectV4Record.model_validate(raw)
+            except (ValidationError, TypeError, ValueError) as exc:
+                raise PersistenceIntegrityError(
+                    malformed,
+                    details={"error": str(exc)},
+                ) from exc
+            return _build_v4_object(record, descriptor=descriptor, claimed=set())
+
+        scan = _scan_lazy_objects(
+            raw_objects,
+            facts=_v4_raw_facts,
+            claim=_raw_v4_claim,
+            build=build,
+            malformed_message=malformed,
+        )
+        relationships = _parse_v4_relationships(
+            payload.relationships,
+            objects=scan.objects,
+            evidence=evidence,
+            descriptor=descriptor,
+            claimed=scan.claimed_assertion_ids,
+        )
+        scan.check_node_evidence(evidence)
+        return _lazy_snapshot(
+            scan,
+            world_id=payload.world_id,
+            graph_schema=graph_schema,
+            evidence=evidence,
+            relationships=relationships,
+            semantic_profile_ref=payload.semantic_profile,
+            semantic_profile_descriptor=descriptor,
+        )
+
+    claimed_assertion_ids: set[str] = set()
+    objects: dict[str, GraphObjectView] = {}
+    for record in payload.objects:
+        if record.object_id in objects:
+            raise PersistenceIntegrityError(
+                f"duplicate object_id {record.object_id!r}",
+                details={"object_id": record.object_id},
+            )
+        objects[record.object_id] = _build_v4_object(
+            record, descriptor=descriptor, claimed=claimed_assertion_ids
+        )
+
+    relationships = _parse_v4_relationships(
+        payload.relationships,
+        objects=objects,
+        evidence=evidence,
+        descriptor=descriptor,
+        claimed=claimed_assertion_ids,
+    )
+
+    for obj in objects.values():
+        for evidence_ref_id in obj.evidence_ref_ids:
+            if evidence_ref_id not in evidence:
+                raise PersistenceIntegrityError(
+                    f"dangling node evidence_ref_id {evidence_ref_id!r}",
+                    details={"object_id": obj.object_id},
+                )
+
+    label_index, alias_index = build_label_and_alias_indexes(objects)
+    subject_index, object_index, predicate_index = build_relationship_indexes(
+        relationships
+    )
+    return ParsedGraphSnapshot(
+        world_id=payload.world_id,
+        graph_schema=graph_schema,
+        objects=objects,
+        relationships=relationships,
+        evidence=evidence,
+        label_index=label_index,
+        alias_index=alias_index,
+        subject_index=subject_index,
+        object_index=object_index,
+        predicate_index=predicate_index,
+        semantic_profile_ref=payload.semantic_profile,
+        semantic_profile_descriptor=descriptor,
+    )
+
+
 class UnionGraphV4SnapshotReader:
     """Concrete reader for ``dm_union_graph_v4`` only."""
 
-    def __init__(self, profile_registry: SemanticProfileRegistry) -> None:
-        self._profile_registry = profile_registry
+    def __init__(
+        self,
+        profile_registry: SemanticProfileRegistry,
+        *,
+        lazy_objects: bool = False,
+    ) -> None:
+        self.profile_registry = profile_registry
+        self.lazy_objects = lazy_objects
 
     def parse(
         self,
@@ -253,159 +553,13 @@ class UnionGraphV4SnapshotReader:
                 "dm_union_graph_v4 requires semantic_profile",
                 details={"graph_schema": graph_schema},
             )
-        try:
-            payload = UnionGraphV4Payload.model_validate(graph_payload)
-        except (ValidationError, TypeError, ValueError) as exc:
-            raise PersistenceIntegrityError(
-                "malformed dm_union_graph_v4 object, relationship, assertion, "
-                "or evidence record",
-                details={"error": str(exc)},
-            ) from exc
-
-        descriptor = resolve_and_verify_profile(
-            payload.semantic_profile, self._profile_registry
-        )
-        evidence = _index_evidence(payload.evidence_refs)
-        claimed_assertion_ids: set[str] = set()
-
-        objects: dict[str, GraphObjectView] = {}
-        for record in payload.objects:
-            if record.object_id in objects:
-                raise PersistenceIntegrityError(
-                    f"duplicate object_id {record.object_id!r}",
-                    details={"object_id": record.object_id},
-                )
-            validate_qualified_term(record.kind, descriptor, field_name="kind")
-            existence = _claim_assertion(
-                record.assertion_metadata,
-                claimed=claimed_assertion_ids,
-                kind="object_existence",
-            )
-
-            alias_views: list[AdmittedAliasAssertion] = []
-            for alias in record.aliases:
-                metadata = _claim_assertion(
-                    alias.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="alias",
-                )
-                alias_views.append(
-                    AdmittedAliasAssertion(
-                        assertion_id=metadata.assertion_id,
-                        alias=alias.value,
-                        evidence_ref_ids=list(metadata.evidence_ref_ids),
-                        assertion_metadata=metadata,
-                    )
-                )
-
-            summary_view: AdmittedSummaryAssertion | None = None
-            if record.summary is not None:
-                metadata = _claim_assertion(
-                    record.summary.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="summary",
-                )
-                summary_view = AdmittedSummaryAssertion(
-                    assertion_id=metadata.assertion_id,
-                    summary=record.summary.value,
-                    evidence_ref_ids=list(metadata.evidence_ref_ids),
-                    assertion_metadata=metadata,
-                )
-
-            property_views: list[AdmittedPropertyAssertion] = []
-            for prop in record.properties:
-                validate_qualified_term(
-                    prop.property_term, descriptor, field_name="property_term"
-                )
-                metadata = _claim_assertion(
-                    prop.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="property",
-                )
-                property_views.append(
-                    AdmittedPropertyAssertion(
-                        assertion_id=metadata.assertion_id,
-                        property_term=prop.property_term,
-                        value=prop.value,
-                        evidence_ref_ids=list(metadata.evidence_ref_ids),
-                        assertion_metadata=metadata,
-                    )
-                )
-
-            objects[record.object_id] = GraphObjectView(
-                object_id=record.object_id,
-                kind=record.kind,
-                label=record.label,
-                aliases=list(dict.fromkeys(item.alias for item in alias_views)),
-                evidence_ref_ids=_retained_evidence(
-                    existence, alias_views, summary_view, property_views
-                ),
-                summary=summary_view.summary if summary_view is not None else None,
-                object_field_schema="v4",
-                core_evidence_ref_ids=list(existence.evidence_ref_ids),
-                admitted_alias_assertions=alias_views,
-                admitted_summary_assertion=summary_view,
-                existence_assertion_metadata=existence,
-                admitted_property_assertions=property_views,
-            )
-
-        relationships: dict[str, GraphRelationshipView] = {}
-        for rel in payload.relationships:
-            if rel.relationship_id in relationships:
-                raise PersistenceIntegrityError(
-                    f"duplicate relationship_id {rel.relationship_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            if rel.source_object_id not in objects:
-                raise PersistenceIntegrityError(
-                    f"dangling relationship subject {rel.source_object_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            if rel.target_object_id not in objects:
-                raise PersistenceIntegrityError(
-                    f"dangling relationship object {rel.target_object_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            validate_qualified_term(rel.predicate, descriptor, field_name="predicate")
-            metadata = _claim_assertion(
-                rel.assertion_metadata,
-                claimed=claimed_assertion_ids,
-                kind="relationship",
-            )
-            for evidence_ref_id in metadata.evidence_ref_ids:
-                if evidence_ref_id not in evidence:
-                    raise PersistenceIntegrityError(
-                        f"dangling relationship evidence_ref_id {evidence_ref_id!r}",
-                        details={"relationship_id": rel.relationship_id},
-                    )
-            relationships[rel.relationship_id] = GraphRelationshipView(
-                relationship_id=rel.relationship_id,
-                subject_object_id=rel.source_object_id,
-                predicate=rel.predicate,
-                object_object_id=rel.target_object_id,
-                evidence_ref_ids=list(metadata.evidence_ref_ids),
-                assertion_metadata=metadata,
-            )
-
-        for obj in objects.values():
-            for evidence_ref_id in obj.evidence_ref_ids:
-                if evidence_ref_id not in evidence:
-                    raise PersistenceIntegrityError(
-                        f"dangling node evidence_ref_id {evidence_ref_id!r}",
-                        details={"object_id": obj.object_id},
-                    )
-
-        label_index, alias_index = build_label_and_alias_indexes(objects)
-        return ParsedGraphSnapshot(
-            world_id=payload.world_id,
+        return parse_assertion_graph(
+            graph_payload,
             graph_schema=graph_schema,
-            objects=objects,
-            relationships=relationships,
-            evidence=evidence,
-            label_index=label_index,
-            alias_index=alias_index,
-            semantic_profile_ref=payload.semantic_profile,
-            semantic_profile_descriptor=descriptor,
+            payload_model=UnionGraphV4Payload,
+            index_evidence=lambda payload: _index_evidence(payload.evidence_refs),
+            profile_registry=self.profile_registry,
+            lazy_objects=self.lazy_objects,
         )
 
     def get_object(
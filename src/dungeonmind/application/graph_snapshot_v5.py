@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import Any, Self
 
-from pydantic import Field, ValidationError, model_validator
+from pydantic import Field, model_validator
 
 from ..contracts.base import DungeonMindModel
 from ..contracts.retrieval import ResolvedReferent
@@ -17,15 +17,11 @@ from ..contracts.semantic_profile import SemanticProfileRef
 from ..domain.errors import PersistenceIntegrityError
 from .graph_snapshot import (
     GRAPH_SCHEMA_V5,
-    AdmittedAliasAssertion,
-    AdmittedPropertyAssertion,
-    AdmittedSummaryAssertion,
     GraphEvidenceLedgerRecord,
     GraphEvidenceRecordV2,
     GraphObjectView,
     GraphRelationshipView,
     ParsedGraphSnapshot,
-    build_label_and_alias_indexes,
     get_object_from_snapshot,
     list_relationships_from_snapshot,
     resolve_mentions_from_snapshot,
@@ -33,15 +29,10 @@ from .graph_snapshot import (
 from .graph_snapshot_v4 import (
     GraphObjectV4Record,
     GraphRelationshipV4Record,
-    _claim_assertion,
     _reject_blank,
-    _retained_evidence,
-)
-from .semantic_profiles import (
-    SemanticProfileRegistry,
-    resolve_and_verify_profile,
-    validate_qualified_term,
+    parse_assertion_graph,
 )
+from .semantic_profiles import SemanticProfileRegistry
 
 
 class UnionGraphV5Payload(DungeonMindModel):
@@ -78,8 +69,14 @@ def _index_evidence_v2(
 class UnionGraphV5SnapshotReader:
     """Concrete reader for ``dm_union_graph_v5`` only."""
 
-    def __init__(self, profile_registry: SemanticProfileRegistry) -> None:
-        self._profile_registry = profile_registry
+    def __init__(
+        self,
+        profile_registry: SemanticProfileRegistry,
+        *,
+        lazy_objects: bool = False,
+    ) -> None:
+        self.profile_registry = profile_registry
+        self.lazy_objects = lazy_objects
 
     def parse(
         self,
@@ -103,159 +100,13 @@ class UnionGraphV5SnapshotReader:
                 "dm_union_graph_v5 requires semantic_profile",
                 details={"graph_schema": graph_schema},
             )
-        try:
-            payload = UnionGraphV5Payload.model_validate(graph_payload)
-        except (ValidationError, TypeError, ValueError) as exc:
-            raise PersistenceIntegrityError(
-                "malformed dm_union_graph_v5 object, relationship, assertion, "
-                "or evidence record",
-                details={"error": str(exc)},
-            ) from exc
-
-        descriptor = resolve_and_verify_profile(
-            payload.semantic_profile, self._profile_registry
-        )
-        evidence = _index_evidence_v2(payload.evidence_refs)
-        claimed_assertion_ids: set[str] = set()
-
-        objects: dict[str, GraphObjectView] = {}
-        for record in payload.objects:
-            if record.object_id in objects:
-                raise PersistenceIntegrityError(
-                    f"duplicate object_id {record.object_id!r}",
-                    details={"object_id": record.object_id},
-                )
-            validate_qualified_term(record.kind, descriptor, field_name="kind")
-            existence = _claim_assertion(
-                record.assertion_metadata,
-                claimed=claimed_assertion_ids,
-                kind="object_existence",
-            )
-
-            alias_views: list[AdmittedAliasAssertion] = []
-            for alias in record.aliases:
-                metadata = _claim_assertion(
-                    alias.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="alias",
-                )
-                alias_views.append(
-                    AdmittedAliasAssertion(
-                        assertion_id=metadata.assertion_id,
-                        alias=alias.value,
-                        evidence_ref_ids=list(metadata.evidence_ref_ids),
-                        assertion_metadata=metadata,
-                    )
-                )
-
-            summary_view: AdmittedSummaryAssertion | None = None
-            if record.summary is not None:
-                metadata = _claim_assertion(
-                    record.summary.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="summary",
-                )
-                summary_view = AdmittedSummaryAssertion(
-                    assertion_id=metadata.assertion_id,
-                    summary=record.summary.value,
-                    evidence_ref_ids=list(metadata.evidence_ref_ids),
-                    assertion_metadata=metadata,
-                )
-
-            property_views: list[AdmittedPropertyAssertion] = []
-            for prop in record.properties:
-                validate_qualified_term(
-                    prop.property_term, descriptor, field_name="property_term"
-                )
-                metadata = _claim_assertion(
-                    prop.assertion_metadata,
-                    claimed=claimed_assertion_ids,
-                    kind="property",
-                )
-                property_views.append(
-                    AdmittedPropertyAssertion(
-                        assertion_id=metadata.assertion_id,
-                        property_term=prop.property_term,
-                        value=prop.value,
-                        evidence_ref_ids=list(metadata.evidence_ref_ids),
-                        assertion_metadata=metadata,
-                    )
-                )
-
-            objects[record.object_id] = GraphObjectView(
-                object_id=record.object_id,
-                kind=record.kind,
-                label=record.label,
-                aliases=list(dict.fromkeys(item.alias for item in alias_views)),
-                evidence_ref_ids=_retained_evidence(
-                    existence, alias_views, summary_view, property_views
-                ),
-                summary=summary_view.summary if summary_view is not None else None,
-                object_field_schema="v4",
-                core_evidence_ref_ids=list(existence.evidence_ref_ids),
-                admitted_alias_assertions=alias_views,
-                admitted_summary_assertion=summary_view,
-                existence_assertion_metadata=existence,
-                admitted_property_assertions=property_views,
-            )
-
-        relationships: dict[str, GraphRelationshipView] = {}
-        for rel in payload.relationships:
-            if rel.relationship_id in relationships:
-                raise PersistenceIntegrityError(
-                    f"duplicate relationship_id {rel.relationship_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            if rel.source_object_id not in objects:
-                raise PersistenceIntegrityError(
-                    f"dangling relationship subject {rel.source_object_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            if rel.target_object_id not in objects:
-                raise PersistenceIntegrityError(
-                    f"dangling relationship object {rel.target_object_id!r}",
-                    details={"relationship_id": rel.relationship_id},
-                )
-            validate_qualified_term(rel.predicate, descriptor, field_name="predicate")
-            metadata = _claim_assertion(
-                rel.assertion_metadata,
-                claimed=claimed_assertion_ids,
-                kind="relationship",
-            )
-            for evidence_ref_id in metadata.evidence_ref_ids:
-                if evidence_ref_id not in evidence:
-                    raise PersistenceIntegrityError(
-                        f"dangling relationship evidence_ref_id {evidence_ref_id!r}",
-                        details={"relationship_id": rel.relationship_id},
-                    )
-            relationships[rel.relationship_id] = GraphRelationshipView(
-                relationship_id=rel.relationship_id,
-                subject_object_id=rel.source_object_id,
-                predicate=rel.predicate,
-                object_object_id=rel.target_object_id,
-                evidence_ref_ids=list(metadata.evidence_ref_ids),
-                assertion_metadata=metadata,
-            )
-
-        for obj in objects.values():
-            for evidence_ref_id in obj.evidence_ref_ids:
-                if evidence_ref_id not in evidence:
-                    raise PersistenceIntegrityError(
-                        f"dangling node evidence_ref_id {evidence_ref_id!r}",
-                        details={"object_id": obj.object_id},
-                    )
-
-        label_index, alias_index = build_label_and_alias_indexes(objects)
-        return ParsedGraphSnapshot(
-            world_id=payload.world_id,
+        return parse_assertion_graph(
+            graph_payload,
             graph_schema=graph_schema,
-            objects=objects,
-            relationships=relationships,
-            evidence=evidence,
-            label_index=label_index,
-            alias_index=alias_index,
-            semantic_profile_ref=payload.semantic_profile,
-            semantic_profile_descriptor=descriptor,
+            payload_model=UnionGraphV5Payload,
+            index_evidence=lambda payload: _index_evidence_v2(payload.evidence_refs),
+            profile_registry=self.profile_registry,
+            lazy_objects=self.lazy_objects,
         )
 
     def get_object(
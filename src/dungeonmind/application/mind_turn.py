@@ -5,11 +5,14 @@ Transport-neutral: no FastAPI, Psycopg, fixture paths, or Uvicorn imports.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Protocol
+from typing import Any, Protocol, TypeVar
 
 from ..agents.protocol import AgentAdapter, AgentTurnContext, sanitize_agent_input
 from ..contracts.capability import CapabilityPolicy, GraphScope
@@ -32,7 +35,7 @@ from ..contracts.retrieval import (
     RetrievalOperationKind,
     SourceAnchor,
 )
-from ..contracts.semantic import CandidateChannel, SemanticQuery
+from ..contracts.semantic import CandidateChannel, SemanticCandidate, SemanticQuery
 from ..contracts.vocabulary import Visibility
 from ..domain.canonical import canonical_json, canonical_sha256
 from ..domain.errors import (
@@ -42,27 +45,34 @@ from ..domain.errors import (
     ScopeResolutionError,
 )
 from ..domain.fusion import reciprocal_rank_fusion
-from .context_assembly import assemble_agent_context
+from .context_assembly import TokenBudget, assemble_agent_context, context_priority
 from .graph_scope import (
     STORED_PROVENANCE_INVALID,
     EvidenceScopeVerdict,
+    PrefetchedSources,
     ProvenanceRejection,
+    ProvenanceVerdict,
+    ScopedGraphProjection,
     ValidatedProvenance,
-    filter_candidate_object_ids,
+    filter_scoped_candidate_object_ids,
     project_scoped_snapshot,
     public_coverage_gaps_for_exclusion,
     resolve_evidence_provenance,
 )
+from .graph_scope_cache import EvidenceScopeIndexCache, ScopedProjectionCache
 from .graph_snapshot import (
     GRAPH_SCHEMA_V5,
     GraphEvidenceRecord,
     GraphObjectView,
     GraphRelationshipView,
     GraphSnapshotReader,
+    NeighborhoodExpansion,
     ParsedGraphSnapshot,
     VersionedUnionGraphSnapshotReader,
     collect_one_hop_object_ids,
+    expand_neighborhood,
 )
+from .graph_snapshot_cache import ParsedSnapshotCache
 from .query_embedding import QueryEmbeddingProvider
 from .repositories import (
     MindThreadRepository,
@@ -70,12 +80,24 @@ from .repositories import (
     SemanticDocumentRepository,
     SemanticSearchPort,
     SourceRepository,
+    TurnCommitRepository,
     WorldGraphRepository,
 )
+from .request_coordination import RequestCoordinator
+from .retrieval_cache import (
+    AdmittedAnchor,
+    RetrievalCacheKey,
+    RetrievalResultCache,
+    TurnRetrieval,
+)
+from .source_cache import CachingSourceRepository, for_world
+from .turn_instrumentation import TurnOutcome, TurnRecorder, TurnStage, TurnTimer
 
 TOP_K_PER_CHANNEL = 5
 REQUEST_FINGERPRINT_DIAGNOSTIC = "authorized_request_fingerprint"
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class _RequestLockEntry:
@@ -114,6 +136,65 @@ def _admissibility_to_visibility(admissibility: Admissibility) -> Visibility:
 
 
 
+def _projection_snapshot(
+    request: MindTurnRequest, *, revision_id: str, head_revision_id: str, now: datetime
+) -> ProjectionSnapshot:
+    return ProjectionSnapshot(
+        world_id=request.world_id,
+        campaign_id=request.campaign_id,
+        focus=request.focus,
+        admissibility=request.admissibility,
+        scope_mode=ScopeMode.CAMPAIGN if request.campaign_id is not None else ScopeMode.WORLD,
+        revision_id=revision_id,
+        head_revision_id=head_revision_id,
+        is_head=revision_id == head_revision_id,
+        projected_at=now,
+    )
+
+
+def _semantic_query(
+    request: MindTurnRequest, *, revision_id: str, embedding: list[float] | None
+) -> SemanticQuery:
+    return SemanticQuery(
+        world_id=request.world_id,
+        campaign_scope=request.campaign_id,
+        visibility=_admissibility_to_visibility(request.admissibility),
+        graph_revision_id=revision_id,
+        text=request.message,
+        embedding=embedding,
+        top_k=TOP_K_PER_CHANNEL,
+    )
+
+
+def _source_anchors(
+    admitted: tuple[AdmittedAnchor, ...], request_id: str, revision_id: str
+) -> list[SourceAnchor]:
+    anchors = [
+        SourceAnchor(
+            anchor_id=_stable_id(
+                "anchor", request_id, revision_id, anchor.evidence_ref_id, anchor.owner_id
+            ),
+            revision_id=revision_id,
+            evidence_ref_id=anchor.evidence_ref_id,
+            source_artifact_id=anchor.source_artifact_id,
+            source_domain=anchor.source_domain,
+            supporting_object_ids=list(anchor.supporting_object_ids),
+            readable=anchor.readable,
+            locator_kind="external_fixture",
+            display_label=anchor.display_label,
+        )
+        for anchor in admitted
+    ]
+    anchors.sort(key=lambda item: item.anchor_id)
+    return anchors
+
+
+def _count_graph(counts: dict[str, int], snapshot: ParsedGraphSnapshot) -> None:
+    counts["objects"] = len(snapshot.objects)
+    counts["relationships"] = len(snapshot.relationships)
+    counts["evidence"] = len(snapshot.evidence)
+
+
 def request_fingerprint(request: MindTurnRequest) -> str:
     """Canonical fingerprint of the complete authorized request."""
     return canonical_sha256(request.model_dump(mode="json"))
@@ -150,6 +231,15 @@ class MindTurnService:
         query_embedder: QueryEmbeddingProvider,
         agent_adapter: AgentAdapter,
         clock: Clock,
+        snapshot_cache: ParsedSnapshotCache | None = None,
+        projection_cache: ScopedProjectionCache | None = None,
+        neighborhood_expansion: NeighborhoodExpansion | None = None,
+        request_coordinator: RequestCoordinator | None = None,
+        turn_recorder: TurnRecorder | None = None,
+        context_budget: TokenBudget | None = None,
+        turn_commits: TurnCommitRepository | None = None,
+        retrieval_cache: RetrievalResultCache | None = None,
+        scope_index_cache: EvidenceScopeIndexCache | None = None,
     ) -> None:
         self._world_graph = world_graph
         self._retrieval_sessions = retrieval_sessions
@@ -161,6 +251,21 @@ class MindTurnService:
         self._query_embedder = query_embedder
         self._agent_adapter = agent_adapter
         self._clock = clock
+        self._snapshot_cache = snapshot_cache
+        self._projection_cache = projection_cache
+        self._neighborhood_expansion = neighborhood_expansion
+        self._request_coordinator = request_coordinator
+        self._turn_recorder = turn_recorder
+        self._context_budget = context_budget
+        self._turn_commits = turn_commits
+        self._retrieval_cache = retrieval_cache
+        self._scope_index_cache = scope_index_cache
+        self._keys_on_source_state = (
+            projection_cache is not None
+            or retrieval_cache is not None
+            or scope_index_cache is not None
+            or isinstance(sources, CachingSourceRepository)
+        )
         self._agent_invocation_count = 0
         self._request_locks_guard = threading.Lock()
         self._request_locks: dict[tuple[str, str], _RequestLockEntry] = {}
@@ -193,60 +298,335 @@ class MindTurnService:
                 self._request_locks.pop(key, None)
 
     def execute(self, request: MindTurnRequest) -> MindTurnResponse:
-        # Process-local coordination only. Run the demo host as a single worker.
+        # Identical requests queue on a process-local lock first, so at most one
+        # per process waits on the (optional) cross-worker coordinator.
+        timer = TurnTimer(request.thread_id, request.request_id)
         key, lock = self._acquire_request_lock(request.thread_id, request.request_id)
         try:
             with lock:
-                return self._execute_unlocked(request)
+                if self._request_coordinator is None:
+                    return self._execute_unlocked(request, timer)
+                with self._request_coordinator.hold(request.thread_id, request.request_id):
+                    return self._execute_unlocked(request, timer)
         finally:
             self._release_request_lock(key)
+            self.record_turn(timer)
 
-    def _execute_unlocked(self, request: MindTurnRequest) -> MindTurnResponse:
-        replay = self._find_replay(request)
+    def _execute_unlocked(self, request: MindTurnRequest, timer: TurnTimer) -> MindTurnResponse:
+        replay = self.find_replay(request, timer)
         if replay is not None:
+            timer.outcome = TurnOutcome.REPLAYED
             return replay
 
-        session_id = _session_id_for(request.request_id)
-        existing_session = self._retrieval_sessions.get(session_id)
+        existing_session = self.find_session(request, timer)
         if existing_session is not None:
-            response = self._response_from_session(request, existing_session)
-            self._threads.append_turn(request, response)
-            return response
+            return self.recover_session(request, existing_session, timer)
 
         now = self._clock.now()
-        revision_id, head_revision_id, stored = self._resolve_revision(request)
-        self._reject_unsupported_mind_turn_graph(stored.revision.graph_schema)
-        snapshot = ProjectionSnapshot(
-            world_id=request.world_id,
-            campaign_id=request.campaign_id,
-            focus=request.focus,
-            admissibility=request.admissibility,
-            scope_mode=(
-                ScopeMode.CAMPAIGN if request.campaign_id is not None else ScopeMode.WORLD
-            ),
-            revision_id=revision_id,
-            head_revision_id=head_revision_id,
-            is_head=revision_id == head_revision_id,
-            projected_at=now,
+        revision_id, head_revision_id, stored = self.resolve_revision(request, timer)
+        snapshot = _projection_snapshot(
+            request, revision_id=revision_id, head_revision_id=head_revision_id, now=now
         )
+        state_version, sources = self.turn_sources(request, timer)
+        cache_key, retrieval = self.cached_retrieval(request, stored, state_version, timer)
+        if retrieval is None:
+            scoped = self.parse_and_scope(
+                request, stored, timer, sources=sources, state_version=state_version
+            )
+            embedding = self.embed_query(request, timer)
+            candidates = self.search_candidates(
+                _semantic_query(request, revision_id=revision_id, embedding=embedding), timer
+            )
+            retrieval = self.retrieve(
+                request,
+                scoped=scoped,
+                sources=sources,
+                candidates=candidates,
+                cache_key=cache_key,
+                timer=timer,
+            )
+        return self.complete_turn(request, snapshot=snapshot, retrieval=retrieval, timer=timer)
+
+    # Turn stages, in the order ``execute`` runs them. Each records its own
+    # samples on ``timer``; the async front end schedules them directly.
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    @property
+    def request_coordinator(self) -> RequestCoordinator | None:
+        return self._request_coordinator
 
-        parsed = self._graph_reader.parse(
-            graph_schema=stored.revision.graph_schema,
-            graph_payload=stored.graph_payload,
+    @property
+    def retrieval_cache(self) -> RetrievalResultCache | None:
+        return self._retrieval_cache
+
+    def record_turn(self, timer: TurnTimer) -> None:
+        if self._turn_recorder is not None:
+            self._turn_recorder.record(timer.finish())
+
+    def find_replay(self, request: MindTurnRequest, timer: TurnTimer) -> MindTurnResponse | None:
+        return timer.call(TurnStage.REPLAY_LOOKUP, self._find_replay, request)
+
+    def find_session(
+        self, request: MindTurnRequest, timer: TurnTimer
+    ) -> GraphRetrievalSession | None:
+        return timer.call(
+            TurnStage.SESSION_LOOKUP,
+            self._retrieval_sessions.get,
+            _session_id_for(request.request_id),
         )
+
+    def resolve_revision(
+        self, request: MindTurnRequest, timer: TurnTimer
+    ) -> tuple[str, str, StoredGraphRevision]:
+        """Pinned revision, world head and stored payload; fails closed on graph v5."""
+        resolved = timer.call(TurnStage.RESOLVE_REVISION, self._resolve_revision, request)
+        self._reject_unsupported_mind_turn_graph(resolved[2].revision.graph_schema)
+        return resolved
+
+    def embed_query(self, request: MindTurnRequest, timer: TurnTimer) -> list[float] | None:
+        return timer.call(TurnStage.EMBED_QUERY, self._query_embedder.embed_query, request.message)
+
+    def recover_session(
+        self, request: MindTurnRequest, session: GraphRetrievalSession, timer: TurnTimer
+    ) -> MindTurnResponse:
+        response = self._response_from_session(request, session)
+        timer.call(TurnStage.THREAD_APPEND, self._threads.append_turn, request, response)
+        timer.outcome = TurnOutcome.RECOVERED
+        return response
+
+    def turn_sources(
+        self, request: MindTurnRequest, timer: TurnTimer | None = None
+    ) -> tuple[str | None, SourceRepository]:
+        """Read the source-state stamp once and pin the turn's sources to it.
+
+        Every cache the turn consults reuses this one stamp. Without such a
+        cache nothing keys on it and it is not read.
+        """
+        if not self._keys_on_source_state:
+            return None, self._sources
+        if timer is None:
+            state_version = self._sources.state_version(request.world_id)
+        else:
+            state_version = timer.call(
+                TurnStage.SOURCE_STATE, self._sources.state_version, request.world_id
+            )
+        return state_version, for_world(self._sources, request.world_id, state_version)
+
+    def parse_and_scope(
+        self,
+        request: MindTurnRequest,
+        stored: StoredGraphRevision,
+        timer: TurnTimer,
+        *,
+        sources: SourceRepository,
+        state_version: str | None,
+    ) -> ScopedGraphProjection:
+        with timer.stage(TurnStage.PARSE) as counts:
+            parsed = self._parse_revision(stored)
+            _count_graph(counts, parsed)
         if parsed.world_id != request.world_id:
             raise PersistenceWorldMismatch(parsed.world_id, request.world_id)
-        scoped = project_scoped_snapshot(
-            parsed,
-            sources=self._sources,
-            world_id=request.world_id,
-            campaign_id=request.campaign_id,
-            admissibility=request.admissibility,
-        )
+        with timer.stage(TurnStage.SCOPE) as counts:
+            scoped = self._project_scoped(
+                parsed,
+                stored=stored,
+                request=request,
+                sources=sources,
+                state_version=state_version,
+            )
+            _count_graph(counts, scoped.snapshot)
+            counts["excluded_objects"] = len(scoped.object_exclusions)
+        return scoped
+
+    def search_candidates(
+        self, query: SemanticQuery, timer: TurnTimer
+    ) -> list[SemanticCandidate]:
+        with timer.stage(TurnStage.SEMANTIC_SEARCH) as counts:
+            candidates = self._semantic_search.search(query)
+            counts["candidates"] = len(candidates)
+        return candidates
+
+    def cached_retrieval(
+        self,
+        request: MindTurnRequest,
+        stored: StoredGraphRevision,
+        state_version: str | None,
+        timer: TurnTimer,
+    ) -> tuple[RetrievalCacheKey | None, TurnRetrieval | None]:
+        if self._retrieval_cache is None:
+            return None, None
+        assert state_version is not None
+        with timer.stage(TurnStage.RETRIEVAL_CACHE) as counts:
+            key = self._retrieval_cache.key_for(
+                request, revision=stored.revision, state_version=state_version
+            )
+            retrieval = self._retrieval_cache.get(key)
+            counts["hits"] = int(retrieval is not None)
+        return key, retrieval
+
+    def retrieve(
+        self,
+        request: MindTurnRequest,
+        *,
+        scoped: ScopedGraphProjection,
+        sources: SourceRepository,
+        candidates: list[SemanticCandidate],
+        cache_key: RetrievalCacheKey | None,
+        timer: TurnTimer,
+    ) -> TurnRetrieval:
+        """Preflight, mention resolution, focus expansion and evidence admission.
+
+        Nothing here depends on the request beyond its cache key, so the result
+        is shared through the retrieval cache when one is configured.
+        """
         object_exclusions = dict(scoped.object_exclusions)
-        omitted_alias_index = dict(scoped.omitted_alias_index)
         parsed = scoped.snapshot
 
+        with timer.stage(TurnStage.PREFLIGHT) as counts:
+            by_channel: dict[CandidateChannel, list[str]] = {
+                CandidateChannel.EXACT: [],
+                CandidateChannel.LEXICAL: [],
+                CandidateChannel.DENSE: [],
+            }
+            for candidate in sorted(candidates, key=lambda c: (c.channel.value, c.rank)):
+                by_channel[candidate.channel].append(candidate.semantic_document_id)
+
+            fused = reciprocal_rank_fusion(
+                [
+                    by_channel[CandidateChannel.EXACT],
+                    by_channel[CandidateChannel.LEXICAL],
+                    by_channel[CandidateChannel.DENSE],
+                ]
+            )
+            preflight_ids = [doc_id for doc_id, _score in fused]
+
+            candidate_object_ids: list[str] = []
+            coverage = Coverage()
+            targeted_excluded_ids: list[str] = []
+            graph_object_ids = self._candidate_graph_object_ids(preflight_ids)
+            for doc_id in preflight_ids:
+                graph_object_id = graph_object_ids.get(doc_id)
+                if not graph_object_id:
+                    coverage.gap_codes.append("semantic_document_missing_graph_object")
+                    coverage.missing.append(doc_id)
+                    continue
+                if self._graph_reader.get_object(parsed, graph_object_id) is None:
+                    coverage.gap_codes.append("candidate_graph_object_missing")
+                    coverage.missing.append(graph_object_id)
+                    targeted_excluded_ids.append(graph_object_id)
+                    continue
+                candidate_object_ids.append(graph_object_id)
+
+            # Exact omitted-alias matches and admitted multi-object alias ambiguity
+            # must not be recovered through semantic candidate seeding.
+            candidate_object_ids = filter_scoped_candidate_object_ids(
+                candidate_object_ids,
+                message=request.message,
+                projection=scoped,
+            )
+
+            # Selected IDs that fail scoping are request-targeted; surface only
+            # sanitized / in-scope gaps for those objects — never graph-global dumps.
+            for selected_id in request.surface_context.selected_object_ids:
+                if self._graph_reader.get_object(parsed, selected_id) is None:
+                    targeted_excluded_ids.append(selected_id)
+
+            for object_id in dict.fromkeys(targeted_excluded_ids):
+                exclusion = object_exclusions.get(object_id)
+                if exclusion is None:
+                    continue
+                gap_codes, missing = public_coverage_gaps_for_exclusion(exclusion)
+                coverage.gap_codes.extend(gap_codes)
+                coverage.missing.extend(missing)
+            counts["documents"] = len(preflight_ids)
+            counts["objects"] = len(candidate_object_ids)
+
+        with timer.stage(TurnStage.RESOLVE_MENTIONS) as counts:
+            referents = self._graph_reader.resolve_mentions(
+                parsed,
+                message=request.message,
+                selected_object_ids=list(request.surface_context.selected_object_ids),
+                candidate_object_ids=candidate_object_ids,
+            )
+            counts["referents"] = sum(1 for r in referents if r.object_id)
+
+        seed_ids = sorted(
+            {
+                *(r.object_id for r in referents if r.object_id),
+                *candidate_object_ids,
+            }
+        )
+        with timer.stage(TurnStage.EXPAND) as counts:
+            focus_ids, relationships, capped_hub_ids = self._expand_focus(
+                parsed, seed_ids, candidate_object_ids
+            )
+            if capped_hub_ids:
+                coverage.gap_codes.append("hub_neighbors_capped")
+                coverage.missing.extend(capped_hub_ids)
+            objects: list[GraphObjectView] = []
+            for object_id in focus_ids:
+                obj = self._graph_reader.get_object(parsed, object_id)
+                if obj is None:
+                    continue
+                objects.append(obj)
+            counts["objects"] = len(objects)
+            counts["relationships"] = len(relationships)
+
+        with timer.stage(TurnStage.ADMIT_EVIDENCE) as counts:
+            evidence, anchors = self._admit_evidence(
+                request=request,
+                sources=sources,
+                parsed=parsed,
+                verdicts=scoped.evidence_verdicts,
+                objects=objects,
+                relationships=relationships,
+                coverage=coverage,
+            )
+            counts["evidence"] = len(evidence)
+            counts["anchors"] = len(anchors)
+
+        retrieval = TurnRetrieval(
+            candidate_count=len(candidates),
+            preflight_ids=tuple(preflight_ids),
+            candidate_object_ids=tuple(candidate_object_ids),
+            referents=tuple(referents),
+            seed_ids=tuple(seed_ids),
+            objects=tuple(objects),
+            relationships=tuple(relationships),
+            evidence=tuple(evidence),
+            anchors=tuple(anchors),
+            coverage=coverage,
+        )
+        if cache_key is not None and self._retrieval_cache is not None:
+            self._retrieval_cache.put(cache_key, retrieval)
+        return retrieval
+
+    def complete_turn(
+        self,
+        request: MindTurnRequest,
+        *,
+        snapshot: ProjectionSnapshot,
+        retrieval: TurnRetrieval,
+        timer: TurnTimer,
+    ) -> MindTurnResponse:
+        """Everything after retrieval: per-request ids, context, agent, persist."""
+        session_id = _session_id_for(request.request_id)
+        now = snapshot.projected_at
+        revision_id = snapshot.revision_id
+        # Retrieval results may be shared through the cache; never hand the
+        # same model instance to two responses.
+        coverage = retrieval.coverage.model_copy(deep=True)
+        referents = [referent.model_copy(deep=True) for referent in retrieval.referents]
+        evidence = [item.model_copy() for item in retrieval.evidence]
+        candidate_object_ids = list(retrieval.candidate_object_ids)
+        seed_ids = list(retrieval.seed_ids)
+        objects = list(retrieval.objects)
+        relationships = list(retrieval.relationships)
+        anchors = _source_anchors(retrieval.anchors, request.request_id, revision_id)
+
         diagnostics: list[DiagnosticEntry] = [
             _fingerprint_diagnostic(request),
             DiagnosticEntry(
@@ -278,91 +658,18 @@ class MindTurnService:
             )
 
         operations: list[RetrievalOperation] = []
-        embedding = self._query_embedder.embed_query(request.message)
-        candidates = self._semantic_search.search(
-            SemanticQuery(
-                world_id=request.world_id,
-                campaign_scope=request.campaign_id,
-                visibility=_admissibility_to_visibility(request.admissibility),
-                graph_revision_id=revision_id,
-                text=request.message,
-                embedding=embedding,
-                top_k=TOP_K_PER_CHANNEL,
-            )
-        )
         operations.append(
             RetrievalOperation(
                 operation_id=_stable_id("op", request.request_id, "semantic"),
                 kind=RetrievalOperationKind.SEMANTIC_CANDIDATES,
-                outcome=OperationOutcome.OK if candidates else OperationOutcome.MISS,
+                outcome=(
+                    OperationOutcome.OK if retrieval.candidate_count else OperationOutcome.MISS
+                ),
                 revision_id=revision_id,
                 arguments={"top_k": TOP_K_PER_CHANNEL},
-                result_count=len(candidates),
+                result_count=retrieval.candidate_count,
             )
         )
-
-        by_channel: dict[CandidateChannel, list[str]] = {
-            CandidateChannel.EXACT: [],
-            CandidateChannel.LEXICAL: [],
-            CandidateChannel.DENSE: [],
-        }
-        for candidate in sorted(candidates, key=lambda c: (c.channel.value, c.rank)):
-            by_channel[candidate.channel].append(candidate.semantic_document_id)
-
-        fused = reciprocal_rank_fusion(
-            [
-                by_channel[CandidateChannel.EXACT],
-                by_channel[CandidateChannel.LEXICAL],
-                by_channel[CandidateChannel.DENSE],
-            ]
-        )
-        preflight_ids = [doc_id for doc_id, _score in fused]
-
-        candidate_object_ids: list[str] = []
-        coverage = Coverage()
-        targeted_excluded_ids: list[str] = []
-        for doc_id in preflight_ids:
-            doc = self._semantic_documents.get(doc_id)
-            if doc is None or not doc.graph_object_id:
-                coverage.gap_codes.append("semantic_document_missing_graph_object")
-                coverage.missing.append(doc_id)
-                continue
-            if self._graph_reader.get_object(parsed, doc.graph_object_id) is None:
-                coverage.gap_codes.append("candidate_graph_object_missing")
-                coverage.missing.append(doc.graph_object_id)
-                targeted_excluded_ids.append(doc.graph_object_id)
-                continue
-            candidate_object_ids.append(doc.graph_object_id)
-
-        # Exact omitted-alias matches and admitted multi-object alias ambiguity
-        # must not be recovered through semantic candidate seeding.
-        candidate_object_ids = filter_candidate_object_ids(
-            candidate_object_ids,
-            message=request.message,
-            omitted_alias_index=omitted_alias_index,
-            alias_index=parsed.alias_index,
-        )
-
-        # Selected IDs that fail scoping are request-targeted; surface only
-        # sanitized / in-scope gaps for those objects — never graph-global dumps.
-        for selected_id in request.surface_context.selected_object_ids:
-            if self._graph_reader.get_object(parsed, selected_id) is None:
-                targeted_excluded_ids.append(selected_id)
-
-        for object_id in dict.fromkeys(targeted_excluded_ids):
-            exclusion = object_exclusions.get(object_id)
-            if exclusion is None:
-                continue
-            gap_codes, missing = public_coverage_gaps_for_exclusion(exclusion)
-            coverage.gap_codes.extend(gap_codes)
-            coverage.missing.extend(missing)
-
-        referents = self._graph_reader.resolve_mentions(
-            parsed,
-            message=request.message,
-            selected_object_ids=list(request.surface_context.selected_object_ids),
-            candidate_object_ids=candidate_object_ids,
-        )
         operations.append(
             RetrievalOperation(
                 operation_id=_stable_id("op", request.request_id, "resolve"),
@@ -376,51 +683,27 @@ class MindTurnService:
                 result_count=sum(1 for r in referents if r.object_id),
             )
         )
-
-        seed_ids = sorted(
-            {
-                *(r.object_id for r in referents if r.object_id),
-                *candidate_object_ids,
-            }
-        )
-        focus_ids = collect_one_hop_object_ids(parsed, seed_ids)
-        objects: list[GraphObjectView] = []
-        for object_id in focus_ids:
-            obj = self._graph_reader.get_object(parsed, object_id)
-            if obj is None:
-                continue
-            objects.append(obj)
+        for obj in objects:
             operations.append(
                 RetrievalOperation(
-                    operation_id=_stable_id("op", request.request_id, "get", object_id),
+                    operation_id=_stable_id("op", request.request_id, "get", obj.object_id),
                     kind=RetrievalOperationKind.GET_OBJECT,
                     outcome=OperationOutcome.OK,
                     revision_id=revision_id,
-                    arguments={"object_id": object_id},
+                    arguments={"object_id": obj.object_id},
                     result_count=1,
                 )
             )
-
-        relationships = self._graph_reader.list_relationships(parsed, seed_ids)
         operations.append(
             RetrievalOperation(
                 operation_id=_stable_id("op", request.request_id, "rels"),
                 kind=RetrievalOperationKind.LIST_RELATIONSHIPS,
                 outcome=OperationOutcome.OK if relationships else OperationOutcome.MISS,
                 revision_id=revision_id,
-                arguments={"object_ids": seed_ids},
+                arguments={"object_ids": seed_ids, **self._expansion_arguments()},
                 result_count=len(relationships),
             )
         )
-
-        evidence, anchors = self._admit_evidence(
-            request=request,
-            revision_id=revision_id,
-            parsed=parsed,
-            objects=objects,
-            relationships=relationships,
-            coverage=coverage,
-        )
         for anchor in anchors:
             operations.append(
                 RetrievalOperation(
@@ -439,18 +722,30 @@ class MindTurnService:
             if "missing_support_evidence" not in coverage.gap_codes:
                 coverage.gap_codes.append("unresolved_referent")
 
-        assembled = assemble_agent_context(
-            revision_id=revision_id,
-            world_id=request.world_id,
-            campaign_id=request.campaign_id,
-            admissibility=request.admissibility,
-            focus=request.focus,
-            objects=objects,
-            relationships=relationships,
-            evidence=evidence,
-            source_anchors=anchors,
-            coverage=coverage,
-        )
+        with timer.stage(TurnStage.ASSEMBLE_CONTEXT) as counts:
+            # Token budgets rank what to keep by seed distance and fused rank.
+            priority = None
+            if self._context_budget is not None:
+                priority = context_priority(
+                    seed_ids=seed_ids,
+                    relationships=relationships,
+                    candidate_object_ids=candidate_object_ids,
+                )
+            assembled = assemble_agent_context(
+                revision_id=revision_id,
+                world_id=request.world_id,
+                campaign_id=request.campaign_id,
+                admissibility=request.admissibility,
+                focus=request.focus,
+                objects=objects,
+                relationships=relationships,
+                evidence=evidence,
+                source_anchors=anchors,
+                coverage=coverage,
+                token_budget=self._context_budget,
+                priority=priority,
+            )
+            counts["chars"] = len(assembled)
 
         policy = CapabilityPolicy(
             policy_id=_stable_id("pol", request.request_id, "readonly"),
@@ -482,9 +777,11 @@ class MindTurnService:
             raise RuntimeError("assembled context leaked authorization metadata")
 
         self._agent_invocation_count += 1
-        agent_result = self._agent_adapter.execute_turn(
-            AgentTurnContext(input=agent_input, capability_policy=policy)
-        )
+        with timer.stage(TurnStage.AGENT) as counts:
+            agent_result = self._agent_adapter.execute_turn(
+                AgentTurnContext(input=agent_input, capability_policy=policy)
+            )
+            counts["claims"] = len(agent_result.claims)
         diagnostics.extend(agent_result.diagnostics)
         diagnostics.append(
             DiagnosticEntry(
@@ -563,12 +860,10 @@ class MindTurnService:
             source_reads=[],
             coverage=coverage,
             diagnostics=diagnostics,
-            preflight_candidate_ids=preflight_ids,
+            preflight_candidate_ids=list(retrieval.preflight_ids),
             created_at=now,
             updated_at=now,
         )
-        self._retrieval_sessions.create(session)
-
         response = MindTurnResponse(
             request_id=request.request_id,
             turn_id=_stable_id("turn", request.request_id),
@@ -588,22 +883,30 @@ class MindTurnService:
             coverage=coverage,
             diagnostics=diagnostics,
         )
-        self._threads.append_turn(request, response)
+        if self._turn_commits is not None:
+            timer.call(
+                TurnStage.TURN_COMMIT, self._turn_commits.commit_turn, session, request, response
+            )
+        else:
+            # A crash between these two writes leaves a session that the next
+            # retry recovers from; a turn-commit port closes that window.
+            timer.call(TurnStage.SESSION_WRITE, self._retrieval_sessions.create, session)
+            timer.call(TurnStage.THREAD_APPEND, self._threads.append_turn, request, response)
+        timer.outcome = TurnOutcome.EXECUTED
         return response
 
     def _find_replay(self, request: MindTurnRequest) -> MindTurnResponse | None:
-        turns = self._threads.list_turns(request.thread_id)
-        for prior_request, prior_response in turns:
-            if prior_request.request_id != request.request_id:
-                continue
-            if canonical_json(prior_request.model_dump(mode="json")) != canonical_json(
-                request.model_dump(mode="json")
-            ):
-                raise IdempotencyConflictError(
-                    f"request_id {request.request_id!r} already used with a different payload"
-                )
-            return prior_response
-        return None
+        prior = self._threads.get_turn_by_request_id(request.thread_id, request.request_id)
+        if prior is None:
+            return None
+        prior_request, prior_response = prior
+        if canonical_json(prior_request.model_dump(mode="json")) != canonical_json(
+            request.model_dump(mode="json")
+        ):
+            raise IdempotencyConflictError(
+                f"request_id {request.request_id!r} already used with a different payload"
+            )
+        return prior_response
 
     def _assert_session_matches_request(
         self,
@@ -655,7 +958,7 @@ class MindTurnService:
     ) -> MindTurnResponse:
         """Reconstruct a deterministic response from an existing retrieval session.
 
-        Replays the same seed → one-hop → projection path against the pinned
+        Replays the same seed → neighborhood → projection path against the pinned
         revision using persisted preflight candidates and referents, without
         re-invoking the agent.
         """
@@ -675,31 +978,29 @@ class MindTurnService:
                 f"{request.world_id!r} during session recovery"
             )
         self._reject_unsupported_mind_turn_graph(stored.revision.graph_schema)
-        parsed = self._graph_reader.parse(
-            graph_schema=stored.revision.graph_schema,
-            graph_payload=stored.graph_payload,
-        )
-        scoped = project_scoped_snapshot(
+        parsed = self._parse_revision(stored)
+        state_version, sources = self.turn_sources(request)
+        scoped = self._project_scoped(
             parsed,
-            sources=self._sources,
-            world_id=request.world_id,
-            campaign_id=request.campaign_id,
-            admissibility=request.admissibility,
+            stored=stored,
+            request=request,
+            sources=sources,
+            state_version=state_version,
         )
         parsed = scoped.snapshot
         candidate_object_ids: list[str] = []
+        graph_object_ids = self._candidate_graph_object_ids(session.preflight_candidate_ids)
         for doc_id in session.preflight_candidate_ids:
-            doc = self._semantic_documents.get(doc_id)
-            if doc is None or not doc.graph_object_id:
+            graph_object_id = graph_object_ids.get(doc_id)
+            if not graph_object_id:
                 continue
-            if self._graph_reader.get_object(parsed, doc.graph_object_id) is None:
+            if self._graph_reader.get_object(parsed, graph_object_id) is None:
                 continue
-            candidate_object_ids.append(doc.graph_object_id)
-        candidate_object_ids = filter_candidate_object_ids(
+            candidate_object_ids.append(graph_object_id)
+        candidate_object_ids = filter_scoped_candidate_object_ids(
             candidate_object_ids,
             message=request.message,
-            omitted_alias_index=dict(scoped.omitted_alias_index),
-            alias_index=parsed.alias_index,
+            projection=scoped,
         )
         seed_ids = sorted(
             {
@@ -707,12 +1008,14 @@ class MindTurnService:
                 *candidate_object_ids,
             }
         )
-        focus_ids = collect_one_hop_object_ids(parsed, seed_ids)
+        # Coverage (including hub caps) is replayed from the stored session.
+        focus_ids, relationships, _capped_hub_ids = self._expand_focus(
+            parsed, seed_ids, candidate_object_ids
+        )
         for object_id in focus_ids:
             obj = self._graph_reader.get_object(parsed, object_id)
             if obj is not None:
                 objects.append(obj)
-        relationships = self._graph_reader.list_relationships(parsed, seed_ids)
 
         projections = self._build_projections(
             request_id=request.request_id,
@@ -808,6 +1111,51 @@ class MindTurnService:
             )
         return revision_id, head_revision_id, stored
 
+    def _parse_revision(self, stored: StoredGraphRevision) -> ParsedGraphSnapshot:
+        if self._snapshot_cache is None:
+            return self._graph_reader.parse(
+                graph_schema=stored.revision.graph_schema,
+                graph_payload=stored.graph_payload,
+            )
+        return self._snapshot_cache.get_or_parse(stored, reader=self._graph_reader)
+
+    def _project_scoped(
+        self,
+        parsed: ParsedGraphSnapshot,
+        *,
+        stored: StoredGraphRevision,
+        request: MindTurnRequest,
+        sources: SourceRepository,
+        state_version: str | None,
+    ) -> ScopedGraphProjection:
+        if self._projection_cache is None:
+            scope_index = None
+            if self._scope_index_cache is not None and state_version is not None:
+                scope_index = self._scope_index_cache.get_or_build(
+                    parsed,
+                    revision=stored.revision,
+                    sources=sources,
+                    world_id=request.world_id,
+                    state_version=state_version,
+                )
+            return project_scoped_snapshot(
+                parsed,
+                sources=sources,
+                world_id=request.world_id,
+                campaign_id=request.campaign_id,
+                admissibility=request.admissibility,
+                scope_index=scope_index,
+            )
+        return self._projection_cache.get_or_project(
+            parsed,
+            revision=stored.revision,
+            sources=sources,
+            world_id=request.world_id,
+            campaign_id=request.campaign_id,
+            admissibility=request.admissibility,
+            state_version=state_version,
+        )
+
     @staticmethod
     def _reject_unsupported_mind_turn_graph(graph_schema: str) -> None:
         """Fail closed: mind_turn_v1 cannot represent v2 evidence (graph v5).
@@ -831,30 +1179,54 @@ class MindTurnService:
         self,
         *,
         request: MindTurnRequest,
-        revision_id: str,
+        sources: SourceRepository,
         parsed: ParsedGraphSnapshot,
+        verdicts: Mapping[str, ProvenanceVerdict],
         objects: list[GraphObjectView],
         relationships: list[GraphRelationshipView],
         coverage: Coverage,
-    ) -> tuple[list[EvidenceRef], list[SourceAnchor]]:
+    ) -> tuple[list[EvidenceRef], list[AdmittedAnchor]]:
+        """Admit focus evidence, reusing the verdicts scoping already reached.
+
+        Scoping checks every ref a retained object or relationship cites, so
+        fresh provenance lookups here are a fallback only. Evidence is shared
+        with the verdicts; :meth:`complete_turn` copies it per response.
+        """
         evidence: list[EvidenceRef] = []
-        anchors: list[SourceAnchor] = []
+        anchors: list[AdmittedAnchor] = []
         seen_evidence: set[str] = set()
-        seen_anchors: set[str] = set()
+        seen_anchors: set[tuple[str, str]] = set()
+        unresolved = {
+            evidence_ref_id
+            for owner in (*objects, *relationships)
+            for evidence_ref_id in owner.evidence_ref_ids
+            if evidence_ref_id not in verdicts
+        }
+        prefetched = PrefetchedSources.for_evidence(
+            sources,
+            (
+                parsed.evidence[evidence_ref_id]
+                for evidence_ref_id in unresolved
+                if evidence_ref_id in parsed.evidence
+            ),
+        )
 
         def _admit(
             evidence_ref_id: str,
             supporting_object_ids: list[str],
             owner_id: str,
         ) -> None:
-            resolved = resolve_evidence_provenance(
-                evidence_ref_id,
-                snapshot=parsed,
-                sources=self._sources,
-                world_id=request.world_id,
-                campaign_id=request.campaign_id,
-                admissibility=request.admissibility,
-            )
+            if evidence_ref_id in verdicts:
+                resolved = verdicts[evidence_ref_id]
+            else:
+                resolved = resolve_evidence_provenance(
+                    evidence_ref_id,
+                    snapshot=parsed,
+                    sources=prefetched,
+                    world_id=request.world_id,
+                    campaign_id=request.campaign_id,
+                    admissibility=request.admissibility,
+                )
             if resolved is None:
                 # Out-of-scope: silent (should not occur on retained objects).
                 return
@@ -889,26 +1261,17 @@ class MindTurnService:
             if evidence_ref_id not in seen_evidence:
                 seen_evidence.add(evidence_ref_id)
                 evidence.append(resolved.evidence)
-            anchor_id = _stable_id(
-                "anchor",
-                request.request_id,
-                revision_id,
-                evidence_ref_id,
-                owner_id,
-            )
-            if anchor_id in seen_anchors:
+            if (evidence_ref_id, owner_id) in seen_anchors:
                 return
-            seen_anchors.add(anchor_id)
+            seen_anchors.add((evidence_ref_id, owner_id))
             anchors.append(
-                SourceAnchor(
-                    anchor_id=anchor_id,
-                    revision_id=revision_id,
+                AdmittedAnchor(
                     evidence_ref_id=evidence_ref_id,
+                    owner_id=owner_id,
                     source_artifact_id=record.source_artifact_id,
                     source_domain=record.source_domain,
-                    supporting_object_ids=sorted(set(supporting_object_ids)),
+                    supporting_object_ids=tuple(sorted(set(supporting_object_ids))),
                     readable=record.can_open_source,
-                    locator_kind="external_fixture",
                     display_label=record.locator or record.source_artifact_id,
                 )
             )
@@ -932,12 +1295,66 @@ class MindTurnService:
                 )
 
         evidence.sort(key=lambda item: item.evidence_ref_id)
-        anchors.sort(key=lambda item: item.anchor_id)
         # Deduplicate gap codes while preserving order.
         coverage.gap_codes = list(dict.fromkeys(coverage.gap_codes))
         coverage.missing = list(dict.fromkeys(coverage.missing))
         return evidence, anchors
 
+    def _candidate_graph_object_ids(self, doc_ids: list[str]) -> dict[str, str | None]:
+        """``graph_object_id`` per fused candidate document, fetched in one batch."""
+        if not doc_ids:
+            return {}
+        rows = self._semantic_documents.get_many(doc_ids, columns=("graph_object_id",))
+        return {doc_id: row["graph_object_id"] for doc_id, row in rows.items()}
+
+    def _expand_focus(
+        self,
+        parsed: ParsedGraphSnapshot,
+        seed_ids: list[str],
+        candidate_object_ids: list[str],
+    ) -> tuple[list[str], list[GraphRelationshipView], list[str]]:
+        """Focus objects, context relationships and capped hubs for the seeds.
+
+        Without a configured expansion this is the one-hop focus plus every
+        relationship touching a seed; with one, the bounded neighborhood and
+        every allowed relationship among its objects, keeping capped
+        neighbours in fused preflight rank order.
+        """
+        if self._neighborhood_expansion is None:
+            return (
+                collect_one_hop_object_ids(parsed, seed_ids),
+                self._graph_reader.list_relationships(parsed, seed_ids),
+                [],
+            )
+        candidate_rank: dict[str, int] = {}
+        for object_id in candidate_object_ids:
+            candidate_rank.setdefault(object_id, len(candidate_rank))
+        neighborhood = expand_neighborhood(
+            parsed,
+            seed_ids,
+            self._neighborhood_expansion,
+            candidate_rank=candidate_rank,
+        )
+        relationships = [
+            parsed.relationships[relationship_id]
+            for relationship_id in neighborhood.relationship_ids
+        ]
+        return neighborhood.object_ids, relationships, neighborhood.capped_hub_ids
+
+    def _expansion_arguments(self) -> dict[str, Any]:
+        expansion = self._neighborhood_expansion
+        if expansion is None:
+            return {}
+        return {
+            "max_hops": expansion.max_hops,
+            "predicates": None if expansion.predicates is None else sorted(expansion.predicates),
+            "fanout_per_hop": list(expansion.fanout_per_hop),
+            "max_nodes": expansion.max_nodes,
+            "hub_degree": expansion.hub_degree,
+            "hub_fanout": expansion.hub_fanout,
+            "predicate_priority": list(expansion.predicate_priority),
+        }
+
     def _build_projections(
         self,
         *,
@@ -1031,6 +1448,194 @@ class MindTurnService:
         return projections
 
 
+@dataclass
+class _AsyncRequestLockEntry:
+    """Reference-counted event-loop lock for identical in-flight requests."""
+
+    lock: asyncio.Lock
+    users: int = 0
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Drop speculative work: cancel it, or retrieve a failure it already hit."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
+def _outcome(result: _T | BaseException) -> _T:
+    """Unwrap one ``gather(..., return_exceptions=True)`` result."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+class AsyncMindTurnService:
+    """Asyncio front end over a :class:`MindTurnService` that overlaps independent stages.
+
+    Replay lookup, session lookup, revision resolution and the source stamp read
+    run together, with query embedding started speculatively; semantic search
+    then runs alongside parse and scoping, both skipped on a retrieval-cache
+    hit. Blocking repository and adapter calls run on worker threads, so the
+    event loop never waits on storage. Outcomes are applied in the synchronous
+    order, including which failure wins, and every stage is the synchronous
+    code, so responses are byte-identical to ``execute``. Stages run ahead of
+    that order are timed on a fork and recorded only when the synchronous path
+    would have run them; an embedding that replay, recovery or a cache hit makes
+    unnecessary is cancelled.
+
+    Identical requests queue on an event-loop lock, which is separate from the
+    synchronous locks (a host serves one front end or the other); the service's
+    cross-worker coordinator, when configured, is then held around the turn.
+    Once the lock is taken the turn runs as one shielded task: cancelling
+    ``execute`` abandons the wait, not the turn, and the locks are released and
+    the turn recorded only when that task (and its worker threads) finishes.
+    """
+
+    def __init__(self, service: MindTurnService) -> None:
+        self._service = service
+        self._request_locks: dict[tuple[str, str], _AsyncRequestLockEntry] = {}
+
+    @property
+    def service(self) -> MindTurnService:
+        return self._service
+
+    async def execute(self, request: MindTurnRequest) -> MindTurnResponse:
+        key = (request.thread_id, request.request_id)
+        entry = self._request_locks.get(key)
+        if entry is None:
+            entry = _AsyncRequestLockEntry(lock=asyncio.Lock())
+            self._request_locks[key] = entry
+        entry.users += 1
+        timer = TurnTimer(request.thread_id, request.request_id)
+        try:
+            await entry.lock.acquire()
+        except BaseException:
+            self._leave(key, entry)
+            self._service.record_turn(timer)
+            raise
+        turn = asyncio.ensure_future(self._coordinated(request, timer))
+        turn.add_done_callback(functools.partial(self._finish, key, entry, timer))
+        return await asyncio.shield(turn)
+
+    def _leave(self, key: tuple[str, str], entry: _AsyncRequestLockEntry) -> None:
+        entry.users -= 1
+        if entry.users <= 0:
+            self._request_locks.pop(key, None)
+
+    def _finish(
+        self,
+        key: tuple[str, str],
+        entry: _AsyncRequestLockEntry,
+        timer: TurnTimer,
+        turn: asyncio.Future[MindTurnResponse],
+    ) -> None:
+        entry.lock.release()
+        self._leave(key, entry)
+        if not turn.cancelled():
+            # Seen here when the caller was cancelled and no longer awaits it.
+            turn.exception()
+        self._service.record_turn(timer)
+
+    async def _coordinated(self, request: MindTurnRequest, timer: TurnTimer) -> MindTurnResponse:
+        coordinator = self._service.request_coordinator
+        if coordinator is None:
+            return await self._execute_unlocked(request, timer)
+        hold = coordinator.hold(request.thread_id, request.request_id)
+        await asyncio.to_thread(hold.__enter__)
+        try:
+            return await self._execute_unlocked(request, timer)
+        finally:
+            await asyncio.to_thread(hold.__exit__, None, None, None)
+
+    async def _execute_unlocked(
+        self, request: MindTurnRequest, timer: TurnTimer
+    ) -> MindTurnResponse:
+        embed_timer = timer.fork()
+        embedding = asyncio.ensure_future(
+            asyncio.to_thread(self._service.embed_query, request, embed_timer)
+        )
+        try:
+            return await self._execute_with(request, timer, embedding, embed_timer)
+        finally:
+            _discard(embedding)
+
+    async def _execute_with(
+        self,
+        request: MindTurnRequest,
+        timer: TurnTimer,
+        embedding: asyncio.Future[list[float] | None],
+        embed_timer: TurnTimer,
+    ) -> MindTurnResponse:
+        service = self._service
+        session_timer, resolve_timer, sources_timer = timer.fork(), timer.fork(), timer.fork()
+        replay, existing_session, resolved, pinned = await asyncio.gather(
+            asyncio.to_thread(service.find_replay, request, timer),
+            asyncio.to_thread(service.find_session, request, session_timer),
+            asyncio.to_thread(service.resolve_revision, request, resolve_timer),
+            asyncio.to_thread(service.turn_sources, request, sources_timer),
+            return_exceptions=True,
+        )
+        prior_response = _outcome(replay)
+        if prior_response is not None:
+            timer.outcome = TurnOutcome.REPLAYED
+            return prior_response
+        timer.adopt(session_timer)
+        session = _outcome(existing_session)
+        if session is not None:
+            return await asyncio.to_thread(service.recover_session, request, session, timer)
+
+        now = service.clock.now()
+        timer.adopt(resolve_timer)
+        revision_id, head_revision_id, stored = _outcome(resolved)
+        snapshot = _projection_snapshot(
+            request, revision_id=revision_id, head_revision_id=head_revision_id, now=now
+        )
+        timer.adopt(sources_timer)
+        state_version, sources = _outcome(pinned)
+
+        cache_key, retrieval = None, None
+        if service.retrieval_cache is not None:
+            cache_key, retrieval = await asyncio.to_thread(
+                service.cached_retrieval, request, stored, state_version, timer
+            )
+        if retrieval is None:
+            search_timer = timer.fork()
+
+            async def _search() -> list[SemanticCandidate]:
+                query = _semantic_query(
+                    request, revision_id=revision_id, embedding=await embedding
+                )
+                return await asyncio.to_thread(service.search_candidates, query, search_timer)
+
+            scoping, candidates = await asyncio.gather(
+                asyncio.to_thread(
+                    service.parse_and_scope,
+                    request,
+                    stored,
+                    timer,
+                    sources=sources,
+                    state_version=state_version,
+                ),
+                _search(),
+                return_exceptions=True,
+            )
+            scoped = _outcome(scoping)
+            timer.adopt(embed_timer)
+            timer.adopt(search_timer)
+            retrieval = await asyncio.to_thread(
+                service.retrieve,
+                request,
+                scoped=scoped,
+                sources=sources,
+                candidates=_outcome(candidates),
+                cache_key=cache_key,
+                timer=timer,
+            )
+        return await asyncio.to_thread(
+            service.complete_turn, request, snapshot=snapshot, retrieval=retrieval, timer=timer
+        )
+
+
 class PersistenceWorldMismatch(ScopeResolutionError):
     def __init__(self, graph_world_id: str, request_world_id: str) -> None:
         super().__init__(
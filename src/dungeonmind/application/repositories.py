@@ -11,6 +11,7 @@ Failure model (from ``domain.errors``):
 - reads of unknown ids return ``None`` (transport maps to 404 where relevant)
 """
 
+from collections.abc import Collection
 from datetime import datetime
 from typing import Protocol
 
@@ -68,6 +69,37 @@ def normalize_semantic_document_batch(
     return ordered
 
 
+# Scalar identity columns a ``SemanticDocumentRepository.get_many`` projection
+# may select. Each one is a stored column in the durable adapters; ``content``
+# and ``embedding`` are deliberately excluded.
+SEMANTIC_DOCUMENT_COLUMNS = frozenset(
+    {
+        "semantic_document_id",
+        "document_kind",
+        "world_id",
+        "campaign_scope",
+        "graph_revision_id",
+        "graph_object_id",
+        "source_artifact_id",
+        "source_revision_id",
+        "session_id",
+        "visibility",
+        "content_sha256",
+        "materialization_run_id",
+    }
+)
+
+
+def semantic_document_columns(columns: Collection[str]) -> tuple[str, ...]:
+    """Validate and order a ``get_many`` projection; raises ``ValueError``."""
+    unknown = sorted(set(columns) - SEMANTIC_DOCUMENT_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown semantic document columns: {', '.join(unknown)}")
+    if not columns:
+        raise ValueError("get_many requires at least one column")
+    return tuple(sorted(set(columns)))
+
+
 class WorldGraphRepository(Protocol):
     """One supergraph per world; immutable revisions; one atomically advanced head."""
 
@@ -165,12 +197,29 @@ class SourceRepository(Protocol):
 
     def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None: ...
 
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        """Batch ``get_artifact`` in one round trip; unknown IDs are omitted."""
+        ...
+
     def put_revision(self, revision: SourceRevision) -> SourceRevision: ...
 
     def get_revision(self, source_revision_id: str) -> SourceRevision | None: ...
 
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        """Batch ``get_revision`` in one round trip; unknown IDs are omitted."""
+        ...
+
     def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]: ...
 
+    def state_version(self, world_id: str) -> str:
+        """Opaque stamp that changes whenever ``world_id``'s artifacts or their revisions change.
+
+        Writes in other worlds leave it untouched.
+        """
+        ...
+
 
 class RetrievalSessionRepository(Protocol):
     """Turn-scoped, read-only session ledgers. Create is idempotent by session_id."""
@@ -208,6 +257,28 @@ class MindThreadRepository(Protocol):
 
     def list_turns(self, thread_id: str) -> list[tuple[MindTurnRequest, MindTurnResponse]]: ...
 
+    def get_turn_by_request_id(
+        self, thread_id: str, request_id: str
+    ) -> tuple[MindTurnRequest, MindTurnResponse] | None:
+        """The one turn bound to ``(thread_id, request_id)``, without reading the thread."""
+        ...
+
+
+class TurnCommitRepository(Protocol):
+    """Stores a finished turn's retrieval session and thread turn as one unit.
+
+    Idempotency matches ``RetrievalSessionRepository.create`` followed by
+    ``MindThreadRepository.append_turn``: an exact replay is a no-op and any
+    conflict raises. A failure stores neither record.
+    """
+
+    def commit_turn(
+        self,
+        session: GraphRetrievalSession,
+        request: MindTurnRequest,
+        response: MindTurnResponse,
+    ) -> None: ...
+
 
 class SemanticDocumentRepository(Protocol):
     """Provenance-complete store for derived semantic documents.
@@ -231,6 +302,20 @@ class SemanticDocumentRepository(Protocol):
 
     def get(self, semantic_document_id: str) -> SemanticDocument | None: ...
 
+    def get_many(
+        self,
+        semantic_document_ids: Collection[str],
+        *,
+        columns: Collection[str],
+    ) -> dict[str, dict[str, str | None]]:
+        """Project ``columns`` of many documents in one round trip.
+
+        ``columns`` must be drawn from ``SEMANTIC_DOCUMENT_COLUMNS``; enum values
+        come back as their string values. Embeddings and content are never
+        loaded. Unknown IDs are omitted.
+        """
+        ...
+
     def delete_run_documents(self, materialization_run_id: str) -> int: ...
 
     def count(self, *, world_id: str | None = None) -> int: ...
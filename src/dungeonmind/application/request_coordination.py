@@ -0,0 +1,16 @@
+"""Application port for cross-worker Mind Turn request coordination."""
+
+from contextlib import AbstractContextManager
+from typing import Protocol
+
+
+class RequestCoordinator(Protocol):
+    """Mutual exclusion for one ``(thread_id, request_id)`` across workers and nodes.
+
+    ``MindTurnService`` always serializes identical requests inside one process;
+    a coordinator extends that to every process sharing the same stores, so a
+    retried request executes its turn exactly once. ``hold`` blocks until the
+    key is free and releases it when the context exits, including on error.
+    """
+
+    def hold(self, thread_id: str, request_id: str) -> AbstractContextManager[None]: ...
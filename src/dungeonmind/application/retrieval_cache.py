@@ -0,0 +1,175 @@
+"""Bounded cross-thread cache of Mind Turn retrieval results.
+
+Everything a turn derives before context assembly — fused semantic candidates,
+mention resolution, focus expansion and admitted evidence — depends only on
+the revision, the scope ``(world_id, campaign_id, admissibility)``, the
+surface's selected objects, the message, the materialization run searched and
+the state of the sources behind the evidence. Callers on different threads
+asking the same question of one revision share one :class:`TurnRetrieval`.
+
+The message is keyed verbatim: mention resolution matches phrases case- and
+boundary-sensitively and lexical search sees the raw text, so any folding
+would serve one caller another message's referents.
+
+The active materialization run is read into the key before searching and
+checked again before an entry is retained; a result whose run moved on is
+served but never stored. Source-state stamps follow
+:class:`~dungeonmind.application.graph_scope_cache.ScopedProjectionCache`:
+they are per world, and observing a new stamp drops every entry of that world
+built against an older one.
+
+Entries hold request-independent values only. Operation, anchor and other
+per-request ids are derived by the service on every turn. Cached results are
+shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..contracts.evidence import EvidenceRef
+from ..contracts.graph import WorldGraphRevision
+from ..contracts.mind_turn import MindTurnRequest
+from ..contracts.retrieval import Coverage, ResolvedReferent
+from .graph_snapshot import GraphObjectView, GraphRelationshipView
+from .repositories import EmbeddingRunRepository
+
+
+@dataclass(frozen=True)
+class AdmittedAnchor:
+    """A source anchor admitted for one evidence owner, before its per-request id."""
+
+    evidence_ref_id: str
+    owner_id: str
+    source_artifact_id: str
+    source_domain: str
+    supporting_object_ids: tuple[str, ...]
+    readable: bool
+    display_label: str | None
+
+
+@dataclass(frozen=True)
+class TurnRetrieval:
+    """Request-independent retrieval outcome for one scope, selection and message.
+
+    ``coverage`` is as it stands after evidence admission.
+    """
+
+    candidate_count: int
+    preflight_ids: tuple[str, ...]
+    candidate_object_ids: tuple[str, ...]
+    referents: tuple[ResolvedReferent, ...]
+    seed_ids: tuple[str, ...]
+    objects: tuple[GraphObjectView, ...]
+    relationships: tuple[GraphRelationshipView, ...]
+    evidence: tuple[EvidenceRef, ...]
+    anchors: tuple[AdmittedAnchor, ...]
+    coverage: Coverage
+
+
+@dataclass(frozen=True)
+class RetrievalCacheKey:
+    revision_id: str
+    graph_payload_sha256: str
+    world_id: str
+    campaign_id: str | None
+    admissibility: str
+    selected_object_ids: tuple[str, ...]
+    message: str
+    materialization_run_id: str | None
+    state_version: str
+
+
+@dataclass(frozen=True)
+class RetrievalCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    max_entries: int
+
+
+class RetrievalResultCache:
+    """Thread-safe LRU of :class:`TurnRetrieval` bound to per-world source-state stamps."""
+
+    def __init__(self, embedding_runs: EmbeddingRunRepository, *, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._embedding_runs = embedding_runs
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[RetrievalCacheKey, TurnRetrieval] = OrderedDict()
+        self._state_versions: dict[str, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def key_for(
+        self,
+        request: MindTurnRequest,
+        *,
+        revision: WorldGraphRevision,
+        state_version: str,
+    ) -> RetrievalCacheKey:
+        """Key for ``request`` against ``revision`` and the world's source stamp.
+
+        Read before retrieving; ``state_version`` is the turn's stamp for
+        ``request.world_id``.
+        """
+        return RetrievalCacheKey(
+            revision_id=revision.revision_id,
+            graph_payload_sha256=revision.graph_payload_sha256,
+            world_id=request.world_id,
+            campaign_id=request.campaign_id,
+            admissibility=request.admissibility.value,
+            selected_object_ids=tuple(request.surface_context.selected_object_ids),
+            message=request.message,
+            materialization_run_id=self._embedding_runs.get_active_run_id(request.world_id),
+            state_version=state_version,
+        )
+
+    def get(self, key: RetrievalCacheKey) -> TurnRetrieval | None:
+        with self._lock:
+            if key.state_version != self._state_versions.get(key.world_id):
+                stale = [each for each in self._entries if each.world_id == key.world_id]
+                if stale:
+                    self._invalidations += 1
+                for each in stale:
+                    del self._entries[each]
+                self._state_versions[key.world_id] = key.state_version
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached
+
+    def put(self, key: RetrievalCacheKey, retrieval: TurnRetrieval) -> None:
+        """Retain ``retrieval`` unless its run or source stamp has moved on."""
+        if self._embedding_runs.get_active_run_id(key.world_id) != key.materialization_run_id:
+            return
+        with self._lock:
+            if key.state_version != self._state_versions.get(key.world_id):
+                return
+            self._entries[key] = retrieval
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._state_versions.clear()
+
+    def stats(self) -> RetrievalCacheStats:
+        with self._lock:
+            return RetrievalCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+            )
@@ -24,7 +24,8 @@ from ..contracts.contribution_review import (
 from ..contracts.graph import StoredGraphRevision
 from ..domain.canonical import canonical_json, canonical_sha256
 from ..domain.errors import ContributionMaterializationError
-from .graph_snapshot import GraphSnapshotReader, ParsedGraphSnapshot
+from .graph_snapshot import GraphSnapshotDelta, GraphSnapshotReader, ParsedGraphSnapshot
+from .graph_snapshot_cache import ParsedSnapshotCache
 
 GRAPH_SCHEMA_V3 = "dm_union_graph_v3"
 RELATIONSHIP_ID_SCHEMA = "dm_review_relationship_id_v1"
@@ -46,6 +47,9 @@ class FinalizedReviewGraphMaterialization:
     graph_schema: str
     graph_payload_sha256: str
     _graph_payload_json: str = field(repr=False)
+    _snapshot_delta_json: str = field(repr=False)
+    # The full parse of the payload that validated it; shared and read-only.
+    output_snapshot: ParsedGraphSnapshot | None = field(default=None, repr=False, compare=False)
 
     def __init__(
         self,
@@ -61,8 +65,11 @@ class FinalizedReviewGraphMaterialization:
         graph_schema: str,
         graph_payload: dict[str, Any],
         graph_payload_sha256: str,
+        snapshot_delta: GraphSnapshotDelta | None = None,
+        output_snapshot: ParsedGraphSnapshot | None = None,
     ) -> None:
         payload = copy.deepcopy(graph_payload)
+        delta = snapshot_delta if snapshot_delta is not None else GraphSnapshotDelta()
         if graph_schema != GRAPH_SCHEMA_V3:
             raise ValueError("materialization result has an unsupported graph schema")
         if canonical_sha256(payload) != graph_payload_sha256:
@@ -83,12 +90,38 @@ class FinalizedReviewGraphMaterialization:
         object.__setattr__(self, "graph_schema", graph_schema)
         object.__setattr__(self, "graph_payload_sha256", graph_payload_sha256)
         object.__setattr__(self, "_graph_payload_json", canonical_json(payload))
+        object.__setattr__(self, "output_snapshot", output_snapshot)
+        object.__setattr__(
+            self,
+            "_snapshot_delta_json",
+            canonical_json(
+                {
+                    "upserted_nodes": list(delta.upserted_nodes),
+                    "added_relationships": list(delta.added_relationships),
+                    "added_evidence_refs": list(delta.added_evidence_refs),
+                }
+            ),
+        )
 
     @property
     def graph_payload(self) -> dict[str, Any]:
         """Return a fresh JSON-compatible copy that cannot mutate this result."""
         return json.loads(self._graph_payload_json)
 
+    @property
+    def snapshot_delta(self) -> GraphSnapshotDelta:
+        """Records this payload replaces in or appends to the parent, copied on read.
+
+        Upserted nodes list updated parent nodes first, then created nodes in
+        payload order, so :func:`derive_child_snapshot` preserves object order.
+        """
+        raw = json.loads(self._snapshot_delta_json)
+        return GraphSnapshotDelta(
+            upserted_nodes=tuple(raw["upserted_nodes"]),
+            added_relationships=tuple(raw["added_relationships"]),
+            added_evidence_refs=tuple(raw["added_evidence_refs"]),
+        )
+
 
 def _fail(reason: str, **details: Any) -> NoReturn:
     raise ContributionMaterializationError(reason, details=details) from None
@@ -120,6 +153,7 @@ def _parse_parent(
     *,
     state: ContributionReviewState,
     graph_reader: GraphSnapshotReader,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> ParsedGraphSnapshot:
     record = state.record
     plan_ref = record.plan_ref
@@ -138,14 +172,24 @@ def _parse_parent(
             expected_parent_revision_id=plan_ref.expected_parent_revision_id,
             graph_schema=revision.graph_schema,
         )
-    try:
-        reader_payload = copy.deepcopy(parent.graph_payload)
-        snapshot = graph_reader.parse(
-            graph_schema=revision.graph_schema,
-            graph_payload=reader_payload,
-        )
-    except Exception:
-        _fail("parent_reload_validation", graph_schema=revision.graph_schema)
+    cached = (
+        None
+        if snapshot_cache is None
+        else snapshot_cache.get(revision, reader=graph_reader)
+    )
+    if cached is not None:
+        snapshot = cached
+    else:
+        try:
+            reader_payload = copy.deepcopy(parent.graph_payload)
+            snapshot = graph_reader.parse(
+                graph_schema=revision.graph_schema,
+                graph_payload=reader_payload,
+            )
+        except Exception:
+            _fail("parent_reload_validation", graph_schema=revision.graph_schema)
+        if snapshot_cache is not None:
+            snapshot = snapshot_cache.put(revision, snapshot, reader=graph_reader)
     if (
         snapshot.world_id != record.world_id
         or snapshot.graph_schema != plan_ref.base_graph_schema
@@ -307,14 +351,20 @@ def materialize_finalized_review(
     *,
     parent: StoredGraphRevision,
     graph_reader: GraphSnapshotReader,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> FinalizedReviewGraphMaterialization:
-    """Materialize one finalized review into one validated v3 graph payload."""
+    """Materialize one finalized review into one validated v3 graph payload.
+
+    With ``snapshot_cache``, a cached parse of the digest-verified parent is
+    reused; the output payload is always re-parsed in full.
+    """
     verified_state = _reload_state(state)
     verified_parent = _reload_parent(parent)
     parent_snapshot = _parse_parent(
         verified_parent,
         state=verified_state,
         graph_reader=graph_reader,
+        snapshot_cache=snapshot_cache,
     )
     record = verified_state.record
     plan_ref = record.plan_ref
@@ -646,6 +696,21 @@ def materialize_finalized_review(
             graph_schema=GRAPH_SCHEMA_V3,
             graph_payload=result_payload,
             graph_payload_sha256=result_digest,
+            snapshot_delta=GraphSnapshotDelta(
+                upserted_nodes=tuple(
+                    [
+                        *[materialized_nodes[key] for key in sorted(updated_object_ids)],
+                        *[created_nodes[key] for key in sorted(created_nodes)],
+                    ]
+                ),
+                added_relationships=tuple(
+                    new_relationships[key] for key in sorted(new_relationships)
+                ),
+                added_evidence_refs=tuple(
+                    accepted_evidence[key] for key in sorted(accepted_evidence)
+                ),
+            ),
+            output_snapshot=output_snapshot,
         )
     except Exception:
         _fail("output_graph_validation")
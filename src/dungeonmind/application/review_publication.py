@@ -14,6 +14,7 @@ from typing import Any, NoReturn
 from pydantic import ValidationError
 
 from ..contracts.contribution_review import ContributionReviewState
+from ..contracts.graph import WorldGraphRevision
 from ..contracts.review_publication import (
     FinalizedReviewPublication,
     FinalizedReviewPublicationCommand,
@@ -29,6 +30,7 @@ from ..domain.errors import (
 )
 from ..domain.revision_ids import compute_revision_id
 from .graph_snapshot import GraphSnapshotReader
+from .graph_snapshot_cache import ParsedSnapshotCache
 from .repositories import (
     ContributionReviewRepository,
     FinalizedReviewPublicationRepository,
@@ -122,8 +124,16 @@ def publish_finalized_review(
     world_graph_repository: WorldGraphRepository,
     publication_repository: FinalizedReviewPublicationRepository,
     graph_reader: GraphSnapshotReader,
+    snapshot_cache: ParsedSnapshotCache | None = None,
+    turn_reader: GraphSnapshotReader | None = None,
 ) -> FinalizedReviewPublication:
-    """Publish or exactly replay one durable finalized review."""
+    """Publish or exactly replay one durable finalized review.
+
+    With ``snapshot_cache``, the parent parse is reused. When that cache has an
+    artifact store, the materializer's parse of a newly published revision is
+    also persisted under ``turn_reader`` (default ``graph_reader``), so turn
+    hosts sharing the store load the new head instead of parsing it cold.
+    """
     existing = publication_repository.get_for_review(world_id, review_id)
     if existing is not None:
         return _reload_publication(existing, world_id=world_id, review_id=review_id)
@@ -149,6 +159,7 @@ def publish_finalized_review(
         state,
         parent=parent,
         graph_reader=graph_reader,
+        snapshot_cache=snapshot_cache,
     )
     payload = _validate_materialization(
         materialization,
@@ -185,7 +196,7 @@ def publish_finalized_review(
 
     try:
         publication = publication_repository.publish(command)
-        return _reload_publication(
+        published = _reload_publication(
             publication,
             world_id=world_id,
             review_id=review_id,
@@ -212,3 +223,23 @@ def publish_finalized_review(
             expected_published_revision_id=command.expected_published_revision_id,
             reason="publication_attempt_or_recovery_probe_failed",
         ) from None
+
+    if (
+        snapshot_cache is not None
+        and materialization.output_snapshot is not None
+        and published.graph_payload_sha256 == graph_payload_sha256
+    ):
+        snapshot_cache.save_artifact(
+            WorldGraphRevision(
+                world_id=published.world_id,
+                revision_id=published.published_revision_id,
+                parent_revision_id=published.expected_parent_revision_id,
+                created_at=published.published_at,
+                operation_ids=[published.operation_id],
+                graph_schema=published.graph_schema,
+                graph_payload_sha256=published.graph_payload_sha256,
+            ),
+            materialization.output_snapshot,
+            reader=turn_reader if turn_reader is not None else graph_reader,
+        )
+    return published
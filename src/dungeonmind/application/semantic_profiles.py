@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 import re
+import weakref
 from typing import Protocol
 
 from ..contracts.semantic_profile import SemanticProfileDescriptor, SemanticProfileRef
@@ -32,6 +35,33 @@ def descriptor_sha256(descriptor: SemanticProfileDescriptor) -> str:
     return canonical_sha256(descriptor.model_dump(mode="json"))
 
 
+ProfilePin = tuple[str, str, str]
+
+_unlisted_tokens: weakref.WeakKeyDictionary[object, int] = weakref.WeakKeyDictionary()
+_unlisted_counter = itertools.count()
+
+
+def profile_registry_digest(registry: SemanticProfileRegistry) -> str:
+    """Digest of the ``(profile_id, profile_revision, descriptor_sha256)`` pins
+    ``registry`` admits.
+
+    Registries that list their pins (``descriptor_pins()``) are digested by
+    content, so equal registries agree across processes. Any other registry
+    gets a token unique to the instance for the life of the process, which can
+    only cost cache misses, never serve one registry's parse under another.
+    """
+    pins = getattr(registry, "descriptor_pins", None)
+    if pins is not None:
+        identity = "pins:" + "\n".join("\x00".join(pin) for pin in sorted(pins()))
+    else:
+        token = _unlisted_tokens.get(registry)
+        if token is None:
+            token = _unlisted_tokens[registry] = next(_unlisted_counter)
+        registry_type = type(registry)
+        identity = f"unlisted:{registry_type.__module__}.{registry_type.__qualname__}#{token}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+
+
 def parse_qualified_term(term: str) -> tuple[str, str]:
     """Split ``namespace:local`` or raise ``SemanticTermValidationError``."""
     if not isinstance(term, str) or not term:
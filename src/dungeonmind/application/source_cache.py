@@ -0,0 +1,340 @@
+"""Read-through cache in front of a :class:`SourceRepository`.
+
+Source revisions are immutable once stored (a replay with a different payload
+is an idempotency conflict), so positive revision lookups are kept without a
+TTL and survive source-state changes; only the entry bound evicts them.
+
+Artifacts carry mutable lifecycle (status, visibility), so they are cached per
+world under ``SourceRepository.state_version(world_id)``. The stamp is per
+world and a bare lookup by ID does not say which world to check, so artifacts
+are cached only through :meth:`CachingSourceRepository.for_world` views. A
+view is pinned to one stamp, usually the one its turn read for every cache it
+consults, and answers every lookup under it without asking for the stamp
+again; a new stamp drops that world's cached artifacts, which makes lifecycle
+changes visible to the next view. Like :class:`ScopedProjectionCache`, the
+stamp is read *before* the backing lookup: a write that lands in between
+leaves the entry under the old stamp, which the next view no longer matches.
+
+Negative lookups (unknown IDs) are kept per world in their own bounded LRU
+under the same stamp, so any source write in that world forgets them. Cached
+records are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+from ..contracts.evidence import SourceArtifactRecord, SourceRevision
+from .repositories import SourceRepository
+
+DEFAULT_MAX_NEGATIVE_ENTRIES = 1_024
+
+_ARTIFACT = "artifact"
+_REVISION = "revision"
+
+ArtifactKey = tuple[str, str]
+NegativeKey = tuple[str, str, str]
+_K = TypeVar("_K", bound=Hashable)
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class SourceCacheStats:
+    artifact_hits: int
+    artifact_misses: int
+    revision_hits: int
+    revision_misses: int
+    negative_hits: int
+    invalidations: int
+    artifacts: int
+    revisions: int
+    negative_entries: int
+    max_entries: int
+    max_negative_entries: int
+
+    @property
+    def artifact_hit_rate(self) -> float:
+        return _rate(self.artifact_hits, self.artifact_misses)
+
+    @property
+    def revision_hit_rate(self) -> float:
+        return _rate(self.revision_hits, self.revision_misses)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "artifact_hit_rate": self.artifact_hit_rate,
+            "revision_hit_rate": self.revision_hit_rate,
+        }
+
+
+def _rate(hits: int, misses: int) -> float:
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+class CachingSourceRepository:
+    """Thread-safe :class:`SourceRepository` decorator; writes go straight through.
+
+    Bare artifact reads pass through; :meth:`for_world` views cache them. Hits
+    count lookups answered without the backing repository, negative hits
+    included; misses count IDs that had to be fetched by a caching read.
+    """
+
+    def __init__(
+        self,
+        sources: SourceRepository,
+        *,
+        max_entries: int,
+        max_negative_entries: int = DEFAULT_MAX_NEGATIVE_ENTRIES,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_negative_entries <= 0:
+            raise ValueError("max_negative_entries must be positive")
+        self._sources = sources
+        self._max_entries = max_entries
+        self._max_negative_entries = max_negative_entries
+        self._lock = threading.Lock()
+        self._artifacts: OrderedDict[ArtifactKey, SourceArtifactRecord] = OrderedDict()
+        self._revisions: OrderedDict[str, SourceRevision] = OrderedDict()
+        self._negative: OrderedDict[NegativeKey, None] = OrderedDict()
+        self._state_versions: dict[str, str] = {}
+        self._artifact_hits = 0
+        self._artifact_misses = 0
+        self._revision_hits = 0
+        self._revision_misses = 0
+        self._negative_hits = 0
+        self._invalidations = 0
+
+    def for_world(self, world_id: str, state_version: str | None = None) -> SourceRepository:
+        """A view caching ``world_id``'s artifacts under ``state_version``.
+
+        ``state_version`` defaults to the world's current stamp.
+        """
+        if state_version is None:
+            state_version = self._sources.state_version(world_id)
+        with self._lock:
+            self._observe(world_id, state_version)
+        return _WorldSources(self, world_id, state_version)
+
+    def put_artifact(self, artifact: SourceArtifactRecord) -> SourceArtifactRecord:
+        return self._sources.put_artifact(artifact)
+
+    def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None:
+        return self._sources.get_artifact(source_artifact_id)
+
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        return self._sources.get_artifacts(source_artifact_ids)
+
+    def put_revision(self, revision: SourceRevision) -> SourceRevision:
+        return self._sources.put_revision(revision)
+
+    def get_revision(self, source_revision_id: str) -> SourceRevision | None:
+        return self.get_revisions([source_revision_id]).get(source_revision_id)
+
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        return self._get_revisions(source_revision_ids, world_id=None, state_version=None)
+
+    def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]:
+        revisions = self._sources.list_revisions(source_artifact_id)
+        with self._lock:
+            for revision in revisions:
+                _remember(
+                    self._revisions, revision.source_revision_id, revision, self._max_entries
+                )
+        return revisions
+
+    def state_version(self, world_id: str) -> str:
+        return self._sources.state_version(world_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._artifacts.clear()
+            self._revisions.clear()
+            self._negative.clear()
+            self._state_versions.clear()
+
+    def stats(self) -> SourceCacheStats:
+        with self._lock:
+            return SourceCacheStats(
+                artifact_hits=self._artifact_hits,
+                artifact_misses=self._artifact_misses,
+                revision_hits=self._revision_hits,
+                revision_misses=self._revision_misses,
+                negative_hits=self._negative_hits,
+                invalidations=self._invalidations,
+                artifacts=len(self._artifacts),
+                revisions=len(self._revisions),
+                negative_entries=len(self._negative),
+                max_entries=self._max_entries,
+                max_negative_entries=self._max_negative_entries,
+            )
+
+    def _get_artifacts(
+        self, source_artifact_ids: Collection[str], *, world_id: str, state_version: str
+    ) -> dict[str, SourceArtifactRecord]:
+        found: dict[str, SourceArtifactRecord] = {}
+        remaining: dict[str, None] = {}
+        with self._lock:
+            current = self._state_versions.get(world_id) == state_version
+            for source_artifact_id in source_artifact_ids:
+                key = (world_id, source_artifact_id)
+                cached = self._artifacts.get(key) if current else None
+                if cached is not None:
+                    self._artifacts.move_to_end(key)
+                    self._artifact_hits += 1
+                    found[source_artifact_id] = cached
+                elif current and self._negative_hit((world_id, _ARTIFACT, source_artifact_id)):
+                    self._artifact_hits += 1
+                else:
+                    remaining[source_artifact_id] = None
+            self._artifact_misses += len(remaining)
+        if not remaining:
+            return found
+        fetched = self._sources.get_artifacts(remaining)
+        found.update(fetched)
+        with self._lock:
+            if self._state_versions.get(world_id) == state_version:
+                for source_artifact_id in remaining:
+                    artifact = fetched.get(source_artifact_id)
+                    if artifact is None:
+                        self._remember_negative((world_id, _ARTIFACT, source_artifact_id))
+                    elif artifact.world_id == world_id:
+                        # Another world's artifact is not covered by this stamp.
+                        _remember(
+                            self._artifacts,
+                            (world_id, source_artifact_id),
+                            artifact,
+                            self._max_entries,
+                        )
+        return found
+
+    def _get_revisions(
+        self,
+        source_revision_ids: Collection[str],
+        *,
+        world_id: str | None,
+        state_version: str | None,
+    ) -> dict[str, SourceRevision]:
+        """Positive hits need no stamp; negative ones only within a world view."""
+        found: dict[str, SourceRevision] = {}
+        remaining: dict[str, None] = {}
+        with self._lock:
+            current = (
+                world_id is not None and self._state_versions.get(world_id) == state_version
+            )
+            for source_revision_id in source_revision_ids:
+                cached = self._revisions.get(source_revision_id)
+                if cached is not None:
+                    self._revisions.move_to_end(source_revision_id)
+                    self._revision_hits += 1
+                    found[source_revision_id] = cached
+                elif current and self._negative_hit((world_id, _REVISION, source_revision_id)):
+                    self._revision_hits += 1
+                else:
+                    remaining[source_revision_id] = None
+            self._revision_misses += len(remaining)
+        if not remaining:
+            return found
+        fetched = self._sources.get_revisions(remaining)
+        found.update(fetched)
+        with self._lock:
+            for source_revision_id, revision in fetched.items():
+                _remember(self._revisions, source_revision_id, revision, self._max_entries)
+            if world_id is not None and self._state_versions.get(world_id) == state_version:
+                for source_revision_id in remaining:
+                    if source_revision_id not in fetched:
+                        self._remember_negative((world_id, _REVISION, source_revision_id))
+        return found
+
+    def _observe(self, world_id: str, state_version: str) -> None:
+        """Drop ``world_id``'s stamp-bound entries when its stamp is new. Caller holds the lock."""
+        if self._state_versions.get(world_id) == state_version:
+            return
+        stale_artifacts = [key for key in self._artifacts if key[0] == world_id]
+        stale_negative = [key for key in self._negative if key[0] == world_id]
+        if stale_artifacts or stale_negative:
+            self._invalidations += 1
+        for artifact_key in stale_artifacts:
+            del self._artifacts[artifact_key]
+        for negative_key in stale_negative:
+            del self._negative[negative_key]
+        self._state_versions[world_id] = state_version
+
+    def _negative_hit(self, key: NegativeKey) -> bool:
+        if key not in self._negative:
+            return False
+        self._negative.move_to_end(key)
+        self._negative_hits += 1
+        return True
+
+    def _remember_negative(self, key: NegativeKey) -> None:
+        self._negative[key] = None
+        self._negative.move_to_end(key)
+        while len(self._negative) > self._max_negative_entries:
+            self._negative.popitem(last=False)
+
+
+class _WorldSources:
+    """:class:`SourceRepository` view of a :class:`CachingSourceRepository` pinned
+    to one world's stamp. Writes and other worlds' stamps pass through."""
+
+    def __init__(self, cache: CachingSourceRepository, world_id: str, state_version: str) -> None:
+        self._cache = cache
+        self._world_id = world_id
+        self._state_version = state_version
+
+    def put_artifact(self, artifact: SourceArtifactRecord) -> SourceArtifactRecord:
+        return self._cache.put_artifact(artifact)
+
+    def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None:
+        return self.get_artifacts([source_artifact_id]).get(source_artifact_id)
+
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        return self._cache._get_artifacts(
+            source_artifact_ids, world_id=self._world_id, state_version=self._state_version
+        )
+
+    def put_revision(self, revision: SourceRevision) -> SourceRevision:
+        return self._cache.put_revision(revision)
+
+    def get_revision(self, source_revision_id: str) -> SourceRevision | None:
+        return self.get_revisions([source_revision_id]).get(source_revision_id)
+
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        return self._cache._get_revisions(
+            source_revision_ids, world_id=self._world_id, state_version=self._state_version
+        )
+
+    def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]:
+        return self._cache.list_revisions(source_artifact_id)
+
+    def state_version(self, world_id: str) -> str:
+        if world_id == self._world_id:
+            return self._state_version
+        return self._cache.state_version(world_id)
+
+
+def for_world(
+    sources: SourceRepository, world_id: str, state_version: str | None = None
+) -> SourceRepository:
+    """``sources`` pinned to ``world_id`` when it is a :class:`CachingSourceRepository`."""
+    if isinstance(sources, CachingSourceRepository):
+        return sources.for_world(world_id, state_version)
+    return sources
+
+
+def _remember(entries: OrderedDict[_K, _T], key: _K, value: _T, max_entries: int) -> None:
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > max_entries:
+        entries.popitem(last=False)
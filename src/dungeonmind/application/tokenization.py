@@ -0,0 +1,12 @@
+"""Application port for agent-context tokenizers."""
+
+from typing import Protocol
+
+
+class Tokenizer(Protocol):
+    """Counts the tokens an agent adapter is billed and limited by."""
+
+    @property
+    def tokenizer_id(self) -> str: ...
+
+    def count_tokens(self, text: str) -> int: ...
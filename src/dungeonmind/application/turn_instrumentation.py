@@ -0,0 +1,242 @@
+"""Per-stage latency and work counts for Mind Turn execution.
+
+:class:`MindTurnService` times every stage of a turn and hands the finished
+:class:`TurnTrace` to an optional :class:`TurnRecorder`. Counts record how much
+graph a stage touched (objects, relationships, evidence, candidates) so that a
+slow stage can be told apart from a stage that was simply given more work.
+
+Traces are wall-clock and therefore never enter responses or persisted
+sessions; turns stay byte-identical with or without a recorder.
+:class:`TurnStageAggregator` is the process-level recorder: it folds traces
+into per-stage totals and counts samples that exceed a configured budget.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class TurnStage(StrEnum):
+    REPLAY_LOOKUP = "replay_lookup"
+    SESSION_LOOKUP = "session_lookup"
+    RESOLVE_REVISION = "resolve_revision"
+    # Only when a cache keys on source state; the turn's one stamp read.
+    SOURCE_STATE = "source_state"
+    # Only when a RetrievalResultCache is configured; a hit skips PARSE..ADMIT_EVIDENCE.
+    RETRIEVAL_CACHE = "retrieval_cache"
+    PARSE = "parse"
+    SCOPE = "scope"
+    EMBED_QUERY = "embed_query"
+    SEMANTIC_SEARCH = "semantic_search"
+    PREFLIGHT = "preflight"
+    RESOLVE_MENTIONS = "resolve_mentions"
+    EXPAND = "expand"
+    ADMIT_EVIDENCE = "admit_evidence"
+    ASSEMBLE_CONTEXT = "assemble_context"
+    AGENT = "agent"
+    SESSION_WRITE = "session_write"
+    THREAD_APPEND = "thread_append"
+    # Session and turn in one write, when a TurnCommitRepository is configured.
+    TURN_COMMIT = "turn_commit"
+
+
+class TurnOutcome(StrEnum):
+    EXECUTED = "executed"
+    REPLAYED = "replayed"
+    RECOVERED = "recovered"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class StageSample:
+    stage: TurnStage
+    elapsed_s: float
+    counts: Mapping[str, int]
+
+
+@dataclass(frozen=True)
+class TurnTrace:
+    """Stages in completion order; ``total_s`` includes request-lock waits."""
+
+    thread_id: str
+    request_id: str
+    outcome: TurnOutcome
+    total_s: float
+    stages: tuple[StageSample, ...]
+
+
+class TurnRecorder(Protocol):
+    def record(self, trace: TurnTrace) -> None: ...
+
+
+class TurnTimer:
+    """Collects stage samples for one turn.
+
+    The async front end runs stages on worker threads at the same time, so
+    spans may overlap; samples are appended atomically and never merged.
+    Stages it starts ahead of the synchronous order run on a :meth:`fork`,
+    whose samples are :meth:`adopt`-ed only once the turn gets that far.
+    """
+
+    def __init__(self, thread_id: str, request_id: str) -> None:
+        self._thread_id = thread_id
+        self._request_id = request_id
+        self._started = time.perf_counter()
+        self._samples: list[StageSample] = []
+        self.outcome = TurnOutcome.FAILED
+
+    @contextmanager
+    def stage(self, stage: TurnStage) -> Iterator[dict[str, int]]:
+        """Time the block; counts written to the yielded dict are kept with it."""
+        counts: dict[str, int] = {}
+        started = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            elapsed_s = time.perf_counter() - started
+            self._samples.append(StageSample(stage, elapsed_s, MappingProxyType(counts)))
+
+    def call(
+        self,
+        stage: TurnStage,
+        fn: Callable[_P, _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        with self.stage(stage):
+            return fn(*args, **kwargs)
+
+    def fork(self) -> TurnTimer:
+        """A timer for speculative stages of the same turn; see :meth:`adopt`."""
+        return TurnTimer(self._thread_id, self._request_id)
+
+    def adopt(self, fork: TurnTimer) -> None:
+        """Keep ``fork``'s samples; its stages must have finished."""
+        self._samples.extend(fork._samples)
+
+    def finish(self) -> TurnTrace:
+        return TurnTrace(
+            thread_id=self._thread_id,
+            request_id=self._request_id,
+            outcome=self.outcome,
+            total_s=time.perf_counter() - self._started,
+            stages=tuple(self._samples),
+        )
+
+
+@dataclass(frozen=True)
+class StageStats:
+    samples: int
+    total_s: float
+    max_s: float
+    over_budget: int
+    budget_s: float | None
+    counts: Mapping[str, int]
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.samples if self.samples else 0.0
+
+
+@dataclass(frozen=True)
+class TurnStageStats:
+    turns: int
+    outcomes: Mapping[str, int]
+    stages: Mapping[str, StageStats]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "outcomes": dict(self.outcomes),
+            "stages": {
+                stage: {
+                    "samples": stats.samples,
+                    "total_s": stats.total_s,
+                    "mean_s": stats.mean_s,
+                    "max_s": stats.max_s,
+                    "budget_s": stats.budget_s,
+                    "over_budget": stats.over_budget,
+                    "counts": dict(stats.counts),
+                }
+                for stage, stats in self.stages.items()
+            },
+        }
+
+
+@dataclass
+class _StageTotals:
+    samples: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    over_budget: int = 0
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+class TurnStageAggregator:
+    """Thread-safe process-level :class:`TurnRecorder`.
+
+    ``budgets`` maps a stage to its latency budget in seconds; samples above
+    it are counted per stage. Counts are summed across samples.
+    """
+
+    def __init__(self, *, budgets: Mapping[TurnStage, float] | None = None) -> None:
+        budgets = dict(budgets or {})
+        for stage, budget_s in budgets.items():
+            if budget_s <= 0:
+                raise ValueError(f"budget for stage {stage!r} must be positive")
+        self._budgets = budgets
+        self._lock = threading.Lock()
+        self._turns = 0
+        self._outcomes: dict[str, int] = {}
+        self._stages: dict[TurnStage, _StageTotals] = {}
+
+    def record(self, trace: TurnTrace) -> None:
+        with self._lock:
+            self._turns += 1
+            self._outcomes[trace.outcome] = self._outcomes.get(trace.outcome, 0) + 1
+            for sample in trace.stages:
+                totals = self._stages.setdefault(sample.stage, _StageTotals())
+                totals.samples += 1
+                totals.total_s += sample.elapsed_s
+                totals.max_s = max(totals.max_s, sample.elapsed_s)
+                budget_s = self._budgets.get(sample.stage)
+                if budget_s is not None and sample.elapsed_s > budget_s:
+                    totals.over_budget += 1
+                for name, count in sample.counts.items():
+                    totals.counts[name] = totals.counts.get(name, 0) + count
+
+    def stats(self) -> TurnStageStats:
+        """Totals per stage, in pipeline order."""
+        with self._lock:
+            return TurnStageStats(
+                turns=self._turns,
+                outcomes=dict(self._outcomes),
+                stages={
+                    stage.value: StageStats(
+                        samples=totals.samples,
+                        total_s=totals.total_s,
+                        max_s=totals.max_s,
+                        over_budget=totals.over_budget,
+                        budget_s=self._budgets.get(stage),
+                        counts=dict(totals.counts),
+                    )
+                    for stage in TurnStage
+                    if (totals := self._stages.get(stage)) is not None
+                },
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._turns = 0
+            self._outcomes.clear()
+            self._stages.clear()
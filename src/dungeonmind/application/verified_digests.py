@@ -0,0 +1,167 @@
+"""Process-wide registry of graph payload digests that already verified.
+
+A stored revision is content-addressed: ``(revision_id, graph_payload_sha256,
+graph_schema)`` names one exact payload. Once that payload has hashed to its
+recorded digest *and* passed a full fail-closed parse, later loads only need a
+cheap structural check before trusting the digest again. Hosts build one
+registry at startup and share it across every consumer they wire.
+
+The fast path never admits a key on its own: keys are recorded only through
+:meth:`VerifiedDigestRegistry.record_parsed`, which re-hashes the payload once.
+Fast-path hits re-hash on a deterministic sample (every ``recheck_interval``-th
+hit per key) and any structural or digest mismatch forgets the key, so the next
+load takes the full path again. Corruption that preserves the structural
+signature is therefore caught within ``recheck_interval`` loads rather than on
+every load; callers that need per-load guarantees pass no registry.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ..contracts.graph import WorldGraphRevision
+from ..domain.canonical import canonical_sha256
+
+DEFAULT_RECHECK_INTERVAL = 64
+DEFAULT_MAX_ENTRIES = 4_096
+
+VerifiedDigestKey = tuple[str, str, str]
+PayloadShape = tuple[Any, ...]
+
+
+def graph_payload_shape(graph_payload: dict[str, Any]) -> PayloadShape:
+    """Cheap structural signature of a graph payload (keys and record counts)."""
+    counts = tuple(
+        (key, len(value) if isinstance(value, (list, dict)) else -1)
+        for key, value in sorted(graph_payload.items())
+    )
+    return (graph_payload.get("world_id"), counts)
+
+
+@dataclass(frozen=True)
+class VerifiedDigestRegistryStats:
+    entries: int
+    fast_path_hits: int
+    full_checks: int
+    sampled_rechecks: int
+    mismatches: int
+    max_entries: int
+    recheck_interval: int
+
+
+class _Entry:
+    __slots__ = ("hits", "shape")
+
+    def __init__(self, shape: PayloadShape) -> None:
+        self.shape = shape
+        self.hits = 0
+
+
+class VerifiedDigestRegistry:
+    """Thread-safe, bounded LRU of verified ``(revision_id, digest, schema)`` keys."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        recheck_interval: int = DEFAULT_RECHECK_INTERVAL,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if recheck_interval <= 0:
+            raise ValueError("recheck_interval must be positive")
+        self._max_entries = max_entries
+        self._recheck_interval = recheck_interval
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[VerifiedDigestKey, _Entry] = OrderedDict()
+        self._fast_path_hits = 0
+        self._full_checks = 0
+        self._sampled_rechecks = 0
+        self._mismatches = 0
+
+    def payload_digest_matches(
+        self,
+        revision: WorldGraphRevision,
+        graph_payload: dict[str, Any],
+    ) -> bool:
+        """Whether ``graph_payload`` hashes to ``revision.graph_payload_sha256``.
+
+        Unknown keys, structural mismatches and sampled hits are re-hashed.
+        """
+        key = _key(revision)
+        shape = graph_payload_shape(graph_payload)
+        sampled = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.shape == shape:
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                if entry.hits % self._recheck_interval:
+                    self._fast_path_hits += 1
+                    return True
+                sampled = True
+                self._sampled_rechecks += 1
+            else:
+                self._full_checks += 1
+
+        matches = canonical_sha256(graph_payload) == revision.graph_payload_sha256
+        if not matches or not sampled:
+            with self._lock:
+                if not matches:
+                    self._mismatches += 1
+                    self._entries.pop(key, None)
+                elif entry is not None:
+                    # Same digest, new shape: the payload parser must vouch again.
+                    self._entries.pop(key, None)
+        return matches
+
+    def record_parsed(
+        self,
+        revision: WorldGraphRevision,
+        graph_payload: dict[str, Any],
+    ) -> None:
+        """Record ``revision`` after ``graph_payload`` passed a full fail-closed parse.
+
+        The payload is re-hashed once per new key; a mismatch is not recorded.
+        """
+        key = _key(revision)
+        shape = graph_payload_shape(graph_payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.shape == shape:
+                self._entries.move_to_end(key)
+                return
+        if canonical_sha256(graph_payload) != revision.graph_payload_sha256:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(shape)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, revision: WorldGraphRevision) -> None:
+        with self._lock:
+            self._entries.pop(_key(revision), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> VerifiedDigestRegistryStats:
+        with self._lock:
+            return VerifiedDigestRegistryStats(
+                entries=len(self._entries),
+                fast_path_hits=self._fast_path_hits,
+                full_checks=self._full_checks,
+                sampled_rechecks=self._sampled_rechecks,
+                mismatches=self._mismatches,
+                max_entries=self._max_entries,
+                recheck_interval=self._recheck_interval,
+            )
+
+
+def _key(revision: WorldGraphRevision) -> VerifiedDigestKey:
+    return (revision.revision_id, revision.graph_payload_sha256, revision.graph_schema)
@@ -7,12 +7,15 @@ from .curated_mind_turn import (
     seed_curated_mind_turn,
 )
 from .query_embedding import FIXTURE_EMBEDDING_PROVIDER_ID, FixtureQueryEmbeddingProvider
+from .tokenization import FIXTURE_TOKENIZER_ID, FixtureTokenizer
 
 __all__ = [
     "FIXTURE_EMBEDDING_PROVIDER_ID",
+    "FIXTURE_TOKENIZER_ID",
     "CuratedMindTurnFixture",
     "CuratedMindTurnSeedResult",
     "FixtureQueryEmbeddingProvider",
+    "FixtureTokenizer",
     "load_curated_mind_turn_fixture",
     "seed_curated_mind_turn",
 ]
@@ -0,0 +1,28 @@
+"""Deterministic fixture tokenizer — no network, no vocabulary download."""
+
+from __future__ import annotations
+
+import re
+
+FIXTURE_TOKENIZER_ID = "fixture_tokenizer"
+
+# Word runs and single non-space characters, as subword tokenizers split them.
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_WORD_PIECE_CHARS = 4
+
+
+class FixtureTokenizer:
+    """Four-character word pieces plus one token per punctuation character.
+
+    Punctuation never merges with a neighbour, so the count of a canonical
+    JSON document is the sum of the counts of its members and separators.
+    """
+
+    @property
+    def tokenizer_id(self) -> str:
+        return FIXTURE_TOKENIZER_ID
+
+    def count_tokens(self, text: str) -> int:
+        return sum(
+            -(-len(piece) // _WORD_PIECE_CHARS) for piece in _PIECES.findall(text)
+        )
@@ -15,6 +15,7 @@ from .repositories import (
     InMemorySemanticDocumentRepository,
     InMemorySemanticSearch,
     InMemorySourceRepository,
+    InMemoryTurnCommitRepository,
     InMemoryWorldGraphRepository,
 )
 
@@ -29,5 +30,6 @@ __all__ = [
     "InMemorySemanticDocumentRepository",
     "InMemorySemanticSearch",
     "InMemorySourceRepository",
+    "InMemoryTurnCommitRepository",
     "InMemoryWorldGraphRepository",
 ]
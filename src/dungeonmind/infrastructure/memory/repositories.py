@@ -11,11 +11,14 @@ the PostgreSQL adapter is what makes the ports real.
 import copy
 import math
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from datetime import datetime
 from typing import TypeVar
 
-from ...application.repositories import normalize_semantic_document_batch
+from ...application.repositories import (
+    normalize_semantic_document_batch,
+    semantic_document_columns,
+)
 from ...contracts.contribution import ContributionStatus, GraphContribution
 from ...contracts.contribution_review import (
     ContributionReviewRecord,
@@ -870,6 +873,7 @@ class InMemorySourceRepository:
     def __init__(self) -> None:
         self._artifacts: dict[str, SourceArtifactRecord] = {}
         self._revisions: dict[str, SourceRevision] = {}
+        self._generations: dict[str, int] = {}
         self._lock = threading.Lock()
 
     def put_artifact(self, artifact: SourceArtifactRecord) -> SourceArtifactRecord:
@@ -883,12 +887,22 @@ class InMemorySourceRepository:
                     )
                 return _copy(existing)
             self._artifacts[artifact.source_artifact_id] = _copy(artifact)
+            self._bump(artifact.world_id)
             return _copy(artifact)
 
     def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None:
         item = self._artifacts.get(source_artifact_id)
         return _copy(item) if item is not None else None
 
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        return {
+            source_artifact_id: _copy(self._artifacts[source_artifact_id])
+            for source_artifact_id in source_artifact_ids
+            if source_artifact_id in self._artifacts
+        }
+
     def put_revision(self, revision: SourceRevision) -> SourceRevision:
         with self._lock:
             existing = self._revisions.get(revision.source_revision_id)
@@ -900,17 +914,36 @@ class InMemorySourceRepository:
                     )
                 return _copy(existing)
             self._revisions[revision.source_revision_id] = _copy(revision)
+            # A revision belongs to its artifact's world; before the artifact
+            # exists there is no world to bump, and its insert bumps it later.
+            artifact = self._artifacts.get(revision.source_artifact_id)
+            if artifact is not None:
+                self._bump(artifact.world_id)
             return _copy(revision)
 
     def get_revision(self, source_revision_id: str) -> SourceRevision | None:
         item = self._revisions.get(source_revision_id)
         return _copy(item) if item is not None else None
 
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        return {
+            source_revision_id: _copy(self._revisions[source_revision_id])
+            for source_revision_id in source_revision_ids
+            if source_revision_id in self._revisions
+        }
+
     def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]:
         items = [r for r in self._revisions.values() if r.source_artifact_id == source_artifact_id]
         items.sort(key=lambda r: r.source_revision_id)
         return [_copy(r) for r in items]
 
+    def state_version(self, world_id: str) -> str:
+        with self._lock:
+            return str(self._generations.get(world_id, 0))
+
+    def _bump(self, world_id: str) -> None:
+        self._generations[world_id] = self._generations.get(world_id, 0) + 1
+
 
 class InMemoryRetrievalSessionRepository:
     def __init__(self) -> None:
@@ -940,6 +973,11 @@ class InMemoryRetrievalSessionRepository:
             self._items[session.session_id] = _copy(session)
             return _copy(session)
 
+    def discard(self, session_id: str) -> None:
+        """Forget ``session_id``; rolls back a create whose turn was rejected."""
+        with self._lock:
+            self._items.pop(session_id, None)
+
 
 class InMemoryMindThreadRepository:
     """v1: caller-private, cross-surface threads. Surface is per-turn only."""
@@ -1053,6 +1091,43 @@ class InMemoryMindThreadRepository:
     def list_turns(self, thread_id: str) -> list[tuple[MindTurnRequest, MindTurnResponse]]:
         return [(_copy(req), _copy(resp)) for req, resp in self._turns.get(thread_id, [])]
 
+    def get_turn_by_request_id(
+        self, thread_id: str, request_id: str
+    ) -> tuple[MindTurnRequest, MindTurnResponse] | None:
+        for req, resp in self._turns.get(thread_id, []):
+            if req.request_id == request_id:
+                return _copy(req), _copy(resp)
+        return None
+
+
+class InMemoryTurnCommitRepository:
+    """Commits through the given session and thread stores, undoing a new session on failure."""
+
+    def __init__(
+        self,
+        retrieval_sessions: InMemoryRetrievalSessionRepository,
+        threads: InMemoryMindThreadRepository,
+    ) -> None:
+        self._retrieval_sessions = retrieval_sessions
+        self._threads = threads
+        self._lock = threading.Lock()
+
+    def commit_turn(
+        self,
+        session: GraphRetrievalSession,
+        request: MindTurnRequest,
+        response: MindTurnResponse,
+    ) -> None:
+        with self._lock:
+            existed = self._retrieval_sessions.get(session.session_id) is not None
+            self._retrieval_sessions.create(session)
+            try:
+                self._threads.append_turn(request, response)
+            except BaseException:
+                if not existed:
+                    self._retrieval_sessions.discard(session.session_id)
+                raise
+
 
 class InMemoryEmbeddingRunRepository:
     """Monotonic lifecycle: RUNNING→COMPLETED|FAILED; COMPLETED|FAILED→SUPERSEDED.
@@ -1348,6 +1423,22 @@ class InMemorySemanticDocumentRepository:
             item = self._docs.get(semantic_document_id)
             return _copy(item) if item is not None else None
 
+    def get_many(
+        self,
+        semantic_document_ids: Collection[str],
+        *,
+        columns: Collection[str],
+    ) -> dict[str, dict[str, str | None]]:
+        selected = semantic_document_columns(columns)
+        with self._runs.materialization_lock:
+            docs = [
+                self._docs[doc_id] for doc_id in semantic_document_ids if doc_id in self._docs
+            ]
+        return {
+            doc.semantic_document_id: doc.model_dump(mode="json", include=set(selected))
+            for doc in docs
+        }
+
     def delete_run_documents(self, materialization_run_id: str) -> int:
         with self._runs.materialization_lock:
             run = self._runs._peek(materialization_run_id)
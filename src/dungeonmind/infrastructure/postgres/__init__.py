@@ -5,6 +5,7 @@ Importing this package requires the ``postgres`` extra
 package.
 """
 
+from .coordination import PostgresRequestCoordinator
 from .database import PostgresDatabase
 from .graph import PostgresWorldGraphRepository
 from .records import (
@@ -21,6 +22,7 @@ from .semantic import (
     PostgresSemanticSearch,
 )
 from .threads import PostgresMindThreadRepository
+from .turn_commit import PostgresTurnCommitRepository
 
 __all__ = [
     "PostgresContributionRepository",
@@ -30,10 +32,12 @@ __all__ = [
     "PostgresFinalizedReviewPublicationRepository",
     "PostgresIdentityDecisionRepository",
     "PostgresMindThreadRepository",
+    "PostgresRequestCoordinator",
     "PostgresRetrievalSessionRepository",
     "PostgresSemanticDocumentRepository",
     "PostgresSemanticSearch",
     "PostgresSourceRepository",
+    "PostgresTurnCommitRepository",
     "PostgresWorldGraphRepository",
 ]
 
@@ -53,6 +57,7 @@ class PostgresRepositoryBundle:
         self.sources = PostgresSourceRepository(database)
         self.retrieval_sessions = PostgresRetrievalSessionRepository(database)
         self.threads = PostgresMindThreadRepository(database)
+        self.turn_commits = PostgresTurnCommitRepository(database)
         self.embedding_runs = PostgresEmbeddingRunRepository(database)
         self.semantic_documents = PostgresSemanticDocumentRepository(database)
         self.semantic_search = PostgresSemanticSearch(database)
@@ -0,0 +1,46 @@
+"""PostgreSQL adapter for RequestCoordinator (session-level advisory locks)."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .database import PostgresDatabase
+
+
+def request_lock_key(thread_id: str, request_id: str) -> int:
+    """Stable signed 64-bit advisory-lock key for ``(thread_id, request_id)``.
+
+    Derived in Python rather than with ``hashtext`` so the key does not depend
+    on server version. A collision only serializes two unrelated requests.
+    """
+    digest = hashlib.sha256(f"{thread_id}\x00{request_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class PostgresRequestCoordinator:
+    """Holds ``pg_advisory_lock`` on a dedicated autocommit connection for the turn.
+
+    The lock is session-level and taken outside any transaction, so the
+    connection sits ``idle`` rather than ``idle in transaction`` while the turn
+    (agent call included) runs, and ``idle_in_transaction_session_timeout``
+    never cuts it off. It is released explicitly on exit, and by the server
+    when the connection closes or drops; a crashed worker never strands it.
+    Each held request keeps one connection open until its turn completes.
+    """
+
+    def __init__(self, database: PostgresDatabase) -> None:
+        self._db = database
+
+    @contextmanager
+    def hold(self, thread_id: str, request_id: str) -> Iterator[None]:
+        key = request_lock_key(thread_id, request_id)
+        with self._db.session() as conn:
+            conn.execute("SELECT pg_advisory_lock(%s)", (key,))
+            try:
+                yield
+            finally:
+                # A broken connection has already released the lock server-side.
+                if not conn.broken:
+                    conn.execute("SELECT pg_advisory_unlock(%s)", (key,))
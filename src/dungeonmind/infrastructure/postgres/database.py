@@ -5,6 +5,7 @@ No client, pool, or environment lookup occurs at module import time.
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime
@@ -38,9 +39,11 @@ class PostgresDatabase:
             raise ValueError("database_url must be a non-empty PostgreSQL DSN")
         self._database_url = database_url
 
-    def connect(self) -> Connection[Any]:
+    def connect(self, *, autocommit: bool = False) -> Connection[Any]:
         try:
-            conn = psycopg.connect(self._database_url, row_factory=dict_row)
+            conn = psycopg.connect(
+                self._database_url, row_factory=dict_row, autocommit=autocommit
+            )
         except Exception as exc:
             _map_driver_error(exc)
             raise
@@ -55,6 +58,47 @@ class PostgresDatabase:
             _map_driver_error(exc)
             raise
 
+    @contextmanager
+    def session(self) -> Iterator[Connection[Any]]:
+        """A dedicated autocommit connection; no transaction stays open on it."""
+        try:
+            with self.connect(autocommit=True) as conn:
+                yield conn
+        except Exception as exc:
+            _map_driver_error(exc)
+            raise
+
+
+class SharedConnection:
+    """One lazily opened autocommit connection reused by short, frequent reads.
+
+    Callers are serialized on a lock. A connection that fails is discarded and
+    the next use reconnects. Autocommit means no transaction is ever left open
+    between uses.
+    """
+
+    def __init__(self, database: PostgresDatabase) -> None:
+        self._database = database
+        self._lock = threading.Lock()
+        self._conn: Connection[Any] | None = None
+
+    @contextmanager
+    def use(self) -> Iterator[Connection[Any]]:
+        with self._lock:
+            try:
+                if self._conn is None or self._conn.closed:
+                    self._conn = self._database.connect(autocommit=True)
+                yield self._conn
+            except Exception as exc:
+                self._discard()
+                _map_driver_error(exc)
+                raise
+
+    def _discard(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
 
 def jsonb(value: Any) -> Jsonb:
     return Jsonb(value)
@@ -16,11 +16,18 @@ from .serialization import dump_payload, model_fingerprint, reconstruct
 
 
 def upsert_evidence_refs(conn: Connection[Any], evidence: list[EvidenceRef]) -> None:
-    """Persist evidence refs with atomic insert/reconcile idempotency."""
+    """Persist evidence refs with atomic insert/reconcile idempotency.
+
+    One batched insert and one read-back serve the whole list; exact
+    duplicates within ``evidence`` are written once.
+    """
+    pending: dict[tuple[str, str], EvidenceRef] = {}
     for item in evidence:
-        fingerprint = model_fingerprint(item)
-        payload = dump_payload(item)
-        conn.execute(
+        pending.setdefault((item.evidence_ref_id, model_fingerprint(item)), item)
+    if not pending:
+        return
+    with conn.cursor() as cur:
+        cur.executemany(
             sql.SQL(
                 """
                 INSERT INTO {}.evidence_refs (
@@ -36,43 +43,53 @@ def upsert_evidence_refs(conn: Connection[Any], evidence: list[EvidenceRef]) ->
                 ON CONFLICT (evidence_ref_id) DO NOTHING
                 """
             ).format(sql.Identifier(SCHEMA)),
-            (
-                item.evidence_ref_id,
-                item.source_artifact_id,
-                item.source_revision_id,
-                item.source_domain.value,
-                item.evidence_role.value,
-                item.schema_version,
-                fingerprint,
-                jsonb(payload),
-            ),
+            [
+                (
+                    item.evidence_ref_id,
+                    item.source_artifact_id,
+                    item.source_revision_id,
+                    item.source_domain.value,
+                    item.evidence_role.value,
+                    item.schema_version,
+                    fingerprint,
+                    jsonb(dump_payload(item)),
+                )
+                for (_evidence_ref_id, fingerprint), item in pending.items()
+            ],
         )
-        existing = conn.execute(
-            sql.SQL(
-                """
-                SELECT
-                    evidence_ref_id,
-                    source_artifact_id,
-                    source_revision_id,
-                    source_domain,
-                    evidence_role,
-                    schema_version,
-                    record_fingerprint,
-                    payload
-                FROM {}.evidence_refs
-                WHERE evidence_ref_id = %s
-                """
-            ).format(sql.Identifier(SCHEMA)),
-            (item.evidence_ref_id,),
-        ).fetchone()
+    rows = conn.execute(
+        sql.SQL(
+            """
+            SELECT
+                evidence_ref_id,
+                source_artifact_id,
+                source_revision_id,
+                source_domain,
+                evidence_role,
+                schema_version,
+                record_fingerprint,
+                payload
+            FROM {}.evidence_refs
+            WHERE evidence_ref_id = ANY(%s)
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (sorted({evidence_ref_id for evidence_ref_id, _ in pending}),),
+    ).fetchall()
+    stored = {row["evidence_ref_id"]: row for row in rows}
+    verified: set[str] = set()
+    for evidence_ref_id, fingerprint in pending:
+        existing = stored.get(evidence_ref_id)
         if existing is None:
             raise PersistenceIntegrityError(
-                f"evidence_ref {item.evidence_ref_id!r} missing after insert/reconcile"
+                f"evidence_ref {evidence_ref_id!r} missing after insert/reconcile"
             )
         if existing["record_fingerprint"] != fingerprint:
             raise IdempotencyConflictError(
-                f"evidence_ref {item.evidence_ref_id!r} replayed with different payload"
+                f"evidence_ref {evidence_ref_id!r} replayed with different payload"
             )
+        if evidence_ref_id in verified:
+            continue
+        verified.add(evidence_ref_id)
         reconstruct(
             EvidenceRef,
             dict(existing["payload"]),
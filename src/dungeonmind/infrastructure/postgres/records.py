@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import Any
 
-from psycopg import sql
+from psycopg import Connection, sql
 from pydantic import ValidationError
 
 from ...contracts.contribution import ContributionStatus, GraphContribution
@@ -33,6 +34,7 @@ from ...domain.errors import (
 from .database import (
     SCHEMA,
     PostgresDatabase,
+    SharedConnection,
     ensure_campaign,
     ensure_world,
     jsonb,
@@ -745,6 +747,8 @@ class PostgresIdentityDecisionRepository:
 class PostgresSourceRepository:
     def __init__(self, database: PostgresDatabase) -> None:
         self._database = database
+        # Stamps are read on every turn; reuse one connection for them.
+        self._stamps = SharedConnection(database)
 
     def put_artifact(self, artifact: SourceArtifactRecord) -> SourceArtifactRecord:
         fingerprint = model_fingerprint(artifact)
@@ -853,6 +857,24 @@ class PostgresSourceRepository:
             return None
         return _return_artifact(row)
 
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        if not source_artifact_ids:
+            return {}
+        with self._database.transaction() as conn:
+            rows = conn.execute(
+                sql.SQL(
+                    f"""
+                    SELECT {_ARTIFACT_SELECT}
+                    FROM {{}}.source_artifacts
+                    WHERE source_artifact_id = ANY(%s)
+                    """
+                ).format(sql.Identifier(SCHEMA)),
+                (sorted(set(source_artifact_ids)),),
+            ).fetchall()
+        return {row["source_artifact_id"]: _return_artifact(row) for row in rows}
+
     def put_revision(self, revision: SourceRevision) -> SourceRevision:
         fingerprint = model_fingerprint(revision)
         with self._database.transaction() as conn:
@@ -923,6 +945,22 @@ class PostgresSourceRepository:
             return None
         return _return_revision(row)
 
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        if not source_revision_ids:
+            return {}
+        with self._database.transaction() as conn:
+            rows = conn.execute(
+                sql.SQL(
+                    f"""
+                    SELECT {_REVISION_SELECT}
+                    FROM {{}}.source_revisions
+                    WHERE source_revision_id = ANY(%s)
+                    """
+                ).format(sql.Identifier(SCHEMA)),
+                (sorted(set(source_revision_ids)),),
+            ).fetchall()
+        return {row["source_revision_id"]: _return_revision(row) for row in rows}
+
     def list_revisions(self, source_artifact_id: str) -> list[SourceRevision]:
         with self._database.transaction() as conn:
             rows = conn.execute(
@@ -938,67 +976,88 @@ class PostgresSourceRepository:
             ).fetchall()
         return [_return_revision(row) for row in rows]
 
+    def state_version(self, world_id: str) -> str:
+        # Bumped by statement triggers on source_artifacts / source_revisions in
+        # the writing transaction, so a new stamp is visible only after commit.
+        # A world with no source writes yet has no row.
+        with self._stamps.use() as conn:
+            row = conn.execute(
+                sql.SQL(
+                    """
+                    SELECT generation
+                    FROM {}.source_state_generation
+                    WHERE world_id = %s
+                    """
+                ).format(sql.Identifier(SCHEMA)),
+                (world_id,),
+            ).fetchone()
+        return str(row["generation"]) if row is not None else "0"
+
+
+def create_session_in_transaction(
+    conn: Connection[Any], session: GraphRetrievalSession
+) -> GraphRetrievalSession:
+    """Insert/reconcile one session; its world and evidence refs must already exist."""
+    fingerprint = model_fingerprint(session)
+    conn.execute(
+        sql.SQL(
+            """
+            INSERT INTO {}.retrieval_sessions (
+                session_id,
+                thread_id,
+                world_id,
+                revision_id,
+                created_at,
+                updated_at,
+                schema_version,
+                record_fingerprint,
+                payload
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (session_id) DO NOTHING
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (
+            session.session_id,
+            session.thread_id,
+            session.snapshot.world_id,
+            session.snapshot.revision_id,
+            session.created_at,
+            session.updated_at,
+            session.schema_version,
+            fingerprint,
+            jsonb(dump_payload(session)),
+        ),
+    )
+    row = conn.execute(
+        sql.SQL(
+            f"""
+            SELECT {_SESSION_SELECT}
+            FROM {{}}.retrieval_sessions
+            WHERE session_id = %s
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (session.session_id,),
+    ).fetchone()
+    if row is None:
+        raise PersistenceIntegrityError(
+            f"retrieval session {session.session_id!r} missing after insert/reconcile"
+        )
+    if row["record_fingerprint"] != fingerprint:
+        raise IdempotencyConflictError(
+            f"retrieval session {session.session_id!r} already exists"
+        )
+    return _return_session(row)
+
 
 class PostgresRetrievalSessionRepository:
     def __init__(self, database: PostgresDatabase) -> None:
         self._database = database
 
     def create(self, session: GraphRetrievalSession) -> GraphRetrievalSession:
-        fingerprint = model_fingerprint(session)
-        world_id = session.snapshot.world_id
-        revision_id = session.snapshot.revision_id
         with self._database.transaction() as conn:
-            ensure_world(conn, world_id, created_at=session.created_at)
+            ensure_world(conn, session.snapshot.world_id, created_at=session.created_at)
             upsert_evidence_refs(conn, session.evidence)
-            conn.execute(
-                sql.SQL(
-                    """
-                    INSERT INTO {}.retrieval_sessions (
-                        session_id,
-                        thread_id,
-                        world_id,
-                        revision_id,
-                        created_at,
-                        updated_at,
-                        schema_version,
-                        record_fingerprint,
-                        payload
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (session_id) DO NOTHING
-                    """
-                ).format(sql.Identifier(SCHEMA)),
-                (
-                    session.session_id,
-                    session.thread_id,
-                    world_id,
-                    revision_id,
-                    session.created_at,
-                    session.updated_at,
-                    session.schema_version,
-                    fingerprint,
-                    jsonb(dump_payload(session)),
-                ),
-            )
-            row = conn.execute(
-                sql.SQL(
-                    f"""
-                    SELECT {_SESSION_SELECT}
-                    FROM {{}}.retrieval_sessions
-                    WHERE session_id = %s
-                    """
-                ).format(sql.Identifier(SCHEMA)),
-                (session.session_id,),
-            ).fetchone()
-            if row is None:
-                raise PersistenceIntegrityError(
-                    f"retrieval session {session.session_id!r} missing after "
-                    "insert/reconcile"
-                )
-            if row["record_fingerprint"] != fingerprint:
-                raise IdempotencyConflictError(
-                    f"retrieval session {session.session_id!r} already exists"
-                )
-            return _return_session(row)
+            return create_session_in_transaction(conn, session)
 
     def get(self, session_id: str) -> GraphRetrievalSession | None:
         with self._database.transaction() as conn:
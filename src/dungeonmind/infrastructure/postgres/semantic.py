@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from datetime import datetime
 from typing import Any
 
 from pgvector.psycopg import register_vector
 from psycopg import Connection, sql
 
-from ...application.repositories import normalize_semantic_document_batch
+from ...application.repositories import (
+    normalize_semantic_document_batch,
+    semantic_document_columns,
+)
 from ...contracts.semantic import (
     CandidateChannel,
     EmbeddingRun,
@@ -642,6 +645,33 @@ class PostgresSemanticDocumentRepository:
                 return None
             return _row_to_semantic_document(row).model_copy(deep=True)
 
+    def get_many(
+        self,
+        semantic_document_ids: Collection[str],
+        *,
+        columns: Collection[str],
+    ) -> dict[str, dict[str, str | None]]:
+        selected = semantic_document_columns(columns)
+        ids = sorted(set(semantic_document_ids))
+        if not ids:
+            return {}
+        # Plain columns only: no vector type to register, no payload to rebuild.
+        with self._db.transaction() as conn:
+            rows = conn.execute(
+                sql.SQL(
+                    """
+                    SELECT semantic_document_id AS _id, {}
+                    FROM {}.semantic_documents
+                    WHERE semantic_document_id = ANY(%s)
+                    """
+                ).format(
+                    sql.SQL(", ").join(sql.Identifier(column) for column in selected),
+                    sql.Identifier(SCHEMA),
+                ),
+                (ids,),
+            ).fetchall()
+        return {row["_id"]: {column: row[column] for column in selected} for row in rows}
+
     def delete_run_documents(self, materialization_run_id: str) -> int:
         with self._db.transaction() as conn:
             row = _lock_embedding_run(conn, materialization_run_id)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from psycopg import sql
+from psycopg import Connection, sql
 
 from ...contracts.mind_turn import MindTurnRequest, MindTurnResponse
 from ...domain.canonical import canonical_sha256
@@ -59,6 +59,128 @@ def _verify_binding_row(row: dict[str, Any], *, thread_id: str) -> dict[str, Any
     return row
 
 
+def append_turn_in_transaction(
+    conn: Connection[Any], request: MindTurnRequest, response: MindTurnResponse
+) -> None:
+    """Insert/reconcile one turn row; evidence refs are the caller's to upsert."""
+    request_fp = model_fingerprint(request)
+    response_fp = model_fingerprint(response)
+    binding = conn.execute(
+        sql.SQL(
+            f"""
+            SELECT {_BINDING_SELECT}
+            FROM {{}}.mind_threads
+            WHERE thread_id = %s
+            FOR UPDATE
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (request.thread_id,),
+    ).fetchone()
+    if binding is None:
+        raise DocumentNotFoundError(f"thread {request.thread_id!r} not found")
+    binding = _verify_binding_row(binding, thread_id=request.thread_id)
+    if request.world_id != binding["world_id"]:
+        raise ThreadContextMismatchError(
+            f"request world_id {request.world_id!r} != thread world "
+            f"{binding['world_id']!r}"
+        )
+    if request.campaign_id != binding["campaign_id"]:
+        raise ThreadContextMismatchError(
+            f"request campaign_id {request.campaign_id!r} != thread campaign "
+            f"{binding['campaign_id']!r}"
+        )
+    if request.caller_scope.tenant_id != binding["tenant_id"]:
+        raise ThreadContextMismatchError(
+            f"request tenant_id {request.caller_scope.tenant_id!r} != thread tenant "
+            f"{binding['tenant_id']!r}"
+        )
+    if request.caller_scope.caller_id != binding["caller_id"]:
+        raise ThreadContextMismatchError(
+            f"request caller_id {request.caller_scope.caller_id!r} != thread caller "
+            f"{binding['caller_id']!r}"
+        )
+    if response.request_id != request.request_id:
+        raise ThreadContextMismatchError(
+            f"response.request_id {response.request_id!r} != "
+            f"request.request_id {request.request_id!r}"
+        )
+    if response.thread_id != request.thread_id:
+        raise ThreadContextMismatchError(
+            f"response.thread_id {response.thread_id!r} != "
+            f"request.thread_id {request.thread_id!r}"
+        )
+    if response.world_id != request.world_id:
+        raise ThreadContextMismatchError(
+            f"response.world_id {response.world_id!r} != "
+            f"request.world_id {request.world_id!r}"
+        )
+    if response.campaign_id != request.campaign_id:
+        raise ThreadContextMismatchError(
+            f"response.campaign_id {response.campaign_id!r} != "
+            f"request.campaign_id {request.campaign_id!r}"
+        )
+
+    conflicts = conn.execute(
+        sql.SQL(
+            """
+            SELECT
+                turn_id,
+                request_id,
+                request_fingerprint,
+                response_fingerprint,
+                request_payload,
+                response_payload
+            FROM {}.mind_turns
+            WHERE thread_id = %s
+              AND (turn_id = %s OR request_id = %s)
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (request.thread_id, response.turn_id, request.request_id),
+    ).fetchall()
+    for row in conflicts:
+        if row["turn_id"] == response.turn_id:
+            if (
+                row["request_fingerprint"] == request_fp
+                and row["response_fingerprint"] == response_fp
+            ):
+                # Reconstruct before accepting exact replay so corrupted
+                # JSONB cannot be silently blessed by fingerprint match.
+                _row_to_turn_pair(row, thread_id=request.thread_id)
+                return
+            raise IdempotencyConflictError(
+                f"turn_id {response.turn_id!r} replayed with different payload"
+            )
+        if row["request_id"] == request.request_id:
+            raise IdempotencyConflictError(
+                f"request_id {request.request_id!r} already bound to a different turn"
+            )
+
+    conn.execute(
+        sql.SQL(
+            """
+            INSERT INTO {}.mind_turns (
+                thread_id,
+                turn_id,
+                request_id,
+                request_fingerprint,
+                response_fingerprint,
+                request_payload,
+                response_payload
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """
+        ).format(sql.Identifier(SCHEMA)),
+        (
+            request.thread_id,
+            response.turn_id,
+            request.request_id,
+            request_fp,
+            response_fp,
+            jsonb(dump_payload(request)),
+            jsonb(dump_payload(response)),
+        ),
+    )
+
+
 class PostgresMindThreadRepository:
     """Caller-private, cross-surface threads with the same invariants as memory."""
 
@@ -130,65 +252,28 @@ class PostgresMindThreadRepository:
             return thread_id
 
     def append_turn(self, request: MindTurnRequest, response: MindTurnResponse) -> None:
-        request_fp = model_fingerprint(request)
-        response_fp = model_fingerprint(response)
         with self._db.transaction() as conn:
-            binding = conn.execute(
+            append_turn_in_transaction(conn, request, response)
+            upsert_evidence_refs(conn, response.evidence)
+
+    def list_turns(
+        self, thread_id: str
+    ) -> list[tuple[MindTurnRequest, MindTurnResponse]]:
+        with self._db.transaction() as conn:
+            thread = conn.execute(
                 sql.SQL(
                     f"""
                     SELECT {_BINDING_SELECT}
                     FROM {{}}.mind_threads
                     WHERE thread_id = %s
-                    FOR UPDATE
                     """
                 ).format(sql.Identifier(SCHEMA)),
-                (request.thread_id,),
+                (thread_id,),
             ).fetchone()
-            if binding is None:
-                raise DocumentNotFoundError(f"thread {request.thread_id!r} not found")
-            binding = _verify_binding_row(binding, thread_id=request.thread_id)
-            if request.world_id != binding["world_id"]:
-                raise ThreadContextMismatchError(
-                    f"request world_id {request.world_id!r} != thread world "
-                    f"{binding['world_id']!r}"
-                )
-            if request.campaign_id != binding["campaign_id"]:
-                raise ThreadContextMismatchError(
-                    f"request campaign_id {request.campaign_id!r} != thread campaign "
-                    f"{binding['campaign_id']!r}"
-                )
-            if request.caller_scope.tenant_id != binding["tenant_id"]:
-                raise ThreadContextMismatchError(
-                    f"request tenant_id {request.caller_scope.tenant_id!r} != thread tenant "
-                    f"{binding['tenant_id']!r}"
-                )
-            if request.caller_scope.caller_id != binding["caller_id"]:
-                raise ThreadContextMismatchError(
-                    f"request caller_id {request.caller_scope.caller_id!r} != thread caller "
-                    f"{binding['caller_id']!r}"
-                )
-            if response.request_id != request.request_id:
-                raise ThreadContextMismatchError(
-                    f"response.request_id {response.request_id!r} != "
-                    f"request.request_id {request.request_id!r}"
-                )
-            if response.thread_id != request.thread_id:
-                raise ThreadContextMismatchError(
-                    f"response.thread_id {response.thread_id!r} != "
-                    f"request.thread_id {request.thread_id!r}"
-                )
-            if response.world_id != request.world_id:
-                raise ThreadContextMismatchError(
-                    f"response.world_id {response.world_id!r} != "
-                    f"request.world_id {request.world_id!r}"
-                )
-            if response.campaign_id != request.campaign_id:
-                raise ThreadContextMismatchError(
-                    f"response.campaign_id {response.campaign_id!r} != "
-                    f"request.campaign_id {request.campaign_id!r}"
-                )
-
-            conflicts = conn.execute(
+            if thread is None:
+                return []
+            _verify_binding_row(thread, thread_id=thread_id)
+            rows = conn.execute(
                 sql.SQL(
                     """
                     SELECT
@@ -200,59 +285,17 @@ class PostgresMindThreadRepository:
                         response_payload
                     FROM {}.mind_turns
                     WHERE thread_id = %s
-                      AND (turn_id = %s OR request_id = %s)
+                    ORDER BY ordinal ASC
                     """
                 ).format(sql.Identifier(SCHEMA)),
-                (request.thread_id, response.turn_id, request.request_id),
+                (thread_id,),
             ).fetchall()
-            for row in conflicts:
-                if row["turn_id"] == response.turn_id:
-                    if (
-                        row["request_fingerprint"] == request_fp
-                        and row["response_fingerprint"] == response_fp
-                    ):
-                        # Reconstruct before accepting exact replay so corrupted
-                        # JSONB cannot be silently blessed by fingerprint match.
-                        _row_to_turn_pair(row, thread_id=request.thread_id)
-                        upsert_evidence_refs(conn, response.evidence)
-                        return
-                    raise IdempotencyConflictError(
-                        f"turn_id {response.turn_id!r} replayed with different payload"
-                    )
-                if row["request_id"] == request.request_id:
-                    raise IdempotencyConflictError(
-                        f"request_id {request.request_id!r} already bound to a different turn"
-                    )
-
-            conn.execute(
-                sql.SQL(
-                    """
-                    INSERT INTO {}.mind_turns (
-                        thread_id,
-                        turn_id,
-                        request_id,
-                        request_fingerprint,
-                        response_fingerprint,
-                        request_payload,
-                        response_payload
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """
-                ).format(sql.Identifier(SCHEMA)),
-                (
-                    request.thread_id,
-                    response.turn_id,
-                    request.request_id,
-                    request_fp,
-                    response_fp,
-                    jsonb(dump_payload(request)),
-                    jsonb(dump_payload(response)),
-                ),
-            )
-            upsert_evidence_refs(conn, response.evidence)
+            return [_row_to_turn_pair(row, thread_id=thread_id) for row in rows]
 
-    def list_turns(
-        self, thread_id: str
-    ) -> list[tuple[MindTurnRequest, MindTurnResponse]]:
+    def get_turn_by_request_id(
+        self, thread_id: str, request_id: str
+    ) -> tuple[MindTurnRequest, MindTurnResponse] | None:
+        # Served by the UNIQUE (thread_id, request_id) index on mind_turns.
         with self._db.transaction() as conn:
             thread = conn.execute(
                 sql.SQL(
@@ -265,9 +308,9 @@ class PostgresMindThreadRepository:
                 (thread_id,),
             ).fetchone()
             if thread is None:
-                return []
+                return None
             _verify_binding_row(thread, thread_id=thread_id)
-            rows = conn.execute(
+            row = conn.execute(
                 sql.SQL(
                     """
                     SELECT
@@ -279,12 +322,12 @@ class PostgresMindThreadRepository:
                         response_payload
                     FROM {}.mind_turns
                     WHERE thread_id = %s
-                    ORDER BY ordinal ASC
+                      AND request_id = %s
                     """
                 ).format(sql.Identifier(SCHEMA)),
-                (thread_id,),
-            ).fetchall()
-            return [_row_to_turn_pair(row, thread_id=thread_id) for row in rows]
+                (thread_id, request_id),
+            ).fetchone()
+            return None if row is None else _row_to_turn_pair(row, thread_id=thread_id)
 
 
 def _row_to_turn_pair(
@@ -0,0 +1,30 @@
+"""PostgreSQL adapter for TurnCommitRepository."""
+
+from __future__ import annotations
+
+from ...contracts.mind_turn import MindTurnRequest, MindTurnResponse
+from ...contracts.retrieval import GraphRetrievalSession
+from .database import PostgresDatabase, ensure_world
+from .evidence_extract import upsert_evidence_refs
+from .records import create_session_in_transaction
+from .threads import append_turn_in_transaction
+
+
+class PostgresTurnCommitRepository:
+    """Session, turn row and evidence refs on one connection in one transaction."""
+
+    def __init__(self, database: PostgresDatabase) -> None:
+        self._db = database
+
+    def commit_turn(
+        self,
+        session: GraphRetrievalSession,
+        request: MindTurnRequest,
+        response: MindTurnResponse,
+    ) -> None:
+        with self._db.transaction() as conn:
+            ensure_world(conn, session.snapshot.world_id, created_at=session.created_at)
+            # The response ledger is the session's; one batch covers both.
+            upsert_evidence_refs(conn, [*session.evidence, *response.evidence])
+            create_session_in_transaction(conn, session)
+            append_turn_in_transaction(conn, request, response)
@@ -15,7 +15,7 @@ from typing import Any
 
 from pydantic import ValidationError
 
-from ..application.semantic_profiles import descriptor_sha256
+from ..application.semantic_profiles import ProfilePin, descriptor_sha256
 from ..contracts.semantic_profile import (
     SemanticProfileDescriptor,
     SemanticProfileRegistryConfig,
@@ -40,6 +40,14 @@ def _validation_messages(exc: ValidationError) -> list[str]:
     return list(dict.fromkeys(messages))
 
 
+def _pins(descriptors: Iterable[SemanticProfileDescriptor]) -> tuple[ProfilePin, ...]:
+    return tuple(
+        sorted(
+            (d.profile_id, d.profile_revision, descriptor_sha256(d)) for d in descriptors
+        )
+    )
+
+
 class StaticSemanticProfileRegistry:
     """In-memory registry keyed by ``(profile_id, profile_revision)``."""
 
@@ -59,6 +67,10 @@ class StaticSemanticProfileRegistry:
                     },
                 )
             self._by_key[key] = descriptor.model_copy(deep=True)
+        self._pins = _pins(self._by_key.values())
+
+    def descriptor_pins(self) -> tuple[ProfilePin, ...]:
+        return self._pins
 
     def get(
         self, profile_id: str, profile_revision: str
@@ -76,6 +88,10 @@ class FilesystemSemanticProfileRegistry:
         path = Path(config_path)
         self._by_key: dict[tuple[str, str], SemanticProfileDescriptor] = {}
         self._load(path)
+        self._pins = _pins(self._by_key.values())
+
+    def descriptor_pins(self) -> tuple[ProfilePin, ...]:
+        return self._pins
 
     @classmethod
     def from_config_path(cls, config_path: Path | str) -> FilesystemSemanticProfileRegistry:
@@ -0,0 +1,73 @@
+"""Local-disk adapter for :class:`SnapshotArtifactStore`.
+
+Artifacts are memory-mapped on load and written through a same-directory
+temporary file plus ``os.replace``, so readers never observe a torn file.
+Artifacts that fail to decode for their key are deleted and rebuilt by the
+caller. Every filesystem error degrades to "no artifact": the stored payload
+stays the source of truth and a cold parse is always available.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import threading
+from pathlib import Path
+
+from ..application.graph_snapshot import ParsedGraphSnapshot
+from ..application.graph_snapshot_artifacts import (
+    SnapshotArtifactKey,
+    decode_snapshot_artifact,
+    encode_snapshot_artifact,
+)
+from ..domain.errors import PersistenceIntegrityError
+
+
+class FilesystemSnapshotArtifactStore:
+    """One file per artifact key under ``root`` (created on first save)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, key: SnapshotArtifactKey) -> Path:
+        return self.root / key.artifact_name
+
+    def load(self, key: SnapshotArtifactKey) -> ParsedGraphSnapshot | None:
+        path = self._path(key)
+        try:
+            with path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    snapshot = None
+                else:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        snapshot = decode_snapshot_artifact(mapped, key=key)
+        except OSError:
+            return None
+        if snapshot is None:
+            self._discard(path)
+        return snapshot
+
+    def save(self, key: SnapshotArtifactKey, snapshot: ParsedGraphSnapshot) -> None:
+        try:
+            data = encode_snapshot_artifact(snapshot, key=key)
+        except (ValueError, PersistenceIntegrityError):
+            # Mismatched keys, or a lazy snapshot holding an object that fails
+            # validation: nothing trustworthy to persist.
+            return
+        path = self._path(key)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with temporary.open("wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, path)
+        except OSError:
+            self._discard(temporary)
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
@@ -18,13 +18,17 @@ from ..application.fictional_time_query_service import (
     query_fictional_time_shadow_at_revision,
 )
 from ..application.graph_snapshot import GraphSnapshotReader
-from ..application.mind_turn import Clock, MindTurnService
+from ..application.graph_snapshot_cache import ParsedSnapshotCache
+from ..application.mind_turn import AsyncMindTurnService, Clock, MindTurnService
 from ..application.repositories import (
     ContributionReviewRepository,
     FinalizedReviewPublicationRepository,
     WorldGraphRepository,
 )
 from ..application.review_publication import publish_finalized_review
+from ..application.source_cache import CachingSourceRepository
+from ..application.turn_instrumentation import TurnStageAggregator
+from ..application.verified_digests import VerifiedDigestRegistry
 from ..contracts.fictional_time import FictionalTimeQueryResult
 from ..contracts.fictional_time_transport import FictionalTimeShadowQueryRequest
 from ..contracts.mind_turn import MindTurnRequest, MindTurnResponse
@@ -54,6 +58,7 @@ class MindTurnAppState:
         readiness_probe: Callable[[], dict[str, Any]],
     ) -> None:
         self.service = service
+        self.async_service = AsyncMindTurnService(service)
         self.demo_binding = demo_binding
         self.readiness_probe = readiness_probe
 
@@ -64,7 +69,11 @@ def create_app(
     demo_binding: DemoAccessBinding,
     readiness_probe: Callable[[], dict[str, Any]],
     cors_origin: str | None = None,
+    turn_stages: TurnStageAggregator | None = None,
+    source_cache: CachingSourceRepository | None = None,
 ) -> FastAPI:
+    """``turn_stages``, when given, is served at ``/diagnostics/turn-stages``;
+    ``source_cache`` stats at ``/diagnostics/source-cache``."""
     app = FastAPI(title="DungeonMind Mind Turn", version="0.1.0")
     app.state.mind_turn = MindTurnAppState(
         service=service,
@@ -114,10 +123,22 @@ def create_app(
         return state.readiness_probe()
 
     @app.post("/v1/mind-turn", response_model=MindTurnResponse)
-    def mind_turn(body: MindTurnRequest) -> MindTurnResponse:
+    async def mind_turn(body: MindTurnRequest) -> MindTurnResponse:
         state: MindTurnAppState = app.state.mind_turn
         authorized = authorize_demo_request(body, binding=state.demo_binding)
-        return state.service.execute(authorized)
+        return await state.async_service.execute(authorized)
+
+    if turn_stages is not None:
+
+        @app.get("/diagnostics/turn-stages")
+        def turn_stage_diagnostics() -> dict[str, Any]:
+            return turn_stages.stats().to_json()
+
+    if source_cache is not None:
+
+        @app.get("/diagnostics/source-cache")
+        def source_cache_diagnostics() -> dict[str, Any]:
+            return source_cache.stats().to_json()
 
     return app
 
@@ -133,6 +154,8 @@ class PublicationAppState:
         clock: Clock,
         access_binding: PublicationAccessBinding,
         readiness_probe: Callable[[], dict[str, Any]],
+        snapshot_cache: ParsedSnapshotCache | None = None,
+        turn_reader: GraphSnapshotReader | None = None,
     ) -> None:
         self.review_repository = review_repository
         self.world_graph_repository = world_graph_repository
@@ -141,6 +164,8 @@ class PublicationAppState:
         self.clock = clock
         self.access_binding = access_binding
         self.readiness_probe = readiness_probe
+        self.snapshot_cache = snapshot_cache
+        self.turn_reader = turn_reader
 
 
 def create_publication_app(
@@ -152,8 +177,14 @@ def create_publication_app(
     clock: Clock,
     access_binding: PublicationAccessBinding,
     readiness_probe: Callable[[], dict[str, Any]],
+    snapshot_cache: ParsedSnapshotCache | None = None,
+    turn_reader: GraphSnapshotReader | None = None,
 ) -> FastAPI:
-    """Create the separate bearer-gated finalized-review publication host."""
+    """Create the separate bearer-gated finalized-review publication host.
+
+    ``turn_reader`` names the reader turn hosts parse with, so published heads
+    are persisted as artifacts they can load (see :func:`publish_finalized_review`).
+    """
 
     app = FastAPI(title="DungeonMind Finalized Review Publication", version="0.1.0")
     app.state.publication = PublicationAppState(
@@ -164,6 +195,8 @@ def create_publication_app(
         clock=clock,
         access_binding=access_binding,
         readiness_probe=readiness_probe,
+        snapshot_cache=snapshot_cache,
+        turn_reader=turn_reader,
     )
 
     @app.exception_handler(DungeonMindError)
@@ -238,6 +271,8 @@ def create_publication_app(
             world_graph_repository=state.world_graph_repository,
             publication_repository=state.publication_repository,
             graph_reader=state.graph_reader,
+            snapshot_cache=state.snapshot_cache,
+            turn_reader=state.turn_reader,
         )
         return JSONResponse(
             status_code=200,
@@ -256,11 +291,15 @@ class FictionalTimeQueryAppState:
         graph_reader: GraphSnapshotReader,
         access_binding: FictionalTimeQueryAccessBinding,
         readiness_probe: Callable[[], dict[str, Any]],
+        verified_digests: VerifiedDigestRegistry | None = None,
+        snapshot_cache: ParsedSnapshotCache | None = None,
     ) -> None:
         self.world_graph_repository = world_graph_repository
         self.graph_reader = graph_reader
         self.access_binding = access_binding
         self.readiness_probe = readiness_probe
+        self.verified_digests = verified_digests
+        self.snapshot_cache = snapshot_cache
 
 
 def create_fictional_time_query_app(
@@ -269,6 +308,8 @@ def create_fictional_time_query_app(
     graph_reader: GraphSnapshotReader,
     access_binding: FictionalTimeQueryAccessBinding,
     readiness_probe: Callable[[], dict[str, Any]],
+    verified_digests: VerifiedDigestRegistry | None = None,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> FastAPI:
     """Create the separate bearer-gated fictional-time shadow query host."""
 
@@ -278,6 +319,8 @@ def create_fictional_time_query_app(
         graph_reader=graph_reader,
         access_binding=access_binding,
         readiness_probe=readiness_probe,
+        verified_digests=verified_digests,
+        snapshot_cache=snapshot_cache,
     )
 
     @app.exception_handler(DungeonMindError)
@@ -344,6 +387,8 @@ def create_fictional_time_query_app(
             authorized,
             world_graph_repository=state.world_graph_repository,
             graph_reader=state.graph_reader,
+            verified_digests=state.verified_digests,
+            snapshot_cache=state.snapshot_cache,
         )
         return JSONResponse(
             status_code=200,
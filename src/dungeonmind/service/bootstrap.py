@@ -14,12 +14,23 @@ from typing import Any
 from fastapi import FastAPI
 
 from ..agents.fixture import FixtureGroundedAgentAdapter
+from ..application.context_assembly import TokenBudget
+from ..application.graph_scope_cache import EvidenceScopeIndexCache, ScopedProjectionCache
 from ..application.graph_snapshot import (
     GraphSnapshotReader,
+    NeighborhoodExpansion,
     VersionedUnionGraphSnapshotReader,
 )
+from ..application.graph_snapshot_cache import ParsedSnapshotCache
+from ..application.graph_snapshot_compact import CompactGraphSnapshotReader
 from ..application.mind_turn import FixedClock, MindTurnService
+from ..application.repositories import EmbeddingRunRepository, SourceRepository
+from ..application.request_coordination import RequestCoordinator
+from ..application.retrieval_cache import RetrievalResultCache
 from ..application.semantic_profiles import SemanticProfileRegistry
+from ..application.source_cache import CachingSourceRepository
+from ..application.turn_instrumentation import TurnStage, TurnStageAggregator
+from ..application.verified_digests import VerifiedDigestRegistry
 from ..domain.errors import (
     HeadNotFoundError,
     PersistenceIntegrityError,
@@ -28,12 +39,18 @@ from ..domain.errors import (
     SemanticProfileIntegrityError,
 )
 from ..infrastructure.fixtures.curated_mind_turn import load_curated_mind_turn_fixture
-from ..infrastructure.postgres import PostgresDatabase, PostgresRepositoryBundle
+from ..infrastructure.fixtures.tokenization import FixtureTokenizer
+from ..infrastructure.postgres import (
+    PostgresDatabase,
+    PostgresRepositoryBundle,
+    PostgresRequestCoordinator,
+)
 from ..infrastructure.semantic_profiles import (
     ENV_SEMANTIC_PROFILE_REGISTRY_PATH,
     FilesystemSemanticProfileRegistry,
     StaticSemanticProfileRegistry,
 )
+from ..infrastructure.snapshot_artifacts import FilesystemSnapshotArtifactStore
 from .api import create_app, create_fictional_time_query_app, create_publication_app
 from .demo_access import DemoAccessBinding
 from .fictional_time_access import FictionalTimeQueryAccessBinding
@@ -67,16 +84,247 @@ def load_configured_profile_registry() -> SemanticProfileRegistry:
         ) from None
 
 
+ENV_GRAPH_READER_LAZY_OBJECTS = "DUNGEONMIND_GRAPH_READER_LAZY_OBJECTS"
+
+
+def _env_flag(name: str) -> bool:
+    configured = os.environ.get(name, "").strip().lower()
+    if configured in ("", "0", "false"):
+        return False
+    if configured not in ("1", "true"):
+        raise ValueError(f"{name} must be 0, 1, true or false")
+    return True
+
+
+def _env_ints(name: str) -> list[int]:
+    configured = os.environ.get(name, "").strip()
+    if not configured:
+        return []
+    try:
+        return [int(item) for item in configured.split(",")]
+    except ValueError:
+        raise ValueError(f"{name} must be a comma-separated list of integers") from None
+
+
+def _env_int(name: str) -> int | None:
+    values = _env_ints(name)
+    if len(values) > 1:
+        raise ValueError(f"{name} must be an integer")
+    return values[0] if values else None
+
+
+def _env_strings(name: str) -> list[str]:
+    configured = os.environ.get(name, "")
+    return [item.strip() for item in configured.split(",") if item.strip()]
+
+
 def build_configured_graph_reader(
     profile_registry: SemanticProfileRegistry | None = None,
+    *,
+    allow_lazy_objects: bool = False,
 ) -> VersionedUnionGraphSnapshotReader:
-    """Build the shared versioned graph reader used by service and readiness."""
+    """Build the shared versioned graph reader used by service and readiness.
+
+    Only hosts that look objects up by ID (fictional-time queries) pass
+    ``allow_lazy_objects`` and honour ``DUNGEONMIND_GRAPH_READER_LAZY_OBJECTS``.
+    Hosts that validate graphs before writing them (publication) or scope whole
+    snapshots per turn (Mind Turn, which visits every object) parse eagerly.
+    """
     registry = (
         profile_registry
         if profile_registry is not None
         else load_configured_profile_registry()
     )
-    return VersionedUnionGraphSnapshotReader(profile_registry=registry)
+    return VersionedUnionGraphSnapshotReader(
+        profile_registry=registry,
+        lazy_objects=allow_lazy_objects and _env_flag(ENV_GRAPH_READER_LAZY_OBJECTS),
+    )
+
+
+ENV_GRAPH_SNAPSHOT_CACHE_BYTES = "DUNGEONMIND_GRAPH_SNAPSHOT_CACHE_BYTES"
+
+
+ENV_GRAPH_SNAPSHOT_ARTIFACT_DIR = "DUNGEONMIND_GRAPH_SNAPSHOT_ARTIFACT_DIR"
+
+
+def build_configured_snapshot_cache() -> ParsedSnapshotCache | None:
+    """Opt-in parsed-snapshot cache sized by ``DUNGEONMIND_GRAPH_SNAPSHOT_CACHE_BYTES``.
+
+    ``DUNGEONMIND_GRAPH_SNAPSHOT_ARTIFACT_DIR`` additionally persists parsed
+    snapshots on local disk for cold starts; it has no effect without the cache.
+    """
+    max_bytes = _env_int(ENV_GRAPH_SNAPSHOT_CACHE_BYTES)
+    if max_bytes is None or max_bytes <= 0:
+        return None
+    artifact_dir = os.environ.get(ENV_GRAPH_SNAPSHOT_ARTIFACT_DIR, "").strip()
+    return ParsedSnapshotCache(
+        max_bytes=max_bytes,
+        artifacts=(
+            FilesystemSnapshotArtifactStore(Path(artifact_dir)) if artifact_dir else None
+        ),
+    )
+
+
+ENV_GRAPH_SNAPSHOT_COMPACT = "DUNGEONMIND_GRAPH_SNAPSHOT_COMPACT"
+
+
+def build_configured_turn_reader(graph_reader: GraphSnapshotReader) -> GraphSnapshotReader:
+    """Wrap ``graph_reader`` in the compact backend when ``DUNGEONMIND_GRAPH_SNAPSHOT_COMPACT``."""
+    if not _env_flag(ENV_GRAPH_SNAPSHOT_COMPACT):
+        return graph_reader
+    return CompactGraphSnapshotReader(graph_reader)
+
+
+ENV_SCOPE_INDEX_CACHE_ENTRIES = "DUNGEONMIND_SCOPE_INDEX_CACHE_ENTRIES"
+
+
+def build_configured_scope_index_cache() -> EvidenceScopeIndexCache | None:
+    """Opt-in evidence scope-index cache sized by ``DUNGEONMIND_SCOPE_INDEX_CACHE_ENTRIES``."""
+    max_entries = _env_int(ENV_SCOPE_INDEX_CACHE_ENTRIES)
+    if max_entries is None or max_entries <= 0:
+        return None
+    return EvidenceScopeIndexCache(max_entries=max_entries)
+
+
+ENV_SCOPED_PROJECTION_CACHE_ENTRIES = "DUNGEONMIND_SCOPED_PROJECTION_CACHE_ENTRIES"
+
+
+def build_configured_projection_cache(
+    scope_indexes: EvidenceScopeIndexCache | None = None,
+) -> ScopedProjectionCache | None:
+    """Opt-in scoped-projection cache sized by ``DUNGEONMIND_SCOPED_PROJECTION_CACHE_ENTRIES``.
+
+    ``scope_indexes`` is shared with the turn service when configured.
+    """
+    max_entries = _env_int(ENV_SCOPED_PROJECTION_CACHE_ENTRIES)
+    if max_entries is None or max_entries <= 0:
+        return None
+    return ScopedProjectionCache(max_entries=max_entries, scope_indexes=scope_indexes)
+
+
+ENV_RETRIEVAL_CACHE_ENTRIES = "DUNGEONMIND_RETRIEVAL_CACHE_ENTRIES"
+
+
+def build_configured_retrieval_cache(
+    embedding_runs: EmbeddingRunRepository,
+) -> RetrievalResultCache | None:
+    """Opt-in cross-thread retrieval cache sized by ``DUNGEONMIND_RETRIEVAL_CACHE_ENTRIES``."""
+    max_entries = _env_int(ENV_RETRIEVAL_CACHE_ENTRIES)
+    if max_entries is None or max_entries <= 0:
+        return None
+    return RetrievalResultCache(embedding_runs, max_entries=max_entries)
+
+
+ENV_SOURCE_CACHE_ENTRIES = "DUNGEONMIND_SOURCE_CACHE_ENTRIES"
+
+
+def build_configured_source_cache(sources: SourceRepository) -> CachingSourceRepository | None:
+    """Opt-in read-through cache over ``sources`` sized by ``DUNGEONMIND_SOURCE_CACHE_ENTRIES``."""
+    max_entries = _env_int(ENV_SOURCE_CACHE_ENTRIES)
+    if max_entries is None or max_entries <= 0:
+        return None
+    return CachingSourceRepository(sources, max_entries=max_entries)
+
+
+ENV_CROSS_WORKER_REQUEST_LOCKS = "DUNGEONMIND_CROSS_WORKER_REQUEST_LOCKS"
+
+
+def build_configured_request_coordinator(
+    database: PostgresDatabase,
+) -> RequestCoordinator | None:
+    """Opt-in advisory-lock coordination, ``DUNGEONMIND_CROSS_WORKER_REQUEST_LOCKS``."""
+    if not _env_flag(ENV_CROSS_WORKER_REQUEST_LOCKS):
+        return None
+    return PostgresRequestCoordinator(database)
+
+
+ENV_NEIGHBORHOOD_MAX_HOPS = "DUNGEONMIND_NEIGHBORHOOD_MAX_HOPS"
+ENV_NEIGHBORHOOD_PREDICATES = "DUNGEONMIND_NEIGHBORHOOD_PREDICATES"
+ENV_NEIGHBORHOOD_FANOUT = "DUNGEONMIND_NEIGHBORHOOD_FANOUT"
+ENV_NEIGHBORHOOD_MAX_NODES = "DUNGEONMIND_NEIGHBORHOOD_MAX_NODES"
+ENV_NEIGHBORHOOD_HUB_DEGREE = "DUNGEONMIND_NEIGHBORHOOD_HUB_DEGREE"
+ENV_NEIGHBORHOOD_HUB_FANOUT = "DUNGEONMIND_NEIGHBORHOOD_HUB_FANOUT"
+ENV_NEIGHBORHOOD_PREDICATE_PRIORITY = "DUNGEONMIND_NEIGHBORHOOD_PREDICATE_PRIORITY"
+
+
+def build_configured_neighborhood_expansion() -> NeighborhoodExpansion | None:
+    """Opt-in bounded Mind Turn focus.
+
+    Enabled by ``DUNGEONMIND_NEIGHBORHOOD_MAX_HOPS`` or, for one-hop turns
+    with hub capping only, ``DUNGEONMIND_NEIGHBORHOOD_HUB_DEGREE``.
+    ``DUNGEONMIND_NEIGHBORHOOD_PREDICATES`` (comma-separated allow-list),
+    ``DUNGEONMIND_NEIGHBORHOOD_FANOUT`` (comma-separated per-hop caps),
+    ``DUNGEONMIND_NEIGHBORHOOD_MAX_NODES``, ``DUNGEONMIND_NEIGHBORHOOD_HUB_FANOUT``
+    and ``DUNGEONMIND_NEIGHBORHOOD_PREDICATE_PRIORITY`` (comma-separated,
+    highest first) bound it; unset, turns keep the one-hop focus.
+    """
+    max_hops = _env_int(ENV_NEIGHBORHOOD_MAX_HOPS)
+    hub_degree = _env_int(ENV_NEIGHBORHOOD_HUB_DEGREE)
+    if max_hops is None and hub_degree is None:
+        return None
+    max_nodes = _env_int(ENV_NEIGHBORHOOD_MAX_NODES)
+    hub_fanout = _env_int(ENV_NEIGHBORHOOD_HUB_FANOUT)
+    predicates = _env_strings(ENV_NEIGHBORHOOD_PREDICATES)
+    return NeighborhoodExpansion(
+        max_hops=max_hops if max_hops is not None else 1,
+        predicates=frozenset(predicates) if predicates else None,
+        fanout_per_hop=tuple(_env_ints(ENV_NEIGHBORHOOD_FANOUT)),
+        max_nodes=max_nodes,
+        hub_degree=hub_degree,
+        hub_fanout=hub_fanout if hub_fanout is not None else NeighborhoodExpansion.hub_fanout,
+        predicate_priority=tuple(_env_strings(ENV_NEIGHBORHOOD_PREDICATE_PRIORITY)),
+    )
+
+
+ENV_CONTEXT_TOKEN_BUDGET = "DUNGEONMIND_CONTEXT_TOKEN_BUDGET"
+
+
+def build_configured_context_budget() -> TokenBudget | None:
+    """Opt-in token-budgeted agent context, ``DUNGEONMIND_CONTEXT_TOKEN_BUDGET``.
+
+    The demo host runs the fixture agent, so tokens are counted with the
+    deterministic fixture tokenizer.
+    """
+    max_tokens = _env_int(ENV_CONTEXT_TOKEN_BUDGET)
+    if max_tokens is None or max_tokens <= 0:
+        return None
+    return TokenBudget(tokenizer=FixtureTokenizer(), max_tokens=max_tokens)
+
+
+ENV_TURN_STAGE_DIAGNOSTICS = "DUNGEONMIND_TURN_STAGE_DIAGNOSTICS"
+ENV_TURN_STAGE_BUDGETS_MS = "DUNGEONMIND_TURN_STAGE_BUDGETS_MS"
+
+
+def build_configured_turn_stages() -> TurnStageAggregator | None:
+    """Opt-in per-stage turn timings, ``DUNGEONMIND_TURN_STAGE_DIAGNOSTICS``.
+
+    ``DUNGEONMIND_TURN_STAGE_BUDGETS_MS`` takes comma-separated ``stage=ms``
+    pairs (for example ``parse=20,agent=800``); samples above a budget are
+    counted per stage.
+    """
+    if not _env_flag(ENV_TURN_STAGE_DIAGNOSTICS):
+        return None
+    budgets: dict[TurnStage, float] = {}
+    for item in _env_strings(ENV_TURN_STAGE_BUDGETS_MS):
+        stage, _, millis = item.partition("=")
+        try:
+            budgets[TurnStage(stage.strip())] = float(millis) / 1000
+        except ValueError:
+            raise ValueError(
+                f"{ENV_TURN_STAGE_BUDGETS_MS} must be comma-separated stage=ms pairs"
+            ) from None
+    return TurnStageAggregator(budgets=budgets)
+
+
+ENV_VERIFIED_DIGEST_RECHECK_INTERVAL = "DUNGEONMIND_VERIFIED_DIGEST_RECHECK_INTERVAL"
+
+
+def build_configured_verified_digests() -> VerifiedDigestRegistry | None:
+    """Opt-in digest fast path re-hashing every Nth hit per verified revision."""
+    recheck_interval = _env_int(ENV_VERIFIED_DIGEST_RECHECK_INTERVAL)
+    if recheck_interval is None or recheck_interval <= 0:
+        return None
+    return VerifiedDigestRegistry(recheck_interval=recheck_interval)
 
 
 def build_readiness_probe(
@@ -242,25 +490,38 @@ def _require_publication_database_url() -> str:
 def create_demo_app() -> FastAPI:
     """Uvicorn factory: ``uvicorn dungeonmind.service.bootstrap:create_demo_app --factory``.
 
-    B.1a retry coordination is process-local. Run a single Uvicorn worker for the
-    demo host; cross-worker uniqueness relies on repository idempotency only.
+    Retry coordination is process-local by default; run a single Uvicorn worker
+    unless ``DUNGEONMIND_CROSS_WORKER_REQUEST_LOCKS`` enables advisory-lock
+    coordination, which keeps turn execution exactly-once across workers and nodes.
     """
     fixture = load_curated_mind_turn_fixture()
     binding = DemoAccessBinding.from_mapping(fixture.authorized_demo_binding)
     database = PostgresDatabase(_require_database_url())
     bundle = PostgresRepositoryBundle(database)
     graph_reader = build_configured_graph_reader()
+    turn_stages = build_configured_turn_stages()
+    source_cache = build_configured_source_cache(bundle.sources)
+    scope_indexes = build_configured_scope_index_cache()
     service = MindTurnService(
         world_graph=bundle.world_graph,
         retrieval_sessions=bundle.retrieval_sessions,
         threads=bundle.threads,
         semantic_documents=bundle.semantic_documents,
         semantic_search=bundle.semantic_search,
-        sources=bundle.sources,
-        graph_reader=graph_reader,
+        sources=source_cache or bundle.sources,
+        graph_reader=build_configured_turn_reader(graph_reader),
         query_embedder=fixture.query_embedder,
         agent_adapter=FixtureGroundedAgentAdapter(),
         clock=FixedClock(fixture.created_at()),
+        snapshot_cache=build_configured_snapshot_cache(),
+        projection_cache=build_configured_projection_cache(scope_indexes),
+        neighborhood_expansion=build_configured_neighborhood_expansion(),
+        request_coordinator=build_configured_request_coordinator(database),
+        turn_recorder=turn_stages,
+        context_budget=build_configured_context_budget(),
+        turn_commits=bundle.turn_commits,
+        retrieval_cache=build_configured_retrieval_cache(bundle.embedding_runs),
+        scope_index_cache=scope_indexes,
     )
     cors_origin = os.environ.get("DUNGEONMIND_CORS_ORIGIN") or None
     return create_app(
@@ -274,6 +535,8 @@ def create_demo_app() -> FastAPI:
             graph_reader=graph_reader,
         ),
         cors_origin=cors_origin,
+        turn_stages=turn_stages,
+        source_cache=source_cache,
     )
 
 
@@ -299,6 +562,8 @@ def create_publication_service_app() -> FastAPI:
             bundle=bundle,
             world_id=world_id,
         ),
+        snapshot_cache=build_configured_snapshot_cache(),
+        turn_reader=build_configured_turn_reader(graph_reader),
     )
 
 
@@ -379,7 +644,7 @@ def create_fictional_time_query_service_app() -> FastAPI:
     )
     database = PostgresDatabase(_require_publication_database_url())
     bundle = PostgresRepositoryBundle(database)
-    graph_reader = build_configured_graph_reader()
+    graph_reader = build_configured_graph_reader(allow_lazy_objects=True)
     return create_fictional_time_query_app(
         world_graph_repository=bundle.world_graph,
         graph_reader=graph_reader,
@@ -388,4 +653,6 @@ def create_fictional_time_query_service_app() -> FastAPI:
             bundle=bundle,
             world_id=world_id,
         ),
+        verified_digests=build_configured_verified_digests(),
+        snapshot_cache=build_configured_snapshot_cache(),
     )
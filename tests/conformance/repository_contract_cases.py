@@ -473,6 +473,43 @@ def identity_and_source_roundtrip(bundle: RepositoryBundle) -> None:
     assert bundle.sources.get_revision("srev:1") == revision
 
 
+def source_state_version_tracks_writes(bundle: RepositoryBundle) -> None:
+    other_world = "world:stamp-other"
+    initial = bundle.sources.state_version(WORLD_ID)
+    assert bundle.sources.state_version(WORLD_ID) == initial
+    artifact = SourceArtifact(
+        source_artifact_id="src:stamp",
+        source_domain=SourceDomain.WORLDBUILDING,
+        world_id=WORLD_ID,
+        created_at=NOW,
+    )
+    bundle.sources.put_artifact(artifact)
+    after_artifact = bundle.sources.state_version(WORLD_ID)
+    assert after_artifact != initial
+    bundle.sources.put_artifact(artifact)
+    assert bundle.sources.state_version(WORLD_ID) == after_artifact
+    bundle.sources.put_revision(
+        SourceRevision(
+            source_revision_id="srev:stamp",
+            source_artifact_id="src:stamp",
+            content_sha256="cd" * 32,
+            locator="r2://bucket/stamp",
+            created_at=NOW,
+        )
+    )
+    after_revision = bundle.sources.state_version(WORLD_ID)
+    assert after_revision not in {initial, after_artifact}
+
+    other_initial = bundle.sources.state_version(other_world)
+    bundle.sources.put_artifact(
+        artifact.model_copy(
+            update={"source_artifact_id": "src:stamp-other", "world_id": other_world}
+        )
+    )
+    assert bundle.sources.state_version(other_world) != other_initial
+    assert bundle.sources.state_version(WORLD_ID) == after_revision
+
+
 CASES: list[tuple[str, Callable[[RepositoryBundle], None]]] = [
     ("exact_replay_contribution", exact_replay_contribution),
     ("conflicting_replay_contribution", conflicting_replay_contribution),
@@ -487,4 +524,5 @@ CASES: list[tuple[str, Callable[[RepositoryBundle], None]]] = [
     ("scope_visibility_filtering", scope_visibility_filtering),
     ("graph_publish_genesis_and_stale_parent", graph_publish_genesis_and_stale_parent),
     ("identity_and_source_roundtrip", identity_and_source_roundtrip),
+    ("source_state_version_tracks_writes", source_state_version_tracks_writes),
 ]
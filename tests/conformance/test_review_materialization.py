@@ -14,6 +14,7 @@ import pytest
 from dungeonmind.application.graph_snapshot import (
     GraphRelationshipView,
     UnionGraphV3SnapshotReader,
+    derive_child_snapshot,
 )
 from dungeonmind.application.review_materialization import (
     materialize_finalized_review,
@@ -730,3 +731,26 @@ def test_output_relationship_triple_and_evidence_are_revalidated() -> None:
     with pytest.raises(ContributionMaterializationError) as exc:
         _materialize(_state(), parent, _TamperOutputReader(reader))
     _assert_reason(exc, "output_graph_validation")
+
+
+@pytest.mark.conformance
+def test_snapshot_delta_applied_to_parent_equals_output_reparse() -> None:
+    parent, reader = _parent_inputs()
+    result = _materialize(_state(), parent, reader)
+    parsed_parent = reader.parse(
+        graph_schema=parent.revision.graph_schema,
+        graph_payload=parent.graph_payload,
+    )
+
+    derived = derive_child_snapshot(parsed_parent, result.snapshot_delta)
+    full = reader.parse(graph_schema=result.graph_schema, graph_payload=result.graph_payload)
+
+    assert list(derived.objects) == list(full.objects)
+    assert derived.objects == full.objects
+    assert derived.relationships == full.relationships
+    assert derived.evidence == full.evidence
+    assert derived.label_index == full.label_index
+    assert derived.alias_index == full.alias_index
+    assert derived.subject_index == full.subject_index
+    assert derived.object_index == full.object_index
+    assert derived.predicate_index == full.predicate_index
@@ -20,6 +20,11 @@ from dungeonmind.application import (
     publish_finalized_review,
 )
 from dungeonmind.application.graph_snapshot import UnionGraphV3SnapshotReader
+from dungeonmind.application.graph_snapshot_cache import ParsedSnapshotCache
+from dungeonmind.application.graph_snapshot_compact import (
+    CompactGraphSnapshotReader,
+    is_compact_snapshot,
+)
 from dungeonmind.contracts.contribution_review import ContributionReviewState
 from dungeonmind.contracts.graph import (
     PublishRevisionCommand,
@@ -46,6 +51,7 @@ from dungeonmind.infrastructure.memory import (
     InMemoryWorldGraphRepository,
 )
 from dungeonmind.infrastructure.semantic_profiles import StaticSemanticProfileRegistry
+from dungeonmind.infrastructure.snapshot_artifacts import FilesystemSnapshotArtifactStore
 
 FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
 GRAPH_FIXTURE = FIXTURES / "dungeonmind_dnd/gatewatch-world-graph-v3.json"
@@ -298,6 +304,7 @@ def _publish(
     published_at: datetime = PUBLISHED_AT,
     review_id: str = REVIEW_ID,
     publication_repository: Any | None = None,
+    snapshot_cache: ParsedSnapshotCache | None = None,
 ) -> FinalizedReviewPublication:
     if publication_repository is None:
         owner = getattr(repository, "inner", repository)
@@ -316,6 +323,7 @@ def _publish(
         world_graph_repository=repository,
         publication_repository=publication_repository,
         graph_reader=reader,
+        snapshot_cache=snapshot_cache,
     )
 
 
@@ -374,6 +382,8 @@ def test_public_seam_accepts_only_durable_review_identifiers() -> None:
         "world_graph_repository",
         "publication_repository",
         "graph_reader",
+        "snapshot_cache",
+        "turn_reader",
     }
     assert not names & {
         "state",
@@ -940,3 +950,55 @@ def test_failed_world_rollback_preserves_concurrent_other_world_commit() -> None
     assert graph.get_revision(world_a, commands[world_a].expected_published_revision_id) is None
     assert publication.get_for_review(world_a, "review:a") is None
     assert publication.get_for_review(world_b, "review:b") == winning
+
+
+class _CountingV3Reader(UnionGraphV3SnapshotReader):
+    parse_calls = 0
+
+    def parse(self, *, graph_schema: str, graph_payload: dict[str, Any]) -> Any:
+        self.parse_calls += 1
+        return super().parse(graph_schema=graph_schema, graph_payload=graph_payload)
+
+
+@pytest.mark.conformance
+@pytest.mark.parametrize("compact", [False, True])
+def test_published_head_is_persisted_for_turn_hosts(tmp_path: Path, compact: bool) -> None:
+    graph = InMemoryWorldGraphRepository()
+    _parent, reader = _seed_graph(graph)
+    reviews, _ = _seed_review()
+    store = FilesystemSnapshotArtifactStore(tmp_path)
+    publication_cache = ParsedSnapshotCache(max_bytes=50_000_000, artifacts=store)
+    stored_parent = graph.get_revision(WORLD_ID, PARENT_REVISION_ID)
+    assert stored_parent is not None
+    publication_cache.get_or_parse(stored_parent, reader=reader)
+    turn_parser = _CountingV3Reader(reader.profile_registry)
+    turn_reader = CompactGraphSnapshotReader(turn_parser) if compact else turn_parser
+
+    publish_finalized_review(
+        WORLD_ID,
+        REVIEW_ID,
+        published_at=PUBLISHED_AT,
+        review_repository=reviews,
+        world_graph_repository=graph,
+        publication_repository=InMemoryFinalizedReviewPublicationRepository(reviews, graph),
+        graph_reader=reader,
+        snapshot_cache=publication_cache,
+        turn_reader=turn_reader,
+    )
+
+    published = graph.get_revision(WORLD_ID, PUBLISHED_REVISION_ID)
+    assert published is not None
+    assert publication_cache.get(published.revision, reader=reader) is None
+    turn_cache = ParsedSnapshotCache(max_bytes=50_000_000, artifacts=store)
+    loaded = turn_cache.get_or_parse(published, reader=turn_reader)
+    assert (turn_parser.parse_calls, turn_cache.stats().artifact_loads) == (0, 1)
+    assert is_compact_snapshot(loaded) is compact
+    full = reader.parse(
+        graph_schema=published.revision.graph_schema,
+        graph_payload=published.graph_payload,
+    )
+    assert dict(loaded.objects.items()) == full.objects
+    assert dict(loaded.relationships.items()) == full.relationships
+    assert loaded.evidence == full.evidence
+    assert loaded.alias_index == full.alias_index
+    assert loaded.subject_index == full.subject_index
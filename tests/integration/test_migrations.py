@@ -22,6 +22,7 @@ EXPECTED_TABLES = {
     "finalized_review_publications",
     "source_artifacts",
     "source_revisions",
+    "source_state_generation",
     "evidence_refs",
     "graph_contributions",
     "contribution_reviews",
@@ -68,7 +69,7 @@ def test_vector_extension_and_schema_tables(db) -> None:
             "SELECT version_num FROM dungeonmind.alembic_version"
         ).fetchone()
         assert version is not None
-        assert version["version_num"] == "0005_source_created_at_null"
+        assert version["version_num"] == "0006_source_state_generation"
 
         constraints = conn.execute(
             """
@@ -136,7 +137,7 @@ def test_migrate_empty_database_roundtrip(database_url: str) -> None:
             version = conn.execute(
                 "SELECT version_num FROM dungeonmind.alembic_version"
             ).fetchone()
-            assert version["version_num"] == "0005_source_created_at_null"
+            assert version["version_num"] == "0006_source_state_generation"
             tables = conn.execute(
                 """
                 SELECT COUNT(*) AS n
@@ -554,3 +554,57 @@ def test_concurrent_conflicting_semantic_document_across_runs(
     stored = docs_a.get("sdoc:cross-run")
     assert stored is not None
     assert stored.materialization_run_id == successes[0]
+
+
+@pytest.mark.integration
+def test_advisory_request_lock_serializes_identical_keys(pg) -> None:
+    from dungeonmind.infrastructure.postgres import PostgresRequestCoordinator
+
+    # Separate coordinators stand in for separate workers sharing the database.
+    first = PostgresRequestCoordinator(pg.database)
+    second = PostgresRequestCoordinator(pg.database)
+    events: list[str] = []
+    holding = threading.Event()
+
+    def _contender() -> None:
+        assert holding.wait(timeout=5)
+        with second.hold("thr:lock", "req:same"):
+            events.append("second")
+
+    contender = threading.Thread(target=_contender)
+    contender.start()
+    with first.hold("thr:lock", "req:same"):
+        holding.set()
+        # Other keys never wait on this one.
+        with second.hold("thr:lock", "req:other"):
+            events.append("other")
+        time.sleep(0.2)
+        events.append("first")
+    contender.join(timeout=5)
+
+    assert not contender.is_alive()
+    assert events == ["other", "first", "second"]
+
+
+@pytest.mark.integration
+def test_advisory_request_lock_is_not_held_in_a_transaction(pg) -> None:
+    from dungeonmind.infrastructure.postgres import PostgresRequestCoordinator
+
+    coordinator = PostgresRequestCoordinator(pg.database)
+    with coordinator.hold("thr:lock", "req:session"), pg.database.connect() as conn:
+        holders = conn.execute(
+            """
+            SELECT a.state
+            FROM pg_locks AS l
+            JOIN pg_stat_activity AS a USING (pid)
+            WHERE l.locktype = 'advisory' AND l.granted
+            """
+        ).fetchall()
+
+    assert holders
+    assert all(row["state"] == "idle" for row in holders)
+    with pg.database.connect() as conn:
+        released = conn.execute(
+            "SELECT count(*) AS n FROM pg_locks WHERE locktype = 'advisory'"
+        ).fetchone()
+    assert released["n"] == 0
@@ -90,6 +90,9 @@ def test_contribution_identity_source_session_roundtrip(pg) -> None:
     pg.sources.put_revision(revision)
     assert pg.sources.get_artifact("src:pg") == artifact
     assert pg.sources.list_revisions("src:pg") == [revision]
+    assert pg.sources.get_artifacts(["src:pg", "src:absent", "src:pg"]) == {"src:pg": artifact}
+    assert pg.sources.get_revisions(["srev:pg", "srev:absent"]) == {"srev:pg": revision}
+    assert pg.sources.get_artifacts([]) == {}
 
     session = _session()
     pg.retrieval_sessions.create(session)
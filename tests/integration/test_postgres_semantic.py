@@ -97,6 +97,24 @@ def test_lifecycle_and_deletion_gates(pg) -> None:
     assert docs.get("sdoc:2") is None
 
 
+@pytest.mark.integration
+def test_get_many_projects_plain_columns(pg) -> None:
+    runs, docs = pg.embedding_runs, pg.semantic_documents
+    _begin(runs)
+    docs.upsert_batch([_doc("sdoc:1"), _doc("sdoc:2", visibility=Visibility.PLAYER)])
+
+    rows = docs.get_many(
+        ["sdoc:2", "sdoc:missing", "sdoc:1", "sdoc:1"],
+        columns=("graph_object_id", "visibility"),
+    )
+
+    assert rows == {
+        "sdoc:1": {"graph_object_id": "obj:sdoc:1", "visibility": "gm"},
+        "sdoc:2": {"graph_object_id": "obj:sdoc:2", "visibility": "player"},
+    }
+    assert docs.get_many([], columns=("graph_object_id",)) == {}
+
+
 @pytest.mark.integration
 def test_batch_atomicity(pg) -> None:
     runs, docs = pg.embedding_runs, pg.semantic_documents
@@ -9,8 +9,10 @@ import pytest
 from dungeonmind.contracts import (
     Admissibility,
     CallerScope,
+    GraphRetrievalSession,
     MindTurnRequest,
     MindTurnResponse,
+    ProjectionSnapshot,
     SurfaceContext,
 )
 from dungeonmind.domain.errors import IdempotencyConflictError, ThreadContextMismatchError
@@ -118,6 +120,12 @@ def test_retry_and_ordinal_order(pg) -> None:
     assert turns[0][0].surface_context.surface_id == "surface:plan"
     assert turns[1][0].surface_context.surface_id == "surface:play"
 
+    found = threads.get_turn_by_request_id("thr:ord", "req:2")
+    assert found is not None
+    assert found == turns[1]
+    assert threads.get_turn_by_request_id("thr:ord", "req:missing") is None
+    assert threads.get_turn_by_request_id("thr:missing", "req:2") is None
+
 
 @pytest.mark.integration
 @pytest.mark.parametrize(
@@ -185,3 +193,49 @@ def test_exact_turn_replay_rejects_corrupted_payload(
 
     with pytest.raises(PersistenceIntegrityError):
         threads.append_turn(req, resp)
+    with pytest.raises(PersistenceIntegrityError):
+        threads.get_turn_by_request_id(thread_id, "req:replay")
+
+
+def _session(session_id: str = "rsess:commit") -> GraphRetrievalSession:
+    return GraphRetrievalSession(
+        session_id=session_id,
+        snapshot=ProjectionSnapshot(
+            world_id="world:demo",
+            admissibility=Admissibility.GM,
+            revision_id=REV,
+            head_revision_id=REV,
+            is_head=True,
+            projected_at=NOW,
+        ),
+        question="hello",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+@pytest.mark.integration
+def test_turn_commit_writes_session_and_turn_together(pg) -> None:
+    _create(pg.threads)
+    session = _session()
+    req = _request(request_id="req:commit")
+    resp = _response(req, turn_id="turn:commit")
+
+    pg.turn_commits.commit_turn(session, req, resp)
+    # Exact replay of both records is a no-op.
+    pg.turn_commits.commit_turn(session, req, resp)
+
+    assert pg.retrieval_sessions.get("rsess:commit") == session
+    assert pg.threads.list_turns("thr:pg") == [(req, resp)]
+
+
+@pytest.mark.integration
+def test_rejected_turn_rolls_back_session(pg) -> None:
+    _create(pg.threads)
+    req = _request(request_id="req:commit-bad", caller_id="user:2")
+
+    with pytest.raises(ThreadContextMismatchError):
+        pg.turn_commits.commit_turn(_session("rsess:commit-bad"), req, _response(req))
+
+    assert pg.retrieval_sessions.get("rsess:commit-bad") is None
+    assert pg.threads.list_turns("thr:pg") == []
@@ -89,6 +89,9 @@ class _SuppressFirstAppendThreadRepository:
     def list_turns(self, thread_id):
         return self._inner.list_turns(thread_id)
 
+    def get_turn_by_request_id(self, thread_id, request_id):
+        return self._inner.get_turn_by_request_id(thread_id, request_id)
+
 
 def _narrative_registry() -> StaticSemanticProfileRegistry:
     descriptor = SemanticProfileDescriptor.model_validate(
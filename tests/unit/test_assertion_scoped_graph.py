@@ -12,11 +12,14 @@ from dungeonmind.agents.fixture import FixtureGroundedAgentAdapter
 from dungeonmind.agents.protocol import AgentTurnContext, AgentTurnResult
 from dungeonmind.application.graph_scope import (
     filter_candidate_object_ids,
+    filter_scoped_candidate_object_ids,
     project_scoped_snapshot,
 )
 from dungeonmind.application.graph_snapshot import (
     GRAPH_SCHEMA_V1,
     GRAPH_SCHEMA_V2,
+    GraphDegreeStats,
+    PhraseMatcher,
     UnionGraphV1SnapshotReader,
     UnionGraphV2SnapshotReader,
     VersionedUnionGraphSnapshotReader,
@@ -319,6 +322,28 @@ def test_player_vs_gm_alias_and_summary_admission() -> None:
     assert "asrt:ledger-summary-secret" in player.assertion_exclusions
 
 
+def test_projection_reuses_revision_matcher_and_degree_stats() -> None:
+    parsed = V2.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=_v2_payload())
+    player = project_scoped_snapshot(
+        parsed,
+        sources=_sources(),
+        world_id="world:assertion-scope-demo",
+        campaign_id="camp:assertion-scope",
+        admissibility=Admissibility.PLAYER,
+    ).snapshot
+    message = f"Ask about the {PLAYER_ALIAS.casefold()} and the {GM_ALIAS.casefold()}"
+
+    carried = player.mention_matcher
+    assert carried.aliases.find(message) == PhraseMatcher(player.alias_index).find(message)
+    assert carried.aliases.find(message) == {PLAYER_ALIAS.casefold()}
+    assert parsed.mention_matcher.aliases.find(message) == {
+        PLAYER_ALIAS.casefold(),
+        GM_ALIAS.casefold(),
+    }
+    assert carried.labels.find("the sun ledger") == {"the sun ledger"}
+    assert player.degree_stats == GraphDegreeStats.from_snapshot(player)
+
+
 def test_hidden_alias_cannot_resolve() -> None:
     parsed = V2.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=_v2_payload())
     scoped = project_scoped_snapshot(
@@ -345,6 +370,14 @@ def test_hidden_alias_cannot_resolve() -> None:
         omitted_alias_index=scoped.omitted_alias_index,
     )
     assert filtered == []
+    assert (
+        filter_scoped_candidate_object_ids(
+            ["obj:item-sun-ledger"],
+            message=f"Tell me about the {GM_ALIAS}",
+            projection=scoped,
+        )
+        == []
+    )
     with_candidates = VERSIONED.resolve_mentions(
         scoped.snapshot,
         message=f"Tell me about the {GM_ALIAS}",
@@ -394,6 +427,14 @@ def test_admitted_alias_ambiguity_not_overridden_by_candidates() -> None:
         alias_index=scoped.snapshot.alias_index,
     )
     assert filtered == []
+    assert (
+        filter_scoped_candidate_object_ids(
+            ["obj:item-sun-ledger", "obj:item-dawn-copy"],
+            message=message,
+            projection=scoped,
+        )
+        == []
+    )
     referents = VERSIONED.resolve_mentions(
         scoped.snapshot,
         message=message,
@@ -2,12 +2,20 @@
 
 import json
 
-from dungeonmind.application.context_assembly import assemble_agent_context
+import pytest
+
+from dungeonmind.application.context_assembly import (
+    ContextPriority,
+    TokenBudget,
+    assemble_agent_context,
+    context_priority,
+)
 from dungeonmind.application.graph_snapshot import GraphObjectView, GraphRelationshipView
 from dungeonmind.contracts.evidence import EvidenceRef, EvidenceRole, SourceDomain
 from dungeonmind.contracts.projection import Admissibility, ProjectionFocus
 from dungeonmind.contracts.retrieval import Coverage, SourceAnchor
 from dungeonmind.domain.canonical import canonical_json
+from dungeonmind.infrastructure.fixtures import FixtureTokenizer
 
 
 def _object(oid: str, label: str) -> GraphObjectView:
@@ -178,3 +186,207 @@ def test_assembled_context_omits_auth_metadata_keys() -> None:
     assert "caller_id" not in doc
     assert "tenant_id" not in doc
     assert "roles" not in doc
+
+
+def _pop_and_rerender(
+    *,
+    objects: list[GraphObjectView],
+    relationships: list[GraphRelationshipView],
+    evidence: list[EvidenceRef],
+    source_anchors: list[SourceAnchor],
+    coverage: Coverage,
+    char_limit: int,
+) -> str:
+    """The original quadratic packer: pop one item, re-render everything."""
+    objs, rels, evs, anchors = (
+        list(objects),
+        list(relationships),
+        list(evidence),
+        list(source_anchors),
+    )
+
+    def _render() -> str:
+        return canonical_json(
+            {
+                "revision_id": "rev:" + "ab" * 16,
+                "world_id": "world:demo-atlas",
+                "campaign_id": "camp:démo",
+                "admissibility": Admissibility.GM.value,
+                "focus": ProjectionFocus().model_dump(mode="json"),
+                "objects": [obj.model_dump(mode="json") for obj in objs],
+                "relationships": [rel.model_dump(mode="json") for rel in rels],
+                "evidence": [item.model_dump(mode="json") for item in evs],
+                "source_anchors": [item.model_dump(mode="json") for item in anchors],
+                "coverage": coverage.model_dump(mode="json"),
+            }
+        )
+
+    rendered = _render()
+    while len(rendered.encode("utf-8")) > char_limit:
+        if rels:
+            rels.pop()
+        elif objs and len(objs) > 1:
+            objs.pop()
+        elif anchors:
+            anchors.pop()
+        elif evs:
+            evs.pop()
+        else:
+            break
+        rendered = _render()
+    return rendered
+
+
+def test_packer_matches_pop_and_rerender_at_every_limit() -> None:
+    inputs = {
+        "objects": [_object(f"obj:{i}", f"Ñame {i}") for i in range(4)],
+        "relationships": [
+            _relationship(f"rel:{i}", "obj:0", f"obj:{i % 4}") for i in range(6)
+        ],
+        "evidence": [_evidence(f"ev:{i}") for i in range(3)],
+        "source_anchors": [_anchor(f"anchor:{i}", f"ev:{i}") for i in range(3)],
+        "coverage": Coverage(known=["obj:0"], missing=["“quoted”"], gap_codes=[]),
+    }
+    full = len(_pop_and_rerender(**inputs, char_limit=10_000_000).encode("utf-8"))
+
+    for char_limit in [*range(0, full + 2, 37), full - 1, full, full + 1]:
+        assert assemble_agent_context(
+            revision_id="rev:" + "ab" * 16,
+            world_id="world:demo-atlas",
+            campaign_id="camp:démo",
+            admissibility=Admissibility.GM,
+            focus=ProjectionFocus(),
+            char_limit=char_limit,
+            **inputs,
+        ) == _pop_and_rerender(**inputs, char_limit=char_limit), char_limit
+
+
+def test_packer_keeps_top_object_when_nothing_fits() -> None:
+    rendered = assemble_agent_context(
+        revision_id="rev:" + "ab" * 16,
+        world_id="world:demo-atlas",
+        campaign_id=None,
+        admissibility=Admissibility.GM,
+        focus=ProjectionFocus(),
+        objects=[_object("obj:a", "A"), _object("obj:b", "B")],
+        relationships=[_relationship("rel:a-b", "obj:a", "obj:b")],
+        evidence=[_evidence("ev:obj:a")],
+        source_anchors=[_anchor("anchor:1", "ev:obj:a")],
+        coverage=Coverage(),
+        char_limit=1,
+    )
+    doc = json.loads(rendered)
+    assert [obj["object_id"] for obj in doc["objects"]] == ["obj:a"]
+    assert doc["relationships"] == doc["evidence"] == doc["source_anchors"] == []
+
+
+class _ThirdsTokenizer:
+    """Not additive: one token per three characters of the whole text."""
+
+    tokenizer_id = "thirds"
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 3
+
+
+def _hub_context(**kwargs: object) -> str:
+    defaults: dict[str, object] = {
+        "revision_id": "rev:" + "ab" * 16,
+        "world_id": "world:demo-atlas",
+        "campaign_id": None,
+        "admissibility": Admissibility.GM,
+        "focus": ProjectionFocus(),
+        # obj:seed -> obj:near -> obj:far; the far edge is listed first.
+        "objects": [
+            _object("obj:far", "Far"),
+            _object("obj:near", "Near"),
+            _object("obj:seed", "S"),
+        ],
+        "relationships": [
+            _relationship("rel:near-far", "obj:near", "obj:far"),
+            _relationship("rel:seed-near", "obj:seed", "obj:near"),
+        ],
+        "evidence": [_evidence("ev:obj:far"), _evidence("ev:obj:seed")],
+        "source_anchors": [],
+        "coverage": Coverage(),
+    }
+    defaults.update(kwargs)
+    return assemble_agent_context(**defaults)  # type: ignore[arg-type]
+
+
+def test_fixture_tokenizer_is_deterministic_and_additive() -> None:
+    tokenizer = FixtureTokenizer()
+    assert tokenizer.count_tokens("") == 0
+    assert tokenizer.count_tokens("Who safeguards the Sun Ledger?") == 9
+    rendered = _hub_context()
+    parts = rendered.split(",")
+    assert tokenizer.count_tokens(rendered) == sum(map(tokenizer.count_tokens, parts)) + (
+        len(parts) - 1
+    )
+
+
+def test_context_priority_measures_hops_and_fused_rank() -> None:
+    priority = context_priority(
+        seed_ids=["obj:seed"],
+        relationships=[
+            _relationship("rel:near-far", "obj:near", "obj:far"),
+            _relationship("rel:seed-near", "obj:seed", "obj:near"),
+        ],
+        candidate_object_ids=["obj:far", "obj:seed", "obj:far"],
+    )
+
+    assert priority.seed_distance == {"obj:seed": 0, "obj:near": 1, "obj:far": 2}
+    assert priority.semantic_rank == {"obj:far": 0, "obj:seed": 1}
+    assert priority.object_score(["obj:far", "obj:near"]) == (1, float("inf"))
+
+
+def test_priority_drops_items_farthest_from_seeds_first() -> None:
+    priority = ContextPriority(
+        seed_distance={"obj:seed": 0, "obj:near": 1, "obj:far": 2},
+        semantic_rank={},
+    )
+    full = _hub_context(priority=priority, char_limit=10_000_000)
+    # One byte short of the full document: exactly one relationship goes.
+    char_limit = len(full.encode("utf-8")) - 1
+
+    by_position = json.loads(_hub_context(char_limit=char_limit))
+    by_priority = json.loads(_hub_context(priority=priority, char_limit=char_limit))
+    assert [rel["relationship_id"] for rel in by_position["relationships"]] == ["rel:near-far"]
+    assert [rel["relationship_id"] for rel in by_priority["relationships"]] == ["rel:seed-near"]
+
+    # After relationships, the seed object outlasts the others.
+    tight = json.loads(_hub_context(priority=priority, char_limit=1))
+    assert [obj["object_id"] for obj in tight["objects"]] == ["obj:seed"]
+
+    # Evidence nothing retained cites goes before the seed's evidence.
+    seed_only = {"relationships": [], "objects": [_object("obj:seed", "S")]}
+    char_limit = len(_hub_context(**seed_only).encode("utf-8")) - 1
+    by_position = json.loads(_hub_context(char_limit=char_limit, **seed_only))
+    by_priority = json.loads(_hub_context(priority=priority, char_limit=char_limit, **seed_only))
+    assert [item["evidence_ref_id"] for item in by_position["evidence"]] == ["ev:obj:far"]
+    assert [item["evidence_ref_id"] for item in by_priority["evidence"]] == ["ev:obj:seed"]
+
+
+@pytest.mark.parametrize("tokenizer", [FixtureTokenizer(), _ThirdsTokenizer()])
+def test_token_budget_is_never_exceeded(tokenizer: FixtureTokenizer) -> None:
+    priority = ContextPriority(seed_distance={"obj:seed": 0, "obj:near": 1})
+    full_tokens = tokenizer.count_tokens(_hub_context(char_limit=10_000_000))
+    floor = tokenizer.count_tokens(
+        _hub_context(relationships=[], objects=[_object("obj:seed", "S")], evidence=[])
+    )
+
+    for max_tokens in range(floor, full_tokens + 2):
+        rendered = _hub_context(
+            token_budget=TokenBudget(tokenizer=tokenizer, max_tokens=max_tokens),
+            priority=priority,
+        )
+        assert tokenizer.count_tokens(rendered) <= max_tokens
+        assert rendered == canonical_json(json.loads(rendered))
+    assert _hub_context(
+        token_budget=TokenBudget(tokenizer=tokenizer, max_tokens=full_tokens)
+    ) == _hub_context(char_limit=10_000_000)
+
+
+def test_token_budget_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_tokens"):
+        TokenBudget(tokenizer=FixtureTokenizer(), max_tokens=0)
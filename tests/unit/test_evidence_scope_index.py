@@ -0,0 +1,291 @@
+"""Unit tests for the per-revision evidence scope index behind scoping."""
+
+from __future__ import annotations
+
+from itertools import product
+
+from dungeonmind.application.graph_scope import (
+    EvidenceScopeIndex,
+    EvidenceScopeVerdict,
+    ValidatedProvenance,
+    project_scoped_snapshot,
+    resolve_evidence_provenance,
+)
+from dungeonmind.application.graph_scope_cache import (
+    EvidenceScopeIndexCache,
+    ScopedProjectionCache,
+)
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V2,
+    GraphEvidenceRecord,
+    GraphEvidenceRecordV2,
+    GraphObjectView,
+    ParsedGraphSnapshot,
+)
+from dungeonmind.contracts.evidence import (
+    SourceArtifact,
+    SourceDomain,
+    SourceRevision,
+    SourceStatus,
+)
+from dungeonmind.contracts.projection import Admissibility
+from dungeonmind.contracts.vocabulary import Visibility
+from dungeonmind.infrastructure.memory import InMemorySourceRepository
+
+from .test_graph_scope_cache import _revision
+from .test_source_evidence_v2 import (
+    CAMPAIGN_ID,
+    FIXED_NOW,
+    WORLD_ID,
+    _artifact_v2,
+    _evidence_record,
+    _v1_evidence_record,
+)
+
+
+def _artifact(source_artifact_id: str, **overrides: object) -> SourceArtifact:
+    fields: dict[str, object] = {
+        "source_artifact_id": source_artifact_id,
+        "source_domain": SourceDomain.WORLDBUILDING,
+        "world_id": WORLD_ID,
+        "visibility": Visibility.PLAYER,
+        "created_at": FIXED_NOW,
+        **overrides,
+    }
+    return SourceArtifact.model_validate(fields)
+
+
+def _ledger() -> tuple[
+    InMemorySourceRepository, list[GraphEvidenceRecord | GraphEvidenceRecordV2]
+]:
+    sources = InMemorySourceRepository()
+    artifacts = [
+        _artifact("src:player"),
+        _artifact("src:gm", visibility=Visibility.GM),
+        _artifact("src:alpha", campaign_id=CAMPAIGN_ID),
+        _artifact("src:beta", campaign_id="camp:beta"),
+        _artifact("src:elsewhere", world_id="world:elsewhere"),
+        _artifact("src:retracted", status=SourceStatus.RETRACTED),
+        _artifact(
+            "src:recap",
+            source_domain=SourceDomain.SESSION_RECAP,
+            campaign_id=CAMPAIGN_ID,
+            session_id="ses:1",
+        ),
+        _artifact_v2(),
+        _artifact_v2(source_artifact_id="src:v2-unknown", visibility=None),
+    ]
+    for artifact in artifacts:
+        sources.put_artifact(artifact)
+    for artifact in artifacts:
+        sources.put_revision(
+            SourceRevision(
+                source_revision_id=f"{artifact.source_artifact_id}-v1",
+                source_artifact_id=artifact.source_artifact_id,
+                content_sha256="ab" * 32,
+                locator="fixture://ledger",
+                created_at=FIXED_NOW,
+            )
+        )
+
+    def v1(evidence_ref_id: str, source_artifact_id: str, **update: object) -> GraphEvidenceRecord:
+        record = _v1_evidence_record(
+            evidence_ref_id=evidence_ref_id, source_artifact_id=source_artifact_id
+        )
+        return record.model_copy(
+            update={"source_revision_id": f"{source_artifact_id}-v1", **update}
+        )
+
+    records: list[GraphEvidenceRecord | GraphEvidenceRecordV2] = [
+        v1("ev:player", "src:player"),
+        v1("ev:gm", "src:gm"),
+        v1("ev:alpha", "src:alpha"),
+        v1("ev:beta", "src:beta"),
+        v1("ev:elsewhere", "src:elsewhere"),
+        v1("ev:retracted", "src:retracted"),
+        v1("ev:domain-mismatch", "src:recap"),
+        v1("ev:missing-artifact", "src:missing"),
+        v1("ev:missing-revision", "src:player", source_revision_id="srcrev:missing"),
+        v1("ev:foreign-revision", "src:player", source_revision_id="src:gm-v1"),
+        v1("ev:no-revision", "src:gm", source_revision_id=None),
+        v1("ev:bad-role", "src:player", evidence_role="bogus"),
+        v1("ev:schema-mismatch", "src:v2-notes"),
+        *(
+            _evidence_record(
+                evidence_ref_id=evidence_ref_id, source_artifact_id=source_artifact_id
+            ).model_copy(update={"source_revision_id": f"{source_artifact_id}-v1"})
+            for evidence_ref_id, source_artifact_id in (
+                ("ev:v2", "src:v2-notes"),
+                ("ev:v2-unknown", "src:v2-unknown"),
+                ("ev:v2-on-v1", "src:player"),
+            )
+        ),
+    ]
+    return sources, records
+
+
+def _snapshot(records: list[GraphEvidenceRecord | GraphEvidenceRecordV2]) -> ParsedGraphSnapshot:
+    return ParsedGraphSnapshot(
+        world_id=WORLD_ID,
+        graph_schema=GRAPH_SCHEMA_V2,
+        objects={
+            f"obj:{record.evidence_ref_id[3:]}": GraphObjectView(
+                object_id=f"obj:{record.evidence_ref_id[3:]}",
+                kind="place",
+                label=record.evidence_ref_id[3:].title(),
+                evidence_ref_ids=[record.evidence_ref_id],
+                core_evidence_ref_ids=[record.evidence_ref_id],
+                object_field_schema="v2",
+            )
+            for record in records
+        },
+        relationships={},
+        evidence={record.evidence_ref_id: record for record in records},
+    )
+
+
+SCOPES = list(
+    product(
+        [WORLD_ID, "world:elsewhere"],
+        [None, CAMPAIGN_ID, "camp:beta"],
+        [Admissibility.PLAYER, Admissibility.GM],
+    )
+)
+
+
+def test_admitted_lanes_match_per_ref_resolution_in_every_scope() -> None:
+    sources, records = _ledger()
+    snapshot = _snapshot(records)
+    index = EvidenceScopeIndex(snapshot, sources=sources)
+    ledger_ids = [*snapshot.evidence, "ev:not-in-ledger"]
+
+    seen_verdicts = set()
+    for world_id, campaign_id, admissibility in SCOPES:
+        flags = index.admitted_flags(
+            world_id=world_id, campaign_id=campaign_id, admissibility=admissibility
+        )
+        for evidence_ref_id, position in zip(
+            ledger_ids, index.positions(ledger_ids), strict=True
+        ):
+            verdict = resolve_evidence_provenance(
+                evidence_ref_id,
+                snapshot=snapshot,
+                sources=sources,
+                world_id=world_id,
+                campaign_id=campaign_id,
+                admissibility=admissibility,
+            )
+            seen_verdicts.add(type(verdict).__name__ if verdict is not None else None)
+            assert flags[position] == isinstance(verdict, ValidatedProvenance), (
+                evidence_ref_id,
+                world_id,
+                campaign_id,
+                admissibility,
+            )
+    assert seen_verdicts == {
+        "ValidatedProvenance",
+        "ProvenanceRejection",
+        EvidenceScopeVerdict.__name__,
+        None,
+    }
+
+
+def test_projection_keeps_fail_closed_diagnostics() -> None:
+    sources, records = _ledger()
+    snapshot = _snapshot(records)
+
+    projection = project_scoped_snapshot(
+        snapshot,
+        sources=sources,
+        world_id=WORLD_ID,
+        campaign_id=CAMPAIGN_ID,
+        admissibility=Admissibility.GM,
+    )
+
+    assert sorted(projection.snapshot.objects) == [
+        "obj:alpha",
+        "obj:gm",
+        "obj:no-revision",
+        "obj:player",
+        "obj:v2",
+    ]
+    exclusions = projection.object_exclusions
+    assert exclusions["obj:v2-unknown"].scope_unknown
+    assert exclusions["obj:bad-role"].scope_unknown
+    assert exclusions["obj:missing-artifact"].scope_unknown
+    assert exclusions["obj:beta"].out_of_scope
+    assert [r.gap_code for r in exclusions["obj:retracted"].rejections] == [
+        "evidence_source_inactive"
+    ]
+    assert [r.gap_code for r in exclusions["obj:foreign-revision"].rejections] == [
+        "evidence_source_revision_artifact_mismatch"
+    ]
+
+
+def test_projection_cache_shares_one_index_across_scopes() -> None:
+    sources, records = _ledger()
+    snapshot = _snapshot(records)
+    cache = ScopedProjectionCache(max_entries=8)
+    revision = _revision({"evidence": sorted(snapshot.evidence)})
+
+    projections = [
+        cache.get_or_project(
+            snapshot,
+            revision=revision,
+            sources=sources,
+            world_id=world_id,
+            campaign_id=campaign_id,
+            admissibility=admissibility,
+        )
+        for world_id, campaign_id, admissibility in SCOPES
+    ]
+
+    # One index per world whose stamp keyed the scopes.
+    assert cache.stats().indexes == 2
+    for projection, (world_id, campaign_id, admissibility) in zip(
+        projections, SCOPES, strict=True
+    ):
+        uncached = project_scoped_snapshot(
+            snapshot,
+            sources=sources,
+            world_id=world_id,
+            campaign_id=campaign_id,
+            admissibility=admissibility,
+        )
+        assert projection.snapshot.objects.keys() == uncached.snapshot.objects.keys()
+        assert projection.object_exclusions == uncached.object_exclusions
+
+
+def test_scope_index_cache_keys_on_revision_and_source_stamp() -> None:
+    sources, records = _ledger()
+    snapshot = _snapshot(records)
+    cache = EvidenceScopeIndexCache(max_entries=4)
+    revision = _revision({"evidence": sorted(snapshot.evidence)})
+
+    def index_under(state_version: str) -> EvidenceScopeIndex:
+        return cache.get_or_build(
+            snapshot,
+            revision=revision,
+            sources=sources,
+            world_id=WORLD_ID,
+            state_version=state_version,
+        )
+
+    first = index_under("1")
+    assert index_under("1") is first
+    moved = index_under("2")
+    assert moved is not first
+    stats = cache.stats()
+    # The index under the old stamp is dropped once the new one is stored.
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+
+    reparsed = _snapshot(records)
+    rebuilt = cache.get_or_build(
+        reparsed,
+        revision=revision,
+        sources=sources,
+        world_id=WORLD_ID,
+        state_version="2",
+    )
+    assert rebuilt.snapshot is reparsed
+    assert cache.stats().entries == 1
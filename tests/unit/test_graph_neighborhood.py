@@ -0,0 +1,285 @@
+"""Unit tests for bounded multi-hop neighborhood expansion."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    GraphDegreeStats,
+    NeighborhoodExpansion,
+    ParsedGraphSnapshot,
+    UnionGraphV1SnapshotReader,
+    collect_one_hop_object_ids,
+    expand_neighborhood,
+    list_relationships_from_snapshot,
+)
+from dungeonmind.application.graph_snapshot_compact import compact_snapshot
+
+
+def _node(object_id: str) -> dict[str, Any]:
+    return {
+        "object_id": object_id,
+        "kind": "npc",
+        "label": object_id.removeprefix("obj:").title(),
+        "aliases": [],
+        "evidence_ref_ids": [],
+    }
+
+
+def _rel(subject: str, predicate: str, obj: str) -> dict[str, Any]:
+    return {
+        "relationship_id": f"rel:{subject[4:]}-{predicate}-{obj[4:]}",
+        "subject_object_id": subject,
+        "predicate": predicate,
+        "object_object_id": obj,
+        "evidence_ref_ids": [],
+    }
+
+
+def _snapshot() -> ParsedGraphSnapshot:
+    """ledger <-owns- owner <-serves- servant -lives_in-> town, plus a hub."""
+    edges = [
+        ("obj:owner", "owns", "obj:ledger"),
+        ("obj:servant", "serves", "obj:owner"),
+        ("obj:servant", "lives_in", "obj:town"),
+        ("obj:owner", "member_of", "obj:guild"),
+    ]
+    edges += [(f"obj:member-{index}", "member_of", "obj:guild") for index in range(6)]
+    object_ids = sorted({endpoint for subject, _, obj in edges for endpoint in (subject, obj)})
+    payload = {
+        "world_id": "world:neighborhood",
+        "nodes": [_node(object_id) for object_id in object_ids],
+        "relationships": [_rel(*edge) for edge in edges],
+        "evidence_refs": [],
+    }
+    return UnionGraphV1SnapshotReader().parse(
+        graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload
+    )
+
+
+def test_one_hop_expansion_matches_legacy_focus() -> None:
+    snapshot = _snapshot()
+    for seeds in (["obj:ledger"], ["obj:guild"], ["obj:servant", "obj:missing"], []):
+        neighborhood = expand_neighborhood(snapshot, seeds, NeighborhoodExpansion())
+        assert neighborhood.object_ids == collect_one_hop_object_ids(snapshot, seeds)
+        assert neighborhood.relationship_ids == [
+            rel.relationship_id
+            for rel in list_relationships_from_snapshot(
+                snapshot, [oid for oid in seeds if oid in snapshot.objects]
+            )
+        ]
+        assert not neighborhood.truncated
+
+
+def test_two_hops_answer_who_serves_the_owner() -> None:
+    neighborhood = expand_neighborhood(
+        _snapshot(),
+        ["obj:ledger"],
+        NeighborhoodExpansion(max_hops=2, predicates=frozenset({"owns", "serves"})),
+    )
+
+    assert neighborhood.object_ids == ["obj:ledger", "obj:owner", "obj:servant"]
+    assert neighborhood.relationship_ids == [
+        "rel:owner-owns-ledger",
+        "rel:servant-serves-owner",
+    ]
+
+
+def test_relationships_cover_every_allowed_edge_among_reached_objects() -> None:
+    edges = [
+        ("obj:seed", "knows", "obj:a"),
+        ("obj:seed", "knows", "obj:b"),
+        ("obj:seed", "knows", "obj:c"),
+        # Both endpoints are reached at the final hop; never followed.
+        ("obj:a", "knows", "obj:b"),
+        ("obj:b", "rivals", "obj:a"),
+    ]
+    object_ids = sorted({endpoint for subject, _, obj in edges for endpoint in (subject, obj)})
+    snapshot = UnionGraphV1SnapshotReader().parse(
+        graph_schema=GRAPH_SCHEMA_V1,
+        graph_payload={
+            "world_id": "world:neighborhood",
+            "nodes": [_node(object_id) for object_id in object_ids],
+            "relationships": [_rel(*edge) for edge in edges],
+            "evidence_refs": [],
+        },
+    )
+
+    capped = expand_neighborhood(
+        snapshot,
+        ["obj:seed"],
+        NeighborhoodExpansion(fanout_per_hop=(2,), predicates=frozenset({"knows"})),
+    )
+    reranked = expand_neighborhood(
+        snapshot,
+        ["obj:seed"],
+        NeighborhoodExpansion(fanout_per_hop=(2,), predicates=frozenset({"knows"})),
+        candidate_rank={"obj:b": 0, "obj:a": 1},
+    )
+
+    assert capped.object_ids == ["obj:a", "obj:b", "obj:seed"]
+    assert capped.relationship_ids == [
+        "rel:a-knows-b",
+        "rel:seed-knows-a",
+        "rel:seed-knows-b",
+    ]
+    assert reranked == capped
+
+
+def test_fanout_cap_keeps_hubs_bounded_and_deterministic() -> None:
+    snapshot = _snapshot()
+    expansion = NeighborhoodExpansion(max_hops=3, fanout_per_hop=(4, 2))
+
+    first = expand_neighborhood(snapshot, ["obj:ledger"], expansion)
+    second = expand_neighborhood(snapshot, ["obj:ledger"], expansion)
+
+    assert first == second
+    assert first.truncated
+    # Hop 3 reaches the guild hub, which may add only two members.
+    members = [oid for oid in first.object_ids if oid.startswith("obj:member-")]
+    assert members == ["obj:member-0", "obj:member-1"]
+
+
+def test_node_budget_counts_seeds_and_never_drops_them() -> None:
+    snapshot = _snapshot()
+
+    bounded = expand_neighborhood(
+        snapshot, ["obj:guild"], NeighborhoodExpansion(max_hops=4, max_nodes=3)
+    )
+    assert bounded.object_ids == ["obj:guild", "obj:member-0", "obj:member-1"]
+    assert bounded.truncated
+
+    seeds_only = expand_neighborhood(
+        snapshot, ["obj:ledger", "obj:town"], NeighborhoodExpansion(max_nodes=1)
+    )
+    assert seeds_only.object_ids == ["obj:ledger", "obj:town"]
+
+
+def test_expansion_is_backend_and_adjacency_independent() -> None:
+    snapshot = _snapshot()
+    expansion = NeighborhoodExpansion(max_hops=3, fanout_per_hop=(3,))
+    expected = expand_neighborhood(snapshot, ["obj:town"], expansion)
+
+    unindexed = replace(snapshot, subject_index={}, object_index={}, predicate_index={})
+    assert expand_neighborhood(compact_snapshot(snapshot), ["obj:town"], expansion) == expected
+    assert expand_neighborhood(unindexed, ["obj:town"], expansion) == expected
+
+
+def test_degree_stats_count_each_relationship_once() -> None:
+    snapshot = _snapshot()
+    looped = replace(
+        snapshot,
+        relationships={
+            **snapshot.relationships,
+            "rel:town-near-town": snapshot.relationships["rel:owner-owns-ledger"].model_copy(
+                update={
+                    "relationship_id": "rel:town-near-town",
+                    "subject_object_id": "obj:town",
+                    "predicate": "near",
+                    "object_object_id": "obj:town",
+                }
+            ),
+        },
+        subject_index={},
+        object_index={},
+        predicate_index={},
+    )
+
+    stats = snapshot.degree_stats
+    assert stats is snapshot.degree_stats
+    assert (stats.degree("obj:guild"), stats.degree("obj:owner")) == (7, 3)
+    assert stats.degree("obj:missing") == 0
+    assert stats.max_degree == 7
+    assert stats.mean_degree == pytest.approx(2 * 10 / 11)
+    assert compact_snapshot(snapshot).degree_stats == stats
+    assert looped.degree_stats.degree("obj:town") == 2
+
+
+def test_restricted_degree_stats_match_a_fresh_count() -> None:
+    snapshot = _snapshot()
+    kept_objects = {k: v for k, v in snapshot.objects.items() if k != "obj:owner"}
+    kept = {
+        rel_id: rel
+        for rel_id, rel in snapshot.relationships.items()
+        if "obj:owner" not in (rel.subject_object_id, rel.object_object_id)
+        and rel.predicate != "lives_in"
+    }
+    dropped = [rel for rel_id, rel in snapshot.relationships.items() if rel_id not in kept]
+    restricted = replace(
+        snapshot, objects=kept_objects, relationships=kept, subject_index={}, object_index={}
+    )
+
+    stats = snapshot.degree_stats.restricted(kept_objects, dropped)
+    assert stats == GraphDegreeStats.from_snapshot(restricted)
+    assert "obj:owner" not in stats.degrees
+    assert stats.degree("obj:town") == 0
+
+
+def test_hub_cap_keeps_ranked_neighbours_and_reports_hub() -> None:
+    snapshot = _snapshot()
+    expansion = NeighborhoodExpansion(hub_degree=5, hub_fanout=2)
+
+    by_id = expand_neighborhood(snapshot, ["obj:guild"], expansion)
+    ranked = expand_neighborhood(
+        snapshot,
+        ["obj:guild"],
+        expansion,
+        candidate_rank={"obj:member-4": 0, "obj:owner": 1},
+    )
+
+    assert by_id.object_ids == ["obj:guild", "obj:member-0", "obj:member-1"]
+    assert ranked.object_ids == ["obj:guild", "obj:member-4", "obj:owner"]
+    assert by_id.capped_hub_ids == ranked.capped_hub_ids == ["obj:guild"]
+    assert ranked.truncated
+    # The owner is below the hub threshold and keeps its full fanout.
+    assert expand_neighborhood(snapshot, ["obj:owner"], expansion) == expand_neighborhood(
+        snapshot, ["obj:owner"], NeighborhoodExpansion()
+    )
+
+
+def test_predicate_priority_orders_capped_neighbours() -> None:
+    snapshot = _snapshot()
+
+    default = expand_neighborhood(
+        snapshot, ["obj:owner"], NeighborhoodExpansion(hub_degree=3, hub_fanout=1)
+    )
+    prioritized = expand_neighborhood(
+        snapshot,
+        ["obj:owner"],
+        NeighborhoodExpansion(hub_degree=3, hub_fanout=1, predicate_priority=("serves", "owns")),
+    )
+
+    assert default.object_ids == ["obj:guild", "obj:owner"]
+    assert prioritized.object_ids == ["obj:owner", "obj:servant"]
+    assert prioritized.relationship_ids == ["rel:servant-serves-owner"]
+
+
+def test_tighter_fanout_cap_is_not_reported_as_hub_cap() -> None:
+    neighborhood = expand_neighborhood(
+        _snapshot(),
+        ["obj:guild"],
+        NeighborhoodExpansion(fanout_per_hop=(1,), hub_degree=5, hub_fanout=2),
+    )
+
+    assert neighborhood.object_ids == ["obj:guild", "obj:member-0"]
+    assert neighborhood.truncated
+    assert neighborhood.capped_hub_ids == []
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        {"max_hops": 0},
+        {"fanout_per_hop": (2, 0)},
+        {"max_nodes": 0},
+        {"hub_degree": 0},
+        {"hub_fanout": 0},
+    ],
+)
+def test_expansion_bounds_must_be_positive(bounds: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        NeighborhoodExpansion(**bounds)
@@ -0,0 +1,212 @@
+"""Unit tests for the scoped-projection cache and its source-state invalidation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_scope import project_scoped_snapshot
+from dungeonmind.application.graph_scope_cache import ScopedProjectionCache
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    UnionGraphV1SnapshotReader,
+)
+from dungeonmind.contracts.evidence import (
+    SourceArtifact,
+    SourceDomain,
+    SourceRevision,
+    SourceStatus,
+)
+from dungeonmind.contracts.graph import WorldGraphRevision
+from dungeonmind.contracts.projection import Admissibility
+from dungeonmind.contracts.vocabulary import Visibility
+from dungeonmind.domain.canonical import canonical_sha256
+from dungeonmind.infrastructure.memory import InMemorySourceRepository
+
+from ..conftest import FIXED_NOW
+
+READER = UnionGraphV1SnapshotReader()
+WORLD = "world:demo-atlas"
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "world_id": WORLD,
+        "nodes": [
+            {
+                "object_id": "obj:item-sun-ledger",
+                "kind": "artifact",
+                "label": "The Sun Ledger",
+                "aliases": ["Sun Ledger"],
+                "evidence_ref_ids": ["ev:ledger"],
+            }
+        ],
+        "relationships": [],
+        "evidence_refs": [
+            {
+                "evidence_ref_id": "ev:ledger",
+                "source_artifact_id": "src:atlas-notes",
+                "source_revision_id": "srcrev:atlas-notes-v1",
+                "source_domain": "worldbuilding",
+                "evidence_role": "support",
+                "locator": "fixture://atlas-notes#sun-ledger",
+            }
+        ],
+    }
+
+
+def _revision(payload: dict[str, Any]) -> WorldGraphRevision:
+    return WorldGraphRevision(
+        world_id=WORLD,
+        revision_id="rev:scope-cache",
+        parent_revision_id=None,
+        created_at=FIXED_NOW,
+        operation_ids=["op:seed"],
+        graph_schema=GRAPH_SCHEMA_V1,
+        graph_payload_sha256=canonical_sha256(payload),
+    )
+
+
+def _put_artifact(sources: InMemorySourceRepository) -> None:
+    sources.put_artifact(
+        SourceArtifact(
+            source_artifact_id="src:atlas-notes",
+            source_domain=SourceDomain.WORLDBUILDING,
+            world_id=WORLD,
+            visibility=Visibility.PLAYER,
+            status=SourceStatus.ACTIVE,
+            created_at=FIXED_NOW,
+        )
+    )
+
+
+def _put_revision(sources: InMemorySourceRepository) -> None:
+    sources.put_revision(
+        SourceRevision(
+            source_revision_id="srcrev:atlas-notes-v1",
+            source_artifact_id="src:atlas-notes",
+            content_sha256="aa" * 32,
+            body_storage="external",
+            locator="fixture://atlas-notes",
+            created_at=FIXED_NOW,
+        )
+    )
+
+
+def _project(
+    cache: ScopedProjectionCache,
+    sources: InMemorySourceRepository,
+    *,
+    admissibility: Admissibility = Admissibility.PLAYER,
+    campaign_id: str | None = "camp:demo",
+) -> Any:
+    payload = _payload()
+    return cache.get_or_project(
+        READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload),
+        revision=_revision(payload),
+        sources=sources,
+        world_id=WORLD,
+        campaign_id=campaign_id,
+        admissibility=admissibility,
+    )
+
+
+def test_identical_scope_reuses_projection() -> None:
+    sources = InMemorySourceRepository()
+    _put_artifact(sources)
+    _put_revision(sources)
+    cache = ScopedProjectionCache(max_entries=8)
+
+    first = _project(cache, sources)
+    second = _project(cache, sources)
+
+    assert first is second
+    assert "obj:item-sun-ledger" in first.snapshot.objects
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_scope_triple_is_part_of_key() -> None:
+    sources = InMemorySourceRepository()
+    _put_artifact(sources)
+    _put_revision(sources)
+    cache = ScopedProjectionCache(max_entries=8)
+
+    _project(cache, sources, admissibility=Admissibility.PLAYER)
+    _project(cache, sources, admissibility=Admissibility.GM)
+    _project(cache, sources, campaign_id=None)
+
+    assert cache.stats().misses == 3
+    assert cache.stats().entries == 3
+
+
+def test_source_write_invalidates_cached_projection() -> None:
+    sources = InMemorySourceRepository()
+    _put_artifact(sources)
+    cache = ScopedProjectionCache(max_entries=8)
+
+    before = _project(cache, sources)
+    assert before.snapshot.objects == {}
+    assert any(
+        r.gap_code == "evidence_source_revision_missing" for r in before.rejections
+    )
+
+    _put_revision(sources)
+    after = _project(cache, sources)
+
+    assert "obj:item-sun-ledger" in after.snapshot.objects
+    assert cache.stats().invalidations == 1
+    payload = _payload()
+    uncached = project_scoped_snapshot(
+        READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload),
+        sources=sources,
+        world_id=WORLD,
+        campaign_id="camp:demo",
+        admissibility=Admissibility.PLAYER,
+    )
+    assert after.snapshot.objects == uncached.snapshot.objects
+
+
+def test_other_worlds_source_writes_keep_projection() -> None:
+    sources = InMemorySourceRepository()
+    _put_artifact(sources)
+    _put_revision(sources)
+    cache = ScopedProjectionCache(max_entries=8)
+    first = _project(cache, sources)
+
+    sources.put_artifact(
+        SourceArtifact(
+            source_artifact_id="src:elsewhere",
+            source_domain=SourceDomain.WORLDBUILDING,
+            world_id="world:elsewhere",
+            visibility=Visibility.PLAYER,
+            status=SourceStatus.ACTIVE,
+            created_at=FIXED_NOW,
+        )
+    )
+
+    assert _project(cache, sources) is first
+    stats = cache.stats()
+    assert (stats.hits, stats.invalidations) == (1, 0)
+
+
+def test_entry_bound_evicts_least_recent() -> None:
+    sources = InMemorySourceRepository()
+    _put_artifact(sources)
+    _put_revision(sources)
+    cache = ScopedProjectionCache(max_entries=1)
+
+    _project(cache, sources, admissibility=Admissibility.PLAYER)
+    _project(cache, sources, admissibility=Admissibility.GM)
+    _project(cache, sources, admissibility=Admissibility.PLAYER)
+
+    stats = cache.stats()
+    assert stats.entries == 1
+    assert stats.hits == 0
+    assert stats.misses == 3
+
+
+def test_entry_bound_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        ScopedProjectionCache(max_entries=0)
@@ -0,0 +1,284 @@
+"""Unit tests for persisted parsed-snapshot artifacts and their rebuild rules."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dungeonmind.application import graph_snapshot_artifacts
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    GRAPH_SCHEMA_V2,
+    ParsedGraphSnapshot,
+    VersionedUnionGraphSnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_artifacts import (
+    SnapshotArtifactKey,
+    decode_snapshot_artifact,
+    encode_snapshot_artifact,
+)
+from dungeonmind.application.graph_snapshot_cache import (
+    ParsedSnapshotCache,
+    graph_reader_digest,
+)
+from dungeonmind.application.graph_snapshot_compact import (
+    CompactGraphSnapshotReader,
+    compact_snapshot,
+    is_compact_snapshot,
+)
+from dungeonmind.application.graph_snapshot_v5 import UnionGraphV5SnapshotReader
+from dungeonmind.contracts.graph import StoredGraphRevision, WorldGraphRevision
+from dungeonmind.domain.canonical import canonical_sha256
+from dungeonmind.domain.errors import SemanticProfileNotFoundError
+from dungeonmind.infrastructure.semantic_profiles import StaticSemanticProfileRegistry
+from dungeonmind.infrastructure.snapshot_artifacts import FilesystemSnapshotArtifactStore
+
+from ..conftest import FIXED_NOW
+from .test_graph_snapshot_compact import _v1_payload, _v2_payload
+from .test_union_graph_v4 import _parse as _parse_v4
+from .test_union_graph_v5 import _registry as _v5_registry
+from .test_union_graph_v5 import _v5_payload
+
+READER = VersionedUnionGraphSnapshotReader()
+
+
+def _key(snapshot: ParsedGraphSnapshot, **overrides: str) -> SnapshotArtifactKey:
+    fields = {
+        "world_id": snapshot.world_id,
+        "revision_id": "rev:artifact",
+        "graph_payload_sha256": "ab" * 32,
+        "graph_schema": snapshot.graph_schema,
+        "reader_digest": "reader",
+    }
+    fields.update(overrides)
+    return SnapshotArtifactKey(**fields)
+
+
+def _assert_same_snapshot(actual: ParsedGraphSnapshot, expected: ParsedGraphSnapshot) -> None:
+    assert (actual.world_id, actual.graph_schema) == (expected.world_id, expected.graph_schema)
+    assert list(actual.objects) == list(expected.objects)
+    for object_id, view in expected.objects.items():
+        restored = actual.objects[object_id]
+        assert restored == view
+        assert restored.model_dump(mode="json") == view.model_dump(mode="json")
+        assert restored.model_fields_set == view.model_fields_set
+    assert dict(actual.relationships.items()) == dict(expected.relationships.items())
+    assert actual.evidence == expected.evidence
+    assert actual.semantic_profile_ref == expected.semantic_profile_ref
+    assert actual.semantic_profile_descriptor == expected.semantic_profile_descriptor
+    assert actual.label_index == expected.label_index
+    assert actual.alias_index == expected.alias_index
+    assert actual.subject_index == expected.subject_index
+    assert actual.object_index == expected.object_index
+    assert actual.predicate_index == expected.predicate_index
+
+
+def _snapshots() -> list[ParsedGraphSnapshot]:
+    return [
+        READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload()),
+        READER.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=_v2_payload()),
+        _parse_v4(),
+        UnionGraphV5SnapshotReader(profile_registry=_v5_registry()).parse(
+            graph_schema="dm_union_graph_v5", graph_payload=_v5_payload()
+        ),
+    ]
+
+
+@pytest.mark.parametrize("index", range(4), ids=["v1", "v2", "v4", "v5"])
+def test_artifact_round_trip_equals_full_parse(index: int) -> None:
+    snapshot = _snapshots()[index]
+    key = _key(snapshot)
+
+    restored = decode_snapshot_artifact(encode_snapshot_artifact(snapshot, key=key), key=key)
+
+    assert restored is not None
+    _assert_same_snapshot(restored, snapshot)
+
+
+def test_compact_snapshot_round_trips_compact() -> None:
+    snapshot = compact_snapshot(
+        READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    )
+    key = _key(snapshot)
+
+    restored = decode_snapshot_artifact(encode_snapshot_artifact(snapshot, key=key), key=key)
+
+    assert restored is not None
+    assert is_compact_snapshot(restored)
+    _assert_same_snapshot(restored, snapshot)
+
+
+@pytest.mark.parametrize(
+    "field",
+    ["world_id", "revision_id", "graph_payload_sha256", "graph_schema", "reader_digest"],
+)
+def test_any_key_mismatch_requires_rebuild(field: str) -> None:
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    key = _key(snapshot)
+    data = encode_snapshot_artifact(snapshot, key=key)
+
+    assert decode_snapshot_artifact(data, key=replace(key, **{field: "other"})) is None
+
+
+def test_reader_code_change_requires_rebuild(monkeypatch: pytest.MonkeyPatch) -> None:
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    key = _key(snapshot)
+    data = encode_snapshot_artifact(snapshot, key=key)
+    monkeypatch.setattr(graph_snapshot_artifacts, "reader_code_digest", lambda: "0" * 64)
+
+    assert decode_snapshot_artifact(data, key=key) is None
+
+
+def test_reader_code_covers_every_dispatched_reader() -> None:
+    modules = graph_snapshot_artifacts._reader_code_modules()
+
+    for reader in READER.schema_readers.values():
+        assert type(reader).__module__ in modules
+    assert "dungeonmind.application.graph_snapshot_v4" in modules
+    assert "dungeonmind.application.graph_snapshot_v5" in modules
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:-1],
+        lambda data: data[:-1] + bytes([data[-1] ^ 0xFF]),
+        lambda data: b"NOTSNAP!" + data[8:],
+        lambda data: data[:12],
+        lambda data: b"",
+    ],
+    ids=["truncated", "flipped-body-byte", "bad-magic", "header-cut", "empty"],
+)
+def test_corrupt_artifacts_require_rebuild(corrupt: Any) -> None:
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    key = _key(snapshot)
+
+    data = corrupt(encode_snapshot_artifact(snapshot, key=key))
+
+    assert decode_snapshot_artifact(data, key=key) is None
+
+
+def test_encode_rejects_snapshot_from_another_world() -> None:
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    with pytest.raises(ValueError, match="artifact key"):
+        encode_snapshot_artifact(snapshot, key=_key(snapshot, world_id="world:other"))
+
+
+def test_filesystem_store_discards_unusable_artifacts(tmp_path: Path) -> None:
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload())
+    key = _key(snapshot)
+    store = FilesystemSnapshotArtifactStore(tmp_path / "artifacts")
+
+    assert store.load(key) is None
+    store.save(key, snapshot)
+    path = tmp_path / "artifacts" / key.artifact_name
+    assert path.exists()
+    assert [item.name for item in path.parent.iterdir()] == [key.artifact_name]
+    assert "world:" not in key.artifact_name
+
+    loaded = store.load(key)
+    assert loaded is not None
+    _assert_same_snapshot(loaded, snapshot)
+
+    path.write_bytes(path.read_bytes()[:-3])
+    assert store.load(key) is None
+    assert not path.exists()
+
+
+class _CountingReader(VersionedUnionGraphSnapshotReader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.parse_calls = 0
+
+    def parse(self, *, graph_schema: str, graph_payload: dict[str, Any]) -> ParsedGraphSnapshot:
+        self.parse_calls += 1
+        return super().parse(graph_schema=graph_schema, graph_payload=graph_payload)
+
+
+def _stored(
+    payload: dict[str, Any], *, graph_schema: str = GRAPH_SCHEMA_V1
+) -> StoredGraphRevision:
+    return StoredGraphRevision(
+        revision=WorldGraphRevision(
+            world_id=str(payload["world_id"]),
+            revision_id="rev:artifact",
+            parent_revision_id=None,
+            created_at=FIXED_NOW,
+            operation_ids=["op:seed"],
+            graph_schema=graph_schema,
+            graph_payload_sha256=canonical_sha256(payload),
+        ),
+        graph_payload=payload,
+    )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_restarted_cache_loads_artifact_instead_of_parsing(
+    tmp_path: Path, compact: bool
+) -> None:
+    stored = _stored(_v1_payload())
+    store = FilesystemSnapshotArtifactStore(tmp_path)
+    cold_reader = _CountingReader()
+    reader = CompactGraphSnapshotReader(cold_reader) if compact else cold_reader
+
+    first = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+    parsed = first.get_or_parse(stored, reader=reader)
+    assert (cold_reader.parse_calls, first.stats().artifact_rebuilds) == (1, 1)
+
+    restarted = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+    loaded = restarted.get_or_parse(stored, reader=reader)
+
+    assert cold_reader.parse_calls == 1
+    assert restarted.stats().artifact_loads == 1
+    assert is_compact_snapshot(loaded) is compact
+    _assert_same_snapshot(loaded, parsed)
+    assert restarted.get_or_parse(stored, reader=reader) is loaded
+
+
+def test_artifact_for_another_reader_is_not_reused(tmp_path: Path) -> None:
+    stored = _stored(_v1_payload())
+    store = FilesystemSnapshotArtifactStore(tmp_path)
+    ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store).get_or_parse(
+        stored, reader=READER
+    )
+    compact_reader = CompactGraphSnapshotReader(_CountingReader())
+    assert graph_reader_digest(compact_reader) != graph_reader_digest(READER)
+
+    cache = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+    cache.get_or_parse(stored, reader=compact_reader)
+
+    assert compact_reader.wrapped_reader.parse_calls == 1
+    assert cache.stats().artifact_loads == 0
+
+
+def test_loaded_artifact_pin_is_rechecked_against_live_registry(tmp_path: Path) -> None:
+    stored = _stored(_v5_payload(), graph_schema="dm_union_graph_v5")
+    store = FilesystemSnapshotArtifactStore(tmp_path)
+    ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store).get_or_parse(
+        stored, reader=VersionedUnionGraphSnapshotReader(_v5_registry())
+    )
+
+    admitted = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+    admitted.get_or_parse(stored, reader=VersionedUnionGraphSnapshotReader(_v5_registry()))
+    assert admitted.stats().artifact_loads == 1
+
+    withdrawn = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+    with pytest.raises(SemanticProfileNotFoundError):
+        withdrawn.get_or_parse(
+            stored, reader=VersionedUnionGraphSnapshotReader(StaticSemanticProfileRegistry())
+        )
+    assert withdrawn.stats().entries == 0
+
+
+def test_lazy_reader_bypasses_artifacts(tmp_path: Path) -> None:
+    stored = _stored(_v2_payload(), graph_schema=GRAPH_SCHEMA_V2)
+    store = FilesystemSnapshotArtifactStore(tmp_path)
+    cache = ParsedSnapshotCache(max_bytes=10_000_000, artifacts=store)
+
+    cache.get_or_parse(stored, reader=VersionedUnionGraphSnapshotReader(lazy_objects=True))
+
+    assert list(tmp_path.iterdir()) == []
+    assert (cache.stats().artifact_loads, cache.stats().artifact_rebuilds) == (0, 0)
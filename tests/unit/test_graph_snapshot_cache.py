@@ -0,0 +1,182 @@
+"""Unit tests for the revision-keyed parsed snapshot cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    ParsedGraphSnapshot,
+    UnionGraphV1SnapshotReader,
+    VersionedUnionGraphSnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_cache import (
+    ParsedSnapshotCache,
+    estimate_snapshot_bytes,
+    graph_reader_digest,
+)
+from dungeonmind.contracts.graph import StoredGraphRevision, WorldGraphRevision
+from dungeonmind.contracts.semantic_profile import SemanticProfileDescriptor
+from dungeonmind.domain.canonical import canonical_sha256
+from dungeonmind.domain.errors import PersistenceIntegrityError
+from dungeonmind.infrastructure.semantic_profiles import StaticSemanticProfileRegistry
+
+from ..conftest import FIXED_NOW
+
+
+class _CountingReader(UnionGraphV1SnapshotReader):
+    def __init__(self) -> None:
+        self.parse_calls = 0
+
+    def parse(
+        self,
+        *,
+        graph_schema: str,
+        graph_payload: dict[str, Any],
+    ) -> ParsedGraphSnapshot:
+        self.parse_calls += 1
+        return super().parse(graph_schema=graph_schema, graph_payload=graph_payload)
+
+
+def _payload(world_id: str = "world:cache", *, nodes: int = 2) -> dict[str, Any]:
+    return {
+        "world_id": world_id,
+        "nodes": [
+            {
+                "object_id": f"obj:n{index}",
+                "kind": "npc",
+                "label": f"Node {index}",
+                "aliases": [],
+                "evidence_ref_ids": [],
+            }
+            for index in range(nodes)
+        ],
+        "relationships": [],
+        "evidence_refs": [],
+    }
+
+
+def _stored(revision_id: str, payload: dict[str, Any]) -> StoredGraphRevision:
+    return StoredGraphRevision(
+        revision=WorldGraphRevision(
+            world_id=str(payload["world_id"]),
+            revision_id=revision_id,
+            parent_revision_id=None,
+            created_at=FIXED_NOW,
+            operation_ids=["op:seed"],
+            graph_schema=GRAPH_SCHEMA_V1,
+            graph_payload_sha256=canonical_sha256(payload),
+        ),
+        graph_payload=payload,
+    )
+
+
+def test_repeated_revision_parses_once() -> None:
+    reader = _CountingReader()
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    stored = _stored("rev:a", _payload())
+
+    first = cache.get_or_parse(stored, reader=reader)
+    second = cache.get_or_parse(stored, reader=reader)
+
+    assert first is second
+    assert reader.parse_calls == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.current_bytes == estimate_snapshot_bytes(first)
+
+
+def test_payload_digest_is_part_of_key() -> None:
+    reader = _CountingReader()
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    cache.get_or_parse(_stored("rev:a", _payload(nodes=2)), reader=reader)
+    cache.get_or_parse(_stored("rev:a", _payload(nodes=3)), reader=reader)
+    assert reader.parse_calls == 2
+    assert cache.stats().entries == 2
+
+
+def test_reader_digest_separates_reader_implementations() -> None:
+    assert graph_reader_digest(UnionGraphV1SnapshotReader()) != graph_reader_digest(
+        VersionedUnionGraphSnapshotReader()
+    )
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    stored = _stored("rev:a", _payload())
+    v1 = cache.get_or_parse(stored, reader=UnionGraphV1SnapshotReader())
+    union = cache.get_or_parse(stored, reader=VersionedUnionGraphSnapshotReader())
+    assert v1 is not union
+    assert cache.stats().misses == 2
+
+
+def test_reader_digest_separates_profile_registries() -> None:
+    descriptor = SemanticProfileDescriptor(
+        profile_id="test.cache",
+        profile_revision="cache-profile-v1",
+        term_namespaces=["cache"],
+    )
+    admitting = VersionedUnionGraphSnapshotReader(StaticSemanticProfileRegistry([descriptor]))
+    empty = VersionedUnionGraphSnapshotReader()
+    assert graph_reader_digest(admitting) != graph_reader_digest(empty)
+    assert graph_reader_digest(admitting) == graph_reader_digest(
+        VersionedUnionGraphSnapshotReader(StaticSemanticProfileRegistry([descriptor]))
+    )
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    stored = _stored("rev:a", _payload())
+    cache.get_or_parse(stored, reader=admitting)
+    cache.get_or_parse(stored, reader=empty)
+    assert cache.stats().misses == 2
+
+
+def test_lru_eviction_respects_byte_budget() -> None:
+    reader = _CountingReader()
+    one_entry = estimate_snapshot_bytes(
+        reader.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_payload())
+    )
+    cache = ParsedSnapshotCache(max_bytes=one_entry * 2)
+    stored_a = _stored("rev:a", _payload("world:a"))
+    stored_b = _stored("rev:b", _payload("world:b"))
+    stored_c = _stored("rev:c", _payload("world:c"))
+
+    cache.get_or_parse(stored_a, reader=reader)
+    cache.get_or_parse(stored_b, reader=reader)
+    cache.get_or_parse(stored_a, reader=reader)  # a becomes most recent
+    cache.get_or_parse(stored_c, reader=reader)  # evicts b
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.current_bytes <= stats.max_bytes
+    calls = reader.parse_calls
+    cache.get_or_parse(stored_a, reader=reader)
+    assert reader.parse_calls == calls
+    cache.get_or_parse(stored_b, reader=reader)
+    assert reader.parse_calls == calls + 1
+
+
+def test_snapshot_larger_than_budget_is_served_not_retained() -> None:
+    reader = _CountingReader()
+    cache = ParsedSnapshotCache(max_bytes=1)
+    stored = _stored("rev:a", _payload())
+    cache.get_or_parse(stored, reader=reader)
+    cache.get_or_parse(stored, reader=reader)
+    assert reader.parse_calls == 2
+    assert cache.stats().entries == 0
+
+
+def test_parse_failures_are_not_cached() -> None:
+    reader = _CountingReader()
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    payload = _payload()
+    payload["nodes"].append(dict(payload["nodes"][0]))
+    stored = _stored("rev:bad", payload)
+    for _ in range(2):
+        with pytest.raises(PersistenceIntegrityError, match="duplicate object_id"):
+            cache.get_or_parse(stored, reader=reader)
+    assert reader.parse_calls == 2
+    assert cache.stats().entries == 0
+
+
+def test_budget_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        ParsedSnapshotCache(max_bytes=0)
@@ -0,0 +1,223 @@
+"""Unit tests for the compact, interned parsed-snapshot backend."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    GRAPH_SCHEMA_V2,
+    UnionGraphV1SnapshotReader,
+    VersionedUnionGraphSnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_cache import (
+    estimate_snapshot_bytes,
+    graph_reader_digest,
+)
+from dungeonmind.application.graph_snapshot_compact import (
+    CompactGraphSnapshotReader,
+    compact_snapshot,
+    is_compact_snapshot,
+)
+from dungeonmind.domain.errors import PersistenceIntegrityError
+
+
+def _evidence(evidence_ref_id: str) -> dict[str, Any]:
+    return {
+        "evidence_ref_id": evidence_ref_id,
+        "source_artifact_id": "src:atlas-notes",
+        "source_revision_id": "srcrev:atlas-notes-v1",
+        "source_domain": "worldbuilding",
+        "evidence_role": "support",
+        "locator": f"fixture://atlas-notes#{evidence_ref_id}",
+    }
+
+
+def _v1_payload() -> dict[str, Any]:
+    return {
+        "world_id": "world:compact",
+        "nodes": [
+            {
+                "object_id": f"obj:n{index}",
+                "kind": "npc",
+                "label": f"Node {index}",
+                "aliases": [f"Alias {index}"],
+                "evidence_ref_ids": ["ev:shared", f"ev:{index}"],
+            }
+            for index in range(3)
+        ],
+        "relationships": [
+            {
+                "relationship_id": f"rel:{index}",
+                "subject_object_id": f"obj:n{index}",
+                "predicate": "knows",
+                "object_object_id": f"obj:n{(index + 1) % 3}",
+                "evidence_ref_ids": ["ev:shared"],
+            }
+            for index in range(3)
+        ],
+        "evidence_refs": [_evidence("ev:shared")]
+        + [_evidence(f"ev:{index}") for index in range(3)],
+    }
+
+
+def _v2_payload() -> dict[str, Any]:
+    return {
+        "world_id": "world:compact",
+        "nodes": [
+            {
+                "object_id": "obj:ledger",
+                "kind": "artifact",
+                "label": "The Sun Ledger",
+                "evidence_ref_ids": ["ev:core"],
+                "alias_assertions": [
+                    {
+                        "assertion_id": "asrt:alias-ledger",
+                        "alias": "Sun Ledger",
+                        "evidence_ref_ids": ["ev:alias"],
+                    }
+                ],
+                "summary_assertion": {
+                    "assertion_id": "asrt:summary-ledger",
+                    "summary": "A ledger of sunrises.",
+                    "evidence_ref_ids": ["ev:summary"],
+                },
+            }
+        ],
+        "relationships": [],
+        "evidence_refs": [_evidence("ev:core"), _evidence("ev:alias"), _evidence("ev:summary")],
+    }
+
+
+@pytest.mark.parametrize(
+    ("graph_schema", "payload"),
+    [(GRAPH_SCHEMA_V1, _v1_payload()), (GRAPH_SCHEMA_V2, _v2_payload())],
+)
+def test_compact_views_equal_full_views(graph_schema: str, payload: dict[str, Any]) -> None:
+    reader = VersionedUnionGraphSnapshotReader()
+    full = reader.parse(graph_schema=graph_schema, graph_payload=payload)
+    compact = CompactGraphSnapshotReader(reader).parse(
+        graph_schema=graph_schema, graph_payload=payload
+    )
+
+    assert is_compact_snapshot(compact)
+    assert list(compact.objects) == list(full.objects)
+    assert dict(compact.objects.items()) == full.objects
+    assert dict(compact.relationships.items()) == full.relationships
+    assert compact.evidence == full.evidence
+    assert list(compact.evidence) == list(full.evidence)
+    assert all(
+        compact.evidence[key].model_fields_set == record.model_fields_set
+        for key, record in full.evidence.items()
+    )
+    assert compact.label_index == full.label_index
+    assert compact.alias_index == full.alias_index
+    assert compact.subject_index == full.subject_index
+    for object_id in full.objects:
+        assert reader.get_object(compact, object_id) == full.objects[object_id]
+    assert reader.list_relationships(compact, ["obj:n0"]) == reader.list_relationships(
+        full, ["obj:n0"]
+    )
+    message = "Tell me about Node 1 and the Sun Ledger"
+    assert reader.resolve_mentions(
+        compact, message=message, selected_object_ids=[]
+    ) == reader.resolve_mentions(full, message=message, selected_object_ids=[])
+
+
+def test_views_are_materialized_per_access() -> None:
+    compact = compact_snapshot(
+        UnionGraphV1SnapshotReader().parse(
+            graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload()
+        )
+    )
+    first = compact.objects["obj:n0"]
+    first.aliases.append("Mutated")
+
+    assert compact.objects["obj:n0"] is not first
+    assert compact.objects["obj:n0"].aliases == ["Alias 0"]
+    assert "obj:n0" in compact.objects
+    assert "obj:missing" not in compact.objects
+    assert compact.objects.get("obj:missing") is None
+
+
+def test_compaction_is_idempotent() -> None:
+    full = UnionGraphV1SnapshotReader().parse(
+        graph_schema=GRAPH_SCHEMA_V1, graph_payload=_v1_payload()
+    )
+    compact = compact_snapshot(full)
+
+    assert compact_snapshot(compact) is compact
+    assert not is_compact_snapshot(full)
+    assert estimate_snapshot_bytes(compact) < estimate_snapshot_bytes(full)
+
+
+def _generated_payload(count: int) -> dict[str, Any]:
+    return {
+        "world_id": "world:compact-generated",
+        "nodes": [
+            {
+                "object_id": f"obj:n{index}",
+                "kind": "npc",
+                "label": f"Node {index}",
+                "aliases": [f"Alias {index}"],
+                "evidence_ref_ids": [f"ev:{index}"],
+            }
+            for index in range(count)
+        ],
+        "relationships": [
+            {
+                "relationship_id": f"rel:{index}-{hop}",
+                "subject_object_id": f"obj:n{index}",
+                "predicate": "knows",
+                "object_object_id": f"obj:n{(index * 7 + hop + 1) % count}",
+                "evidence_ref_ids": [f"ev:{index}"],
+            }
+            for index in range(count)
+            for hop in range(2)
+        ],
+        "evidence_refs": [_evidence(f"ev:{index}") for index in range(count)],
+    }
+
+
+def test_compaction_retains_a_fraction_of_the_full_parse() -> None:
+    payload = _generated_payload(2_000)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        full = UnionGraphV1SnapshotReader().parse(
+            graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload
+        )
+        gc.collect()
+        full_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        compact = compact_snapshot(full)
+        del full
+        gc.collect()
+        compact_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert len(compact.evidence) == 2_000
+    # About 2.8x here; the margin keeps the check stable across Python builds.
+    assert compact_bytes * 2 < full_bytes
+
+
+def test_wrapped_reader_digest_tracks_inner_reader() -> None:
+    v1 = CompactGraphSnapshotReader(UnionGraphV1SnapshotReader())
+    versioned = CompactGraphSnapshotReader(VersionedUnionGraphSnapshotReader())
+
+    assert graph_reader_digest(v1) != graph_reader_digest(versioned)
+    assert graph_reader_digest(v1) != graph_reader_digest(UnionGraphV1SnapshotReader())
+
+
+def test_parse_failures_come_from_wrapped_reader() -> None:
+    payload = _v1_payload()
+    payload["nodes"].append(dict(payload["nodes"][0]))
+    with pytest.raises(PersistenceIntegrityError, match="duplicate object_id"):
+        CompactGraphSnapshotReader(UnionGraphV1SnapshotReader()).parse(
+            graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload
+        )
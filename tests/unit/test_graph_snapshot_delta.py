@@ -0,0 +1,193 @@
+"""Unit tests for deriving a child snapshot from its parent plus a delta."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    GRAPH_SCHEMA_V2,
+    GraphSnapshotDelta,
+    ParsedGraphSnapshot,
+    UnionGraphV1SnapshotReader,
+    UnionGraphV2SnapshotReader,
+    derive_child_snapshot,
+)
+from dungeonmind.domain.errors import PersistenceIntegrityError
+
+READER = UnionGraphV2SnapshotReader()
+
+
+def _evidence(evidence_ref_id: str) -> dict[str, Any]:
+    return {
+        "evidence_ref_id": evidence_ref_id,
+        "source_artifact_id": "src:atlas-notes",
+        "source_revision_id": "srcrev:atlas-notes-v1",
+        "source_domain": "worldbuilding",
+        "evidence_role": "support",
+        "locator": f"fixture://atlas-notes#{evidence_ref_id}",
+    }
+
+
+def _node(object_id: str, label: str, *, alias: str | None = None) -> dict[str, Any]:
+    return {
+        "object_id": object_id,
+        "kind": "npc",
+        "label": label,
+        "evidence_ref_ids": ["ev:core"],
+        "alias_assertions": (
+            []
+            if alias is None
+            else [
+                {
+                    "assertion_id": f"asrt:alias-{object_id}",
+                    "alias": alias,
+                    "evidence_ref_ids": ["ev:core"],
+                }
+            ]
+        ),
+        "summary_assertion": None,
+    }
+
+
+def _relationship(relationship_id: str, subject: str, obj: str) -> dict[str, Any]:
+    return {
+        "relationship_id": relationship_id,
+        "subject_object_id": subject,
+        "predicate": "knows",
+        "object_object_id": obj,
+        "evidence_ref_ids": ["ev:core"],
+    }
+
+
+def _parent_payload() -> dict[str, Any]:
+    return {
+        "world_id": "world:delta",
+        "nodes": [
+            _node("obj:a", "Alda", alias="Old Alda"),
+            _node("obj:b", "Bram"),
+        ],
+        "relationships": [_relationship("rel:ab", "obj:a", "obj:b")],
+        "evidence_refs": [_evidence("ev:core")],
+    }
+
+
+def _apply(payload: dict[str, Any], delta: GraphSnapshotDelta) -> dict[str, Any]:
+    child = copy.deepcopy(payload)
+    positions = {node["object_id"]: i for i, node in enumerate(child["nodes"])}
+    for node in delta.upserted_nodes:
+        if node["object_id"] in positions:
+            child["nodes"][positions[node["object_id"]]] = copy.deepcopy(node)
+        else:
+            child["nodes"].append(copy.deepcopy(node))
+    child["relationships"].extend(copy.deepcopy(list(delta.added_relationships)))
+    child["evidence_refs"].extend(copy.deepcopy(list(delta.added_evidence_refs)))
+    return child
+
+
+def _assert_equivalent(derived: ParsedGraphSnapshot, full: ParsedGraphSnapshot) -> None:
+    assert dict(derived.objects.items()) == dict(full.objects.items())
+    assert dict(derived.relationships.items()) == dict(full.relationships.items())
+    assert derived.evidence == full.evidence
+    assert derived.label_index == full.label_index
+    assert derived.alias_index == full.alias_index
+    assert derived.subject_index == full.subject_index
+    assert derived.object_index == full.object_index
+    assert derived.predicate_index == full.predicate_index
+
+
+def _colliding_alias_node() -> dict[str, Any]:
+    node = _node("obj:c", "Corin", alias="Alias")
+    node["alias_assertions"][0]["assertion_id"] = "asrt:alias-obj:a"
+    return node
+
+
+def _delta() -> GraphSnapshotDelta:
+    return GraphSnapshotDelta(
+        upserted_nodes=(
+            _node("obj:a", "Alda the Bold", alias="Bold Alda"),
+            _node("obj:c", "Corin", alias="Old Alda"),
+        ),
+        added_relationships=(_relationship("rel:ca", "obj:c", "obj:a"),),
+        added_evidence_refs=(_evidence("ev:extra"),),
+    )
+
+
+def test_derived_child_equals_full_parse_of_child_payload() -> None:
+    parent_payload = _parent_payload()
+    parent = READER.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=parent_payload)
+    delta = _delta()
+
+    derived = derive_child_snapshot(parent, delta)
+    full = READER.parse(
+        graph_schema=GRAPH_SCHEMA_V2, graph_payload=_apply(parent_payload, delta)
+    )
+
+    _assert_equivalent(derived, full)
+    assert list(derived.objects) == list(full.objects)
+    assert derived.objects["obj:b"] is parent.objects["obj:b"]
+    assert parent.alias_index == {"old alda": ["obj:a"]}
+    assert READER.resolve_mentions(
+        derived, message="Old Alda met Corin", selected_object_ids=[]
+    ) == READER.resolve_mentions(full, message="Old Alda met Corin", selected_object_ids=[])
+
+
+def test_empty_delta_reproduces_parent() -> None:
+    parent = READER.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=_parent_payload())
+    _assert_equivalent(derive_child_snapshot(parent, GraphSnapshotDelta()), parent)
+
+
+@pytest.mark.parametrize(
+    ("delta", "match"),
+    [
+        (
+            GraphSnapshotDelta(upserted_nodes=(_colliding_alias_node(),)),
+            "duplicate assertion_id",
+        ),
+        (
+            GraphSnapshotDelta(
+                upserted_nodes=(dict(_node("obj:c", "Corin"), evidence_ref_ids=["ev:gone"]),)
+            ),
+            "dangling node evidence_ref_id",
+        ),
+        (
+            GraphSnapshotDelta(added_relationships=(_relationship("rel:ab", "obj:b", "obj:a"),)),
+            "duplicate relationship_id",
+        ),
+        (
+            GraphSnapshotDelta(added_relationships=(_relationship("rel:bz", "obj:b", "obj:z"),)),
+            "dangling relationship object",
+        ),
+        (
+            GraphSnapshotDelta(added_evidence_refs=(dict(_evidence("ev:core"), locator="x"),)),
+            "differing payloads",
+        ),
+    ],
+)
+def test_invalid_delta_fails_closed_like_a_full_parse(
+    delta: GraphSnapshotDelta, match: str
+) -> None:
+    parent_payload = _parent_payload()
+    parent = READER.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=parent_payload)
+
+    with pytest.raises(PersistenceIntegrityError, match=match):
+        derive_child_snapshot(parent, delta)
+    with pytest.raises(PersistenceIntegrityError):
+        READER.parse(graph_schema=GRAPH_SCHEMA_V2, graph_payload=_apply(parent_payload, delta))
+
+
+def test_v1_snapshots_are_not_derived() -> None:
+    payload = {
+        "world_id": "world:delta",
+        "nodes": [],
+        "relationships": [],
+        "evidence_refs": [],
+    }
+    parent = UnionGraphV1SnapshotReader().parse(
+        graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload
+    )
+    with pytest.raises(PersistenceIntegrityError, match="incrementally"):
+        derive_child_snapshot(parent, GraphSnapshotDelta())
@@ -0,0 +1,195 @@
+"""Unit tests for lazy object materialization in the v2-v5 graph readers."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V2,
+    GRAPH_SCHEMA_V3,
+    GRAPH_SCHEMA_V4,
+    GRAPH_SCHEMA_V5,
+    LazyObjectTable,
+    ParsedGraphSnapshot,
+    VersionedUnionGraphSnapshotReader,
+    is_lazy_snapshot,
+)
+from dungeonmind.application.graph_snapshot_cache import graph_reader_digest
+from dungeonmind.application.graph_snapshot_compact import compact_snapshot
+from dungeonmind.application.semantic_profiles import SemanticProfileRegistry
+from dungeonmind.domain.errors import PersistenceIntegrityError
+
+from .test_graph_snapshot_compact import _v2_payload
+from .test_semantic_profile_graph import _narrative_registry, _v3_payload
+from .test_union_graph_v4 import _registry as _v4_registry
+from .test_union_graph_v4 import _v4_payload
+from .test_union_graph_v5 import _registry as _v5_registry
+from .test_union_graph_v5 import _v5_payload
+
+_CASES: dict[
+    str, tuple[str, Callable[[], SemanticProfileRegistry | None], Callable[[], dict[str, Any]]]
+] = {
+    "v2": (GRAPH_SCHEMA_V2, lambda: None, _v2_payload),
+    "v3": (GRAPH_SCHEMA_V3, _narrative_registry, _v3_payload),
+    "v4": (GRAPH_SCHEMA_V4, _v4_registry, _v4_payload),
+    "v5": (GRAPH_SCHEMA_V5, _v5_registry, _v5_payload),
+}
+
+
+def _parse(
+    case: str, *, lazy: bool, payload: dict[str, Any] | None = None
+) -> ParsedGraphSnapshot:
+    graph_schema, registry, factory = _CASES[case]
+    reader = VersionedUnionGraphSnapshotReader(registry(), lazy_objects=lazy)
+    return reader.parse(
+        graph_schema=graph_schema,
+        graph_payload=payload if payload is not None else factory(),
+    )
+
+
+def _eager_error(case: str, payload: dict[str, Any]) -> str:
+    with pytest.raises(PersistenceIntegrityError) as exc_info:
+        _parse(case, lazy=False, payload=payload)
+    return str(exc_info.value)
+
+
+@pytest.mark.parametrize("case", sorted(_CASES))
+def test_lazy_snapshot_equals_eager_parse(case: str) -> None:
+    eager = _parse(case, lazy=False)
+    lazy = _parse(case, lazy=True)
+
+    assert is_lazy_snapshot(lazy)
+    assert not is_lazy_snapshot(eager)
+    assert isinstance(lazy.objects, LazyObjectTable)
+    assert lazy.objects.materialized_count == 0
+    assert list(lazy.objects) == list(eager.objects)
+    assert lazy.label_index == eager.label_index
+    assert lazy.alias_index == eager.alias_index
+    assert lazy.relationships == eager.relationships
+    assert lazy.evidence == eager.evidence
+    assert lazy.subject_index == eager.subject_index
+    assert lazy.semantic_profile_descriptor == eager.semantic_profile_descriptor
+    for object_id, view in eager.objects.items():
+        assert lazy.objects[object_id] == view
+    assert lazy.objects.materialized_count == len(eager.objects)
+    assert lazy.objects.get("obj:missing") is None
+
+
+def test_only_touched_objects_are_built() -> None:
+    lazy = _parse("v4", lazy=True)
+    assert isinstance(lazy.objects, LazyObjectTable)
+    object_id = next(iter(lazy.objects))
+
+    first = lazy.objects[object_id]
+
+    assert lazy.objects[object_id] is first
+    assert lazy.objects.materialized_count == 1
+    assert object_id in lazy.objects
+
+
+def _break_kind(payload: dict[str, Any]) -> str:
+    record = payload["objects"][-1]
+    record["kind"] = "unknown:kind"
+    return record["object_id"]
+
+
+def _blank_label(payload: dict[str, Any]) -> str:
+    node = payload["nodes"][0]
+    node["label"] = " "
+    return node["object_id"]
+
+
+@pytest.mark.parametrize(
+    ("case", "corrupt"),
+    [("v2", _blank_label), ("v4", _break_kind), ("v5", _break_kind)],
+)
+def test_object_errors_fire_on_access_exactly_as_eager(
+    case: str, corrupt: Callable[[dict[str, Any]], str]
+) -> None:
+    payload = copy.deepcopy(_CASES[case][2]())
+    broken_id = corrupt(payload)
+    expected = _eager_error(case, payload)
+
+    lazy = _parse(case, lazy=True, payload=payload)
+
+    for object_id in lazy.objects:
+        if object_id != broken_id:
+            assert lazy.objects[object_id].object_id == object_id
+    for _ in range(2):
+        with pytest.raises(PersistenceIntegrityError) as exc_info:
+            lazy.objects[broken_id]
+        assert str(exc_info.value) == expected
+    with pytest.raises(PersistenceIntegrityError):
+        compact_snapshot(lazy)
+
+
+def _duplicate_object(payload: dict[str, Any]) -> None:
+    records = payload.get("objects", payload.get("nodes"))
+    records.append(copy.deepcopy(records[0]))
+
+
+def _duplicate_assertion(payload: dict[str, Any]) -> None:
+    if "objects" in payload:
+        first, second = payload["objects"][:2]
+        second["assertion_metadata"]["assertion_id"] = first["assertion_metadata"][
+            "assertion_id"
+        ]
+    else:
+        clone = copy.deepcopy(payload["nodes"][0])
+        clone["object_id"] = "obj:clone"
+        clone["label"] = "Clone"
+        clone["alias_assertions"][0]["alias"] = "Clone Alias"
+        del clone["summary_assertion"]
+        payload["nodes"].append(clone)
+
+
+def _dangling_node_evidence(payload: dict[str, Any]) -> None:
+    if "objects" in payload:
+        payload["objects"][0]["assertion_metadata"]["evidence_ref_ids"].append("ev:missing")
+    else:
+        payload["nodes"][0]["evidence_ref_ids"].append("ev:missing")
+
+
+def _dangling_relationship(payload: dict[str, Any]) -> None:
+    rel = payload["relationships"][0]
+    rel["target_object_id" if "objects" in payload else "object_object_id"] = "obj:missing"
+
+
+@pytest.mark.parametrize(
+    ("case", "corrupt", "match"),
+    [
+        ("v2", _duplicate_object, "duplicate object_id"),
+        ("v2", _duplicate_assertion, "duplicate assertion_id"),
+        ("v2", _dangling_node_evidence, "dangling node evidence_ref_id"),
+        ("v3", _dangling_relationship, "dangling relationship object"),
+        ("v4", _duplicate_object, "duplicate object_id"),
+        ("v4", _duplicate_assertion, "duplicate assertion_id"),
+        ("v4", _dangling_node_evidence, "dangling node evidence_ref_id"),
+        ("v4", _dangling_relationship, "dangling relationship object"),
+    ],
+)
+def test_structural_errors_still_fail_parse(
+    case: str, corrupt: Callable[[dict[str, Any]], None], match: str
+) -> None:
+    payload = copy.deepcopy(_CASES[case][2]())
+    corrupt(payload)
+    expected = _eager_error(case, payload)
+
+    with pytest.raises(PersistenceIntegrityError, match=match) as exc_info:
+        _parse(case, lazy=True, payload=payload)
+
+    assert str(exc_info.value) == expected
+
+
+def test_lazy_reader_has_its_own_digest() -> None:
+    eager = VersionedUnionGraphSnapshotReader()
+    lazy = VersionedUnionGraphSnapshotReader(lazy_objects=True)
+
+    assert graph_reader_digest(eager) != graph_reader_digest(lazy)
+    assert graph_reader_digest(lazy) == graph_reader_digest(
+        VersionedUnionGraphSnapshotReader(lazy_objects=True)
+    )
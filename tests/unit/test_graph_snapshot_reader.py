@@ -1,13 +1,25 @@
 """Unit tests for the ``dm_union_graph_v1`` snapshot reader."""
 
+import random
+from dataclasses import replace
+from datetime import UTC, datetime
+
 import pytest
 
+from dungeonmind.application.graph_scope import project_scoped_snapshot
 from dungeonmind.application.graph_snapshot import (
+    PhraseMatcher,
     UnionGraphV1SnapshotReader,
+    build_relationship_indexes,
     collect_one_hop_object_ids,
+    contains_exact_phrase,
+    list_relationships_from_snapshot,
 )
+from dungeonmind.contracts.evidence import SourceArtifact, SourceDomain, SourceRevision
 from dungeonmind.contracts.identity import IdentityOutcome
+from dungeonmind.contracts.projection import Admissibility
 from dungeonmind.domain.errors import PersistenceIntegrityError
+from dungeonmind.infrastructure.memory import InMemorySourceRepository
 
 READER = UnionGraphV1SnapshotReader()
 
@@ -213,6 +225,78 @@ def test_one_hop_traversal_is_deterministic() -> None:
     assert [r.relationship_id for r in first] == sorted(r.relationship_id for r in first)
 
 
+def test_reader_builds_relationship_adjacency() -> None:
+    snapshot = READER.parse(graph_schema="dm_union_graph_v1", graph_payload=_payload())
+    assert snapshot.subject_index == {
+        "obj:npc-mere-astor": ["rel:astor-resides-vael", "rel:astor-safeguards-ledger"]
+    }
+    assert snapshot.object_index == {
+        "obj:city-vael": ["rel:astor-resides-vael"],
+        "obj:item-sun-ledger": ["rel:astor-safeguards-ledger"],
+    }
+    assert snapshot.predicate_index == {
+        "resides_in": ["rel:astor-resides-vael"],
+        "safeguards": ["rel:astor-safeguards-ledger"],
+    }
+
+
+def test_adjacency_lookup_matches_full_scan() -> None:
+    snapshot = READER.parse(graph_schema="dm_union_graph_v1", graph_payload=_payload())
+    unindexed = replace(snapshot, subject_index={}, object_index={}, predicate_index={})
+    for focus in (
+        [],
+        ["obj:npc-mere-astor"],
+        ["obj:city-vael"],
+        ["obj:item-sun-ledger", "obj:city-vael"],
+        ["obj:missing"],
+    ):
+        indexed = list_relationships_from_snapshot(snapshot, focus)
+        scanned = list_relationships_from_snapshot(unindexed, focus)
+        assert [r.relationship_id for r in indexed] == [
+            r.relationship_id for r in scanned
+        ]
+
+
+def test_scoped_projection_carries_adjacency_for_retained_relationships() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=UTC)
+    sources = InMemorySourceRepository()
+    sources.put_artifact(
+        SourceArtifact(
+            source_artifact_id="src:atlas-notes",
+            source_domain=SourceDomain.WORLDBUILDING,
+            world_id="world:demo-atlas",
+            created_at=now,
+        )
+    )
+    sources.put_revision(
+        SourceRevision(
+            source_revision_id="srcrev:atlas-notes-v1",
+            source_artifact_id="src:atlas-notes",
+            content_sha256="aa" * 32,
+            locator="fixture://atlas-notes",
+            created_at=now,
+        )
+    )
+    payload = _payload()
+    # Unestablishable provenance hides the Vael edge but keeps both endpoints.
+    payload["evidence_refs"][3]["source_artifact_id"] = "src:missing"  # type: ignore[index]
+    snapshot = READER.parse(graph_schema="dm_union_graph_v1", graph_payload=payload)
+    scoped = project_scoped_snapshot(
+        snapshot,
+        sources=sources,
+        world_id="world:demo-atlas",
+        campaign_id=None,
+        admissibility=Admissibility.GM,
+    ).snapshot
+    assert set(scoped.relationships) == {"rel:astor-safeguards-ledger"}
+    assert (
+        scoped.subject_index,
+        scoped.object_index,
+        scoped.predicate_index,
+    ) == build_relationship_indexes(scoped.relationships)
+    assert list_relationships_from_snapshot(scoped, ["obj:city-vael"]) == []
+
+
 def test_traversal_never_exceeds_one_hop() -> None:
     snapshot = READER.parse(graph_schema="dm_union_graph_v1", graph_payload=_payload())
     expanded = collect_one_hop_object_ids(snapshot, ["obj:item-sun-ledger"])
@@ -313,3 +397,46 @@ def test_substring_labels_and_ids_do_not_resolve() -> None:
         "obj:npc-mere-astor-impostor"
     }
     assert "obj:npc-mere-astor" not in {r.object_id for r in hyphenated if r.object_id}
+
+
+def test_phrase_matcher_agrees_with_boundary_regex() -> None:
+    phrases = [
+        "astor",
+        "mere astor",
+        "obj:x",
+        "obj:xyz",
+        "obj:npc-mere-astor",
+        "obj:npc-mere-astor-impostor",
+        "sun ledger",
+        "ledger",
+        "a",
+        "-x",
+        "x-",
+        "café",
+        "é",
+        "vael city.",
+        "",
+    ]
+    messages = [
+        "Astoria visited Vaelian markets near obj:xyz",
+        "mere astor, astor; obj:x obj:xyz obj:npc-mere-astor-impostor",
+        "(obj:npc-mere-astor) and the sun ledger!",
+        "a-a a_a a:a a",
+        "--x x-- -x- x-",
+        "café éclair é",
+        "vael city. vael city.x",
+        "",
+    ]
+    rng = random.Random(20261016)
+    alphabet = "ax:-_ .éobjx"
+    messages.extend("".join(rng.choice(alphabet) for _ in range(24)) for _ in range(200))
+    matcher = PhraseMatcher(phrases)
+    for message in messages:
+        expected = {p for p in phrases if contains_exact_phrase(message, p)}
+        assert matcher.find(message) == expected, message
+
+
+def test_snapshot_mention_matcher_is_compiled_once() -> None:
+    snapshot = READER.parse(graph_schema="dm_union_graph_v1", graph_payload=_payload())
+    assert snapshot.mention_matcher is snapshot.mention_matcher
+    assert snapshot.mention_matcher.aliases.find("ask astor") == {"astor"}
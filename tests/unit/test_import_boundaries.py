@@ -92,6 +92,11 @@ LAYER_RULES: dict[str, set[str]] = {
         "dungeonmind.domain",
         "dungeonmind.application",
     },
+    "dungeonmind.infrastructure.snapshot_artifacts": {
+        "dungeonmind.contracts",
+        "dungeonmind.domain",
+        "dungeonmind.application",
+    },
     "dungeonmind.service": {
         "dungeonmind.contracts",
         "dungeonmind.domain",
@@ -102,6 +107,7 @@ LAYER_RULES: dict[str, set[str]] = {
         "dungeonmind.infrastructure.postgres",
         "dungeonmind.infrastructure.memory",
         "dungeonmind.infrastructure.semantic_profiles",
+        "dungeonmind.infrastructure.snapshot_artifacts",
     },
 }
 
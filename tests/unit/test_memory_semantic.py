@@ -154,6 +154,24 @@ def test_reembedding_creates_new_run_not_overwrite(
     assert store.get("sdoc:2") is not None
 
 
+def test_get_many_projects_columns_and_omits_unknown_ids(
+    store: InMemorySemanticDocumentRepository,
+) -> None:
+    store.upsert_batch([make_doc("sdoc:1"), make_doc("sdoc:2", visibility=Visibility.PLAYER)])
+
+    rows = store.get_many(
+        ["sdoc:2", "sdoc:missing", "sdoc:1"], columns=("graph_object_id", "visibility")
+    )
+
+    assert rows == {
+        "sdoc:1": {"graph_object_id": "obj:sdoc:1", "visibility": "gm"},
+        "sdoc:2": {"graph_object_id": "obj:sdoc:2", "visibility": "player"},
+    }
+    assert store.get_many([], columns=("graph_object_id",)) == {}
+    with pytest.raises(ValueError, match="embedding"):
+        store.get_many(["sdoc:1"], columns=("embedding",))
+
+
 def test_delete_run_documents_rejects_completed_and_active_runs(
     runs: InMemoryEmbeddingRunRepository,
     store: InMemorySemanticDocumentRepository,
@@ -183,3 +183,19 @@ def test_same_request_id_different_turn_id_rejected() -> None:
     repo.append_turn(req, _response(req, turn_id="turn:1"))
     with pytest.raises(IdempotencyConflictError):
         repo.append_turn(req, _response(req, turn_id="turn:2"))
+
+
+def test_get_turn_by_request_id_returns_only_that_turn() -> None:
+    repo = InMemoryMindThreadRepository()
+    _create(repo)
+    for index in range(3):
+        req = _request(request_id=f"req:{index}")
+        repo.append_turn(req, _response(req, turn_id=f"turn:{index}"))
+
+    found = repo.get_turn_by_request_id("thr:1", "req:1")
+
+    assert found is not None
+    assert found[0].request_id == "req:1"
+    assert found[1].turn_id == "turn:1"
+    assert repo.get_turn_by_request_id("thr:1", "req:missing") is None
+    assert repo.get_turn_by_request_id("thr:missing", "req:1") is None
@@ -0,0 +1,194 @@
+"""Unit tests for the asyncio Mind Turn front end."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.mind_turn import AsyncMindTurnService
+from dungeonmind.application.turn_instrumentation import TurnOutcome, TurnStage, TurnTrace
+from dungeonmind.domain.canonical import canonical_json
+from dungeonmind.domain.errors import IdempotencyConflictError, RevisionNotFoundError
+
+from .test_mind_turn_service import _authorized_request, _build_service
+from .test_turn_instrumentation import _Traces
+
+MESSAGES = [
+    "Who safeguards the Sun Ledger?",
+    "Where does Mere Astor live?",
+    "What is the Sun Ledger?",
+    "Who is the Moon King?",
+]
+
+
+def _dump(response: Any) -> str:
+    return canonical_json(response.model_dump(mode="json"))
+
+
+def test_async_turns_are_byte_identical_to_sync() -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    service, _async_threads, _binding, _ = _build_service()
+    front = AsyncMindTurnService(service)
+
+    for index, message in enumerate(MESSAGES):
+        request = _authorized_request(binding, request_id=f"req:async-{index}", message=message)
+        expected = _dump(baseline.execute(request))
+        assert _dump(asyncio.run(front.execute(request))) == expected
+        # Replays come back unchanged from the thread ledger.
+        assert _dump(asyncio.run(front.execute(request))) == expected
+
+    assert service.agent_invocation_count == len(MESSAGES)
+
+
+def test_async_recovers_stored_session_without_agent() -> None:
+    service, threads, binding, _revision_id = _build_service()
+    front = AsyncMindTurnService(service)
+    request = _authorized_request(
+        binding, request_id="req:async-recover", message="Who safeguards the Sun Ledger?"
+    )
+    expected = _dump(service.execute(request))
+    # Simulate append failure after session create: session remains, turn gone.
+    threads._turns[binding.thread_id] = []
+
+    assert _dump(asyncio.run(front.execute(request))) == expected
+    assert service.agent_invocation_count == 1
+    assert len(threads.list_turns(binding.thread_id)) == 1
+
+
+def test_async_failures_match_sync_precedence() -> None:
+    service, _threads, binding, _revision_id = _build_service()
+    front = AsyncMindTurnService(service)
+    missing = _authorized_request(
+        binding,
+        request_id="req:async-missing",
+        message="Who safeguards the Sun Ledger?",
+        requested_revision_id="rev:missing",
+    )
+    with pytest.raises(RevisionNotFoundError):
+        asyncio.run(front.execute(missing))
+
+    request = _authorized_request(binding, request_id="req:async-dup", message=MESSAGES[0])
+    asyncio.run(front.execute(request))
+    changed = _authorized_request(binding, request_id="req:async-dup", message=MESSAGES[1])
+    with pytest.raises(IdempotencyConflictError):
+        asyncio.run(front.execute(changed))
+
+
+def test_revision_resolution_overlaps_query_embedding(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, _threads, binding, _revision_id = _build_service()
+    # Both stages must be in flight at once to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    world_graph = service._world_graph
+    embedder = service._query_embedder
+    get_head = world_graph.get_head
+    embed_query = embedder.embed_query
+
+    def _get_head(world_id: str) -> Any:
+        barrier.wait()
+        return get_head(world_id)
+
+    def _embed_query(text: str) -> Any:
+        barrier.wait()
+        return embed_query(text)
+
+    monkeypatch.setattr(world_graph, "get_head", _get_head)
+    monkeypatch.setattr(embedder, "embed_query", _embed_query)
+    request = _authorized_request(binding, request_id="req:async-overlap", message=MESSAGES[0])
+
+    response = asyncio.run(AsyncMindTurnService(service).execute(request))
+
+    assert "Mere Astor" in response.answer
+
+
+def test_concurrent_identical_async_requests_invoke_agent_once() -> None:
+    service, _threads, binding, _revision_id = _build_service()
+    front = AsyncMindTurnService(service)
+    request = _authorized_request(binding, request_id="req:async-race", message=MESSAGES[0])
+
+    async def _race() -> list[Any]:
+        return await asyncio.gather(*(front.execute(request) for _ in range(4)))
+
+    responses = asyncio.run(_race())
+
+    assert len({_dump(response) for response in responses}) == 1
+    assert service.agent_invocation_count == 1
+    assert front._request_locks == {}
+
+
+def test_cancelled_turn_still_runs_once_before_its_duplicate() -> None:
+    service, threads, binding, _revision_id = _build_service()
+    front = AsyncMindTurnService(service)
+    request = _authorized_request(binding, request_id="req:async-cancel", message=MESSAGES[0])
+    adapter = service._agent_adapter
+    execute_turn = adapter.execute_turn
+    entered, release = threading.Event(), threading.Event()
+
+    def _execute_turn(context: Any) -> Any:
+        entered.set()
+        assert release.wait(timeout=5)
+        return execute_turn(context)
+
+    adapter.execute_turn = _execute_turn  # type: ignore[method-assign]
+
+    async def _cancel_mid_turn() -> Any:
+        first = asyncio.ensure_future(front.execute(request))
+        assert await asyncio.to_thread(entered.wait, 5)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        duplicate = asyncio.ensure_future(front.execute(request))
+        await asyncio.sleep(0.05)
+        # The abandoned turn still holds the request lock.
+        assert not duplicate.done()
+        release.set()
+        return await duplicate
+
+    response = asyncio.run(_cancel_mid_turn())
+
+    assert service.agent_invocation_count == 1
+    turns = threads.list_turns(binding.thread_id)
+    assert [turn[0].request_id for turn in turns] == [request.request_id]
+    assert _dump(turns[0][1]) == _dump(response)
+    assert front._request_locks == {}
+
+
+def _stages(trace: TurnTrace) -> tuple[TurnOutcome, list[TurnStage]]:
+    return trace.outcome, sorted(sample.stage for sample in trace.stages)
+
+
+def test_async_records_the_stages_the_sync_path_runs() -> None:
+    sync_traces, async_traces = _Traces(), _Traces()
+    sync, sync_threads, binding, _revision_id = _build_service(
+        turn_recorder=sync_traces, retrieval_cache_entries=8
+    )
+    service, async_threads, _binding, _ = _build_service(
+        turn_recorder=async_traces, retrieval_cache_entries=8
+    )
+    front = AsyncMindTurnService(service)
+    executed = _authorized_request(binding, request_id="req:async-stages-1", message=MESSAGES[0])
+    cached = _authorized_request(binding, request_id="req:async-stages-2", message=MESSAGES[0])
+    recovered = _authorized_request(binding, request_id="req:async-stages-3", message=MESSAGES[1])
+
+    for request in (executed, cached, executed, recovered):
+        sync.execute(request)
+        asyncio.run(front.execute(request))
+    # Simulate append failure after session create: the next retry recovers.
+    sync_threads._turns[binding.thread_id] = []
+    async_threads._turns[binding.thread_id] = []
+    sync.execute(recovered)
+    asyncio.run(front.execute(recovered))
+
+    expected = [_stages(trace) for trace in sync_traces.traces]
+    assert [_stages(trace) for trace in async_traces.traces] == expected
+    assert [outcome for outcome, _stages_run in expected] == [
+        TurnOutcome.EXECUTED,
+        TurnOutcome.EXECUTED,
+        TurnOutcome.REPLAYED,
+        TurnOutcome.EXECUTED,
+        TurnOutcome.RECOVERED,
+    ]
+    for _outcome, stages in expected[1:3] + expected[4:]:
+        assert TurnStage.EMBED_QUERY not in stages
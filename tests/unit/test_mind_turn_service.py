@@ -9,11 +9,27 @@ import pytest
 
 from dungeonmind.agents.fixture import FixtureGroundedAgentAdapter
 from dungeonmind.agents.protocol import AgentTurnContext
-from dungeonmind.application.mind_turn import FixedClock, MindTurnService
+from dungeonmind.application.context_assembly import TokenBudget
+from dungeonmind.application.graph_scope_cache import (
+    EvidenceScopeIndexCache,
+    ScopedProjectionCache,
+)
+from dungeonmind.application.graph_snapshot import (
+    GraphSnapshotReader,
+    NeighborhoodExpansion,
+    VersionedUnionGraphSnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_cache import ParsedSnapshotCache
+from dungeonmind.application.graph_snapshot_compact import CompactGraphSnapshotReader
+from dungeonmind.application.mind_turn import FixedClock, MindTurnService, _session_id_for
+from dungeonmind.application.retrieval_cache import RetrievalResultCache
+from dungeonmind.application.source_cache import CachingSourceRepository
+from dungeonmind.application.turn_instrumentation import TurnRecorder
 from dungeonmind.contracts.mind_turn import CallerScope, MindTurnRequest, SurfaceContext
 from dungeonmind.contracts.projection import ProjectionFocus
 from dungeonmind.domain.canonical import canonical_json
 from dungeonmind.domain.errors import IdempotencyConflictError, RevisionNotFoundError
+from dungeonmind.infrastructure.fixtures import FixtureTokenizer
 from dungeonmind.infrastructure.fixtures.curated_mind_turn import (
     load_curated_mind_turn_fixture,
     seed_curated_mind_turn,
@@ -25,6 +41,7 @@ from dungeonmind.infrastructure.memory import (
     InMemorySemanticDocumentRepository,
     InMemorySemanticSearch,
     InMemorySourceRepository,
+    InMemoryTurnCommitRepository,
     InMemoryWorldGraphRepository,
 )
 from dungeonmind.service.demo_access import DemoAccessBinding, authorize_demo_request
@@ -32,7 +49,19 @@ from dungeonmind.service.demo_access import DemoAccessBinding, authorize_demo_re
 from ..conftest import FIXED_NOW
 
 
-def _build_service() -> tuple[MindTurnService, Any, DemoAccessBinding, str]:
+def _build_service(
+    *,
+    snapshot_cache: ParsedSnapshotCache | None = None,
+    projection_cache: ScopedProjectionCache | None = None,
+    graph_reader: GraphSnapshotReader | None = None,
+    neighborhood_expansion: NeighborhoodExpansion | None = None,
+    turn_recorder: TurnRecorder | None = None,
+    context_budget: TokenBudget | None = None,
+    combined_commit: bool = False,
+    retrieval_cache_entries: int | None = None,
+    source_cache_entries: int | None = None,
+    scope_index_cache: EvidenceScopeIndexCache | None = None,
+) -> tuple[MindTurnService, Any, DemoAccessBinding, str]:
     fixture = load_curated_mind_turn_fixture()
     world_graph = InMemoryWorldGraphRepository()
     sources = InMemorySourceRepository()
@@ -57,10 +86,29 @@ def _build_service() -> tuple[MindTurnService, Any, DemoAccessBinding, str]:
         threads=threads,
         semantic_documents=semantic_documents,
         semantic_search=semantic_search,
-        sources=sources,
+        sources=(
+            CachingSourceRepository(sources, max_entries=source_cache_entries)
+            if source_cache_entries is not None
+            else sources
+        ),
+        graph_reader=graph_reader,
         query_embedder=fixture.query_embedder,
         agent_adapter=FixtureGroundedAgentAdapter(),
         clock=FixedClock(FIXED_NOW),
+        snapshot_cache=snapshot_cache,
+        projection_cache=projection_cache,
+        neighborhood_expansion=neighborhood_expansion,
+        turn_recorder=turn_recorder,
+        context_budget=context_budget,
+        turn_commits=(
+            InMemoryTurnCommitRepository(retrieval_sessions, threads) if combined_commit else None
+        ),
+        retrieval_cache=(
+            RetrievalResultCache(embedding_runs, max_entries=retrieval_cache_entries)
+            if retrieval_cache_entries is not None
+            else None
+        ),
+        scope_index_cache=scope_index_cache,
     )
     return service, threads, binding, seed.revision_id
 
@@ -243,6 +291,31 @@ def test_agent_context_has_no_auth_metadata(monkeypatch: pytest.MonkeyPatch) ->
     assert "roles" not in assembled
 
 
+def test_token_budget_bounds_agent_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    tokenizer = FixtureTokenizer()
+    budget = TokenBudget(tokenizer=tokenizer, max_tokens=400)
+    service, _threads, binding, _revision_id = _build_service(context_budget=budget)
+    unbounded, _, _, _ = _build_service()
+    captured: dict[str, str] = {}
+    for name, target in (("bounded", service), ("unbounded", unbounded)):
+        original = target._agent_adapter.execute_turn
+
+        def _capture(context: AgentTurnContext, name: str = name, original: Any = original) -> Any:
+            captured[name] = context.input.assembled_context
+            return original(context)
+
+        monkeypatch.setattr(target._agent_adapter, "execute_turn", _capture)
+        target.execute(
+            _authorized_request(
+                binding, request_id="req:token-budget", message="Who safeguards the Sun Ledger?"
+            )
+        )
+
+    assert tokenizer.count_tokens(captured["unbounded"]) > budget.max_tokens
+    assert tokenizer.count_tokens(captured["bounded"]) <= budget.max_tokens
+    assert json.loads(captured["bounded"])["objects"]
+
+
 def test_policy_enabled_tools_empty_and_revision_pin_matches(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -305,6 +378,25 @@ def test_same_request_id_changed_message_conflicts() -> None:
         service.execute(changed)
 
 
+def test_replay_reads_only_the_matching_turn(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, threads, binding, _revision_id = _build_service()
+    requests = [
+        _authorized_request(binding, request_id=f"req:indexed-{index}", message=message)
+        for index, message in enumerate(
+            ["Who safeguards the Sun Ledger?", "Where does Mere Astor live?"]
+        )
+    ]
+    first = [service.execute(request) for request in requests]
+
+    def _list_turns(thread_id: str) -> Any:
+        pytest.fail(f"replay scanned thread {thread_id!r}")
+
+    monkeypatch.setattr(threads, "list_turns", _list_turns)
+
+    assert [service.execute(request) for request in requests] == first
+    assert service.agent_invocation_count == 2
+
+
 def test_append_failure_recovery_reuses_session_without_reinvoking_agent() -> None:
     service, threads, binding, _revision_id = _build_service()
     request = _authorized_request(
@@ -329,6 +421,45 @@ def test_append_failure_recovery_reuses_session_without_reinvoking_agent() -> No
     assert len(threads.list_turns(binding.thread_id)) == 1
 
 
+def test_combined_turn_commit_matches_separate_writes() -> None:
+    separate, _threads, binding, _revision_id = _build_service()
+    combined, threads, _binding, _ = _build_service(combined_commit=True)
+    request = _authorized_request(
+        binding, request_id="req:combined", message="Who safeguards the Sun Ledger?"
+    )
+
+    expected = canonical_json(separate.execute(request).model_dump(mode="json"))
+    response = combined.execute(request)
+
+    assert canonical_json(response.model_dump(mode="json")) == expected
+    assert combined._retrieval_sessions.get(_session_id_for(request.request_id)) is not None
+    assert len(threads.list_turns(binding.thread_id)) == 1
+    assert canonical_json(combined.execute(request).model_dump(mode="json")) == expected
+    assert combined.agent_invocation_count == 1
+
+
+def test_failed_combined_commit_leaves_no_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, threads, binding, _revision_id = _build_service(combined_commit=True)
+    request = _authorized_request(
+        binding, request_id="req:combined-fail", message="Who safeguards the Sun Ledger?"
+    )
+
+    def _append_turn(*_args: Any) -> None:
+        raise IdempotencyConflictError("simulated append failure")
+
+    monkeypatch.setattr(threads, "append_turn", _append_turn)
+    with pytest.raises(IdempotencyConflictError):
+        service.execute(request)
+    assert service._retrieval_sessions._items == {}
+    monkeypatch.undo()
+
+    # Nothing to recover from: the retry runs the turn again and commits both records.
+    service.execute(request)
+    assert service.agent_invocation_count == 2
+    assert service._retrieval_sessions.get(_session_id_for(request.request_id)) is not None
+    assert len(threads.list_turns(binding.thread_id)) == 1
+
+
 def test_projections_actions_source_reads_and_no_similarity() -> None:
     service, _threads, binding, _revision_id = _build_service()
     response = service.execute(
@@ -398,7 +529,7 @@ def test_request_lock_survives_exception_and_retry_is_coordinated() -> None:
     )
     original = service._execute_unlocked
 
-    def _boom(req):
+    def _boom(req, timer):
         raise RuntimeError("simulated failure before persistence")
 
     service._execute_unlocked = _boom  # type: ignore[method-assign]
@@ -434,10 +565,10 @@ def test_waiting_requester_keeps_shared_lock_during_cleanup() -> None:
     waiter_acquired_ref = threading.Event()
     observed_keys: list[object] = []
 
-    def _slow(req):
+    def _slow(req, timer):
         holder_entered.set()
         assert release_holder.wait(timeout=2)
-        return original(req)
+        return original(req, timer)
 
     service._execute_unlocked = _slow  # type: ignore[method-assign]
 
@@ -475,3 +606,150 @@ def test_waiting_requester_keeps_shared_lock_during_cleanup() -> None:
     assert service.agent_invocation_count == 1
     assert (binding.thread_id, request.request_id) not in service._request_locks
     service._execute_unlocked = original  # type: ignore[method-assign]
+
+
+def test_preflight_resolves_candidate_documents_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, _threads, binding, _revision_id = _build_service()
+    documents = service._semantic_documents
+    fetch_many = documents.get_many
+    batches: list[tuple[list[str], tuple[str, ...]]] = []
+
+    def _get_many(ids: list[str], *, columns: tuple[str, ...]) -> Any:
+        batches.append((list(ids), tuple(columns)))
+        return fetch_many(ids, columns=columns)
+
+    def _get(doc_id: str) -> Any:
+        pytest.fail(f"per-candidate document read for {doc_id!r}")
+
+    monkeypatch.setattr(documents, "get_many", _get_many)
+    monkeypatch.setattr(documents, "get", _get)
+    service.execute(
+        _authorized_request(
+            binding, request_id="req:batch-preflight", message="Who safeguards the Sun Ledger?"
+        )
+    )
+
+    assert len(batches) == 1
+    ids, columns = batches[0]
+    assert ids and columns == ("graph_object_id",)
+
+
+def test_snapshot_cache_serves_identical_turns() -> None:
+    cache = ParsedSnapshotCache(max_bytes=64 * 1024 * 1024)
+    baseline, _threads, binding, _revision_id = _build_service()
+    cached, _cached_threads, _binding, _ = _build_service(snapshot_cache=cache)
+
+    for index, message in enumerate(
+        ["Who safeguards the Sun Ledger?", "Where does Mere Astor live?"]
+    ):
+        request = _authorized_request(
+            binding, request_id=f"req:cache-{index}", message=message
+        )
+        assert canonical_json(
+            cached.execute(request).model_dump(mode="json")
+        ) == canonical_json(baseline.execute(request).model_dump(mode="json"))
+
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+
+def test_projection_cache_serves_identical_turns() -> None:
+    cache = ScopedProjectionCache(max_entries=16)
+    baseline, _threads, binding, _revision_id = _build_service()
+    cached, _cached_threads, _binding, _ = _build_service(projection_cache=cache)
+
+    for index, message in enumerate(
+        ["Who safeguards the Sun Ledger?", "Where does Mere Astor live?"]
+    ):
+        request = _authorized_request(
+            binding, request_id=f"req:scope-cache-{index}", message=message
+        )
+        assert canonical_json(
+            cached.execute(request).model_dump(mode="json")
+        ) == canonical_json(baseline.execute(request).model_dump(mode="json"))
+
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+
+def test_scope_index_cache_builds_one_index_per_source_state() -> None:
+    scope_indexes = EvidenceScopeIndexCache(max_entries=4)
+    baseline, _threads, binding, _revision_id = _build_service()
+    indexed, _indexed_threads, _binding, _ = _build_service(
+        snapshot_cache=ParsedSnapshotCache(max_bytes=64 * 1024 * 1024),
+        scope_index_cache=scope_indexes,
+    )
+
+    for index, message in enumerate(
+        ["Who safeguards the Sun Ledger?", "Where does Mere Astor live?"]
+    ):
+        request = _authorized_request(
+            binding, request_id=f"req:scope-index-{index}", message=message
+        )
+        assert canonical_json(
+            indexed.execute(request).model_dump(mode="json")
+        ) == canonical_json(baseline.execute(request).model_dump(mode="json"))
+
+    stats = scope_indexes.stats()
+    assert (stats.misses, stats.hits, stats.entries) == (1, 1, 1)
+
+
+def test_compact_reader_serves_identical_turns() -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    compact, _compact_threads, _binding, _ = _build_service(
+        graph_reader=CompactGraphSnapshotReader(VersionedUnionGraphSnapshotReader()),
+        snapshot_cache=ParsedSnapshotCache(max_bytes=64 * 1024 * 1024),
+    )
+
+    for index, message in enumerate(
+        ["Who safeguards the Sun Ledger?", "Where does Mere Astor live?"]
+    ):
+        request = _authorized_request(
+            binding, request_id=f"req:compact-{index}", message=message
+        )
+        assert canonical_json(
+            compact.execute(request).model_dump(mode="json")
+        ) == canonical_json(baseline.execute(request).model_dump(mode="json"))
+
+
+def _relationship_ids(response: Any) -> list[str]:
+    return [
+        rel["relationship_id"]
+        for projection in response.semantic_projections
+        if projection.kind == "relationship_list"
+        for rel in projection.payload["relationships"]
+    ]
+
+
+def test_configured_expansion_selects_turn_neighborhood() -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    one_hop, _one_hop_threads, _binding, _ = _build_service(
+        neighborhood_expansion=NeighborhoodExpansion()
+    )
+    allow_listed, _allow_listed_threads, _binding, _ = _build_service(
+        neighborhood_expansion=NeighborhoodExpansion(
+            max_hops=2, predicates=frozenset({"safeguards"})
+        )
+    )
+    request = _authorized_request(
+        binding, request_id="req:neighborhood", message="Who safeguards the Sun Ledger?"
+    )
+
+    expected = baseline.execute(request)
+    assert canonical_json(one_hop.execute(request).model_dump(mode="json")) == (
+        canonical_json(expected.model_dump(mode="json"))
+    )
+    assert _relationship_ids(expected) == [
+        "rel:astor-resides-vael",
+        "rel:astor-safeguards-ledger",
+    ]
+    narrowed = allow_listed.execute(request)
+    assert _relationship_ids(narrowed) == ["rel:astor-safeguards-ledger"]
+    assert "Mere Astor" in narrowed.answer
+    assert canonical_json(allow_listed.execute(request).model_dump(mode="json")) == (
+        canonical_json(narrowed.model_dump(mode="json"))
+    )
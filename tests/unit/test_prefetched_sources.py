@@ -0,0 +1,137 @@
+"""Unit tests for batched, memoized provenance lookups during scoping and admission."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection
+from typing import Any
+
+from dungeonmind.application.graph_scope import (
+    PrefetchedSources,
+    ValidatedProvenance,
+    project_scoped_snapshot,
+)
+from dungeonmind.application.graph_snapshot import GRAPH_SCHEMA_V1
+from dungeonmind.contracts.evidence import SourceArtifactRecord, SourceRevision
+from dungeonmind.contracts.projection import Admissibility
+from dungeonmind.infrastructure.memory import InMemorySourceRepository
+
+from .test_graph_scope_cache import READER, WORLD, _payload, _put_artifact, _put_revision
+
+
+class _CountingSources(InMemorySourceRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: Counter[str] = Counter()
+
+    def get_artifact(self, source_artifact_id: str) -> SourceArtifactRecord | None:
+        self.calls["get_artifact"] += 1
+        return super().get_artifact(source_artifact_id)
+
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        self.calls["get_artifacts"] += 1
+        return super().get_artifacts(source_artifact_ids)
+
+    def get_revision(self, source_revision_id: str) -> SourceRevision | None:
+        self.calls["get_revision"] += 1
+        return super().get_revision(source_revision_id)
+
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        self.calls["get_revisions"] += 1
+        return super().get_revisions(source_revision_ids)
+
+
+def _wide_payload(objects: int) -> dict[str, Any]:
+    payload = _payload()
+    template = payload["nodes"][0]
+    payload["nodes"] = [
+        dict(
+            template,
+            object_id=f"obj:item-{index}",
+            label=f"Item {index}",
+            aliases=[],
+            evidence_ref_ids=[f"ev:{index}"],
+        )
+        for index in range(objects)
+    ]
+    payload["evidence_refs"] = [
+        dict(payload["evidence_refs"][0], evidence_ref_id=f"ev:{index}")
+        for index in range(objects)
+    ]
+    return payload
+
+
+def test_scoping_resolves_every_evidence_ref_in_one_batch_per_table() -> None:
+    sources = _CountingSources()
+    _put_artifact(sources)
+    _put_revision(sources)
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=_wide_payload(50))
+
+    projection = project_scoped_snapshot(
+        snapshot,
+        sources=sources,
+        world_id=WORLD,
+        campaign_id="camp:demo",
+        admissibility=Admissibility.PLAYER,
+    )
+
+    assert len(projection.snapshot.objects) == 50
+    assert sources.calls == Counter(get_artifacts=1, get_revisions=1)
+
+
+def test_prefetched_misses_stay_misses_and_other_ids_pass_through() -> None:
+    sources = _CountingSources()
+    _put_artifact(sources)
+    _put_revision(sources)
+    prefetched = PrefetchedSources(
+        sources,
+        source_artifact_ids=["src:atlas-notes", "src:absent"],
+        source_revision_ids=["srcrev:absent"],
+    )
+
+    assert prefetched.get_artifact("src:atlas-notes") == sources.get_artifact("src:atlas-notes")
+    assert prefetched.get_artifact("src:absent") is None
+    assert prefetched.get_revision("srcrev:absent") is None
+    assert sources.calls["get_revision"] == 0
+    assert prefetched.get_revision("srcrev:atlas-notes-v1") is not None
+    assert sources.calls["get_revision"] == 1
+    assert set(prefetched.get_artifacts(["src:atlas-notes", "src:absent", "src:other"])) == {
+        "src:atlas-notes"
+    }
+    assert prefetched.state_version(WORLD) == sources.state_version(WORLD)
+
+
+def test_shared_citations_resolve_once_and_cover_admission() -> None:
+    sources = _CountingSources()
+    _put_artifact(sources)
+    _put_revision(sources)
+    payload = _wide_payload(20)
+    payload["nodes"].append(
+        dict(payload["nodes"][0], object_id="obj:gm-note", label="GM Note", evidence_ref_ids=[])
+    )
+    for node in payload["nodes"][:-1]:
+        node["evidence_ref_ids"] = ["ev:0", "ev:1"]
+    snapshot = READER.parse(graph_schema=GRAPH_SCHEMA_V1, graph_payload=payload)
+
+    projection = project_scoped_snapshot(
+        snapshot,
+        sources=sources,
+        world_id=WORLD,
+        campaign_id="camp:demo",
+        admissibility=Admissibility.PLAYER,
+    )
+
+    verdicts = projection.evidence_verdicts
+    assert "obj:gm-note" not in projection.snapshot.objects
+    cited = {
+        evidence_ref_id
+        for obj in projection.snapshot.objects.values()
+        for evidence_ref_id in obj.evidence_ref_ids
+    }
+    assert cited == {"ev:0", "ev:1"}
+    assert cited <= verdicts.keys()
+    assert isinstance(verdicts["ev:0"], ValidatedProvenance)
+    assert verdicts["ev:0"] is verdicts["ev:0"]
+    assert sources.calls == Counter(get_artifacts=1, get_revisions=1)
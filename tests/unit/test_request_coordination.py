@@ -0,0 +1,80 @@
+"""Unit tests for pluggable cross-worker Mind Turn request coordination."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from dungeonmind.application.mind_turn import AsyncMindTurnService, MindTurnService
+
+from .test_mind_turn_service import _authorized_request, _build_service
+
+
+class _SharedKeyLocks:
+    """In-memory stand-in for a database-wide keyed lock."""
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self.holds: list[tuple[str, str]] = []
+
+    @contextmanager
+    def hold(self, thread_id: str, request_id: str) -> Iterator[None]:
+        key = (thread_id, request_id)
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            self.holds.append(key)
+            yield
+
+
+def _worker(service: MindTurnService, coordinator: _SharedKeyLocks) -> MindTurnService:
+    """A second service over the same stores, as another process would build it."""
+    return MindTurnService(
+        world_graph=service._world_graph,
+        retrieval_sessions=service._retrieval_sessions,
+        threads=service._threads,
+        semantic_documents=service._semantic_documents,
+        semantic_search=service._semantic_search,
+        sources=service._sources,
+        graph_reader=service._graph_reader,
+        query_embedder=service._query_embedder,
+        agent_adapter=service._agent_adapter,
+        clock=service._clock,
+        request_coordinator=coordinator,
+    )
+
+
+def test_coordinator_makes_turns_exactly_once_across_workers() -> None:
+    seeded, threads, binding, _revision_id = _build_service()
+    coordinator = _SharedKeyLocks()
+    workers = [_worker(seeded, coordinator) for _ in range(3)]
+    request = _authorized_request(
+        binding, request_id="req:cross-worker", message="Who safeguards the Sun Ledger?"
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as pool:
+        answers = list(pool.map(lambda index: workers[index % 3].execute(request).answer, range(6)))
+
+    assert len(set(answers)) == 1
+    assert sum(worker.agent_invocation_count for worker in workers) == 1
+    turns = threads.list_turns(binding.thread_id)
+    assert [t[0].request_id for t in turns].count(request.request_id) == 1
+    assert coordinator.holds == [(binding.thread_id, request.request_id)] * 6
+
+
+def test_async_front_end_holds_the_coordinator() -> None:
+    seeded, _threads, binding, _revision_id = _build_service()
+    coordinator = _SharedKeyLocks()
+    front = AsyncMindTurnService(_worker(seeded, coordinator))
+    request = _authorized_request(
+        binding, request_id="req:cross-worker-async", message="Where does Mere Astor live?"
+    )
+
+    response = asyncio.run(front.execute(request))
+
+    assert response.request_id == request.request_id
+    assert coordinator.holds == [(binding.thread_id, request.request_id)]
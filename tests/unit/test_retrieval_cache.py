@@ -0,0 +1,209 @@
+"""Unit tests for the cross-thread retrieval result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.mind_turn import AsyncMindTurnService
+from dungeonmind.application.retrieval_cache import RetrievalResultCache
+from dungeonmind.application.turn_instrumentation import TurnStage, TurnTrace
+from dungeonmind.contracts.evidence import SourceArtifact, SourceDomain, SourceStatus
+from dungeonmind.contracts.vocabulary import Visibility
+from dungeonmind.domain.canonical import canonical_json
+from dungeonmind.infrastructure.memory import InMemoryEmbeddingRunRepository
+
+from ..conftest import FIXED_NOW
+from .test_mind_turn_service import _authorized_request, _build_service
+
+MESSAGES = [
+    "Who safeguards the Sun Ledger?",
+    "Where does Mere Astor live?",
+    "Who is the Moon King?",
+]
+
+
+class _Traces:
+    def __init__(self) -> None:
+        self.traces: list[TurnTrace] = []
+
+    def record(self, trace: TurnTrace) -> None:
+        self.traces.append(trace)
+
+
+def _dump(response: Any) -> str:
+    return canonical_json(response.model_dump(mode="json"))
+
+
+def _count_searches(service: Any, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    searched: list[str] = []
+    search = service._semantic_search.search
+
+    def _search(query: Any) -> Any:
+        searched.append(query.text)
+        return search(query)
+
+    monkeypatch.setattr(service._semantic_search, "search", _search)
+    return searched
+
+
+def test_cached_turns_are_byte_identical_across_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    service, threads, _binding, _ = _build_service(retrieval_cache_entries=8)
+    searched = _count_searches(service, monkeypatch)
+    other = dataclasses.replace(binding, thread_id="thr:other-player", caller_id="user:other")
+    for repo in (baseline._threads, threads):
+        repo.create_thread(
+            other.thread_id,
+            world_id=other.world_id,
+            campaign_id=other.campaign_id,
+            caller_id=other.caller_id,
+            tenant_id=other.tenant_id,
+            created_at=FIXED_NOW,
+        )
+
+    for index, message in enumerate(MESSAGES):
+        for each in (binding, other):
+            request = _authorized_request(
+                each, request_id=f"req:{each.caller_id}-{index}", message=message
+            )
+            assert _dump(service.execute(request)) == _dump(baseline.execute(request))
+
+    assert searched == MESSAGES
+    assert service.agent_invocation_count == 2 * len(MESSAGES)
+    stats = service._retrieval_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (3, 3, 3)
+
+
+def test_hit_skips_retrieval_stages() -> None:
+    recorder = _Traces()
+    service, _threads, binding, _revision_id = _build_service(
+        turn_recorder=recorder, retrieval_cache_entries=8
+    )
+    for request_id in ("req:cache-miss", "req:cache-hit"):
+        service.execute(_authorized_request(binding, request_id=request_id, message=MESSAGES[0]))
+
+    missed, hit = recorder.traces
+    miss_stages = [sample.stage for sample in missed.stages]
+    assert TurnStage.SEMANTIC_SEARCH in miss_stages
+    assert [sample.stage for sample in hit.stages] == [
+        TurnStage.REPLAY_LOOKUP,
+        TurnStage.SESSION_LOOKUP,
+        TurnStage.RESOLVE_REVISION,
+        TurnStage.SOURCE_STATE,
+        TurnStage.RETRIEVAL_CACHE,
+        TurnStage.ASSEMBLE_CONTEXT,
+        TurnStage.AGENT,
+        TurnStage.SESSION_WRITE,
+        TurnStage.THREAD_APPEND,
+    ]
+    assert [dict(sample.counts) for sample in (missed.stages[4], hit.stages[4])] == [
+        {"hits": 0},
+        {"hits": 1},
+    ]
+
+
+def test_message_and_selection_are_part_of_the_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, _threads, binding, _revision_id = _build_service(retrieval_cache_entries=8)
+    searched = _count_searches(service, monkeypatch)
+    request = _authorized_request(binding, request_id="req:key-a", message=MESSAGES[1])
+    selected = request.model_copy(
+        update={
+            "request_id": "req:key-b",
+            "surface_context": request.surface_context.model_copy(
+                update={"selected_object_ids": ["obj:npc-mere-astor"]}
+            ),
+        }
+    )
+    folded = _authorized_request(binding, request_id="req:key-c", message=MESSAGES[1].lower())
+
+    for each in (request, selected, folded):
+        service.execute(each)
+
+    assert searched == [MESSAGES[1], MESSAGES[1], MESSAGES[1].lower()]
+
+
+def test_source_write_invalidates_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, _threads, binding, _revision_id = _build_service(retrieval_cache_entries=8)
+    searched = _count_searches(service, monkeypatch)
+    service.execute(_authorized_request(binding, request_id="req:src-1", message=MESSAGES[0]))
+
+    service._sources.put_artifact(
+        SourceArtifact(
+            source_artifact_id="src:unrelated",
+            source_domain=SourceDomain.WORLDBUILDING,
+            world_id=binding.world_id,
+            visibility=Visibility.PLAYER,
+            status=SourceStatus.ACTIVE,
+            created_at=FIXED_NOW,
+        )
+    )
+    service.execute(_authorized_request(binding, request_id="req:src-2", message=MESSAGES[0]))
+
+    assert searched == [MESSAGES[0], MESSAGES[0]]
+    assert service._retrieval_cache.stats().invalidations == 1
+
+
+def test_other_worlds_source_writes_keep_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, _threads, binding, _revision_id = _build_service(retrieval_cache_entries=8)
+    searched = _count_searches(service, monkeypatch)
+    service.execute(_authorized_request(binding, request_id="req:other-1", message=MESSAGES[0]))
+
+    service._sources.put_artifact(
+        SourceArtifact(
+            source_artifact_id="src:elsewhere",
+            source_domain=SourceDomain.WORLDBUILDING,
+            world_id="world:elsewhere",
+            visibility=Visibility.PLAYER,
+            status=SourceStatus.ACTIVE,
+            created_at=FIXED_NOW,
+        )
+    )
+    service.execute(_authorized_request(binding, request_id="req:other-2", message=MESSAGES[0]))
+
+    assert searched == [MESSAGES[0]]
+    assert service._retrieval_cache.stats().invalidations == 0
+
+
+def test_async_front_end_shares_the_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    service, _async_threads, _binding, _ = _build_service(retrieval_cache_entries=8)
+    searched = _count_searches(service, monkeypatch)
+    front = AsyncMindTurnService(service)
+
+    for request_id in ("req:async-cache-1", "req:async-cache-2"):
+        request = _authorized_request(binding, request_id=request_id, message=MESSAGES[0])
+        assert _dump(asyncio.run(front.execute(request))) == _dump(baseline.execute(request))
+
+    assert searched == [MESSAGES[0]]
+
+
+def test_result_is_not_retained_when_active_run_moves() -> None:
+    service, _threads, binding, _revision_id = _build_service()
+    runs = InMemoryEmbeddingRunRepository()
+    cache = RetrievalResultCache(runs, max_entries=4)
+    request = _authorized_request(binding, request_id="req:run", message=MESSAGES[0])
+    stored = service._world_graph.get_revision(binding.world_id, _revision_id)
+    assert stored is not None
+    key = cache.key_for(
+        request,
+        revision=stored.revision,
+        state_version=service._sources.state_version(binding.world_id),
+    )
+    assert key.materialization_run_id is None
+    assert cache.get(key) is None
+
+    runs.get_active_run_id = lambda world_id: "run:newer"  # type: ignore[method-assign]
+    cache.put(key, object())  # type: ignore[arg-type]
+
+    assert cache.stats().entries == 0
+
+
+def test_max_entries_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        RetrievalResultCache(InMemoryEmbeddingRunRepository(), max_entries=0)
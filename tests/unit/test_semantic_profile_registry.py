@@ -11,6 +11,7 @@ import pytest
 
 from dungeonmind.application.semantic_profiles import (
     descriptor_sha256,
+    profile_registry_digest,
     resolve_and_verify_profile,
 )
 from dungeonmind.contracts.semantic_profile import (
@@ -312,3 +313,19 @@ def test_static_registry_cache_and_not_found() -> None:
             ),
             registry,
         )
+
+
+def test_registry_digest_tracks_admitted_pins(tmp_path: Path) -> None:
+    descriptor = SemanticProfileDescriptor.model_validate(
+        json.loads(FIXTURE_DESCRIPTOR.read_text(encoding="utf-8"))
+    )
+    static = StaticSemanticProfileRegistry([descriptor])
+    loaded = FilesystemSemanticProfileRegistry.from_config_path(_write_registry(tmp_path))
+    assert profile_registry_digest(static) == profile_registry_digest(loaded)
+    assert profile_registry_digest(static) != profile_registry_digest(
+        StaticSemanticProfileRegistry()
+    )
+    tampered = descriptor.model_copy(update={"term_namespaces": ["narrative", "other"]})
+    assert profile_registry_digest(static) != profile_registry_digest(
+        StaticSemanticProfileRegistry([tampered])
+    )
@@ -0,0 +1,235 @@
+"""Unit tests for the read-through SourceRepository cache."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+import pytest
+
+from dungeonmind.application.graph_scope_cache import ScopedProjectionCache
+from dungeonmind.application.source_cache import CachingSourceRepository
+from dungeonmind.contracts.evidence import (
+    SourceArtifact,
+    SourceArtifactRecord,
+    SourceDomain,
+    SourceRevision,
+    SourceStatus,
+)
+from dungeonmind.contracts.vocabulary import Visibility
+from dungeonmind.infrastructure.memory import InMemorySourceRepository
+
+from ..conftest import FIXED_NOW
+from .test_mind_turn_service import _authorized_request, _build_service
+
+WORLD = "world:demo-atlas"
+
+
+class _CountingSources(InMemorySourceRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.artifact_reads: list[list[str]] = []
+        self.revision_reads: list[list[str]] = []
+
+    def get_artifacts(
+        self, source_artifact_ids: Collection[str]
+    ) -> dict[str, SourceArtifactRecord]:
+        self.artifact_reads.append(list(source_artifact_ids))
+        return super().get_artifacts(source_artifact_ids)
+
+    def get_revisions(self, source_revision_ids: Collection[str]) -> dict[str, SourceRevision]:
+        self.revision_reads.append(list(source_revision_ids))
+        return super().get_revisions(source_revision_ids)
+
+
+def _artifact(source_artifact_id: str = "src:atlas-notes") -> SourceArtifact:
+    return SourceArtifact(
+        source_artifact_id=source_artifact_id,
+        source_domain=SourceDomain.WORLDBUILDING,
+        world_id=WORLD,
+        visibility=Visibility.PLAYER,
+        status=SourceStatus.ACTIVE,
+        created_at=FIXED_NOW,
+    )
+
+
+def _revision(source_revision_id: str = "srcrev:atlas-notes-v1") -> SourceRevision:
+    return SourceRevision(
+        source_revision_id=source_revision_id,
+        source_artifact_id="src:atlas-notes",
+        content_sha256="aa" * 32,
+        body_storage="external",
+        locator="fixture://atlas-notes",
+        created_at=FIXED_NOW,
+    )
+
+
+def test_revisions_are_cached_across_source_writes() -> None:
+    backing = _CountingSources()
+    backing.put_revision(_revision())
+    cache = CachingSourceRepository(backing, max_entries=8)
+
+    first = cache.get_revision("srcrev:atlas-notes-v1")
+    backing.put_artifact(_artifact())
+    second = cache.get_revision("srcrev:atlas-notes-v1")
+
+    assert first is second
+    assert first == _revision()
+    assert backing.revision_reads == [["srcrev:atlas-notes-v1"]]
+    stats = cache.stats()
+    assert (stats.revision_hits, stats.revision_misses) == (1, 1)
+    assert stats.revision_hit_rate == 0.5
+
+
+def test_artifact_cache_follows_source_state() -> None:
+    backing = _CountingSources()
+    backing.put_artifact(_artifact())
+    cache = CachingSourceRepository(backing, max_entries=8)
+
+    view = cache.for_world(WORLD)
+    assert view.get_artifacts(["src:atlas-notes", "src:atlas-notes"]) == {
+        "src:atlas-notes": _artifact()
+    }
+    assert cache.for_world(WORLD).get_artifact("src:atlas-notes") == _artifact()
+    assert backing.artifact_reads == [["src:atlas-notes"]]
+
+    # A source write in the world is a new stamp; the next view reads through.
+    backing.put_artifact(_artifact("src:atlas-appendix"))
+    assert cache.for_world(WORLD).get_artifact("src:atlas-notes") == _artifact()
+    assert len(backing.artifact_reads) == 2
+    assert cache.stats().invalidations == 1
+
+
+def test_other_worlds_writes_keep_entries() -> None:
+    backing = _CountingSources()
+    backing.put_artifact(_artifact())
+    cache = CachingSourceRepository(backing, max_entries=8)
+    cache.for_world(WORLD).get_artifact("src:atlas-notes")
+
+    backing.put_artifact(
+        _artifact("src:elsewhere").model_copy(update={"world_id": "world:elsewhere"})
+    )
+
+    assert cache.for_world(WORLD).get_artifact("src:atlas-notes") == _artifact()
+    assert backing.artifact_reads == [["src:atlas-notes"]]
+    assert cache.stats().invalidations == 0
+
+
+def test_stale_views_and_bare_reads_never_populate() -> None:
+    backing = _CountingSources()
+    backing.put_artifact(_artifact())
+    cache = CachingSourceRepository(backing, max_entries=8)
+
+    stale = cache.for_world(WORLD)
+    backing.put_artifact(_artifact("src:atlas-appendix"))
+    cache.for_world(WORLD)
+    assert stale.get_artifact("src:atlas-notes") == _artifact()
+    assert cache.get_artifacts(["src:atlas-notes", "src:absent"]) == {
+        "src:atlas-notes": _artifact()
+    }
+
+    stats = cache.stats()
+    assert (stats.artifacts, stats.negative_entries) == (0, 0)
+    assert len(backing.artifact_reads) == 2
+
+
+def test_negative_lookups_are_bounded_and_forgotten_on_write() -> None:
+    backing = _CountingSources()
+    cache = CachingSourceRepository(backing, max_entries=8, max_negative_entries=2)
+
+    view = cache.for_world(WORLD)
+    assert view.get_artifacts(["src:a", "src:b", "src:c"]) == {}
+    assert cache.stats().negative_entries == 2
+    assert view.get_artifacts(["src:b", "src:c"]) == {}
+    assert view.get_revision("srcrev:atlas-notes-v1") is None
+    assert view.get_revision("srcrev:atlas-notes-v1") is None
+    assert backing.artifact_reads == [["src:a", "src:b", "src:c"]]
+    assert backing.revision_reads == [["srcrev:atlas-notes-v1"]]
+    assert cache.stats().negative_hits == 3
+
+    cache.put_artifact(_artifact("src:b"))
+    cache.put_revision(_revision())
+
+    view = cache.for_world(WORLD)
+    assert view.get_artifacts(["src:b"]) == {"src:b": _artifact("src:b")}
+    assert view.get_revision("srcrev:atlas-notes-v1") == _revision()
+    stats = cache.stats()
+    assert stats.negative_entries == 0
+    assert (stats.artifact_hits, stats.artifact_misses) == (2, 4)
+
+
+def test_entry_bound_evicts_least_recent_revision() -> None:
+    backing = _CountingSources()
+    for index in range(3):
+        backing.put_revision(_revision(f"srcrev:v{index}"))
+    cache = CachingSourceRepository(backing, max_entries=2)
+
+    cache.get_revisions(["srcrev:v0", "srcrev:v1"])
+    cache.get_revision("srcrev:v0")
+    cache.get_revision("srcrev:v2")
+    cache.get_revisions(["srcrev:v0", "srcrev:v1"])
+
+    assert backing.revision_reads[-1] == ["srcrev:v1"]
+    assert cache.stats().revisions == 2
+
+
+def test_entry_bounds_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        CachingSourceRepository(InMemorySourceRepository(), max_entries=0)
+    with pytest.raises(ValueError, match="max_negative_entries"):
+        CachingSourceRepository(
+            InMemorySourceRepository(), max_entries=1, max_negative_entries=0
+        )
+
+
+def test_turn_reads_the_source_stamp_once_for_every_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    service, _cached_threads, _binding, _ = _build_service(
+        projection_cache=ScopedProjectionCache(max_entries=4),
+        retrieval_cache_entries=4,
+        source_cache_entries=64,
+    )
+    backing = service._sources._sources
+    stamps: list[str] = []
+    state_version = backing.state_version
+
+    def _state_version(world_id: str) -> str:
+        stamps.append(world_id)
+        return state_version(world_id)
+
+    monkeypatch.setattr(backing, "state_version", _state_version)
+    for request_id, message in (
+        ("req:stamp-1", "Who safeguards the Sun Ledger?"),
+        ("req:stamp-2", "Where does Mere Astor live?"),
+    ):
+        request = _authorized_request(binding, request_id=request_id, message=message)
+        assert service.execute(request).model_dump(mode="json") == baseline.execute(
+            request
+        ).model_dump(mode="json")
+
+    assert stamps == [binding.world_id, binding.world_id]
+    stats = service._sources.stats()
+    assert (stats.artifact_misses, stats.artifacts, stats.invalidations) == (1, 1, 0)
+
+
+def test_stats_are_served_as_diagnostics() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from dungeonmind.service.api import create_app
+
+    service, _threads, binding, _revision_id = _build_service(source_cache_entries=64)
+    service.execute(_authorized_request(binding, request_id="req:diag", message="Who?"))
+    app = create_app(
+        service=service,
+        demo_binding=binding,
+        readiness_probe=lambda: {"status": "ready"},
+        source_cache=service._sources,
+    )
+
+    body = TestClient(app).get("/diagnostics/source-cache").json()
+
+    assert body == service._sources.stats().to_json()
+    assert body["artifact_misses"] == 1
+    assert "artifact_hit_rate" in body
@@ -0,0 +1,169 @@
+"""Unit tests for Mind Turn stage timings and the process-level aggregator."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dungeonmind.application.mind_turn import AsyncMindTurnService
+from dungeonmind.application.turn_instrumentation import (
+    StageSample,
+    TurnOutcome,
+    TurnStage,
+    TurnStageAggregator,
+    TurnTrace,
+)
+from dungeonmind.domain.canonical import canonical_json
+from dungeonmind.domain.errors import RevisionNotFoundError
+
+from .test_mind_turn_service import _authorized_request, _build_service
+
+EXECUTED_STAGES = [
+    TurnStage.REPLAY_LOOKUP,
+    TurnStage.SESSION_LOOKUP,
+    TurnStage.RESOLVE_REVISION,
+    TurnStage.PARSE,
+    TurnStage.SCOPE,
+    TurnStage.EMBED_QUERY,
+    TurnStage.SEMANTIC_SEARCH,
+    TurnStage.PREFLIGHT,
+    TurnStage.RESOLVE_MENTIONS,
+    TurnStage.EXPAND,
+    TurnStage.ADMIT_EVIDENCE,
+    TurnStage.ASSEMBLE_CONTEXT,
+    TurnStage.AGENT,
+    TurnStage.SESSION_WRITE,
+    TurnStage.THREAD_APPEND,
+]
+
+
+class _Traces:
+    def __init__(self) -> None:
+        self.traces: list[TurnTrace] = []
+
+    def record(self, trace: TurnTrace) -> None:
+        self.traces.append(trace)
+
+
+def _trace(outcome: TurnOutcome, *samples: tuple[TurnStage, float, int]) -> TurnTrace:
+    return TurnTrace(
+        thread_id="thr:demo",
+        request_id="req:demo",
+        outcome=outcome,
+        total_s=sum(elapsed_s for _stage, elapsed_s, _count in samples),
+        stages=tuple(
+            StageSample(stage, elapsed_s, {"objects": count})
+            for stage, elapsed_s, count in samples
+        ),
+    )
+
+
+def test_executed_turn_records_every_stage_with_work_counts() -> None:
+    recorder = _Traces()
+    service, _threads, binding, _revision_id = _build_service(turn_recorder=recorder)
+    request = _authorized_request(
+        binding, request_id="req:stages", message="Who safeguards the Sun Ledger?"
+    )
+
+    response = service.execute(request)
+    service.execute(request)
+
+    executed, replayed = recorder.traces
+    assert executed.outcome is TurnOutcome.EXECUTED
+    assert [sample.stage for sample in executed.stages] == EXECUTED_STAGES
+    assert all(sample.elapsed_s >= 0 for sample in executed.stages)
+    assert executed.total_s >= sum(sample.elapsed_s for sample in executed.stages)
+    counts = {sample.stage: dict(sample.counts) for sample in executed.stages}
+    assert counts[TurnStage.PARSE]["objects"] >= counts[TurnStage.SCOPE]["objects"] > 0
+    assert counts[TurnStage.EXPAND]["objects"] == sum(
+        1 for projection in response.semantic_projections if projection.kind == "entity_brief"
+    )
+    assert counts[TurnStage.ADMIT_EVIDENCE]["evidence"] == len(response.evidence)
+    assert counts[TurnStage.AGENT]["claims"] >= len(response.claims)
+    assert counts[TurnStage.SEMANTIC_SEARCH]["candidates"] > 0
+    assert replayed.outcome is TurnOutcome.REPLAYED
+    assert [sample.stage for sample in replayed.stages] == [TurnStage.REPLAY_LOOKUP]
+
+
+def test_combined_commit_is_one_stage() -> None:
+    recorder = _Traces()
+    service, _threads, binding, _revision_id = _build_service(
+        turn_recorder=recorder, combined_commit=True
+    )
+    service.execute(
+        _authorized_request(
+            binding, request_id="req:stages-commit", message="Who safeguards the Sun Ledger?"
+        )
+    )
+
+    (executed,) = recorder.traces
+    assert [sample.stage for sample in executed.stages] == [
+        *EXECUTED_STAGES[:-2],
+        TurnStage.TURN_COMMIT,
+    ]
+
+
+def test_recorder_does_not_change_responses() -> None:
+    baseline, _threads, binding, _revision_id = _build_service()
+    instrumented, _, _, _ = _build_service(turn_recorder=TurnStageAggregator())
+    request = _authorized_request(
+        binding, request_id="req:stages-identical", message="Where does Mere Astor live?"
+    )
+
+    assert canonical_json(instrumented.execute(request).model_dump(mode="json")) == (
+        canonical_json(baseline.execute(request).model_dump(mode="json"))
+    )
+
+
+def test_failed_and_async_turns_are_recorded() -> None:
+    recorder = _Traces()
+    service, _threads, binding, _revision_id = _build_service(turn_recorder=recorder)
+    missing = _authorized_request(
+        binding,
+        request_id="req:stages-missing",
+        message="Who safeguards the Sun Ledger?",
+        requested_revision_id="rev:missing",
+    )
+    with pytest.raises(RevisionNotFoundError):
+        service.execute(missing)
+    request = _authorized_request(
+        binding, request_id="req:stages-async", message="Who safeguards the Sun Ledger?"
+    )
+    asyncio.run(AsyncMindTurnService(service).execute(request))
+
+    failed, executed = recorder.traces
+    assert failed.outcome is TurnOutcome.FAILED
+    assert failed.stages[-1].stage is TurnStage.RESOLVE_REVISION
+    assert executed.outcome is TurnOutcome.EXECUTED
+    # Overlapped stages finish in any order, but each is sampled once.
+    assert sorted(sample.stage for sample in executed.stages) == sorted(EXECUTED_STAGES)
+
+
+def test_aggregator_sums_stages_and_counts_budget_overruns() -> None:
+    aggregator = TurnStageAggregator(budgets={TurnStage.PARSE: 0.010})
+    aggregator.record(
+        _trace(TurnOutcome.EXECUTED, (TurnStage.PARSE, 0.004, 3), (TurnStage.AGENT, 0.2, 0))
+    )
+    aggregator.record(_trace(TurnOutcome.EXECUTED, (TurnStage.PARSE, 0.016, 5)))
+    aggregator.record(_trace(TurnOutcome.REPLAYED, (TurnStage.REPLAY_LOOKUP, 0.001, 0)))
+
+    stats = aggregator.stats()
+
+    assert stats.turns == 3
+    assert stats.outcomes == {"executed": 2, "replayed": 1}
+    assert list(stats.stages) == ["replay_lookup", "parse", "agent"]
+    parse = stats.stages["parse"]
+    assert (parse.samples, parse.over_budget, parse.budget_s) == (2, 1, 0.010)
+    assert parse.max_s == 0.016
+    assert parse.mean_s == pytest.approx(0.010)
+    assert parse.counts == {"objects": 8}
+    assert stats.to_json()["stages"]["agent"]["budget_s"] is None
+
+    aggregator.reset()
+    assert aggregator.stats().turns == 0
+
+
+def test_budgets_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="parse"):
+        TurnStageAggregator(budgets={TurnStage.PARSE: 0})
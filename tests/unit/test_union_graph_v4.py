@@ -29,6 +29,7 @@ from dungeonmind.application.graph_snapshot import (
     VersionedUnionGraphSnapshotReader,
     collect_one_hop_object_ids,
 )
+from dungeonmind.application.graph_snapshot_compact import compact_snapshot
 from dungeonmind.application.graph_snapshot_v4 import UnionGraphV4SnapshotReader
 from dungeonmind.application.semantic_profiles import descriptor_sha256
 from dungeonmind.contracts.evidence import (
@@ -442,6 +443,37 @@ def test_v4_property_assertions_have_no_implicit_winner() -> None:
     assert [item.value for item in roles] == ["archivist", "informant"]
 
 
+def test_v4_compact_snapshot_matches_full_parse_and_scope() -> None:
+    full = _parse()
+    compact = compact_snapshot(_parse())
+
+    assert list(compact.objects) == list(full.objects)
+    for object_id, view in full.objects.items():
+        assert compact.objects[object_id] == view
+        assert compact.objects[object_id].model_dump(mode="json") == view.model_dump(
+            mode="json"
+        )
+    assert dict(compact.relationships.items()) == full.relationships
+    for admissibility in (Admissibility.PLAYER, Admissibility.GM):
+        expected = project_scoped_snapshot(
+            full,
+            sources=_sources(),
+            world_id=WORLD_ID,
+            campaign_id=CAMPAIGN_ID,
+            admissibility=admissibility,
+        )
+        actual = project_scoped_snapshot(
+            compact,
+            sources=_sources(),
+            world_id=WORLD_ID,
+            campaign_id=CAMPAIGN_ID,
+            admissibility=admissibility,
+        )
+        assert actual.snapshot.objects == expected.snapshot.objects
+        assert actual.snapshot.relationships == expected.snapshot.relationships
+        assert actual.rejections == expected.rejections
+
+
 def test_v4_versioned_reader_dispatches_v4() -> None:
     reader = VersionedUnionGraphSnapshotReader(profile_registry=_registry())
     snapshot = reader.parse(graph_schema=GRAPH_SCHEMA_V4, graph_payload=_v4_payload())
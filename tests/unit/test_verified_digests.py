@@ -0,0 +1,244 @@
+"""Unit tests for the verified-digest fast path and its sampled re-checks."""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dungeonmind.application.fictional_time import evaluate_fictional_time_query
+from dungeonmind.application.graph_snapshot import (
+    GRAPH_SCHEMA_V1,
+    UnionGraphV1SnapshotReader,
+)
+from dungeonmind.application.graph_snapshot_cache import ParsedSnapshotCache
+from dungeonmind.application.verified_digests import VerifiedDigestRegistry
+from dungeonmind.contracts.fictional_time import (
+    FICTIONAL_TIME_QUERY_SCHEMA,
+    FictionalTimeClaimBundle,
+    FictionalTimeQuery,
+)
+from dungeonmind.contracts.graph import StoredGraphRevision, WorldGraphRevision
+from dungeonmind.domain.canonical import canonical_sha256
+from dungeonmind.domain.errors import FictionalTimeIntegrityError
+
+from ..conftest import FIXED_NOW
+
+FIX = Path(__file__).resolve().parents[1] / "fixtures/fictional_time"
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "world_id": "world:digests",
+        "nodes": [
+            {
+                "object_id": "obj:a",
+                "kind": "npc",
+                "label": "Alpha",
+                "aliases": [],
+                "evidence_ref_ids": [],
+            }
+        ],
+        "relationships": [],
+        "evidence_refs": [],
+    }
+
+
+def _revision(payload: dict[str, Any]) -> WorldGraphRevision:
+    return WorldGraphRevision(
+        world_id="world:digests",
+        revision_id="rev:digests",
+        parent_revision_id=None,
+        created_at=FIXED_NOW,
+        operation_ids=["op:seed"],
+        graph_schema=GRAPH_SCHEMA_V1,
+        graph_payload_sha256=canonical_sha256(payload),
+    )
+
+
+def _relabelled(payload: dict[str, Any]) -> dict[str, Any]:
+    corrupted = copy.deepcopy(payload)
+    corrupted["nodes"][0]["label"] = "Corrupted"
+    return corrupted
+
+
+def test_unrecorded_key_is_always_rehashed() -> None:
+    registry = VerifiedDigestRegistry(recheck_interval=1_000)
+    payload = _payload()
+    revision = _revision(payload)
+
+    assert registry.payload_digest_matches(revision, payload)
+    assert not registry.payload_digest_matches(revision, _relabelled(payload))
+    stats = registry.stats()
+    assert (stats.entries, stats.fast_path_hits, stats.full_checks) == (0, 0, 2)
+    assert stats.mismatches == 1
+
+
+def test_recorded_key_takes_fast_path_and_samples_rechecks() -> None:
+    registry = VerifiedDigestRegistry(recheck_interval=4)
+    payload = _payload()
+    revision = _revision(payload)
+    registry.record_parsed(revision, payload)
+
+    for _ in range(8):
+        assert registry.payload_digest_matches(revision, payload)
+
+    stats = registry.stats()
+    assert stats.entries == 1
+    assert stats.fast_path_hits == 6
+    assert stats.sampled_rechecks == 2
+
+
+def test_sampled_recheck_catches_shape_preserving_corruption() -> None:
+    registry = VerifiedDigestRegistry(recheck_interval=3)
+    payload = _payload()
+    revision = _revision(payload)
+    registry.record_parsed(revision, payload)
+    corrupted = _relabelled(payload)
+
+    results = [registry.payload_digest_matches(revision, corrupted) for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert registry.stats().entries == 0
+    assert not registry.payload_digest_matches(revision, corrupted)
+
+
+def test_structural_mismatch_forces_full_check() -> None:
+    registry = VerifiedDigestRegistry(recheck_interval=1_000)
+    payload = _payload()
+    revision = _revision(payload)
+    registry.record_parsed(revision, payload)
+    grown = copy.deepcopy(payload)
+    grown["nodes"].append(dict(grown["nodes"][0], object_id="obj:b"))
+
+    assert not registry.payload_digest_matches(revision, grown)
+    assert registry.stats().fast_path_hits == 0
+    assert registry.stats().entries == 0
+
+
+def test_record_rejects_payload_that_does_not_hash_to_revision() -> None:
+    registry = VerifiedDigestRegistry()
+    payload = _payload()
+    registry.record_parsed(_revision(payload), _relabelled(payload))
+    assert registry.stats().entries == 0
+
+
+def test_entry_bound_evicts_least_recent() -> None:
+    registry = VerifiedDigestRegistry(max_entries=1)
+    first = _payload()
+    second = _payload()
+    second["world_id"] = "world:other"
+    registry.record_parsed(_revision(first), first)
+    registry.record_parsed(_revision(second), second)
+
+    assert registry.stats().entries == 1
+    assert registry.payload_digest_matches(_revision(first), first)
+    assert registry.stats().full_checks == 1
+
+
+@pytest.mark.parametrize("field", ["max_entries", "recheck_interval"])
+def test_bounds_must_be_positive(field: str) -> None:
+    with pytest.raises(ValueError, match=field):
+        VerifiedDigestRegistry(**{field: 0})
+
+
+def _fictional_time_inputs() -> tuple[StoredGraphRevision, FictionalTimeClaimBundle]:
+    stored = StoredGraphRevision.model_validate(
+        json.loads((FIX / "ft1-two-case-graph-v1.json").read_text())
+    )
+    bundle = FictionalTimeClaimBundle.model_validate(
+        json.loads((FIX / "ft1-two-case-claim-bundle-v1.json").read_text())
+    )
+    return stored, bundle
+
+
+def _evaluate(
+    stored: StoredGraphRevision,
+    bundle: FictionalTimeClaimBundle,
+    registry: VerifiedDigestRegistry | None,
+    *,
+    reader: UnionGraphV1SnapshotReader | None = None,
+    snapshot_cache: ParsedSnapshotCache | None = None,
+) -> Any:
+    return evaluate_fictional_time_query(
+        stored_revision=stored,
+        claim_bundle=bundle,
+        query=FictionalTimeQuery.model_validate(
+            {
+                "schema_version": FICTIONAL_TIME_QUERY_SCHEMA,
+                "query_id": "query:hempholm-tree-before-beetles",
+                "query_kind": "strict_before",
+                "before_anchor_id": "anchor:hempholm-tree-felled",
+                "after_anchor_id": "anchor:hempholm-root-beetle-attack",
+            }
+        ),
+        graph_reader=reader if reader is not None else UnionGraphV1SnapshotReader(),
+        verified_digests=registry,
+        snapshot_cache=snapshot_cache,
+    )
+
+
+def test_fictional_time_fast_path_matches_full_verification() -> None:
+    stored, bundle = _fictional_time_inputs()
+    registry = VerifiedDigestRegistry(recheck_interval=1_000)
+
+    baseline = _evaluate(stored, bundle, None)
+    first = _evaluate(stored, bundle, registry)
+    second = _evaluate(stored, bundle, registry)
+
+    assert first == baseline
+    assert second == baseline
+    stats = registry.stats()
+    assert (stats.entries, stats.full_checks, stats.fast_path_hits) == (1, 1, 1)
+
+
+def test_fictional_time_unverified_corruption_still_fails_closed() -> None:
+    stored, bundle = _fictional_time_inputs()
+    registry = VerifiedDigestRegistry(recheck_interval=1_000)
+    corrupted = stored.model_copy(deep=True)
+    corrupted.graph_payload["nodes"][0]["label"] = "Corrupted"
+
+    with pytest.raises(FictionalTimeIntegrityError) as exc_info:
+        _evaluate(corrupted, bundle, registry)
+
+    assert exc_info.value.reason == "graph_payload_digest_mismatch"
+    assert registry.stats().entries == 0
+
+
+class _CountingReader(UnionGraphV1SnapshotReader):
+    parse_calls = 0
+
+    def parse(self, *, graph_schema: str, graph_payload: dict[str, Any]) -> Any:
+        self.parse_calls += 1
+        return super().parse(graph_schema=graph_schema, graph_payload=graph_payload)
+
+
+def test_fictional_time_reuses_cached_parse_and_shares_verified_payload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stored, bundle = _fictional_time_inputs()
+    registry = VerifiedDigestRegistry(recheck_interval=1_000)
+    cache = ParsedSnapshotCache(max_bytes=10_000_000)
+    reader = _CountingReader()
+    baseline = _evaluate(stored, bundle, None)
+
+    results = [
+        _evaluate(stored, bundle, registry, reader=reader, snapshot_cache=cache)
+        for _ in range(3)
+    ]
+    reloads: list[Any] = []
+    validate = StoredGraphRevision.model_validate
+    monkeypatch.setattr(
+        StoredGraphRevision,
+        "model_validate",
+        lambda value: reloads.append(value) or validate(value),
+    )
+    results.append(_evaluate(stored, bundle, registry, reader=reader, snapshot_cache=cache))
+
+    assert results == [baseline] * 4
+    assert reader.parse_calls == 1
+    assert reloads == []
+    assert (cache.stats().hits, registry.stats().fast_path_hits) == (3, 3)